@@ -11,8 +11,12 @@ from sqlalchemy import pool
 from alembic import context
 
 from src.joias.infrastructure.persistence.sqlalchemy.base import Base
+from src.joias.infrastructure.persistence.sqlalchemy.models.fornecedor import Fornecedor
 from src.joias.infrastructure.persistence.sqlalchemy.models.permissao import PermissaoModel
+from src.joias.infrastructure.persistence.sqlalchemy.models.produto import ProdutoModel
+from src.joias.infrastructure.persistence.sqlalchemy.models.token import Token
 from src.joias.infrastructure.persistence.sqlalchemy.models.usuario import UsuarioModel
+from src.joias.infrastructure.persistence.sqlalchemy.models.versao_catalogo import VersaoCatalogoModel
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
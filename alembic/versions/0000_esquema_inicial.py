@@ -0,0 +1,199 @@
+"""Esquema inicial
+
+Cria as tabelas no estado anterior às demais revisões: sem os índices
+das revisões 0001 a 0003, sem a tabela de versões dos catálogos (0004) e
+com o token ainda único pelo texto, sem hash (0005).
+
+Tabelas que já existem são mantidas, para que `alembic upgrade head`
+funcione tanto em um banco vazio quanto em um banco criado a partir dos
+modelos (Base.metadata.create_all); as revisões seguintes também ignoram
+os objetos já existentes.
+
+Revision ID: 0000_esquema_inicial
+Revises:
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0000_esquema_inicial"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def tabelas():
+    """Retorna as tabelas do esquema inicial, em ordem de dependência."""
+    return [
+        (
+            "fornecedores",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("nome", sa.String(100), nullable=False),
+            sa.Column("logradouro", sa.String(100), nullable=False),
+            sa.Column("numero", sa.String(10), nullable=False),
+            sa.Column("bairro", sa.String(50), nullable=False),
+            sa.Column("cidade", sa.String(50), nullable=False),
+            sa.Column("estado", sa.String(2), nullable=False),
+            sa.Column("cep", sa.String(9), nullable=False),
+            sa.Column("complemento", sa.String(100)),
+            sa.Column("pais", sa.String(50)),
+            sa.Column("ativo", sa.Boolean()),
+            sa.Column("data_cadastro", sa.DateTime()),
+        ),
+        (
+            "perfis",
+            sa.Column("id", sa.String(36), primary_key=True),
+            sa.Column("nome", sa.String(100), nullable=False, unique=True),
+            sa.Column("descricao", sa.String(255)),
+            sa.Column("data_criacao", sa.DateTime(), nullable=False),
+        ),
+        (
+            "permissoes",
+            sa.Column("id", sa.String(36), primary_key=True),
+            sa.Column("nome", sa.String(100), nullable=False),
+            sa.Column("chave", sa.String(50), nullable=False, unique=True),
+            sa.Column("descricao", sa.String(255)),
+        ),
+        (
+            "produtos",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("sku", sa.String(50), nullable=False, unique=True),
+            sa.Column("nome", sa.String(100), nullable=False),
+            sa.Column("descricao", sa.String(500)),
+            sa.Column("preco_valor", sa.Numeric(10, 2), nullable=False),
+            sa.Column("preco_moeda", sa.String(3), nullable=False),
+            sa.Column("preco_data_inicio", sa.DateTime(), nullable=False),
+            sa.Column("preco_data_fim", sa.DateTime()),
+            sa.Column("data_criacao", sa.DateTime(), nullable=False),
+            sa.Column("ativo", sa.Boolean(), nullable=False),
+        ),
+        (
+            "usuarios",
+            sa.Column("id", sa.Uuid(), primary_key=True),
+            sa.Column("nome", sa.String(100), nullable=False),
+            sa.Column("email", sa.String(255), nullable=False, unique=True),
+            sa.Column("senha_hash", sa.String(255), nullable=False),
+            sa.Column("ativo", sa.Boolean(), nullable=False),
+            sa.Column("data_criacao", sa.DateTime(), nullable=False),
+        ),
+        (
+            "detalhes",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column(
+                "produto_id",
+                sa.Integer(),
+                sa.ForeignKey("produtos.id"),
+                nullable=False,
+            ),
+            sa.Column("nome", sa.String(100), nullable=False),
+            sa.Column("valor", sa.String(200), nullable=False),
+            sa.Column("tipo", sa.String(50), nullable=False),
+            sa.Column("data_criacao", sa.DateTime(), nullable=False),
+            sa.Column("ativo", sa.Boolean(), nullable=False),
+        ),
+        (
+            "documentos",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("numero", sa.String(20), nullable=False),
+            sa.Column("tipo", sa.String(10), nullable=False),
+            sa.Column(
+                "fornecedor_id",
+                sa.Integer(),
+                sa.ForeignKey("fornecedores.id"),
+                nullable=False,
+            ),
+        ),
+        (
+            "fornecedores_produtos",
+            sa.Column(
+                "fornecedor_id",
+                sa.Integer(),
+                sa.ForeignKey("fornecedores.id"),
+                primary_key=True,
+            ),
+            sa.Column(
+                "produto_id",
+                sa.Integer(),
+                sa.ForeignKey("produtos.id"),
+                primary_key=True,
+            ),
+        ),
+        (
+            "perfil_permissao",
+            sa.Column(
+                "perfil_id", sa.String(36), sa.ForeignKey("perfis.id"), primary_key=True
+            ),
+            sa.Column(
+                "permissao_id",
+                sa.String(36),
+                sa.ForeignKey("permissoes.id"),
+                primary_key=True,
+            ),
+        ),
+        (
+            "token",
+            sa.Column("id", sa.Uuid(), primary_key=True),
+            sa.Column(
+                "usuario_id", sa.Uuid(), sa.ForeignKey("usuarios.id"), nullable=False
+            ),
+            sa.Column("token", sa.String(255), nullable=False, unique=True),
+            sa.Column("expiracao", sa.DateTime(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+            sa.Column("deleted_at", sa.DateTime()),
+        ),
+        (
+            "usuario_perfil",
+            sa.Column(
+                "usuario_id", sa.Uuid(), sa.ForeignKey("usuarios.id"), primary_key=True
+            ),
+            sa.Column(
+                "perfil_id", sa.String(36), sa.ForeignKey("perfis.id"), primary_key=True
+            ),
+        ),
+        (
+            "variacoes",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column(
+                "produto_id",
+                sa.Integer(),
+                sa.ForeignKey("produtos.id"),
+                nullable=False,
+            ),
+            sa.Column("nome", sa.String(100), nullable=False),
+            sa.Column("descricao", sa.String(500)),
+            sa.Column("codigo", sa.String(50), nullable=False),
+            sa.Column("data_criacao", sa.DateTime(), nullable=False),
+            sa.Column("ativo", sa.Boolean(), nullable=False),
+        ),
+        (
+            "detalhes_variacoes",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column(
+                "variacao_id",
+                sa.Integer(),
+                sa.ForeignKey("variacoes.id"),
+                nullable=False,
+            ),
+            sa.Column("nome", sa.String(100), nullable=False),
+            sa.Column("valor", sa.String(200), nullable=False),
+            sa.Column("tipo", sa.String(50), nullable=False),
+            sa.Column("data_criacao", sa.DateTime(), nullable=False),
+            sa.Column("ativo", sa.Boolean(), nullable=False),
+        ),
+    ]
+
+
+def upgrade() -> None:
+    existentes = set(sa.inspect(op.get_bind()).get_table_names())
+    for nome, *colunas in tabelas():
+        if nome not in existentes:
+            op.create_table(nome, *colunas)
+
+
+def downgrade() -> None:
+    for nome, *_ in reversed(tabelas()):
+        op.drop_table(nome)
@@ -0,0 +1,80 @@
+"""Índices para as colunas filtradas pelos repositórios
+
+Cria os índices usados pelas consultas dos repositórios SQLAlchemy:
+
+- produtos (ativo, preco_valor): listagens e buscar_por_faixa_de_preco
+- chaves estrangeiras de variações, detalhes, detalhes de variações e
+  documentos: carregamento dos relacionamentos (selectinload) por IN
+- token (usuario_id): buscar_por_usuario_id; o valor do token já é
+  indexado pela restrição unique
+- usuarios lower(email): buscas de email sem diferenciar maiúsculas
+- usuarios email/nome com trigramas (apenas PostgreSQL, extensão
+  pg_trgm): filtros ilike '%...%' da listagem de usuários
+
+Índices já existentes (banco criado a partir dos modelos) são mantidos.
+
+Revision ID: 0001_indices_filtros
+Revises: 0000_esquema_inicial
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0001_indices_filtros"
+down_revision = "0000_esquema_inicial"
+branch_labels = None
+depends_on = None
+
+# (nome, tabela, colunas)
+INDICES = [
+    ("ix_produtos_ativo_preco_valor", "produtos", ["ativo", "preco_valor"]),
+    ("ix_variacoes_produto_id", "variacoes", ["produto_id"]),
+    ("ix_detalhes_produto_id", "detalhes", ["produto_id"]),
+    ("ix_detalhes_variacoes_variacao_id", "detalhes_variacoes", ["variacao_id"]),
+    ("ix_documentos_fornecedor_id", "documentos", ["fornecedor_id"]),
+    ("ix_token_usuario_id", "token", ["usuario_id"]),
+]
+
+# Índices GIN de trigramas para ilike '%...%' (PostgreSQL)
+INDICES_TRIGRAMAS = [
+    ("ix_usuarios_email_trgm", "usuarios", "email"),
+    ("ix_usuarios_nome_trgm", "usuarios", "nome"),
+]
+
+
+def upgrade() -> None:
+    for nome, tabela, colunas in INDICES:
+        op.create_index(nome, tabela, colunas, if_not_exists=True)
+
+    op.create_index(
+        "ix_usuarios_email_lower",
+        "usuarios",
+        [sa.text("lower(email)")],
+        if_not_exists=True,
+    )
+
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for nome, tabela, coluna in INDICES_TRIGRAMAS:
+            op.create_index(
+                nome,
+                tabela,
+                [coluna],
+                postgresql_using="gin",
+                postgresql_ops={coluna: "gin_trgm_ops"},
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        for nome, tabela, _ in reversed(INDICES_TRIGRAMAS):
+            op.drop_index(nome, table_name=tabela)
+
+    op.drop_index("ix_usuarios_email_lower", table_name="usuarios")
+
+    for nome, tabela, _ in reversed(INDICES):
+        op.drop_index(nome, table_name=tabela)
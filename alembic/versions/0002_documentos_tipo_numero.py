@@ -0,0 +1,33 @@
+"""Índice único de documentos por (tipo, numero)
+
+Um documento identifica um único fornecedor. O índice garante isso no
+banco e atende buscar_por_documento e a verificação de documentos já
+cadastrados na importação de fornecedores em lote.
+
+Revision ID: 0002_documentos_tipo_numero
+Revises: 0001_indices_filtros
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0002_documentos_tipo_numero"
+down_revision = "0001_indices_filtros"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "uq_documentos_tipo_numero",
+        "documentos",
+        ["tipo", "numero"],
+        unique=True,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_documentos_tipo_numero", table_name="documentos")
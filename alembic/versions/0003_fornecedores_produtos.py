@@ -0,0 +1,34 @@
+"""Índice de fornecedores_produtos por produto
+
+A chave primária (fornecedor_id, produto_id) atende a listagem dos
+produtos de um fornecedor; este índice atende a listagem dos
+fornecedores de um produto.
+
+Revision ID: 0003_fornecedores_produtos
+Revises: 0002_documentos_tipo_numero
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0003_fornecedores_produtos"
+down_revision = "0002_documentos_tipo_numero"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_fornecedores_produtos_produto_id",
+        "fornecedores_produtos",
+        ["produto_id", "fornecedor_id"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_fornecedores_produtos_produto_id", table_name="fornecedores_produtos"
+    )
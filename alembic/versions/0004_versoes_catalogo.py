@@ -0,0 +1,37 @@
+"""Tabela de versões dos catálogos em cache
+
+Cada escrita no catálogo de permissões incrementa a versão na mesma
+transação; os processos comparam a versão para saber se o cache de
+permissões ficou desatualizado.
+
+Revision ID: 0004_versoes_catalogo
+Revises: 0003_fornecedores_produtos
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0004_versoes_catalogo"
+down_revision = "0003_fornecedores_produtos"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Já criada em bancos gerados a partir dos modelos
+    if sa.inspect(op.get_bind()).has_table("versoes_catalogo"):
+        return
+
+    versoes = op.create_table(
+        "versoes_catalogo",
+        sa.Column("nome", sa.String(50), primary_key=True),
+        sa.Column("versao", sa.Integer(), nullable=False),
+    )
+    op.bulk_insert(versoes, [{"nome": "permissoes", "versao": 0}])
+
+
+def downgrade() -> None:
+    op.drop_table("versoes_catalogo")
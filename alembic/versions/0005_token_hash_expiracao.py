@@ -0,0 +1,95 @@
+"""Hash do token e índice de expiração
+
+- token (token_hash): SHA-256 do token, em hexadecimal, com índice
+  único; buscar_por_token passa a usar este índice de tamanho fixo em
+  vez do texto do JWT, cuja restrição unique é removida
+- token (expiracao): índice percorrido pela purga dos tokens expirados
+
+Os hashes dos tokens existentes são calculados em lotes durante o
+upgrade. Em bancos criados a partir dos modelos, a coluna e os índices
+já existem e são mantidos.
+
+Revision ID: 0005_token_hash_expiracao
+Revises: 0004_versoes_catalogo
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+import hashlib
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0005_token_hash_expiracao"
+down_revision = "0004_versoes_catalogo"
+branch_labels = None
+depends_on = None
+
+# Quantidade de tokens atualizados por comando no cálculo dos hashes
+LOTE = 1000
+
+# Nome gerado pelo PostgreSQL para a restrição unique de token.token; no
+# SQLite, a tabela recriada pelo batch_alter_table já não a tem
+RESTRICAO_TOKEN = "token_token_key"
+
+
+def upgrade() -> None:
+    conexao = op.get_bind()
+    inspetor = sa.inspect(conexao)
+    if "token_hash" not in {c["name"] for c in inspetor.get_columns("token")}:
+        preencher_token_hash(conexao)
+
+    op.create_index(
+        "ix_token_token_hash", "token", ["token_hash"], unique=True, if_not_exists=True
+    )
+    op.create_index("ix_token_expiracao", "token", ["expiracao"], if_not_exists=True)
+
+    if conexao.dialect.name == "postgresql" and RESTRICAO_TOKEN in {
+        r["name"] for r in inspetor.get_unique_constraints("token")
+    }:
+        op.drop_constraint(RESTRICAO_TOKEN, "token", type_="unique")
+
+
+def preencher_token_hash(conexao) -> None:
+    """Cria a coluna token_hash e calcula o hash dos tokens existentes."""
+    op.add_column("token", sa.Column("token_hash", sa.CHAR(64), nullable=True))
+
+    token = sa.table(
+        "token", sa.column("id"), sa.column("token"), sa.column("token_hash")
+    )
+    atualizar = (
+        sa.update(token)
+        .where(token.c.id == sa.bindparam("id_token"))
+        .values(token_hash=sa.bindparam("hash"))
+    )
+    pendentes = sa.select(token.c.id, token.c.token).where(
+        token.c.token_hash.is_(None)
+    )
+    while True:
+        linhas = conexao.execute(pendentes.limit(LOTE)).all()
+        if not linhas:
+            break
+        conexao.execute(
+            atualizar,
+            [
+                {
+                    "id_token": linha.id,
+                    "hash": hashlib.sha256(linha.token.encode()).hexdigest(),
+                }
+                for linha in linhas
+            ],
+        )
+
+    with op.batch_alter_table("token") as batch:
+        batch.alter_column("token_hash", existing_type=sa.CHAR(64), nullable=False)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.create_unique_constraint(RESTRICAO_TOKEN, "token", ["token"])
+
+    op.drop_index("ix_token_expiracao", table_name="token")
+    op.drop_index("ix_token_token_hash", table_name="token")
+    with op.batch_alter_table("token") as batch:
+        batch.drop_column("token_hash")
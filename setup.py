@@ -13,6 +13,8 @@ setup(
         "uvicorn==0.27.1",
         "sqlalchemy==2.0.27",
         "psycopg2-binary==2.9.9",
+        "asyncpg==0.29.0",
+        "aiosqlite==0.20.0",
         "pydantic==2.6.1",
         "pydantic-settings==2.1.0",
         "python-jose==3.3.0",
@@ -24,6 +26,7 @@ setup(
     extras_require={
         "test": [
             "pytest==8.0.2",
+            "pytest-asyncio==0.23.5",
             "httpx==0.27.0",
         ],
     },
@@ -50,6 +50,14 @@ class CriarFornecedorDTO:
     endereco: EnderecoDTO
 
 
+@dataclass
+class ImportacaoFornecedoresDTO:
+    """DTO com o resultado da criação de fornecedores em lote."""
+
+    criados: int
+    ignorados: List[DocumentoDTO]
+
+
 @dataclass
 class AtualizarFornecedorDTO:
     """DTO para atualização de fornecedores."""
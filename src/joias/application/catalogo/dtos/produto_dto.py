@@ -16,7 +16,7 @@ class PrecoDTO:
 
     valor: Decimal
     moeda: str
-    data_inicio: datetime
+    data_inicio: Optional[datetime] = None
     data_fim: Optional[datetime] = None
 
 
@@ -81,3 +81,11 @@ class ListagemProdutoDTO:
     preco_valor: Decimal
     preco_moeda: str
     ativo: bool
+
+
+@dataclass
+class PaginaProdutosDTO:
+    """DTO para uma página de listagem de produtos."""
+
+    itens: List[ListagemProdutoDTO]
+    proximo_cursor: Optional[int] = None
@@ -8,7 +8,10 @@ e o domínio.
 from typing import List, Optional
 
 from ....domain.catalogo.entities.fornecedor import Documento, Fornecedor
-from ....domain.catalogo.repositories.fornecedor_repository import FornecedorRepository
+from ....domain.catalogo.repositories.fornecedor_repository import (
+    FornecedorRepository,
+    ResumoFornecedor,
+)
 from ....domain.catalogo.services.fornecedor_service import FornecedorService
 from ....domain.shared.value_objects.endereco import Endereco
 from ..dtos.fornecedor_dto import (
@@ -17,6 +20,7 @@ from ..dtos.fornecedor_dto import (
     DocumentoDTO,
     EnderecoDTO,
     FornecedorDTO,
+    ImportacaoFornecedoresDTO,
     ListagemFornecedorDTO,
 )
 
@@ -62,6 +66,44 @@ class FornecedorAppService:
 
         return self._to_dto(fornecedor)
 
+    def importar_fornecedores(
+        self, dtos: List[CriarFornecedorDTO], tamanho_lote: int = 1000
+    ) -> ImportacaoFornecedoresDTO:
+        """
+        Cria fornecedores em lote, como na importação de um cadastro de CNPJs.
+
+        Fornecedores cujo documento já está cadastrado (ou se repete no
+        próprio lote) são ignorados em vez de interromper a importação.
+
+        Args:
+            dtos: DTOs com os dados dos fornecedores
+            tamanho_lote: Quantidade de fornecedores por transação
+
+        Returns:
+            ImportacaoFornecedoresDTO: Quantidade de fornecedores criados e
+            documentos dos fornecedores ignorados
+        """
+        fornecedores = [
+            Fornecedor(
+                nome=dto.nome,
+                documentos=[
+                    Documento(numero=dto.documento_numero, tipo=dto.documento_tipo)
+                ],
+                endereco=self._to_endereco_entity(dto.endereco),
+            )
+            for dto in dtos
+        ]
+
+        criados = self._service.criar_fornecedores_em_lote(fornecedores, tamanho_lote)
+
+        ids_criados = {id(f) for f in criados}
+        ignorados = [
+            DocumentoDTO(numero=f.documentos[0].numero, tipo=f.documentos[0].tipo)
+            for f in fornecedores
+            if id(f) not in ids_criados
+        ]
+        return ImportacaoFornecedoresDTO(criados=len(criados), ignorados=ignorados)
+
     def atualizar_fornecedor(
         self, fornecedor_id: int, dto: AtualizarFornecedorDTO
     ) -> Optional[FornecedorDTO]:
@@ -116,8 +158,8 @@ class FornecedorAppService:
             List[ListagemFornecedorDTO]: Lista de DTOs com dados resumidos
             dos fornecedores
         """
-        fornecedores = self._repository.listar(apenas_ativos)
-        return [self._to_listagem_dto(f) for f in fornecedores]
+        resumos = self._repository.listar_resumos(apenas_ativos)
+        return [self._resumo_to_listagem_dto(r) for r in resumos]
 
     def buscar_por_nome(self, nome: str) -> List[ListagemFornecedorDTO]:
         """
@@ -207,6 +249,28 @@ class FornecedorAppService:
             ativo=fornecedor.ativo,
         )
 
+    def _resumo_to_listagem_dto(
+        self, resumo: ResumoFornecedor
+    ) -> ListagemFornecedorDTO:
+        """
+        Converte um resumo de fornecedor para DTO de listagem.
+
+        Args:
+            resumo: O resumo lido pelo repositório
+
+        Returns:
+            ListagemFornecedorDTO: O DTO correspondente
+        """
+        return ListagemFornecedorDTO(
+            nome=resumo.nome,
+            documento_principal=DocumentoDTO(
+                numero=resumo.documento_numero, tipo=resumo.documento_tipo
+            ),
+            cidade=resumo.cidade,
+            estado=resumo.estado,
+            ativo=resumo.ativo,
+        )
+
     def _to_endereco_entity(self, dto: EnderecoDTO) -> Endereco:
         """
         Converte um DTO de endereço para entidade.
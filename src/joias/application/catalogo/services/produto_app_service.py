@@ -7,18 +7,22 @@ e o domínio.
 """
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from ....domain.catalogo.entities.produto import Detalhe, Produto, Variacao
-from ....domain.catalogo.repositories.produto_repository import ProdutoRepository
+from ....domain.catalogo.repositories.produto_repository import (
+    ProdutoRepository,
+    ResumoProduto,
+)
 from ....domain.catalogo.services.produto_service import ProdutoService
 from ....domain.shared.value_objects.moeda import Moeda
-from ....domain.shared.value_objects.preco import Preco
+from ....domain.shared.value_objects.preco import Preco, centavos
 from ..dtos.produto_dto import (
     AtualizarProdutoDTO,
     CriarProdutoDTO,
     DetalheDTO,
     ListagemProdutoDTO,
+    PaginaProdutosDTO,
     PrecoDTO,
     ProdutoDTO,
     VariacaoDTO,
@@ -54,15 +58,11 @@ class ProdutoAppService:
             ProdutoDTO: DTO com os dados do produto criado
 
         Raises:
-            ValueError: Se o SKU já existe
+            ValueError: Se o SKU já existe ou a moeda não estiver registrada
         """
         preco = Preco(
-            valor=dto.preco_valor,
-            moeda=Moeda(
-                codigo=dto.preco_moeda,
-                nome="",  # Nome será preenchido pelo construtor
-                simbolo="",  # Símbolo será preenchido pelo construtor
-            ),
+            valor_em_centavos=centavos(dto.preco_valor),
+            moeda=Moeda.de_codigo(dto.preco_moeda),
         )
 
         produto = self._service.criar_produto(
@@ -97,11 +97,15 @@ class ProdutoAppService:
 
         if dto.preco_valor is not None or dto.preco_moeda is not None:
             novo_preco = Preco(
-                valor=dto.preco_valor or produto.preco.valor,
-                moeda=Moeda(
-                    codigo=dto.preco_moeda or produto.preco.moeda.codigo,
-                    nome="",  # Nome será preenchido pelo construtor
-                    simbolo="",  # Símbolo será preenchido pelo construtor
+                valor_em_centavos=(
+                    centavos(dto.preco_valor)
+                    if dto.preco_valor is not None
+                    else produto.preco.valor_em_centavos
+                ),
+                moeda=(
+                    Moeda.de_codigo(dto.preco_moeda)
+                    if dto.preco_moeda is not None
+                    else produto.preco.moeda
                 ),
             )
             produto.atualizar_preco(novo_preco)
@@ -150,8 +154,59 @@ class ProdutoAppService:
             List[ListagemProdutoDTO]: Lista de DTOs com dados resumidos
             dos produtos
         """
-        produtos = self._repository.listar(apenas_ativos)
-        return [self._to_listagem_dto(p) for p in produtos]
+        resumos = self._repository.listar_resumos(apenas_ativos)
+        return [self._resumo_to_listagem_dto(r) for r in resumos]
+
+    def listar_pagina(
+        self,
+        cursor: Optional[int] = None,
+        limite: int = 50,
+        apenas_ativos: bool = True,
+    ) -> PaginaProdutosDTO:
+        """
+        Lista uma página de produtos.
+
+        Args:
+            cursor: Cursor retornado pela página anterior (None na primeira)
+            limite: Quantidade máxima de produtos na página
+            apenas_ativos: Se True, retorna apenas produtos ativos
+
+        Returns:
+            PaginaProdutosDTO: Produtos da página e cursor da próxima
+        """
+        resumos, proximo = self._repository.listar_pagina_resumos(
+            cursor, limite, apenas_ativos
+        )
+        return PaginaProdutosDTO(
+            itens=[self._resumo_to_listagem_dto(r) for r in resumos],
+            proximo_cursor=proximo,
+        )
+
+    def exportar(
+        self, apenas_ativos: bool = True, lote: int = 1000
+    ) -> Iterator[ListagemProdutoDTO]:
+        """
+        Percorre todos os produtos em memória limitada, para exportações.
+
+        Lê as páginas de resumos, sem carregar entidades, variações e
+        detalhes que o DTO de listagem não usa.
+
+        Args:
+            apenas_ativos: Se True, exporta apenas produtos ativos
+            lote: Quantidade de produtos lidos por página
+
+        Yields:
+            ListagemProdutoDTO: Dados resumidos de cada produto
+        """
+        cursor = None
+        while True:
+            resumos, cursor = self._repository.listar_pagina_resumos(
+                cursor, lote, apenas_ativos
+            )
+            for resumo in resumos:
+                yield self._resumo_to_listagem_dto(resumo)
+            if cursor is None:
+                return
 
     def buscar_por_faixa_de_preco(
         self, preco_minimo: Decimal, preco_maximo: Decimal
@@ -211,8 +266,6 @@ class ProdutoAppService:
             preco=PrecoDTO(
                 valor=produto.preco.valor,
                 moeda=produto.preco.moeda.codigo,
-                data_inicio=produto.preco.data_inicio,
-                data_fim=produto.preco.data_fim,
             ),
             variacoes=[
                 VariacaoDTO(
@@ -249,3 +302,21 @@ class ProdutoAppService:
             preco_moeda=produto.preco.moeda.codigo,
             ativo=produto.ativo,
         )
+
+    def _resumo_to_listagem_dto(self, resumo: ResumoProduto) -> ListagemProdutoDTO:
+        """
+        Converte um resumo de produto para DTO de listagem.
+
+        Args:
+            resumo: O resumo lido pelo repositório
+
+        Returns:
+            ListagemProdutoDTO: O DTO correspondente
+        """
+        return ListagemProdutoDTO(
+            sku=resumo.sku,
+            nome=resumo.nome,
+            preco_valor=resumo.preco_valor,
+            preco_moeda=resumo.preco_moeda,
+            ativo=resumo.ativo,
+        )
@@ -0,0 +1,104 @@
+"""
+Serviço de autenticação assíncrono.
+
+Versão do AuthService sobre o repositório assíncrono de usuários, usada
+pelos endpoints da API. A geração de tokens e de hashes de senha não
+acessa o banco e é herdada do AuthService.
+"""
+from uuid import UUID
+
+from jose import jwt
+from jwt.exceptions import InvalidTokenError
+
+from ...domain.entities.autorizacao import Usuario
+from ...domain.shared.value_objects.email import Email
+from ...infrastructure.persistence.sqlalchemy.repositories.async_usuario_repository import (
+    AsyncUsuarioRepository,
+)
+from ..shared.exceptions import AutenticacaoError, ValidacaoError
+from .auth_service import AuthService
+
+
+class AsyncAuthService(AuthService):
+    """
+    Serviço assíncrono para autenticação de usuários.
+    """
+
+    def __init__(
+        self,
+        usuario_repository: AsyncUsuarioRepository,
+        secret_key: str,
+        token_expiration: int = 24,
+    ):
+        """
+        Inicializa o serviço de autenticação.
+
+        Args:
+            usuario_repository: Repositório assíncrono de usuários
+            secret_key: Chave secreta para geração de tokens
+            token_expiration: Tempo de expiração do token em horas (padrão: 24)
+        """
+        super().__init__(usuario_repository, secret_key, token_expiration)
+
+    async def autenticar(self, email: str, senha: str) -> str:
+        """
+        Autentica um usuário.
+
+        Args:
+            email: Email do usuário
+            senha: Senha do usuário
+
+        Returns:
+            Token JWT
+
+        Raises:
+            AutenticacaoError: Se as credenciais forem inválidas
+            ValidacaoError: Se o email for inválido
+        """
+        try:
+            email_obj = Email(email)
+        except ValueError as e:
+            raise ValidacaoError(str(e))
+
+        usuario = await self._usuario_repository.buscar_por_email(str(email_obj))
+        if not usuario:
+            raise AutenticacaoError("Credenciais inválidas")
+
+        if not usuario.ativo:
+            raise AutenticacaoError("Usuário inativo")
+
+        if not self._verificar_senha(senha, usuario.senha_hash):
+            raise AutenticacaoError("Credenciais inválidas")
+
+        return self._gerar_token(usuario)
+
+    async def validar_token(self, token: str) -> Usuario:
+        """
+        Valida um token JWT.
+
+        Args:
+            token: Token JWT
+
+        Returns:
+            Usuário autenticado
+
+        Raises:
+            AutenticacaoError: Se o token for inválido
+        """
+        try:
+            payload = jwt.decode(
+                token,
+                self._secret_key,
+                algorithms=["HS256"],
+            )
+        except InvalidTokenError:
+            raise AutenticacaoError("Token inválido")
+
+        usuario = await self._usuario_repository.buscar_por_id(UUID(payload["sub"]))
+        if not usuario:
+            raise AutenticacaoError("Token inválido")
+
+        if not usuario.ativo:
+            raise AutenticacaoError("Usuário inativo")
+
+        return usuario
@@ -0,0 +1,218 @@
+"""
+Serviço de aplicação assíncrono para gerenciamento de perfis.
+
+Versão do PerfilService sobre os repositórios assíncronos, usada pelos
+endpoints da API. O PerfilService síncrono continua disponível para
+scripts.
+"""
+from typing import List, Optional
+
+from ...domain.entities.perfil import Perfil
+from ...infrastructure.persistence.sqlalchemy.repositories.async_perfil_repository import (
+    AsyncSQLPerfilRepository,
+)
+from ...infrastructure.persistence.sqlalchemy.repositories.async_permissao_repository import (
+    AsyncSQLPermissaoRepository,
+)
+from ..dtos.perfil import AtualizarPerfilDTO, CriarPerfilDTO, PerfilDTO
+from ..dtos.permissao import PermissaoDTO
+
+
+def perfil_to_dto(perfil: Perfil) -> PerfilDTO:
+    """
+    Converte um perfil em DTO.
+
+    Args:
+        perfil: Perfil com suas permissões
+
+    Returns:
+        DTO com os dados do perfil
+    """
+    return PerfilDTO(
+        id=str(perfil.id),
+        nome=perfil.nome,
+        descricao=perfil.descricao,
+        permissoes=[
+            PermissaoDTO(
+                id=str(p.id),
+                nome=p.nome,
+                chave=p.chave,
+                descricao=p.descricao,
+            )
+            for p in perfil.permissoes
+        ],
+        data_criacao=perfil.data_criacao,
+    )
+
+
+class AsyncPerfilService:
+    """
+    Serviço de aplicação assíncrono para gerenciamento de perfis.
+
+    Implementa os mesmos casos de uso do PerfilService, aguardando as
+    chamadas aos repositórios.
+    """
+
+    def __init__(
+        self,
+        perfil_repository: AsyncSQLPerfilRepository,
+        permissao_repository: AsyncSQLPermissaoRepository,
+    ):
+        """
+        Inicializa o serviço com suas dependências.
+
+        Args:
+            perfil_repository: Repositório assíncrono de perfis
+            permissao_repository: Repositório assíncrono de permissões
+        """
+        self._perfil_repository = perfil_repository
+        self._permissao_repository = permissao_repository
+
+    async def criar_perfil(self, dados: CriarPerfilDTO) -> PerfilDTO:
+        """
+        Cria um novo perfil no sistema.
+
+        Args:
+            dados: DTO com os dados do perfil
+
+        Returns:
+            DTO com os dados do perfil criado
+
+        Raises:
+            ValueError: Se os dados forem inválidos ou o nome já existir
+        """
+        if await self._perfil_repository.buscar_por_nome(dados.nome):
+            raise ValueError(f"Nome de perfil já cadastrado: {dados.nome}")
+
+        perfil = Perfil(
+            nome=dados.nome,
+            descricao=dados.descricao,
+        )
+        perfil = await self._perfil_repository.criar(perfil)
+
+        return perfil_to_dto(perfil)
+
+    async def atualizar_perfil(self, id: str, dados: AtualizarPerfilDTO) -> PerfilDTO:
+        """
+        Atualiza um perfil existente.
+
+        Args:
+            id: ID do perfil
+            dados: DTO com os dados a serem atualizados
+
+        Returns:
+            DTO com os dados do perfil atualizado
+
+        Raises:
+            ValueError: Se o perfil não existir ou os dados forem inválidos
+        """
+        perfil = await self._perfil_repository.buscar_por_id(id)
+        if not perfil:
+            raise ValueError("Perfil não encontrado")
+
+        if dados.nome and dados.nome != perfil.nome:
+            if await self._perfil_repository.buscar_por_nome(dados.nome):
+                raise ValueError(f"Nome de perfil já cadastrado: {dados.nome}")
+            perfil.nome = dados.nome
+
+        if dados.descricao is not None:
+            perfil.descricao = dados.descricao
+
+        perfil = await self._perfil_repository.atualizar(perfil)
+        return perfil_to_dto(perfil)
+
+    async def buscar_perfil(self, id: str) -> Optional[PerfilDTO]:
+        """
+        Busca um perfil pelo ID.
+
+        Args:
+            id: ID do perfil
+
+        Returns:
+            DTO com os dados do perfil ou None
+        """
+        perfil = await self._perfil_repository.buscar_por_id(id)
+        return perfil_to_dto(perfil) if perfil else None
+
+    async def listar_perfis(self) -> List[PerfilDTO]:
+        """
+        Lista todos os perfis.
+
+        Returns:
+            Lista de DTOs de perfil
+        """
+        perfis = await self._perfil_repository.listar()
+        return [perfil_to_dto(perfil) for perfil in perfis]
+
+    async def adicionar_permissao(self, perfil_id: str, permissao_id: str) -> PerfilDTO:
+        """
+        Adiciona uma permissão a um perfil.
+
+        Args:
+            perfil_id: ID do perfil
+            permissao_id: ID da permissão
+
+        Returns:
+            DTO com os dados do perfil atualizado
+
+        Raises:
+            ValueError: Se o perfil ou a permissão não existirem
+        """
+        perfil = await self._perfil_repository.buscar_por_id(perfil_id)
+        if not perfil:
+            raise ValueError("Perfil não encontrado")
+
+        permissao = await self._permissao_repository.buscar_por_id(permissao_id)
+        if not permissao:
+            raise ValueError("Permissão não encontrada")
+
+        perfil.adicionar_permissao(permissao)
+        perfil = await self._perfil_repository.atualizar(perfil)
+        return perfil_to_dto(perfil)
+
+    async def remover_permissao(self, perfil_id: str, permissao_id: str) -> PerfilDTO:
+        """
+        Remove uma permissão de um perfil.
+
+        Args:
+            perfil_id: ID do perfil
+            permissao_id: ID da permissão
+
+        Returns:
+            DTO com os dados do perfil atualizado
+
+        Raises:
+            ValueError: Se o perfil ou a permissão não existirem
+        """
+        perfil = await self._perfil_repository.buscar_por_id(perfil_id)
+        if not perfil:
+            raise ValueError("Perfil não encontrado")
+
+        permissao = await self._permissao_repository.buscar_por_id(permissao_id)
+        if not permissao:
+            raise ValueError("Permissão não encontrada")
+
+        perfil.remover_permissao(permissao)
+        perfil = await self._perfil_repository.atualizar(perfil)
+        return perfil_to_dto(perfil)
+
+    async def excluir_perfil(self, id: str) -> None:
+        """
+        Exclui um perfil do sistema.
+
+        Args:
+            id: ID do perfil
+
+        Raises:
+            ValueError: Se o perfil não existir ou não puder ser excluído
+        """
+        perfil = await self._perfil_repository.buscar_por_id(id)
+        if not perfil:
+            raise ValueError("Perfil não encontrado")
+
+        if perfil.permissoes:
+            raise ValueError(
+                "Não é possível excluir um perfil que possui permissões associadas"
+            )
+
+        await self._perfil_repository.deletar(perfil)
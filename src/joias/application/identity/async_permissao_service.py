@@ -0,0 +1,156 @@
+"""
+Serviço de aplicação assíncrono para gerenciamento de permissões.
+
+Versão do PermissaoService sobre o repositório assíncrono, usada pelos
+endpoints da API.
+"""
+from typing import List, Optional
+
+from ...domain.entities.permissao import Permissao
+from ...infrastructure.persistence.sqlalchemy.repositories.async_permissao_repository import (
+    AsyncSQLPermissaoRepository,
+)
+from ..dtos.permissao import AtualizarPermissaoDTO, CriarPermissaoDTO, PermissaoDTO
+
+
+def permissao_to_dto(permissao: Permissao) -> PermissaoDTO:
+    """
+    Converte uma permissão em DTO.
+
+    Args:
+        permissao: Permissão
+
+    Returns:
+        DTO com os dados da permissão
+    """
+    return PermissaoDTO(
+        id=str(permissao.id),
+        nome=permissao.nome,
+        chave=permissao.chave,
+        descricao=permissao.descricao,
+    )
+
+
+class AsyncPermissaoService:
+    """
+    Serviço de aplicação assíncrono para gerenciamento de permissões.
+
+    Implementa os mesmos casos de uso do PermissaoService, aguardando as
+    chamadas ao repositório.
+    """
+
+    def __init__(self, permissao_repository: AsyncSQLPermissaoRepository):
+        """
+        Inicializa o serviço com suas dependências.
+
+        Args:
+            permissao_repository: Repositório assíncrono de permissões
+        """
+        self._permissao_repository = permissao_repository
+
+    async def criar_permissao(self, dados: CriarPermissaoDTO) -> PermissaoDTO:
+        """
+        Cria uma nova permissão no sistema.
+
+        Args:
+            dados: DTO com os dados da permissão
+
+        Returns:
+            DTO com os dados da permissão criada
+
+        Raises:
+            ValueError: Se os dados forem inválidos ou a chave já existir
+        """
+        chave = dados.chave.upper()
+
+        if await self._permissao_repository.buscar_por_chave(chave):
+            raise ValueError(f"Chave de permissão já cadastrada: {chave}")
+
+        permissao = Permissao(
+            nome=dados.nome,
+            chave=chave,
+            descricao=dados.descricao,
+        )
+        permissao = await self._permissao_repository.criar(permissao)
+
+        return permissao_to_dto(permissao)
+
+    async def atualizar_permissao(
+        self, id: str, dados: AtualizarPermissaoDTO
+    ) -> PermissaoDTO:
+        """
+        Atualiza uma permissão existente.
+
+        Args:
+            id: ID da permissão
+            dados: DTO com os dados a serem atualizados
+
+        Returns:
+            DTO com os dados da permissão atualizada
+
+        Raises:
+            ValueError: Se a permissão não existir ou os dados forem inválidos
+        """
+        permissao = await self._permissao_repository.buscar_por_id(id)
+        if not permissao:
+            raise ValueError("Permissão não encontrada")
+
+        if dados.chave:
+            chave = dados.chave.upper()
+            existente = await self._permissao_repository.buscar_por_chave(chave)
+            if existente and existente.id != permissao.id:
+                raise ValueError(f"Chave de permissão já cadastrada: {chave}")
+            permissao.chave = chave
+
+        if dados.nome is not None:
+            permissao.nome = dados.nome
+
+        if dados.descricao is not None:
+            permissao.descricao = dados.descricao
+
+        permissao = await self._permissao_repository.atualizar(permissao)
+        return permissao_to_dto(permissao)
+
+    async def buscar_permissao(self, id: str) -> Optional[PermissaoDTO]:
+        """
+        Busca uma permissão pelo ID.
+
+        Args:
+            id: ID da permissão
+
+        Returns:
+            DTO com os dados da permissão ou None
+        """
+        permissao = await self._permissao_repository.buscar_por_id(id)
+        return permissao_to_dto(permissao) if permissao else None
+
+    async def listar_permissoes(self) -> List[PermissaoDTO]:
+        """
+        Lista todas as permissões.
+
+        Returns:
+            Lista de DTOs de permissão
+        """
+        permissoes = await self._permissao_repository.listar()
+        return [permissao_to_dto(p) for p in permissoes]
+
+    async def excluir_permissao(self, id: str) -> None:
+        """
+        Exclui uma permissão do sistema.
+
+        Args:
+            id: ID da permissão
+
+        Raises:
+            ValueError: Se a permissão não existir ou não puder ser excluída
+        """
+        permissao = await self._permissao_repository.buscar_por_id(id)
+        if not permissao:
+            raise ValueError("Permissão não encontrada")
+
+        if await self._permissao_repository.tem_perfis_associados(permissao.id):
+            raise ValueError(
+                "Não é possível excluir uma permissão que está associada a perfis"
+            )
+
+        await self._permissao_repository.excluir(permissao)
@@ -0,0 +1,181 @@
+"""
+Serviço de usuário assíncrono.
+
+Versão do UsuarioService sobre o repositório assíncrono de usuários,
+usada pelos endpoints da API. Trabalha com a entidade de usuário mapeada
+pelo repositório (`domain.entities.autorizacao.Usuario`).
+"""
+from typing import List, Optional
+from uuid import UUID
+
+from ...domain.entities.autorizacao import Usuario
+from ...domain.repositories.usuario_repository import ResumoUsuario
+from ...domain.shared.value_objects import Email
+from ...infrastructure.persistence.sqlalchemy.repositories.async_usuario_repository import (
+    AsyncUsuarioRepository,
+)
+from ..shared.exceptions import (
+    EntidadeJaExisteError,
+    EntidadeNaoEncontradaError,
+    ValidacaoError,
+)
+from .auth_service import AuthService
+
+
+class AsyncUsuarioService:
+    """
+    Serviço assíncrono para gerenciamento de usuários.
+    """
+
+    def __init__(
+        self,
+        usuario_repository: AsyncUsuarioRepository,
+        auth_service: AuthService,
+    ):
+        """
+        Inicializa o serviço de usuário.
+
+        Args:
+            usuario_repository: Repositório assíncrono de usuários
+            auth_service: Serviço de autenticação (usado para o hash de senha)
+        """
+        self._usuario_repository = usuario_repository
+        self._auth_service = auth_service
+
+    async def criar_usuario(self, nome: str, email: str, senha: str) -> Usuario:
+        """
+        Cria um novo usuário.
+
+        Args:
+            nome: Nome do usuário
+            email: Email do usuário
+            senha: Senha do usuário
+
+        Returns:
+            Usuário criado
+
+        Raises:
+            EntidadeJaExisteError: Se já existe um usuário com o email informado
+            ValidacaoError: Se os dados do usuário são inválidos
+        """
+        email_obj = self._validar_email(email)
+
+        if await self._usuario_repository.buscar_por_email(str(email_obj)):
+            raise EntidadeJaExisteError("Já existe um usuário com este email")
+
+        usuario = Usuario.criar(
+            email=str(email_obj),
+            nome=nome,
+            senha_hash=self._auth_service.gerar_hash_senha(senha),
+        )
+        return await self._usuario_repository.criar(usuario)
+
+    async def buscar_usuario_por_id(self, id: str) -> Usuario:
+        """
+        Busca um usuário pelo ID.
+
+        Args:
+            id: ID do usuário
+
+        Returns:
+            Usuário encontrado
+
+        Raises:
+            EntidadeNaoEncontradaError: Se o usuário não for encontrado
+        """
+        try:
+            usuario_id = UUID(str(id))
+        except ValueError:
+            raise EntidadeNaoEncontradaError("Usuário não encontrado")
+
+        usuario = await self._usuario_repository.buscar_por_id(usuario_id)
+        if not usuario:
+            raise EntidadeNaoEncontradaError("Usuário não encontrado")
+        return usuario
+
+    async def listar_resumos(self) -> List[ResumoUsuario]:
+        """
+        Lista os resumos dos usuários, sem carregar as entidades.
+
+        Returns:
+            Lista de resumos de usuários
+        """
+        return await self._usuario_repository.listar_resumos()
+
+    async def atualizar_usuario(
+        self,
+        id: str,
+        nome: Optional[str] = None,
+        email: Optional[str] = None,
+        senha: Optional[str] = None,
+        ativo: Optional[bool] = None,
+    ) -> Usuario:
+        """
+        Atualiza um usuário.
+
+        Args:
+            id: ID do usuário
+            nome: Novo nome do usuário
+            email: Novo email do usuário
+            senha: Nova senha do usuário
+            ativo: Novo status do usuário
+
+        Returns:
+            Usuário atualizado
+
+        Raises:
+            EntidadeNaoEncontradaError: Se o usuário não for encontrado
+            EntidadeJaExisteError: Se já existe um usuário com o novo email
+            ValidacaoError: Se os dados do usuário são inválidos
+        """
+        usuario = await self.buscar_usuario_por_id(id)
+
+        if email is not None:
+            email = str(self._validar_email(email))
+            existente = await self._usuario_repository.buscar_por_email(email)
+            if existente and existente.id != usuario.id:
+                raise EntidadeJaExisteError("Já existe um usuário com este email")
+
+        usuario.atualizar(
+            email=email,
+            nome=nome,
+            senha_hash=(
+                self._auth_service.gerar_hash_senha(senha)
+                if senha is not None
+                else None
+            ),
+            ativo=ativo,
+        )
+        return await self._usuario_repository.atualizar(usuario)
+
+    async def excluir_usuario(self, id: str) -> None:
+        """
+        Exclui um usuário.
+
+        Args:
+            id: ID do usuário
+
+        Raises:
+            EntidadeNaoEncontradaError: Se o usuário não for encontrado
+        """
+        usuario = await self.buscar_usuario_por_id(id)
+        await self._usuario_repository.excluir(usuario.id)
+
+    @staticmethod
+    def _validar_email(email: str) -> Email:
+        """
+        Valida um endereço de email.
+
+        Args:
+            email: Email informado
+
+        Returns:
+            Objeto de valor do email
+
+        Raises:
+            ValidacaoError: Se o email for inválido
+        """
+        try:
+            return Email(email)
+        except ValueError as e:
+            raise ValidacaoError(str(e))
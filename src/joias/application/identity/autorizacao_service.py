@@ -0,0 +1,67 @@
+"""
+Serviço de aplicação para autorização.
+"""
+from typing import FrozenSet
+from uuid import UUID
+
+from ...domain.repositories.permissoes_efetivas_repository import (
+    IPermissoesEfetivasRepository,
+)
+from ..shared.exceptions import AutorizacaoError
+
+
+class AutorizacaoService:
+    """
+    Serviço de aplicação para autorização.
+
+    Verifica as permissões de um usuário contra o conjunto de suas
+    permissões efetivas, resolvido (e mantido em cache) pelo repositório.
+    """
+
+    def __init__(self, permissoes_repository: IPermissoesEfetivasRepository):
+        """
+        Inicializa o serviço com suas dependências.
+
+        Args:
+            permissoes_repository: Repositório de permissões efetivas
+        """
+        self._permissoes_repository = permissoes_repository
+
+    def permissoes_do_usuario(self, usuario_id: UUID) -> FrozenSet[str]:
+        """
+        Retorna as chaves das permissões efetivas de um usuário.
+
+        Args:
+            usuario_id: ID do usuário
+
+        Returns:
+            Chaves das permissões do usuário
+        """
+        return self._permissoes_repository.buscar_chaves(usuario_id)
+
+    def tem_permissao(self, usuario_id: UUID, chave: str) -> bool:
+        """
+        Verifica se um usuário tem uma permissão.
+
+        Args:
+            usuario_id: ID do usuário
+            chave: Chave da permissão (ex: "produto:editar")
+
+        Returns:
+            True se o usuário tiver a permissão
+        """
+        return chave.upper() in self.permissoes_do_usuario(usuario_id)
+
+    def exigir_permissao(self, usuario_id: UUID, chave: str) -> None:
+        """
+        Exige que um usuário tenha uma permissão.
+
+        Args:
+            usuario_id: ID do usuário
+            chave: Chave da permissão (ex: "produto:editar")
+
+        Raises:
+            AutorizacaoError: Se o usuário não tiver a permissão
+        """
+        if not self.tem_permissao(usuario_id, chave):
+            raise AutorizacaoError(f"Permissão {chave.upper()} necessária")
@@ -5,7 +5,10 @@ from typing import List, Optional
 from uuid import UUID
 
 from ...domain.entities.usuario import Usuario
-from ...domain.repositories.usuario_repository import IUsuarioRepository
+from ...domain.repositories.usuario_repository import (
+    IUsuarioRepository,
+    ResumoUsuario,
+)
 from ...domain.shared.value_objects import Email
 from ..shared.exceptions import (
     EntidadeJaExisteError,
@@ -125,6 +128,15 @@ class UsuarioService:
         """
         return self._usuario_repository.listar()
 
+    def listar_resumos(self) -> List[ResumoUsuario]:
+        """
+        Lista os resumos dos usuários, sem carregar as entidades.
+
+        Returns:
+            Lista de resumos de usuários
+        """
+        return self._usuario_repository.listar_resumos()
+
     def atualizar_usuario(
         self,
         id: str,
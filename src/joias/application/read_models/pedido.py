@@ -0,0 +1,100 @@
+"""
+Modelos de leitura de pedidos.
+
+Este módulo contém projeções compactas de pedidos, mantidas a partir
+dos eventos de domínio emitidos pela entidade Pedido, para que as
+listagens não precisem carregar agregados completos.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List
+from uuid import UUID
+
+from ...domain.entities.eventos_pedido import EventoPedido
+from ...domain.entities.pedido import StatusPedido
+from ...domain.shared.events.publicador import PublicadorEventos
+
+STATUS_INATIVOS = {StatusPedido.CANCELADO.value, StatusPedido.ENTREGUE.value}
+
+
+@dataclass(frozen=True)
+class ResumoPedido:
+    """Linha compacta de listagem de pedidos."""
+
+    pedido_id: int
+    cliente_id: UUID
+    status: str
+    quantidade_itens: int
+    total: Decimal
+    data_criacao: datetime
+    data_modificacao: datetime
+
+
+class ResumoPedidosReadModel:
+    """
+    Projeção de resumos de pedidos por cliente e de pedidos ativos.
+
+    Cada evento de pedido traz o resumo completo do pedido, então a
+    projeção apenas substitui a linha do pedido e ajusta os índices.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa a projeção vazia."""
+        self._resumos: Dict[int, ResumoPedido] = {}
+        # Dicionários usados como conjuntos ordenados por inserção
+        self._por_cliente: Dict[UUID, Dict[int, None]] = {}
+        self._ativos: Dict[int, None] = {}
+
+    def inscrever_em(self, publicador: PublicadorEventos) -> None:
+        """
+        Inscreve a projeção nos eventos de pedido de um publicador.
+
+        Args:
+            publicador: Publicador de eventos de domínio
+        """
+        publicador.inscrever(EventoPedido, self.aplicar)
+
+    def aplicar(self, evento: EventoPedido) -> None:
+        """
+        Aplica um evento de pedido à projeção.
+
+        Args:
+            evento: Evento de pedido
+        """
+        resumo = ResumoPedido(
+            pedido_id=evento.pedido_id,
+            cliente_id=evento.cliente_id,
+            status=evento.status,
+            quantidade_itens=evento.quantidade_itens,
+            total=evento.total,
+            data_criacao=evento.data_criacao,
+            data_modificacao=evento.data_modificacao,
+        )
+        self._resumos[resumo.pedido_id] = resumo
+        self._por_cliente.setdefault(resumo.cliente_id, {})[resumo.pedido_id] = None
+        if resumo.status in STATUS_INATIVOS:
+            self._ativos.pop(resumo.pedido_id, None)
+        else:
+            self._ativos[resumo.pedido_id] = None
+
+    def listar_por_cliente(self, cliente_id: UUID) -> List[ResumoPedido]:
+        """
+        Lista os resumos dos pedidos de um cliente.
+
+        Args:
+            cliente_id: ID do cliente
+
+        Returns:
+            Lista de resumos dos pedidos do cliente
+        """
+        return [self._resumos[i] for i in self._por_cliente.get(cliente_id, ())]
+
+    def listar_ativos(self) -> List[ResumoPedido]:
+        """
+        Lista os resumos dos pedidos ativos (não cancelados e não entregues).
+
+        Returns:
+            Lista de resumos dos pedidos ativos
+        """
+        return [self._resumos[i] for i in self._ativos]
@@ -32,4 +32,11 @@ class AutenticacaoError(Exception):
     Exceção lançada quando há erro de autenticação.
     """
 
-    pass 
\ No newline at end of file
+    pass 
+
+class AutorizacaoError(Exception):
+    """
+    Exceção lançada quando o usuário não tem a permissão exigida.
+    """
+
+    pass
@@ -7,6 +7,7 @@ relacionadas a pedidos.
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import List, Optional
+from uuid import UUID
 
 from ...domain.entities.dados_pessoais import Endereco
 from ...domain.entities.pedido import ItemPedido, Pedido, StatusPedido
@@ -14,9 +15,26 @@ from ...domain.entities.produto import Produto, Variacao
 from ...domain.entities.usuario import Usuario
 from ...domain.repositories.pedido import PedidoRepository
 from ...domain.repositories.produto import ProdutoRepository
+from ...domain.shared.events.publicador import PublicadorEventos
+from ..read_models.pedido import ResumoPedido, ResumoPedidosReadModel
 from .base import UseCase
 
 
+def _publicar_eventos(
+    publicador: Optional[PublicadorEventos], pedido: Pedido
+) -> None:
+    """
+    Publica os eventos pendentes do pedido e limpa a lista.
+
+    Args:
+        publicador: Publicador de eventos (nada é publicado se None)
+        pedido: Pedido já persistido
+    """
+    if publicador is not None:
+        publicador.publicar(pedido.eventos)
+    pedido.limpar_eventos()
+
+
 @dataclass
 class CriarPedidoInput:
     """Dados de entrada para criação de pedido."""
@@ -29,8 +47,13 @@ class CriarPedidoInput:
 class CriarPedidoUseCase(UseCase[CriarPedidoInput, Pedido]):
     """Caso de uso para criar um novo pedido."""
 
-    def __init__(self, pedido_repository: PedidoRepository):
+    def __init__(
+        self,
+        pedido_repository: PedidoRepository,
+        publicador: Optional[PublicadorEventos] = None,
+    ):
         self.pedido_repository = pedido_repository
+        self.publicador = publicador
 
     def execute(self, input_data: CriarPedidoInput) -> Pedido:
         """
@@ -48,7 +71,10 @@ class CriarPedidoUseCase(UseCase[CriarPedidoInput, Pedido]):
             observacoes=input_data.observacoes,
         )
 
-        return self.pedido_repository.criar(pedido)
+        pedido = self.pedido_repository.criar(pedido)
+        pedido.registrar_criacao()
+        _publicar_eventos(self.publicador, pedido)
+        return pedido
 
 
 @dataclass
@@ -66,10 +92,14 @@ class AdicionarItemUseCase(UseCase[AdicionarItemInput, Pedido]):
     """Caso de uso para adicionar um item a um pedido."""
 
     def __init__(
-        self, pedido_repository: PedidoRepository, produto_repository: ProdutoRepository
+        self,
+        pedido_repository: PedidoRepository,
+        produto_repository: ProdutoRepository,
+        publicador: Optional[PublicadorEventos] = None,
     ):
         self.pedido_repository = pedido_repository
         self.produto_repository = produto_repository
+        self.publicador = publicador
 
     def execute(self, input_data: AdicionarItemInput) -> Pedido:
         """
@@ -97,9 +127,7 @@ class AdicionarItemUseCase(UseCase[AdicionarItemInput, Pedido]):
 
         variacao = None
         if input_data.variacao_id:
-            variacao = next(
-                (v for v in produto.variacoes if v.id == input_data.variacao_id), None
-            )
+            variacao = produto.buscar_variacao(input_data.variacao_id)
             if not variacao:
                 raise ValueError("Variação não encontrada")
 
@@ -112,7 +140,101 @@ class AdicionarItemUseCase(UseCase[AdicionarItemInput, Pedido]):
         )
 
         pedido.adicionar_item(item)
-        return self.pedido_repository.atualizar(pedido)
+        pedido = self.pedido_repository.atualizar(pedido)
+        _publicar_eventos(self.publicador, pedido)
+        return pedido
+
+
+@dataclass
+class ItemPedidoInput:
+    """Dados de um item na adição em lote."""
+
+    produto_id: int
+    quantidade: int
+    variacao_id: Optional[int] = None
+    desconto: Decimal = Decimal("0")
+
+
+@dataclass
+class AdicionarItensInput:
+    """Dados de entrada para adicionar vários itens ao pedido."""
+
+    pedido_id: int
+    itens: List[ItemPedidoInput]
+
+
+class AdicionarItensUseCase(UseCase[AdicionarItensInput, Pedido]):
+    """
+    Caso de uso para adicionar vários itens a um pedido.
+
+    Os produtos são carregados em uma única chamada ao repositório e o
+    pedido é persistido uma única vez. Se algum item for inválido,
+    nenhum item é adicionado.
+    """
+
+    def __init__(
+        self,
+        pedido_repository: PedidoRepository,
+        produto_repository: ProdutoRepository,
+        publicador: Optional[PublicadorEventos] = None,
+    ):
+        self.pedido_repository = pedido_repository
+        self.produto_repository = produto_repository
+        self.publicador = publicador
+
+    def execute(self, input_data: AdicionarItensInput) -> Pedido:
+        """
+        Executa o caso de uso.
+
+        Args:
+            input_data: Dados de entrada
+
+        Returns:
+            Pedido atualizado
+
+        Raises:
+            ValueError: Se o pedido, algum produto ou variação não existirem
+        """
+        pedido = self.pedido_repository.buscar_por_id(input_data.pedido_id)
+        if not pedido:
+            raise ValueError("Pedido não encontrado")
+
+        if not pedido.pode_modificar():
+            raise ValueError("Pedido não pode ser modificado")
+
+        produtos = {
+            p.id: p
+            for p in self.produto_repository.buscar_por_ids(
+                [i.produto_id for i in input_data.itens]
+            )
+        }
+
+        itens = []
+        for item_input in input_data.itens:
+            produto = produtos.get(item_input.produto_id)
+            if not produto:
+                raise ValueError("Produto não encontrado")
+
+            variacao = None
+            if item_input.variacao_id:
+                variacao = produto.buscar_variacao(item_input.variacao_id)
+                if not variacao:
+                    raise ValueError("Variação não encontrada")
+
+            itens.append(
+                ItemPedido(
+                    produto=produto,
+                    quantidade=item_input.quantidade,
+                    preco_unitario=produto.preco.valor,
+                    variacao=variacao,
+                    desconto=item_input.desconto,
+                )
+            )
+
+        pedido.adicionar_itens(itens)
+        pedido = self.pedido_repository.atualizar(pedido)
+        _publicar_eventos(self.publicador, pedido)
+        return pedido
 
 
 @dataclass
@@ -128,8 +250,13 @@ class AtualizarPedidoInput:
 class AtualizarPedidoUseCase(UseCase[AtualizarPedidoInput, Pedido]):
     """Caso de uso para atualizar um pedido existente."""
 
-    def __init__(self, pedido_repository: PedidoRepository):
+    def __init__(
+        self,
+        pedido_repository: PedidoRepository,
+        publicador: Optional[PublicadorEventos] = None,
+    ):
         self.pedido_repository = pedido_repository
+        self.publicador = publicador
 
     def execute(self, input_data: AtualizarPedidoInput) -> Pedido:
         """
@@ -156,9 +283,11 @@ class AtualizarPedidoUseCase(UseCase[AtualizarPedidoInput, Pedido]):
         if input_data.observacoes is not None:
             pedido.observacoes = input_data.observacoes
         if input_data.desconto_total is not None:
-            pedido.desconto_total = input_data.desconto_total
+            pedido.aplicar_desconto(input_data.desconto_total)
 
-        return self.pedido_repository.atualizar(pedido)
+        pedido = self.pedido_repository.atualizar(pedido)
+        _publicar_eventos(self.publicador, pedido)
+        return pedido
 
 
 @dataclass
@@ -172,8 +301,13 @@ class AtualizarStatusInput:
 class AtualizarStatusUseCase(UseCase[AtualizarStatusInput, Pedido]):
     """Caso de uso para atualizar o status de um pedido."""
 
-    def __init__(self, pedido_repository: PedidoRepository):
+    def __init__(
+        self,
+        pedido_repository: PedidoRepository,
+        publicador: Optional[PublicadorEventos] = None,
+    ):
         self.pedido_repository = pedido_repository
+        self.publicador = publicador
 
     def execute(self, input_data: AtualizarStatusInput) -> Pedido:
         """
@@ -193,7 +327,9 @@ class AtualizarStatusUseCase(UseCase[AtualizarStatusInput, Pedido]):
             raise ValueError("Pedido não encontrado")
 
         pedido.atualizar_status(input_data.novo_status)
-        return self.pedido_repository.atualizar(pedido)
+        pedido = self.pedido_repository.atualizar(pedido)
+        _publicar_eventos(self.publicador, pedido)
+        return pedido
 
 
 class ListarPedidosClienteUseCase(UseCase[int, List[Pedido]]):
@@ -229,3 +365,38 @@ class ListarPedidosAtivosUseCase(UseCase[None, List[Pedido]]):
             Lista de pedidos ativos
         """
         return self.pedido_repository.buscar_pedidos_ativos()
+
+
+class ListarResumoPedidosClienteUseCase(UseCase[UUID, List[ResumoPedido]]):
+    """Caso de uso para listar resumos dos pedidos de um cliente."""
+
+    def __init__(self, read_model: ResumoPedidosReadModel):
+        self.read_model = read_model
+
+    def execute(self, cliente_id: UUID) -> List[ResumoPedido]:
+        """
+        Executa o caso de uso.
+
+        Args:
+            cliente_id: ID do cliente
+
+        Returns:
+            Lista de resumos dos pedidos do cliente
+        """
+        return self.read_model.listar_por_cliente(cliente_id)
+
+
+class ListarResumoPedidosAtivosUseCase(UseCase[None, List[ResumoPedido]]):
+    """Caso de uso para listar resumos dos pedidos ativos."""
+
+    def __init__(self, read_model: ResumoPedidosReadModel):
+        self.read_model = read_model
+
+    def execute(self, _: None = None) -> List[ResumoPedido]:
+        """
+        Executa o caso de uso.
+
+        Returns:
+            Lista de resumos dos pedidos ativos
+        """
+        return self.read_model.listar_ativos()
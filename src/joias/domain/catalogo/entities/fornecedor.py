@@ -6,7 +6,7 @@ com seus documentos, endereço e produtos fornecidos.
 """
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from ...shared.value_objects.endereco import Endereco
 from .produto import Produto
@@ -43,6 +43,26 @@ class Documento:
         elif self.tipo == "CPF" and len(self.numero) != 11:
             raise ValueError("CPF deve ter 11 dígitos")
 
+    @classmethod
+    def reconstruir(cls, numero: str, tipo: str) -> "Documento":
+        """
+        Recria um documento já validado, sem repetir a validação.
+
+        Usado pelos repositórios para documentos lidos do banco, que foram
+        normalizados e validados quando gravados.
+
+        Args:
+            numero: Número do documento, apenas dígitos
+            tipo: Tipo do documento, em maiúsculas
+
+        Returns:
+            Documento: O documento recriado
+        """
+        documento = object.__new__(cls)
+        documento.numero = numero
+        documento.tipo = tipo
+        return documento
+
     def __str__(self) -> str:
         """Retorna uma representação string do documento."""
         if self.tipo == "CNPJ":
@@ -62,6 +82,114 @@ class Documento:
         )
 
 
+class ProdutosFornecedor:
+    """
+    Coleção dos produtos de um fornecedor.
+
+    Os produtos são indexados pelo SKU, então verificar, adicionar e
+    remover um produto não percorrem a coleção. Quando criada com uma
+    função de carregamento, a coleção só é carregada quando percorrida:
+    adicionar e remover produtos apenas registram a alteração, que o
+    repositório grava ao salvar o fornecedor, e a verificação de um
+    produto usa a função `contem`, sem trazer todos os produtos.
+    """
+
+    def __init__(
+        self,
+        produtos: Iterable[Produto] = (),
+        carregar: Optional[Callable[[], Iterable[Produto]]] = None,
+        contem: Optional[Callable[[Produto], bool]] = None,
+    ):
+        """
+        Inicializa a coleção.
+
+        Args:
+            produtos: Produtos iniciais
+            carregar: Função que carrega os produtos sob demanda (opcional)
+            contem: Função que verifica se um produto pertence à coleção
+                sem carregá-la (opcional)
+        """
+        self._carregar = carregar
+        self._contem = contem
+        self._por_sku: Optional[Dict[str, Produto]] = None
+        self._adicionados: Dict[str, Produto] = {}
+        self._removidos: Dict[str, Produto] = {}
+        if carregar is None:
+            self._por_sku = {produto.sku: produto for produto in produtos}
+
+    @property
+    def carregada(self) -> bool:
+        """Indica se os produtos já foram carregados."""
+        return self._por_sku is not None
+
+    def _produtos(self) -> Dict[str, Produto]:
+        if self._por_sku is None:
+            por_sku = {produto.sku: produto for produto in self._carregar()}
+            for sku in self._removidos:
+                por_sku.pop(sku, None)
+            for sku, produto in self._adicionados.items():
+                por_sku.setdefault(sku, produto)
+            self._por_sku = por_sku
+        return self._por_sku
+
+    def adicionar(self, produto: Produto) -> None:
+        """
+        Adiciona um produto, se ainda não estiver na coleção.
+
+        Args:
+            produto: O produto a ser adicionado
+        """
+        self._removidos.pop(produto.sku, None)
+        if self._por_sku is not None:
+            if produto.sku in self._por_sku:
+                return
+            self._por_sku[produto.sku] = produto
+        self._adicionados[produto.sku] = produto
+
+    def remover(self, produto: Produto) -> None:
+        """
+        Remove um produto, se estiver na coleção.
+
+        Args:
+            produto: O produto a ser removido
+        """
+        self._adicionados.pop(produto.sku, None)
+        if self._por_sku is not None:
+            if self._por_sku.pop(produto.sku, None) is None:
+                return
+        self._removidos[produto.sku] = produto
+
+    def extrair_alteracoes(self) -> Tuple[List[Produto], List[Produto]]:
+        """
+        Retorna e descarta as alterações ainda não gravadas.
+
+        Returns:
+            Tuple[List[Produto], List[Produto]]: Produtos adicionados e
+            produtos removidos desde a criação da coleção ou a última
+            extração
+        """
+        alteracoes = list(self._adicionados.values()), list(self._removidos.values())
+        self._adicionados.clear()
+        self._removidos.clear()
+        return alteracoes
+
+    def __contains__(self, produto: object) -> bool:
+        sku = getattr(produto, "sku", None)
+        if sku in self._adicionados:
+            return True
+        if sku in self._removidos:
+            return False
+        if self._por_sku is None and self._contem is not None:
+            return self._contem(produto)
+        return sku in self._produtos()
+
+    def __iter__(self) -> Iterator[Produto]:
+        return iter(list(self._produtos().values()))
+
+    def __len__(self) -> int:
+        return len(self._produtos())
+
+
 @dataclass
 class Fornecedor:
     """
@@ -74,9 +202,13 @@ class Fornecedor:
     nome: str
     documentos: List[Documento]
     endereco: Endereco
-    produtos: List[Produto] = field(default_factory=list)
+    # Comparar fornecedores não deve carregar os produtos
+    produtos: ProdutosFornecedor = field(
+        default_factory=ProdutosFornecedor, compare=False, repr=False
+    )
     data_cadastro: datetime = field(default_factory=datetime.now)
     ativo: bool = True
+    id: Optional[int] = None
 
     def __post_init__(self):
         """Valida os dados do fornecedor após a inicialização."""
@@ -84,6 +216,8 @@ class Fornecedor:
             raise ValueError("O nome não pode estar vazio")
         if not self.documentos:
             raise ValueError("O fornecedor deve ter pelo menos um documento")
+        if not isinstance(self.produtos, ProdutosFornecedor):
+            self.produtos = ProdutosFornecedor(self.produtos)
 
     def adicionar_produto(self, produto: Produto) -> None:
         """
@@ -92,8 +226,7 @@ class Fornecedor:
         Args:
             produto: O produto a ser adicionado
         """
-        if produto not in self.produtos:
-            self.produtos.append(produto)
+        self.produtos.adicionar(produto)
 
     def remover_produto(self, produto: Produto) -> None:
         """
@@ -102,8 +235,7 @@ class Fornecedor:
         Args:
             produto: O produto a ser removido
         """
-        if produto in self.produtos:
-            self.produtos.remove(produto)
+        self.produtos.remover(produto)
 
     def listar_produtos(self) -> List[Produto]:
         """
@@ -112,7 +244,7 @@ class Fornecedor:
         Returns:
             List[Produto]: Lista de produtos
         """
-        return self.produtos.copy()
+        return list(self.produtos)
 
     def desativar(self) -> None:
         """Desativa o fornecedor."""
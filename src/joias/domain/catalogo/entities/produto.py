@@ -51,6 +51,7 @@ class Produto:
         detalhes (List[Detalhe]): Lista de detalhes do produto
         data_criacao (datetime): Data de criação do produto
         ativo (bool): Indica se o produto está ativo
+        id (Optional[int]): Identificador do produto, None até ser salvo
     """
 
     sku: str
@@ -61,6 +62,7 @@ class Produto:
     detalhes: List[Detalhe] = field(default_factory=list)
     data_criacao: datetime = field(default_factory=datetime.now)
     ativo: bool = True
+    id: Optional[int] = None
 
     def adicionar_variacao(self, variacao: Variacao) -> None:
         """
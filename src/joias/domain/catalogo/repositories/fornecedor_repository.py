@@ -5,9 +5,22 @@ Este módulo define a interface que deve ser implementada por qualquer
 repositório que queira persistir fornecedores.
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, NamedTuple, Optional, Set, Tuple
 
 from ..entities.fornecedor import Documento, Fornecedor
+from ..entities.produto import Produto
+
+
+class ResumoFornecedor(NamedTuple):
+    """Colunas de um fornecedor usadas nas listagens."""
+
+    id: int
+    nome: str
+    documento_numero: str
+    documento_tipo: str
+    cidade: str
+    estado: str
+    ativo: bool
 
 
 class FornecedorRepository(ABC):
@@ -32,6 +45,22 @@ class FornecedorRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def salvar_em_lote(
+        self, fornecedores: List[Fornecedor], tamanho_lote: int = 1000
+    ) -> int:
+        """
+        Insere muitos fornecedores novos de uma vez, com seus documentos.
+
+        Args:
+            fornecedores: Fornecedores a serem inseridos
+            tamanho_lote: Quantidade de fornecedores por transação
+
+        Returns:
+            int: Quantidade de fornecedores inseridos
+        """
+        pass
+
     @abstractmethod
     def buscar_por_id(self, fornecedor_id: int) -> Optional[Fornecedor]:
         """
@@ -58,6 +87,21 @@ class FornecedorRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def buscar_documentos_existentes(
+        self, documentos: List[Documento]
+    ) -> Set[Tuple[str, str]]:
+        """
+        Verifica, de uma só vez, quais documentos já estão cadastrados.
+
+        Args:
+            documentos: Documentos a serem verificados
+
+        Returns:
+            Set[Tuple[str, str]]: Pares (numero, tipo) já cadastrados
+        """
+        pass
+
     @abstractmethod
     def listar(self, apenas_ativos: bool = True) -> List[Fornecedor]:
         """
@@ -71,6 +115,22 @@ class FornecedorRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def listar_resumos(self, apenas_ativos: bool = True) -> List[ResumoFornecedor]:
+        """
+        Lista os resumos dos fornecedores, sem carregar as entidades.
+
+        O documento do resumo é o documento principal (o primeiro
+        cadastrado) de cada fornecedor.
+
+        Args:
+            apenas_ativos: Se True, retorna apenas fornecedores ativos
+
+        Returns:
+            List[ResumoFornecedor]: Resumos dos fornecedores
+        """
+        pass
+
     @abstractmethod
     def buscar_por_nome(self, nome: str) -> List[Fornecedor]:
         """
@@ -84,6 +144,67 @@ class FornecedorRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def listar_produtos_do_fornecedor(
+        self, fornecedor_id: int, apos_id: Optional[int] = None, limite: int = 50
+    ) -> Tuple[List[Produto], Optional[int]]:
+        """
+        Lista uma página dos produtos de um fornecedor, ordenados por ID.
+
+        Args:
+            fornecedor_id: ID do fornecedor
+            apos_id: Cursor; retorna apenas produtos com ID maior que ele
+            limite: Quantidade máxima de produtos na página
+
+        Returns:
+            Tuple[List[Produto], Optional[int]]: Produtos da página e o
+            cursor da próxima página (None se esta for a última)
+        """
+        pass
+
+    @abstractmethod
+    def listar_fornecedores_do_produto(
+        self, produto_id: int, apos_id: Optional[int] = None, limite: int = 50
+    ) -> Tuple[List[Fornecedor], Optional[int]]:
+        """
+        Lista uma página dos fornecedores de um produto, ordenados por ID.
+
+        Args:
+            produto_id: ID do produto
+            apos_id: Cursor; retorna apenas fornecedores com ID maior que ele
+            limite: Quantidade máxima de fornecedores na página
+
+        Returns:
+            Tuple[List[Fornecedor], Optional[int]]: Fornecedores da página e
+            o cursor da próxima página (None se esta for a última)
+        """
+        pass
+
+    @abstractmethod
+    def associar_produto(self, fornecedor_id: int, produto_id: int) -> None:
+        """
+        Registra que um fornecedor fornece um produto.
+
+        Args:
+            fornecedor_id: ID do fornecedor
+            produto_id: ID do produto
+        """
+        pass
+
+    @abstractmethod
+    def desassociar_produto(self, fornecedor_id: int, produto_id: int) -> bool:
+        """
+        Remove o registro de que um fornecedor fornece um produto.
+
+        Args:
+            fornecedor_id: ID do fornecedor
+            produto_id: ID do produto
+
+        Returns:
+            bool: True se a associação existia, False caso contrário
+        """
+        pass
+
     @abstractmethod
     def atualizar(self, fornecedor: Fornecedor) -> Optional[Fornecedor]:
         """
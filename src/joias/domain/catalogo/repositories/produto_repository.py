@@ -6,11 +6,22 @@ repositório que queira persistir produtos.
 """
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import List, Optional
+from typing import Iterator, List, NamedTuple, Optional, Tuple
 
 from ..entities.produto import Produto
 
 
+class ResumoProduto(NamedTuple):
+    """Colunas de um produto usadas nas listagens."""
+
+    id: int
+    sku: str
+    nome: str
+    preco_valor: Decimal
+    preco_moeda: str
+    ativo: bool
+
+
 class ProdutoRepository(ABC):
     """
     Interface para repositório de produtos.
@@ -33,6 +44,20 @@ class ProdutoRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def salvar_em_lote(self, produtos: List[Produto], tamanho_lote: int = 1000) -> int:
+        """
+        Insere ou atualiza muitos produtos de uma vez, identificados pelo SKU.
+
+        Args:
+            produtos: Produtos a serem salvos
+            tamanho_lote: Quantidade de produtos por transação
+
+        Returns:
+            int: Quantidade de produtos processados
+        """
+        pass
+
     @abstractmethod
     def buscar_por_id(self, produto_id: int) -> Optional[Produto]:
         """
@@ -72,6 +97,75 @@ class ProdutoRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def listar_pagina(
+        self,
+        apos_id: Optional[int] = None,
+        limite: int = 50,
+        apenas_ativos: bool = True,
+    ) -> Tuple[List[Produto], Optional[int]]:
+        """
+        Lista uma página de produtos ordenados por ID (paginação por cursor).
+
+        Args:
+            apos_id: Cursor; retorna apenas produtos com ID maior que ele
+            limite: Quantidade máxima de produtos na página
+            apenas_ativos: Se True, retorna apenas produtos ativos
+
+        Returns:
+            Tuple[List[Produto], Optional[int]]: Produtos da página e o
+            cursor da próxima página (None se esta for a última)
+        """
+        pass
+
+    @abstractmethod
+    def listar_resumos(self, apenas_ativos: bool = True) -> List[ResumoProduto]:
+        """
+        Lista os resumos dos produtos, sem carregar as entidades.
+
+        Args:
+            apenas_ativos: Se True, retorna apenas produtos ativos
+
+        Returns:
+            List[ResumoProduto]: Resumos dos produtos
+        """
+        pass
+
+    @abstractmethod
+    def listar_pagina_resumos(
+        self,
+        apos_id: Optional[int] = None,
+        limite: int = 50,
+        apenas_ativos: bool = True,
+    ) -> Tuple[List[ResumoProduto], Optional[int]]:
+        """
+        Lista uma página de resumos de produtos ordenados por ID.
+
+        Args:
+            apos_id: Cursor; retorna apenas produtos com ID maior que ele
+            limite: Quantidade máxima de produtos na página
+            apenas_ativos: Se True, retorna apenas produtos ativos
+
+        Returns:
+            Tuple[List[ResumoProduto], Optional[int]]: Resumos da página e o
+            cursor da próxima página (None se esta for a última)
+        """
+        pass
+
+    @abstractmethod
+    def iterar(self, apenas_ativos: bool = True, lote: int = 1000) -> Iterator[Produto]:
+        """
+        Percorre todos os produtos sem carregá-los todos em memória.
+
+        Args:
+            apenas_ativos: Se True, percorre apenas produtos ativos
+            lote: Quantidade de produtos carregados por vez
+
+        Returns:
+            Iterator[Produto]: Iterador sobre os produtos
+        """
+        pass
+
     @abstractmethod
     def buscar_por_faixa_de_preco(
         self, preco_minimo: Decimal, preco_maximo: Decimal
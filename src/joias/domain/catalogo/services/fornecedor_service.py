@@ -53,6 +53,39 @@ class FornecedorService:
 
         return self._repository.salvar(fornecedor)
 
+    def criar_fornecedores_em_lote(
+        self, fornecedores: List[Fornecedor], tamanho_lote: int = 1000
+    ) -> List[Fornecedor]:
+        """
+        Cria muitos fornecedores de uma vez, ignorando documentos repetidos.
+
+        Os documentos já cadastrados são verificados com uma única busca
+        em lote no repositório. Um fornecedor é ignorado se algum de seus
+        documentos já estiver cadastrado ou pertencer a um fornecedor
+        anterior do mesmo lote.
+
+        Args:
+            fornecedores: Fornecedores a serem criados
+            tamanho_lote: Quantidade de fornecedores por transação
+
+        Returns:
+            List[Fornecedor]: Os fornecedores criados
+        """
+        vistos = self._repository.buscar_documentos_existentes(
+            [documento for f in fornecedores for documento in f.documentos]
+        )
+
+        novos = []
+        for fornecedor in fornecedores:
+            chaves = {(d.numero, d.tipo) for d in fornecedor.documentos}
+            if chaves & vistos:
+                continue
+            vistos |= chaves
+            novos.append(fornecedor)
+
+        self._repository.salvar_em_lote(novos, tamanho_lote)
+        return novos
+
     def adicionar_documento(
         self, fornecedor_id: int, documento: Documento
     ) -> Optional[Fornecedor]:
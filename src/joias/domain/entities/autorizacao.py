@@ -38,7 +38,8 @@ class Usuario(AggregateRoot):
             updated_at: Data de atualização
             deleted_at: Data de exclusão
         """
-        self.id = id
+        super().__init__()
+        self._id = id
         self.email = email
         self.nome = nome
         self.senha_hash = senha_hash
@@ -127,7 +128,8 @@ class Perfil(AggregateRoot):
             updated_at: Data de atualização
             deleted_at: Data de exclusão
         """
-        self.id = id
+        super().__init__()
+        self._id = id
         self.nome = nome
         self.descricao = descricao
         self.created_at = created_at
@@ -279,7 +281,8 @@ class Token(AggregateRoot):
             updated_at: Data de atualização
             deleted_at: Data de exclusão
         """
-        self.id = id
+        super().__init__()
+        self._id = id
         self.usuario_id = usuario_id
         self.token = token
         self.expiracao = expiracao
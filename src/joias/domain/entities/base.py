@@ -16,12 +16,15 @@ class Entity(ABC):
 
     Uma entidade é um objeto que tem uma identidade única e é distinguível
     mesmo quando seus atributos são idênticos.
+
+    Os campos da base ficam fora do __init__: o ID é atribuído pelo
+    repositório, e assim as subclasses podem declarar campos obrigatórios.
     """
 
-    id: int
-    data_criacao: datetime = field(default_factory=datetime.now)
-    data_atualizacao: Optional[datetime] = None
-    ativo: bool = True
+    id: Optional[int] = field(default=None, init=False)
+    data_criacao: datetime = field(default_factory=datetime.now, init=False)
+    data_atualizacao: Optional[datetime] = field(default=None, init=False)
+    ativo: bool = field(default=True, init=False)
 
     def __eq__(self, other):
         if not isinstance(other, Entity):
@@ -0,0 +1,56 @@
+"""
+Eventos de domínio relacionados a pedidos.
+
+Este módulo contém os eventos emitidos pela entidade Pedido. Cada
+evento carrega um resumo do pedido no momento em que ocorreu, o que
+permite manter modelos de leitura sem recarregar o agregado.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+
+from ..shared.events.domain_event import DomainEvent
+
+
+@dataclass
+class EventoPedido(DomainEvent):
+    """Classe base para eventos de pedido."""
+
+    pedido_id: int
+    cliente_id: UUID
+    status: str
+    quantidade_itens: int
+    total: Decimal
+    data_criacao: datetime
+    data_modificacao: datetime
+
+    def __post_init__(self) -> None:
+        super().__init__()
+
+
+@dataclass
+class PedidoCriado(EventoPedido):
+    """Evento emitido quando um pedido é registrado."""
+
+
+@dataclass
+class ItemAdicionadoAoPedido(EventoPedido):
+    """Evento emitido para cada item adicionado ao pedido."""
+
+
+@dataclass
+class ItemRemovidoDoPedido(EventoPedido):
+    """Evento emitido quando um item é removido do pedido."""
+
+
+@dataclass
+class StatusPedidoAtualizado(EventoPedido):
+    """Evento emitido quando o status do pedido muda."""
+
+    status_anterior: str = ""
+
+
+@dataclass
+class PedidoAtualizado(EventoPedido):
+    """Evento emitido quando dados gerais do pedido mudam."""
@@ -8,10 +8,20 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import List, Optional
+from typing import List, Optional, Type
 
+from ..shared.entities.eventos import EmissorEventos
+from ..shared.events.domain_event import DomainEvent
 from .base import Entity
 from .dados_pessoais import Endereco
+from .eventos_pedido import (
+    EventoPedido,
+    ItemAdicionadoAoPedido,
+    ItemRemovidoDoPedido,
+    PedidoAtualizado,
+    PedidoCriado,
+    StatusPedidoAtualizado,
+)
 from .produto import Produto, Variacao
 from .usuario import Usuario
 
@@ -56,7 +66,7 @@ class ItemPedido(Entity):
 
 
 @dataclass
-class Pedido(Entity):
+class Pedido(EmissorEventos, Entity):
     """
     Entidade que representa um pedido.
 
@@ -66,12 +76,44 @@ class Pedido(Entity):
 
     cliente: Usuario
     status: StatusPedido = StatusPedido.RASCUNHO
-    data_criacao: datetime = field(default_factory=datetime.now)
     data_modificacao: datetime = field(default_factory=datetime.now)
     itens: List[ItemPedido] = field(default_factory=list)
     endereco_entrega: Optional[Endereco] = None
     desconto_total: Decimal = Decimal("0")
     observacoes: Optional[str] = None
+    _eventos: List[DomainEvent] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    def _registrar_evento(self, tipo: Type[EventoPedido], **extras) -> None:
+        """
+        Registra um evento de pedido com o resumo atual do pedido.
+
+        Args:
+            tipo: Tipo do evento
+            extras: Campos adicionais específicos do evento
+        """
+        self.adicionar_evento(
+            tipo(
+                pedido_id=self.id,
+                cliente_id=self.cliente.id,
+                status=self.status.value,
+                quantidade_itens=len(self.itens),
+                total=self.total,
+                data_criacao=self.data_criacao,
+                data_modificacao=self.data_modificacao,
+                **extras,
+            )
+        )
+
+    def atualizar(self) -> None:
+        """Atualiza as datas de atualização e de modificação do pedido."""
+        super().atualizar()
+        self.data_modificacao = self.data_atualizacao
+
+    def registrar_criacao(self) -> None:
+        """Registra o evento de criação, após o pedido receber um ID."""
+        self._registrar_evento(PedidoCriado)
 
     def adicionar_item(self, item: ItemPedido) -> None:
         """
@@ -82,6 +124,22 @@ class Pedido(Entity):
         """
         self.itens.append(item)
         self.atualizar()
+        self._registrar_evento(ItemAdicionadoAoPedido)
+
+    def adicionar_itens(self, itens: List[ItemPedido]) -> None:
+        """
+        Adiciona vários itens ao pedido de uma só vez.
+
+        Registra um ItemAdicionadoAoPedido por item, como adicionar_item,
+        cada um com o resumo do pedido após a inclusão daquele item.
+
+        Args:
+            itens: Itens a serem adicionados
+        """
+        self.atualizar()
+        for item in itens:
+            self.itens.append(item)
+            self._registrar_evento(ItemAdicionadoAoPedido)
 
     def remover_item(self, item_id: int) -> None:
         """
@@ -92,6 +150,7 @@ class Pedido(Entity):
         """
         self.itens = [i for i in self.itens if i.id != item_id]
         self.atualizar()
+        self._registrar_evento(ItemRemovidoDoPedido)
 
     def atualizar_status(self, novo_status: StatusPedido) -> None:
         """
@@ -100,9 +159,12 @@ class Pedido(Entity):
         Args:
             novo_status: Novo status do pedido
         """
+        status_anterior = self.status
         self.status = novo_status
-        self.data_modificacao = datetime.now()
         self.atualizar()
+        self._registrar_evento(
+            StatusPedidoAtualizado, status_anterior=status_anterior.value
+        )
 
     def definir_endereco_entrega(self, endereco: Endereco) -> None:
         """
@@ -113,6 +175,18 @@ class Pedido(Entity):
         """
         self.endereco_entrega = endereco
         self.atualizar()
+        self._registrar_evento(PedidoAtualizado)
+
+    def aplicar_desconto(self, desconto: Decimal) -> None:
+        """
+        Define o desconto total do pedido.
+
+        Args:
+            desconto: Valor do desconto sobre o subtotal
+        """
+        self.desconto_total = desconto
+        self.atualizar()
+        self._registrar_evento(PedidoAtualizado)
 
     @property
     def subtotal(self) -> Decimal:
@@ -7,7 +7,7 @@ suas variações, detalhes e preços.
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from .base import Entity
 
@@ -117,13 +117,123 @@ class Variacao(Entity):
             self.atualizar()
 
 
+class Variacoes(list):
+    """
+    Lista de variações de um produto com índice por ID.
+
+    Toda alteração da lista mantém o índice, então buscar uma variação
+    pelo ID não percorre a lista. Variações incluídas ainda sem ID ficam
+    pendentes e entram no índice na primeira busca depois que o
+    repositório atribui o ID.
+    """
+
+    def __init__(self, variacoes: Iterable[Variacao] = ()):
+        super().__init__(variacoes)
+        self._reindexar()
+
+    def _reindexar(self) -> None:
+        self._por_id: Dict[int, Variacao] = {}
+        self._sem_id: List[Variacao] = []
+        for variacao in self:
+            self._indexar(variacao)
+
+    def _indexar(self, variacao: Variacao) -> None:
+        if variacao.id is None:
+            self._sem_id.append(variacao)
+        else:
+            self._por_id[variacao.id] = variacao
+
+    def _desindexar(self, variacao: Variacao) -> None:
+        if self._por_id.get(variacao.id) is variacao:
+            del self._por_id[variacao.id]
+        self._sem_id = [v for v in self._sem_id if v is not variacao]
+
+    def buscar(self, variacao_id: int) -> Optional[Variacao]:
+        """
+        Busca uma variação pelo ID.
+
+        Args:
+            variacao_id: ID da variação
+
+        Returns:
+            A variação encontrada ou None se não existir
+        """
+        if self._sem_id:
+            pendentes, self._sem_id = self._sem_id, []
+            for variacao in pendentes:
+                self._indexar(variacao)
+        return self._por_id.get(variacao_id)
+
+    def append(self, variacao: Variacao) -> None:
+        super().append(variacao)
+        self._indexar(variacao)
+
+    def insert(self, posicao: int, variacao: Variacao) -> None:
+        super().insert(posicao, variacao)
+        self._indexar(variacao)
+
+    def extend(self, variacoes: Iterable[Variacao]) -> None:
+        for variacao in variacoes:
+            self.append(variacao)
+
+    def __iadd__(self, variacoes: Iterable[Variacao]) -> "Variacoes":
+        self.extend(variacoes)
+        return self
+
+    def remove(self, variacao: Variacao) -> None:
+        posicao = next((i for i, v in enumerate(self) if v is variacao), None)
+        if posicao is None:
+            posicao = self.index(variacao)
+        del self[posicao]
+
+    def pop(self, posicao: int = -1) -> Variacao:
+        variacao = super().pop(posicao)
+        self._desindexar(variacao)
+        return variacao
+
+    def clear(self) -> None:
+        super().clear()
+        self._reindexar()
+
+    def __setitem__(self, posicao, valor) -> None:
+        if isinstance(posicao, slice):
+            # Fatias podem trocar várias variações de uma vez
+            super().__setitem__(posicao, valor)
+            self._reindexar()
+        else:
+            anterior = self[posicao]
+            super().__setitem__(posicao, valor)
+            self._desindexar(anterior)
+            self._indexar(valor)
+
+    def __delitem__(self, posicao) -> None:
+        if isinstance(posicao, slice):
+            super().__delitem__(posicao)
+            self._reindexar()
+        else:
+            variacao = self[posicao]
+            super().__delitem__(posicao)
+            self._desindexar(variacao)
+
+    def __imul__(self, vezes: int) -> "Variacoes":
+        super().__imul__(vezes)
+        self._reindexar()
+        return self
+
+    def __reduce__(self):
+        # Cópias e pickle reconstroem a lista pelo __init__, que monta o índice
+        return (Variacoes, (list(self),))
+
+
 @dataclass
 class Produto(Entity):
     """
     Entidade que representa um produto.
 
     Um produto é um item que pode ser vendido e pode ter
-    diferentes variações e detalhes.
+    diferentes variações e detalhes. As variações ficam em uma lista
+    `Variacoes`, que mantém o índice por ID a cada alteração, inclusive
+    quando a lista inteira é substituída.
     """
 
     nome: str
@@ -133,6 +243,11 @@ class Produto(Entity):
     variacoes: List[Variacao] = field(default_factory=list)
     detalhes: List[Detalhe] = field(default_factory=list)
 
+    def __setattr__(self, nome: str, valor) -> None:
+        if nome == "variacoes" and not isinstance(valor, Variacoes):
+            valor = Variacoes(valor)
+        super().__setattr__(nome, valor)
+
     def adicionar_variacao(self, variacao: Variacao) -> None:
         """
         Adiciona uma variação ao produto.
@@ -140,9 +255,13 @@ class Produto(Entity):
         Args:
             variacao: Variação a ser adicionada
         """
-        if variacao not in self.variacoes:
-            self.variacoes.append(variacao)
-            self.atualizar()
+        if variacao.id is not None and self.variacoes.buscar(variacao.id) is not None:
+            return
+        # Variações ainda sem ID são comparadas pelos dados
+        if variacao.id is None and variacao in self.variacoes:
+            return
+        self.variacoes.append(variacao)
+        self.atualizar()
 
     def remover_variacao(self, variacao_id: int) -> None:
         """
@@ -151,9 +270,23 @@ class Produto(Entity):
         Args:
             variacao_id: ID da variação a ser removida
         """
-        self.variacoes = [v for v in self.variacoes if v.id != variacao_id]
+        variacao = self.variacoes.buscar(variacao_id)
+        if variacao is not None:
+            self.variacoes.remove(variacao)
         self.atualizar()
 
+    def buscar_variacao(self, variacao_id: int) -> Optional[Variacao]:
+        """
+        Busca uma variação do produto pelo ID.
+
+        Args:
+            variacao_id: ID da variação
+
+        Returns:
+            A variação encontrada ou None se não existir
+        """
+        return self.variacoes.buscar(variacao_id)
+
     def adicionar_detalhe(self, detalhe: Detalhe) -> None:
         """
         Adiciona um detalhe ao produto.
@@ -0,0 +1,28 @@
+"""
+Interface para repositório de permissões efetivas.
+"""
+from abc import ABC, abstractmethod
+from typing import FrozenSet
+from uuid import UUID
+
+
+class IPermissoesEfetivasRepository(ABC):
+    """
+    Interface para repositório de permissões efetivas.
+
+    As permissões efetivas de um usuário são as chaves de todas as
+    permissões dos perfis associados a ele.
+    """
+
+    @abstractmethod
+    def buscar_chaves(self, usuario_id: UUID) -> FrozenSet[str]:
+        """
+        Busca as chaves das permissões efetivas de um usuário.
+
+        Args:
+            usuario_id: ID do usuário
+
+        Returns:
+            Chaves das permissões do usuário, em maiúsculas
+        """
+        pass
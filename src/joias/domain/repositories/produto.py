@@ -27,6 +27,19 @@ class ProdutoRepository(Repository[Produto]):
         """
         pass
 
+    @abstractmethod
+    def buscar_por_ids(self, ids: List[int]) -> List[Produto]:
+        """
+        Busca vários produtos pelos IDs em uma única chamada.
+
+        Args:
+            ids: IDs dos produtos
+
+        Returns:
+            Lista dos produtos encontrados (IDs inexistentes são ignorados)
+        """
+        pass
+
     @abstractmethod
     def buscar_por_nome(self, nome: str) -> List[Produto]:
         """
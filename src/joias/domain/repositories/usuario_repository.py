@@ -2,13 +2,24 @@
 Interface para repositório de usuários.
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import List, NamedTuple, Optional
 from uuid import UUID
 
 from ..entities.usuario import Usuario
 from ..shared.value_objects import Email
 
 
+class ResumoUsuario(NamedTuple):
+    """Colunas de um usuário usadas nas listagens."""
+
+    id: UUID
+    nome: str
+    email: str
+    ativo: bool
+    data_criacao: datetime
+
+
 class IUsuarioRepository(ABC):
     """
     Interface para repositório de usuários.
@@ -63,6 +74,16 @@ class IUsuarioRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def listar_resumos(self) -> List[ResumoUsuario]:
+        """
+        Lista os resumos dos usuários, sem carregar as entidades.
+
+        Returns:
+            Lista de resumos de usuários
+        """
+        pass
+
     @abstractmethod
     def atualizar(self, usuario: Usuario) -> Usuario:
         """
@@ -4,5 +4,6 @@ Pacote de entidades compartilhadas.
 Este pacote contém as classes base para entidades do domínio.
 """
 from .aggregate_root import AggregateRoot
+from .eventos import EmissorEventos
 
-__all__ = ["AggregateRoot"]
+__all__ = ["AggregateRoot", "EmissorEventos"]
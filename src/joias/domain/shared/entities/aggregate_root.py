@@ -11,9 +11,10 @@ from typing import List, Optional
 from uuid import UUID, uuid4
 
 from ..events.domain_event import DomainEvent
+from .eventos import EmissorEventos
 
 
-class AggregateRoot(ABC):
+class AggregateRoot(EmissorEventos, ABC):
     """
     Classe base para agregados do domínio.
 
@@ -31,24 +32,6 @@ class AggregateRoot(ABC):
         """Retorna o ID do agregado."""
         return self._id
 
-    @property
-    def eventos(self) -> List[object]:
-        """Retorna os eventos pendentes do agregado."""
-        return self._eventos.copy()
-
-    def adicionar_evento(self, evento: object) -> None:
-        """
-        Adiciona um evento ao agregado.
-
-        Args:
-            evento: O evento a ser adicionado
-        """
-        self._eventos.append(evento)
-
-    def limpar_eventos(self) -> None:
-        """Limpa a lista de eventos pendentes."""
-        self._eventos.clear()
-
     def add_domain_event(self, event: DomainEvent) -> None:
         """
         Adiciona um novo evento de domínio à lista de eventos pendentes.
@@ -94,3 +77,15 @@ class AggregateRoot(ABC):
         if not isinstance(other, AggregateRoot):
             return NotImplemented
         return self.id == other.id
+
+    def __hash__(self) -> int:
+        """
+        Retorna o hash da entidade a partir da sua identidade.
+
+        Mantém as entidades utilizáveis em conjuntos (ex.: permissões de
+        um perfil), coerente com __eq__.
+
+        Returns:
+            int: Hash do ID da entidade
+        """
+        return hash(self.id)
@@ -0,0 +1,36 @@
+"""
+Eventos pendentes de agregados.
+
+Este módulo define o mixin que guarda os eventos de domínio emitidos
+por um agregado até que sejam coletados para publicação.
+"""
+from typing import List
+
+
+class EmissorEventos:
+    """
+    Mixin com os eventos de domínio pendentes de um agregado.
+
+    A classe que usa o mixin guarda os eventos em `_eventos`: agregados
+    comuns o inicializam no __init__, e dataclasses o declaram como campo.
+    """
+
+    _eventos: List[object]
+
+    @property
+    def eventos(self) -> List[object]:
+        """Retorna os eventos pendentes do agregado."""
+        return self._eventos.copy()
+
+    def adicionar_evento(self, evento: object) -> None:
+        """
+        Adiciona um evento ao agregado.
+
+        Args:
+            evento: O evento a ser adicionado
+        """
+        self._eventos.append(evento)
+
+    def limpar_eventos(self) -> None:
+        """Limpa a lista de eventos pendentes."""
+        self._eventos.clear()
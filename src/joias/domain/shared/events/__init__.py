@@ -4,5 +4,6 @@ Pacote de eventos compartilhados.
 Este pacote contém as classes base para eventos do domínio.
 """
 from .domain_event import DomainEvent
+from .publicador import PublicadorEventos
 
-__all__ = ["DomainEvent"]
+__all__ = ["DomainEvent", "PublicadorEventos"]
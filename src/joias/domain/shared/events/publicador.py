@@ -0,0 +1,47 @@
+"""
+Publicador de eventos de domínio.
+
+Este módulo contém um publicador síncrono, em processo, que entrega
+os eventos coletados pelos agregados aos assinantes interessados.
+"""
+from typing import Callable, Dict, Iterable, List, Type
+
+from .domain_event import DomainEvent
+
+Assinante = Callable[[DomainEvent], None]
+
+
+class PublicadorEventos:
+    """
+    Publicador de eventos de domínio em processo.
+
+    Os assinantes são registrados por tipo de evento e recebem também
+    os eventos das subclasses desse tipo.
+    """
+
+    def __init__(self) -> None:
+        """Inicializa o publicador sem assinantes."""
+        self._assinantes: Dict[Type[DomainEvent], List[Assinante]] = {}
+
+    def inscrever(self, tipo: Type[DomainEvent], assinante: Assinante) -> None:
+        """
+        Inscreve um assinante para um tipo de evento.
+
+        Args:
+            tipo: Tipo de evento (subclasses também são entregues)
+            assinante: Função chamada com cada evento publicado
+        """
+        self._assinantes.setdefault(tipo, []).append(assinante)
+
+    def publicar(self, eventos: Iterable[DomainEvent]) -> None:
+        """
+        Entrega os eventos aos assinantes, na ordem em que ocorreram.
+
+        Args:
+            eventos: Eventos a serem publicados
+        """
+        for evento in eventos:
+            for tipo, assinantes in self._assinantes.items():
+                if isinstance(evento, tipo):
+                    for assinante in assinantes:
+                        assinante(evento)
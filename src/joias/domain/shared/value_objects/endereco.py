@@ -47,6 +47,49 @@ class Endereco:
         # Garante que estado está em maiúsculas
         object.__setattr__(self, "estado", self.estado.upper())
 
+    @classmethod
+    def reconstruir(
+        cls,
+        logradouro: str,
+        numero: str,
+        bairro: str,
+        cidade: str,
+        estado: str,
+        cep: str,
+        complemento: Optional[str] = None,
+        pais: str = "Brasil",
+    ) -> "Endereco":
+        """
+        Recria um endereço já validado, sem repetir a validação.
+
+        Usado pelos repositórios para endereços lidos do banco, que foram
+        formatados e validados quando gravados.
+
+        Args:
+            logradouro: Logradouro
+            numero: Número
+            bairro: Bairro
+            cidade: Cidade
+            estado: Estado, em maiúsculas
+            cep: CEP no formato XXXXX-XXX
+            complemento: Complemento
+            pais: País
+
+        Returns:
+            Endereco: O endereço recriado
+        """
+        endereco = object.__new__(cls)
+        atribuir = object.__setattr__
+        atribuir(endereco, "logradouro", logradouro)
+        atribuir(endereco, "numero", numero)
+        atribuir(endereco, "bairro", bairro)
+        atribuir(endereco, "cidade", cidade)
+        atribuir(endereco, "estado", estado)
+        atribuir(endereco, "cep", cep)
+        atribuir(endereco, "complemento", complemento)
+        atribuir(endereco, "pais", pais)
+        return endereco
+
     def _formatar_cep(self, cep: str) -> str:
         """
         Formata o CEP removendo caracteres não numéricos.
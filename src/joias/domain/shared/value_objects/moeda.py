@@ -3,7 +3,12 @@ Objeto de valor que representa uma moeda.
 
 Este módulo define a estrutura e comportamento de uma moeda no sistema,
 incluindo seu código ISO, nome e símbolo.
+
+As moedas conhecidas ficam em um registro compartilhado pelo processo:
+`Moeda.de_codigo` retorna sempre a mesma instância para um código, sem
+criar nem validar uma nova moeda a cada uso.
 """
+import threading
 from dataclasses import dataclass
 from typing import ClassVar, Dict
 
@@ -31,6 +36,10 @@ class Moeda:
     USD: ClassVar["Moeda"]
     EUR: ClassVar["Moeda"]
 
+    # Moedas registradas, indexadas pelo código em maiúsculas
+    _registro: ClassVar[Dict[str, "Moeda"]] = {}
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __post_init__(self):
         """Validação após inicialização."""
         if len(self.codigo) != 3:
@@ -54,8 +63,51 @@ class Moeda:
         """Retorna uma representação oficial da moeda."""
         return f"Moeda(codigo='{self.codigo}', nome='{self.nome}', simbolo='{self.simbolo}')"
 
+    @classmethod
+    def registrar(cls, codigo: str, nome: str, simbolo: str) -> "Moeda":
+        """
+        Registra uma moeda, tornando-a disponível em `de_codigo`.
+
+        Se o código já estiver registrado, a moeda existente é mantida.
+
+        Args:
+            codigo: Código ISO 4217 da moeda
+            nome: Nome completo da moeda
+            simbolo: Símbolo da moeda
+
+        Returns:
+            A moeda registrada para o código
+
+        Raises:
+            ValueError: Se os dados da moeda forem inválidos
+        """
+        moeda = cls(codigo, nome, simbolo)
+        with cls._lock:
+            return cls._registro.setdefault(moeda.codigo, moeda)
+
+    @classmethod
+    def de_codigo(cls, codigo: str) -> "Moeda":
+        """
+        Retorna a moeda registrada para um código.
+
+        Args:
+            codigo: Código ISO 4217 da moeda, sem diferenciar maiúsculas
+
+        Returns:
+            A instância compartilhada da moeda
+
+        Raises:
+            ValueError: Se o código não estiver registrado
+        """
+        moeda = cls._registro.get(codigo)
+        if moeda is None:
+            moeda = cls._registro.get(codigo.upper())
+            if moeda is None:
+                raise ValueError(f"Moeda não registrada: {codigo}")
+        return moeda
+
 
 # Definição das moedas mais comuns
-Moeda.BRL = Moeda("BRL", "Real Brasileiro", "R$")
-Moeda.USD = Moeda("USD", "Dólar Americano", "$")
-Moeda.EUR = Moeda("EUR", "Euro", "€")
+Moeda.BRL = Moeda.registrar("BRL", "Real Brasileiro", "R$")
+Moeda.USD = Moeda.registrar("USD", "Dólar Americano", "$")
+Moeda.EUR = Moeda.registrar("EUR", "Euro", "€")
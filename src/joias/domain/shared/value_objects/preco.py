@@ -5,12 +5,25 @@ Este módulo define a estrutura e comportamento de um preço no sistema,
 incluindo seu valor em centavos e moeda associada.
 """
 from dataclasses import dataclass
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
 from typing import Union
 
 from .moeda import Moeda
 
 
+def centavos(valor: Decimal) -> int:
+    """
+    Converte um valor monetário em Decimal para centavos.
+
+    Args:
+        valor: Valor na unidade da moeda (ex: Decimal("10.90"))
+
+    Returns:
+        int: Valor em centavos, arredondado (ex: 1090)
+    """
+    return int((Decimal(valor) * 100).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+
+
 @dataclass(frozen=True)
 class Preco:
     """
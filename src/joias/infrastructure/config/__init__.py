@@ -0,0 +1,6 @@
+"""
+Configurações da infraestrutura.
+"""
+from .settings import Settings, get_settings
+
+__all__ = ["Settings", "get_settings"]
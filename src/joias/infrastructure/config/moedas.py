@@ -0,0 +1,38 @@
+"""
+Registro das moedas configuradas.
+
+Complementa o registro de moedas do domínio (BRL, USD e EUR) com as
+moedas definidas na variável de ambiente MOEDAS.
+"""
+from typing import List, Optional
+
+from ...domain.shared.value_objects.moeda import Moeda
+from .settings import Settings, get_settings
+
+
+def registrar_moedas(settings: Optional[Settings] = None) -> List[Moeda]:
+    """
+    Registra as moedas definidas nas configurações.
+
+    Args:
+        settings: Configurações da aplicação (por padrão, as do processo)
+
+    Returns:
+        As moedas registradas
+
+    Raises:
+        ValueError: Se alguma moeda não estiver no formato CODIGO:Nome:Símbolo
+    """
+    settings = settings or get_settings()
+    moedas = []
+    for definicao in settings.moedas.split(","):
+        if not definicao.strip():
+            continue
+        partes = [parte.strip() for parte in definicao.split(":")]
+        if len(partes) != 3:
+            raise ValueError(
+                f"Moeda inválida em MOEDAS: '{definicao}' "
+                "(formato esperado: CODIGO:Nome:Símbolo)"
+            )
+        moedas.append(Moeda.registrar(*partes))
+    return moedas
@@ -16,6 +16,54 @@ class Settings(BaseSettings):
         "DATABASE_URL",
         "sqlite:///./joias.db",
     )
+    database_pool_size: int = int(
+        os.getenv(
+            "DATABASE_POOL_SIZE",
+            "5",
+        )
+    )
+    database_max_overflow: int = int(
+        os.getenv(
+            "DATABASE_MAX_OVERFLOW",
+            "10",
+        )
+    )
+    database_pool_pre_ping: bool = os.getenv(
+        "DATABASE_POOL_PRE_PING",
+        "true",
+    ).lower() in ("1", "true", "yes")
+    # Segundos até uma conexão ser reciclada (-1 desativa)
+    database_pool_recycle: int = int(
+        os.getenv(
+            "DATABASE_POOL_RECYCLE",
+            "1800",
+        )
+    )
+    # Segundos de espera por uma conexão livre antes de falhar
+    database_pool_timeout: float = float(
+        os.getenv(
+            "DATABASE_POOL_TIMEOUT",
+            "30",
+        )
+    )
+    # URLs das réplicas de leitura, separadas por vírgula (vazio desativa)
+    database_replica_urls: str = os.getenv(
+        "DATABASE_REPLICA_URLS",
+        "",
+    )
+    # Segundos até uma réplica que falhou voltar a receber leituras
+    database_replica_retorno: float = float(
+        os.getenv(
+            "DATABASE_REPLICA_RETORNO",
+            "30",
+        )
+    )
+    # Moedas além de BRL, USD e EUR, no formato CODIGO:Nome:Símbolo e
+    # separadas por vírgula (ex.: "GBP:Libra Esterlina:£,JPY:Iene:¥")
+    moedas: str = os.getenv(
+        "MOEDAS",
+        "",
+    )
     secret_key: str = os.getenv(
         "SECRET_KEY",
         "your-secret-key",
@@ -26,6 +74,20 @@ class Settings(BaseSettings):
             "24",
         )
     )
+    # Segundos entre as purgas dos tokens expirados (0 desativa)
+    token_purga_intervalo: float = float(
+        os.getenv(
+            "TOKEN_PURGA_INTERVALO",
+            "3600",
+        )
+    )
+    # Quantidade máxima de tokens excluídos por lote na purga
+    token_purga_lote: int = int(
+        os.getenv(
+            "TOKEN_PURGA_LOTE",
+            "1000",
+        )
+    )
 
 
 @lru_cache
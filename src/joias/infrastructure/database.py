@@ -1,38 +1,36 @@
 """
 Configuração do banco de dados.
 
-Este módulo contém a configuração e inicialização do banco de dados
-usando SQLAlchemy.
+Este módulo expõe o acesso ao banco de dados usando o engine único do
+processo, definido em `persistence.sqlalchemy.base`.
 """
 from functools import lru_cache
-from typing import Generator
+from typing import Any, Dict, Generator
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
 
-from .config import Settings, get_settings
+from .persistence.sqlalchemy.base import SessionLocal, engine
+from .persistence.sqlalchemy.engine import metricas_pool
 
 
 class Database:
     """Classe para gerenciar a conexão com o banco de dados."""
 
-    def __init__(self, settings: Settings):
+    def __init__(self):
         """
-        Inicializa a conexão com o banco de dados.
+        Inicializa o acesso ao banco de dados.
 
-        Args:
-            settings: Configurações da aplicação
+        Reutiliza o engine e a fábrica de sessões compartilhados, para que
+        o processo mantenha um único pool de conexões.
         """
-        self._engine = create_engine(
-            settings.DATABASE_URL,
-            pool_size=settings.DATABASE_POOL_SIZE,
-            max_overflow=settings.DATABASE_MAX_OVERFLOW,
-        )
-        self._session_factory = sessionmaker(
-            autocommit=False,
-            autoflush=False,
-            bind=self._engine,
-        )
+        self._engine = engine
+        self._session_factory = SessionLocal
+
+    @property
+    def engine(self) -> Engine:
+        """Retorna o engine do banco de dados."""
+        return self._engine
 
     def get_session(self) -> Generator[Session, None, None]:
         """
@@ -47,6 +45,15 @@ class Database:
         finally:
             session.close()
 
+    def metricas_pool(self) -> Dict[str, Any]:
+        """
+        Retorna o estado atual do pool de conexões.
+
+        Returns:
+            Dict[str, Any]: Métricas do pool
+        """
+        return metricas_pool(self._engine)
+
 
 @lru_cache()
 def get_database() -> Database:
@@ -59,4 +66,4 @@ def get_database() -> Database:
     Returns:
         Database: Instância do banco de dados
     """
-    return Database(get_settings()) 
\ No newline at end of file
+    return Database()
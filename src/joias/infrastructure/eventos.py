@@ -0,0 +1,21 @@
+"""
+Publicador de eventos da aplicação.
+
+Este módulo mantém o publicador de eventos de domínio do processo,
+usado pelas unidades de trabalho das requisições para entregar os
+eventos confirmados aos assinantes registrados na inicialização.
+"""
+from functools import lru_cache
+
+from ..domain.shared.events.publicador import PublicadorEventos
+
+
+@lru_cache
+def get_publicador() -> PublicadorEventos:
+    """
+    Retorna o publicador de eventos de domínio da aplicação.
+
+    Returns:
+        Publicador de eventos compartilhado pelo processo
+    """
+    return PublicadorEventos()
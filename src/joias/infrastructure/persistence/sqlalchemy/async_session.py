@@ -0,0 +1,103 @@
+"""
+Configuração assíncrona do SQLAlchemy.
+
+Este módulo cria o engine assíncrono (asyncpg para PostgreSQL, aiosqlite
+para SQLite) a partir da mesma DATABASE_URL do engine síncrono, e as
+dependências que injetam sessões assíncronas nos endpoints. O engine
+síncrono continua disponível em `base` para scripts e migrações.
+"""
+from typing import AsyncGenerator
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ...config.settings import get_settings
+from ...eventos import get_publicador
+from .base import DATABASE_URL, URLS_REPLICAS
+from .engine import criar_engine_async
+from .replicas import RoteadorReplicas, SessaoRoteada
+from .unit_of_work import AsyncSQLAlchemyUnitOfWork
+
+# Driver assíncrono usado para cada banco suportado
+DRIVERS_ASSINCRONOS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def url_assincrona(url: str) -> str:
+    """
+    Converte uma URL de banco síncrona para o driver assíncrono equivalente.
+
+    Args:
+        url: URL do banco (ex.: postgresql://..., sqlite:///...)
+
+    Returns:
+        URL com o driver assíncrono (ex.: postgresql+asyncpg://...)
+
+    Raises:
+        ValueError: Se o banco não tiver driver assíncrono configurado
+    """
+    url_banco = make_url(url)
+    if url_banco.get_dialect().is_async:
+        return url
+    backend = url_banco.get_backend_name()
+    if backend not in DRIVERS_ASSINCRONOS:
+        raise ValueError(f"Banco sem driver assíncrono configurado: {backend}")
+    return url_banco.set(drivername=DRIVERS_ASSINCRONOS[backend]).render_as_string(
+        hide_password=False
+    )
+
+
+async_engine = criar_engine_async(get_settings(), url_assincrona(DATABASE_URL))
+
+# O roteamento acontece na sessão síncrona interna, então o roteador
+# recebe os engines síncronos por trás dos engines assíncronos
+async_roteador = (
+    RoteadorReplicas(
+        async_engine.sync_engine,
+        [
+            criar_engine_async(get_settings(), url_assincrona(url)).sync_engine
+            for url in URLS_REPLICAS
+        ],
+        get_settings().database_replica_retorno,
+    )
+    if URLS_REPLICAS
+    else None
+)
+
+# expire_on_commit=False: após o commit, acessar um atributo expirado
+# dispararia I/O implícito, o que não é permitido em sessões assíncronas
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    sync_session_class=SessaoRoteada,
+    roteador=async_roteador,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Retorna uma sessão assíncrona do SQLAlchemy.
+
+    Yields:
+        Sessão assíncrona do SQLAlchemy
+    """
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+async def get_async_unit_of_work() -> AsyncGenerator[AsyncSQLAlchemyUnitOfWork, None]:
+    """
+    Retorna uma unidade de trabalho assíncrona que dura a requisição inteira.
+
+    Os eventos dos agregados gravados são entregues ao publicador da
+    aplicação após o commit.
+
+    Yields:
+        Unidade de trabalho assíncrona do SQLAlchemy
+    """
+    async with AsyncSQLAlchemyUnitOfWork(AsyncSessionLocal, get_publicador()) as uow:
+        yield uow
+        await uow.commit()
@@ -1,23 +1,37 @@
 """
 Configuração do SQLAlchemy.
-"""
-import os
 
-from sqlalchemy import create_engine
+O engine é único no processo e criado pela fábrica de `engine`, com o
+pool de conexões configurado pelas Settings. Com réplicas configuradas
+(DATABASE_REPLICA_URLS), as sessões enviam as leituras às réplicas.
+"""
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
-DATABASE_URL = os.getenv(
-    "DATABASE_URL",
-    "sqlite:///./joias.db",
-)
+from ...config.settings import get_settings
+from .engine import criar_engine, urls_replicas
+from .replicas import RoteadorReplicas, SessaoRoteada
+
+DATABASE_URL = get_settings().database_url
+
+URLS_REPLICAS = urls_replicas(get_settings())
+
+engine = criar_engine(get_settings())
 
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False},
+# Sem réplicas configuradas, as sessões usam apenas o engine primário
+roteador = (
+    RoteadorReplicas(
+        engine,
+        [criar_engine(get_settings(), url) for url in URLS_REPLICAS],
+        get_settings().database_replica_retorno,
+    )
+    if URLS_REPLICAS
+    else None
 )
 
 SessionLocal = sessionmaker(
+    class_=SessaoRoteada,
+    roteador=roteador,
     autocommit=False,
     autoflush=False,
     bind=engine,
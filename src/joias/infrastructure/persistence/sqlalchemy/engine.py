@@ -0,0 +1,222 @@
+"""
+Fábrica de engines do SQLAlchemy.
+
+Este módulo concentra a criação dos engines (síncrono e assíncrono) com
+o pool de conexões configurado pelas Settings, e mantém métricas do pool:
+conexões em uso, overflow e histograma do tempo de espera por conexão.
+"""
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from ...config.settings import Settings
+
+# Limites superiores (em segundos) das faixas do histograma de espera
+FAIXAS_ESPERA: Tuple[float, ...] = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+class MetricasPool:
+    """
+    Métricas acumuladas de obtenção de conexões de um pool.
+
+    Registra quanto tempo cada pedido de conexão esperou, em um histograma
+    de faixas fixas, e quantos pedidos esgotaram o timeout do pool.
+    """
+
+    def __init__(self, faixas: Tuple[float, ...] = FAIXAS_ESPERA):
+        """
+        Inicializa as métricas.
+
+        Args:
+            faixas: Limites superiores das faixas do histograma, em segundos
+        """
+        self._faixas = tuple(sorted(faixas))
+        self._contagens = [0] * (len(self._faixas) + 1)
+        self._lock = threading.Lock()
+        self.total = 0
+        self.soma_segundos = 0.0
+        self.esgotamentos = 0
+
+    def registrar_espera(self, segundos: float, esgotou: bool = False) -> None:
+        """
+        Registra um pedido de conexão.
+
+        Args:
+            segundos: Tempo até a conexão ser entregue (ou o timeout)
+            esgotou: Se o pedido terminou em timeout do pool
+        """
+        with self._lock:
+            self._contagens[bisect_left(self._faixas, segundos)] += 1
+            self.total += 1
+            self.soma_segundos += segundos
+            if esgotou:
+                self.esgotamentos += 1
+
+    def histograma(self) -> Dict[str, int]:
+        """
+        Retorna o histograma acumulado do tempo de espera.
+
+        Returns:
+            Contagem de pedidos por faixa, indexada pelo limite superior
+            da faixa ("+Inf" para a última)
+        """
+        with self._lock:
+            contagens = list(self._contagens)
+        rotulos = [str(limite) for limite in self._faixas] + ["+Inf"]
+        return dict(zip(rotulos, contagens))
+
+
+class _PoolMonitorado:
+    """
+    Mixin que mede o tempo de obtenção de conexões de um pool.
+
+    O tempo medido inclui a espera na fila do pool, a abertura de novas
+    conexões e o pre-ping, ou seja, tudo o que a requisição aguarda.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.metricas = MetricasPool()
+
+    def connect(self):
+        inicio = time.perf_counter()
+        try:
+            conexao = super().connect()
+        except PoolTimeoutError:
+            self.metricas.registrar_espera(time.perf_counter() - inicio, esgotou=True)
+            raise
+        self.metricas.registrar_espera(time.perf_counter() - inicio)
+        return conexao
+
+    def recreate(self):
+        # O pool é recriado em dispose(); as métricas continuam acumulando
+        novo = super().recreate()
+        novo.metricas = self.metricas
+        return novo
+
+
+class QueuePoolMonitorado(_PoolMonitorado, QueuePool):
+    """QueuePool com métricas de obtenção de conexões."""
+
+
+class AsyncQueuePoolMonitorado(_PoolMonitorado, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool com métricas de obtenção de conexões."""
+
+
+def _argumentos_engine(url: str, settings: Settings, poolclass: type) -> Dict[str, Any]:
+    """
+    Monta os argumentos de criação do engine a partir das Settings.
+
+    Bancos SQLite em memória usam um pool próprio do SQLAlchemy, de uma
+    conexão por thread, então não recebem configuração de pool.
+
+    Args:
+        url: URL do banco
+        settings: Configurações da aplicação
+        poolclass: Classe de pool para bancos com pool de fila
+
+    Returns:
+        Argumentos nomeados para create_engine/create_async_engine
+    """
+    url_banco = make_url(url)
+    argumentos: Dict[str, Any] = {"pool_pre_ping": settings.database_pool_pre_ping}
+
+    if url_banco.get_backend_name() == "sqlite":
+        argumentos["connect_args"] = {"check_same_thread": False}
+        if url_banco.database in (None, "", ":memory:"):
+            return argumentos
+
+    argumentos.update(
+        poolclass=poolclass,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_recycle=settings.database_pool_recycle,
+        pool_timeout=settings.database_pool_timeout,
+    )
+    return argumentos
+
+
+def criar_engine(settings: Settings, url: Optional[str] = None) -> Engine:
+    """
+    Cria o engine síncrono com o pool configurado pelas Settings.
+
+    Args:
+        settings: Configurações da aplicação
+        url: URL do banco (por padrão, settings.database_url)
+
+    Returns:
+        Engine do SQLAlchemy
+    """
+    url = url or settings.database_url
+    return create_engine(url, **_argumentos_engine(url, settings, QueuePoolMonitorado))
+
+
+def criar_engine_async(settings: Settings, url: str) -> AsyncEngine:
+    """
+    Cria o engine assíncrono com o pool configurado pelas Settings.
+
+    Args:
+        settings: Configurações da aplicação
+        url: URL do banco com driver assíncrono
+
+    Returns:
+        Engine assíncrono do SQLAlchemy
+    """
+    return create_async_engine(
+        url, **_argumentos_engine(url, settings, AsyncQueuePoolMonitorado)
+    )
+
+
+def urls_replicas(settings: Settings) -> List[str]:
+    """
+    Retorna as URLs das réplicas de leitura configuradas.
+
+    Args:
+        settings: Configurações da aplicação
+
+    Returns:
+        URLs de DATABASE_REPLICA_URLS (vazia se não houver réplicas)
+    """
+    urls = settings.database_replica_urls.split(",")
+    return [url.strip() for url in urls if url.strip()]
+
+
+def metricas_pool(engine: Engine | AsyncEngine) -> Dict[str, Any]:
+    """
+    Retorna o estado atual do pool de conexões de um engine.
+
+    Args:
+        engine: Engine síncrono ou assíncrono
+
+    Returns:
+        Dicionário com o tamanho do pool, conexões em uso, overflow,
+        conexões ociosas e, se o pool for monitorado, as métricas de espera
+    """
+    pool: Pool = engine.pool
+    estado: Dict[str, Any] = {"pool": type(pool).__name__}
+
+    if isinstance(pool, QueuePool):
+        estado.update(
+            tamanho=pool.size(),
+            em_uso=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            ociosas=pool.checkedin(),
+        )
+
+    metricas: Optional[MetricasPool] = getattr(pool, "metricas", None)
+    if metricas is not None:
+        estado["espera"] = {
+            "total": metricas.total,
+            "soma_segundos": metricas.soma_segundos,
+            "esgotamentos": metricas.esgotamentos,
+            "histograma": metricas.histograma(),
+        }
+
+    return estado
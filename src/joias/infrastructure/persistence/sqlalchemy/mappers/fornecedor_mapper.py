@@ -4,7 +4,7 @@ Mapeador para fornecedores.
 Este módulo contém as funções de mapeamento entre as entidades de domínio
 e os modelos SQLAlchemy para fornecedores.
 """
-from typing import List
+from typing import Any, Dict, List
 
 from .....domain.catalogo.entities.fornecedor import Documento as DocumentoEntity
 from .....domain.catalogo.entities.fornecedor import Fornecedor as FornecedorEntity
@@ -23,11 +23,13 @@ def to_entity(model: FornecedorModel) -> FornecedorEntity:
     Returns:
         FornecedorEntity: A entidade de domínio correspondente
     """
+    # Dados lidos do banco já foram validados na gravação
     documentos = [
-        DocumentoEntity(numero=d.numero, tipo=d.tipo) for d in model.documentos
+        DocumentoEntity.reconstruir(numero=d.numero, tipo=d.tipo)
+        for d in model.documentos
     ]
 
-    endereco = Endereco(
+    endereco = Endereco.reconstruir(
         logradouro=model.logradouro,
         numero=model.numero,
         bairro=model.bairro,
@@ -39,7 +41,7 @@ def to_entity(model: FornecedorModel) -> FornecedorEntity:
     )
 
     fornecedor = FornecedorEntity(
-        nome=model.nome, documentos=documentos, endereco=endereco
+        nome=model.nome, documentos=documentos, endereco=endereco, id=model.id
     )
 
     # Atributos que não fazem parte do construtor
@@ -78,6 +80,47 @@ def to_model(entity: FornecedorEntity) -> FornecedorModel:
     return model
 
 
+def to_row(entity: FornecedorEntity) -> Dict[str, Any]:
+    """
+    Converte uma entidade de domínio para as colunas da tabela de fornecedores.
+
+    Usado nas escritas em lote, que não passam por modelos ORM.
+
+    Args:
+        entity: A entidade de domínio
+
+    Returns:
+        Dict[str, Any]: Valores das colunas do fornecedor
+    """
+    return {
+        "nome": entity.nome,
+        "logradouro": entity.endereco.logradouro,
+        "numero": entity.endereco.numero,
+        "bairro": entity.endereco.bairro,
+        "cidade": entity.endereco.cidade,
+        "estado": entity.endereco.estado,
+        "cep": entity.endereco.cep,
+        "complemento": entity.endereco.complemento,
+        "pais": entity.endereco.pais,
+        "ativo": entity.ativo,
+        "data_cadastro": entity.data_cadastro,
+    }
+
+
+def documento_to_row(entity: DocumentoEntity, fornecedor_id: int) -> Dict[str, Any]:
+    """
+    Converte um documento para as colunas da tabela de documentos.
+
+    Args:
+        entity: O documento
+        fornecedor_id: ID do fornecedor dono do documento
+
+    Returns:
+        Dict[str, Any]: Valores das colunas do documento
+    """
+    return {"numero": entity.numero, "tipo": entity.tipo, "fornecedor_id": fornecedor_id}
+
+
 def update_model(model: FornecedorModel, entity: FornecedorEntity) -> None:
     """
     Atualiza um modelo SQLAlchemy com os dados de uma entidade.
@@ -4,12 +4,15 @@ Mapeador entre entidades de domínio e modelos SQLAlchemy para produtos.
 Este módulo é responsável por converter entre as entidades de domínio
 e os modelos SQLAlchemy para produtos.
 """
+from collections import defaultdict
 from datetime import datetime
 from decimal import Decimal
+from typing import Any, Callable, Dict, List, Sequence, Tuple
 
 from .....domain.catalogo.entities.produto import Detalhe, Produto, Variacao
 from .....domain.shared.value_objects.moeda import Moeda
-from .....domain.shared.value_objects.preco import Preco
+from .....domain.shared.value_objects.preco import Preco, centavos
+from ..base import Base
 from ..models.produto import (
     DetalheModel,
     DetalheVariacaoModel,
@@ -18,6 +21,23 @@ from ..models.produto import (
 )
 
 
+def atualizar_colunas(model: Base, valores: Dict[str, Any]) -> None:
+    """
+    Altera no modelo apenas as colunas cujo valor mudou.
+
+    Colunas não alteradas não são marcadas como modificadas, então o
+    UPDATE gerado no flush inclui apenas as colunas alteradas (e nenhum
+    UPDATE é gerado se nada mudou).
+
+    Args:
+        model: Modelo carregado da sessão
+        valores: Valores desejados de cada coluna
+    """
+    for coluna, valor in valores.items():
+        if getattr(model, coluna) != valor:
+            setattr(model, coluna, valor)
+
+
 class ProdutoMapper:
     """
     Mapeador entre entidades de domínio e modelos SQLAlchemy para produtos.
@@ -42,8 +62,6 @@ class ProdutoMapper:
             descricao=entity.descricao,
             preco_valor=entity.preco.valor,
             preco_moeda=entity.preco.moeda.codigo,
-            preco_data_inicio=entity.preco.data_inicio,
-            preco_data_fim=entity.preco.data_fim,
             data_criacao=entity.data_criacao,
             ativo=entity.ativo,
         )
@@ -56,6 +74,149 @@ class ProdutoMapper:
 
         return model
 
+    def to_row(self, entity: Produto) -> Dict[str, Any]:
+        """
+        Converte uma entidade Produto para as colunas da tabela de produtos.
+
+        Usado nas escritas em lote, que não passam por modelos ORM.
+
+        Args:
+            entity: A entidade a ser convertida
+
+        Returns:
+            Dict[str, Any]: Valores das colunas do produto
+        """
+        return {
+            "sku": entity.sku,
+            "nome": entity.nome,
+            "descricao": entity.descricao,
+            "preco_valor": entity.preco.valor,
+            "preco_moeda": entity.preco.moeda.codigo,
+            "data_criacao": entity.data_criacao,
+            "ativo": entity.ativo,
+        }
+
+    def variacao_to_row(self, entity: Variacao, produto_id: int) -> Dict[str, Any]:
+        """
+        Converte uma entidade Variacao para as colunas da tabela de variações.
+
+        Args:
+            entity: A entidade a ser convertida
+            produto_id: ID do produto pai
+
+        Returns:
+            Dict[str, Any]: Valores das colunas da variação
+        """
+        return {
+            "produto_id": produto_id,
+            "nome": entity.nome,
+            "descricao": entity.descricao,
+            "codigo": entity.codigo,
+            "data_criacao": entity.data_criacao,
+            "ativo": entity.ativo,
+        }
+
+    def detalhe_to_row(
+        self, entity: Detalhe, chave_pai: str, pai_id: int
+    ) -> Dict[str, Any]:
+        """
+        Converte uma entidade Detalhe para as colunas de uma tabela de detalhes.
+
+        Args:
+            entity: A entidade a ser convertida
+            chave_pai: Coluna de chave estrangeira ("produto_id" ou "variacao_id")
+            pai_id: ID do produto ou da variação pai
+
+        Returns:
+            Dict[str, Any]: Valores das colunas do detalhe
+        """
+        return {
+            chave_pai: pai_id,
+            "nome": entity.nome,
+            "valor": entity.valor,
+            "tipo": entity.tipo,
+            "data_criacao": entity.data_criacao,
+            "ativo": entity.ativo,
+        }
+
+    def atualizar_model(
+        self, entity: Produto, model: ProdutoModel
+    ) -> Tuple[List[Base], List[Base]]:
+        """
+        Aplica a um modelo carregado apenas as diferenças da entidade.
+
+        As colunas do produto são comparadas uma a uma e os filhos são
+        sincronizados por sincronizar_filhos.
+
+        O modelo deve ter as variações (com seus detalhes) e os detalhes
+        carregados.
+
+        Args:
+            entity: A entidade com os dados atualizados
+            model: O modelo do produto, carregado da sessão
+
+        Returns:
+            Tuple[List[Base], List[Base]]: Modelos filhos criados, que devem
+            ser adicionados à sessão, e modelos filhos que devem ser excluídos
+        """
+        atualizar_colunas(model, self.to_row(entity))
+        return self.sincronizar_filhos(entity, model)
+
+    def sincronizar_filhos(
+        self, entity: Produto, model: ProdutoModel
+    ) -> Tuple[List[Base], List[Base]]:
+        """
+        Aplica a um modelo carregado as variações e os detalhes da entidade.
+
+        As variações são associadas pelo código e os detalhes pelo par
+        (nome, tipo): filhos iguais não são alterados, filhos alterados têm
+        apenas as colunas diferentes atualizadas, filhos novos são criados e
+        os que não existem mais na entidade são removidos das coleções.
+
+        O modelo deve ter as variações (com seus detalhes) e os detalhes
+        carregados.
+
+        Args:
+            entity: A entidade com os filhos desejados
+            model: O modelo do produto, carregado da sessão
+
+        Returns:
+            Tuple[List[Base], List[Base]]: Modelos filhos criados, que devem
+            ser adicionados à sessão, e modelos filhos que devem ser excluídos
+        """
+        novos: List[Base] = []
+        removidos: List[Base] = []
+        variacoes = {variacao.codigo: variacao for variacao in model.variacoes}
+        for variacao in entity.variacoes:
+            variacao_model = variacoes.pop(variacao.codigo, None)
+            if variacao_model is None:
+                novos.append(self._variacao_to_model(variacao, model))
+                continue
+            valores = self.variacao_to_row(variacao, model.id)
+            del valores["produto_id"]
+            atualizar_colunas(variacao_model, valores)
+            self._sincronizar_detalhes(
+                variacao_model.detalhes,
+                variacao.detalhes,
+                lambda d, pai=variacao_model: self._detalhe_variacao_to_model(d, pai),
+                novos,
+                removidos,
+            )
+        for variacao_model in variacoes.values():
+            # Os detalhes da variação são excluídos com ela
+            removidos += list(variacao_model.detalhes)
+            removidos.append(variacao_model)
+            model.variacoes.remove(variacao_model)
+
+        self._sincronizar_detalhes(
+            model.detalhes,
+            entity.detalhes,
+            lambda d: self._detalhe_to_model(d, model),
+            novos,
+            removidos,
+        )
+        return novos, removidos
+
     def to_entity(self, model: ProdutoModel) -> Produto:
         """
         Converte um modelo SQLAlchemy para uma entidade Produto.
@@ -66,16 +227,10 @@ class ProdutoMapper:
         Returns:
             Produto: A entidade correspondente
         """
-        # Cria o objeto Preco
+        # Cria o objeto Preco com a moeda compartilhada do registro
         preco = Preco(
-            valor=model.preco_valor,
-            moeda=Moeda(
-                codigo=model.preco_moeda,
-                nome="",  # Nome será preenchido pelo construtor
-                simbolo="",  # Símbolo será preenchido pelo construtor
-            ),
-            data_inicio=model.preco_data_inicio,
-            data_fim=model.preco_data_fim,
+            valor_em_centavos=centavos(model.preco_valor),
+            moeda=Moeda.de_codigo(model.preco_moeda),
         )
 
         # Converte variações
@@ -93,6 +248,7 @@ class ProdutoMapper:
             detalhes=detalhes,
             data_criacao=model.data_criacao,
             ativo=model.ativo,
+            id=model.id,
         )
 
     def _variacao_to_model(
@@ -207,3 +363,47 @@ class ProdutoMapper:
             data_criacao=model.data_criacao,
             ativo=model.ativo,
         )
+
+    def _sincronizar_detalhes(
+        self,
+        models: List[DetalheModel | DetalheVariacaoModel],
+        detalhes: Sequence[Detalhe],
+        criar: Callable[[Detalhe], Any],
+        novos: List[Base],
+        removidos: List[Base],
+    ) -> None:
+        """
+        Sincroniza os detalhes carregados de um produto ou variação.
+
+        Os detalhes são associados pelo par (nome, tipo), na ordem em que
+        aparecem quando o par se repete.
+
+        Args:
+            models: Coleção de detalhes do modelo pai
+            detalhes: Detalhes desejados
+            criar: Cria o modelo de um detalhe novo, já associado ao pai
+            novos: Lista que recebe os detalhes criados
+            removidos: Lista que recebe os detalhes que devem ser excluídos
+        """
+        existentes: Dict[Tuple[str, str], List[Any]] = defaultdict(list)
+        for detalhe_model in models:
+            existentes[(detalhe_model.nome, detalhe_model.tipo)].append(detalhe_model)
+
+        for detalhe in detalhes:
+            candidatos = existentes.get((detalhe.nome, detalhe.tipo))
+            if not candidatos:
+                novos.append(criar(detalhe))
+                continue
+            atualizar_colunas(
+                candidatos.pop(0),
+                {
+                    "valor": detalhe.valor,
+                    "data_criacao": detalhe.data_criacao,
+                    "ativo": detalhe.ativo,
+                },
+            )
+
+        for candidatos in existentes.values():
+            for detalhe_model in candidatos:
+                models.remove(detalhe_model)
+                removidos.append(detalhe_model)
@@ -1,8 +1,12 @@
 """
 Exporta os modelos SQLAlchemy.
 """
-from src.joias.infrastructure.persistence.sqlalchemy.models.perfil import Perfil
+from src.joias.infrastructure.persistence.sqlalchemy.models.perfil import (
+    PerfilModel as Perfil,
+)
 from src.joias.infrastructure.persistence.sqlalchemy.models.token import Token
-from src.joias.infrastructure.persistence.sqlalchemy.models.usuario import Usuario
+from src.joias.infrastructure.persistence.sqlalchemy.models.usuario import (
+    UsuarioModel as Usuario,
+)
 
 __all__ = ["Perfil", "Token", "Usuario"] 
\ No newline at end of file
@@ -6,10 +6,20 @@ de fornecedores e documentos no banco de dados.
 """
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Table
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Table,
+)
 from sqlalchemy.orm import relationship
 
-from .base import Base
+from ..base import Base
+from .produto import ProdutoModel
 
 
 class Fornecedor(Base):
@@ -34,9 +44,7 @@ class Fornecedor(Base):
     documentos = relationship(
         "Documento", back_populates="fornecedor", cascade="all, delete-orphan"
     )
-    produtos = relationship(
-        "Produto", secondary="fornecedores_produtos", back_populates="fornecedores"
-    )
+    produtos = relationship(ProdutoModel, secondary="fornecedores_produtos")
 
 
 class Documento(Base):
@@ -47,7 +55,15 @@ class Documento(Base):
     id = Column(Integer, primary_key=True)
     numero = Column(String(20), nullable=False)
     tipo = Column(String(10), nullable=False)
-    fornecedor_id = Column(Integer, ForeignKey("fornecedores.id"), nullable=False)
+    fornecedor_id = Column(
+        Integer, ForeignKey("fornecedores.id"), nullable=False, index=True
+    )
+
+    # Um documento identifica um único fornecedor; o índice também atende
+    # buscar_por_documento e a verificação de documentos em lote
+    __table_args__ = (
+        Index("uq_documentos_tipo_numero", "tipo", "numero", unique=True),
+    )
 
     # Relacionamentos
     fornecedor = relationship("Fornecedor", back_populates="documentos")
@@ -59,4 +75,7 @@ fornecedores_produtos = Table(
     Base.metadata,
     Column("fornecedor_id", Integer, ForeignKey("fornecedores.id"), primary_key=True),
     Column("produto_id", Integer, ForeignKey("produtos.id"), primary_key=True),
+    # A chave primária atende "produtos do fornecedor"; este índice atende
+    # "fornecedores do produto"
+    Index("ix_fornecedores_produtos_produto_id", "produto_id", "fornecedor_id"),
 )
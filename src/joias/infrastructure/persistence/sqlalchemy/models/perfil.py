@@ -1,12 +1,23 @@
 """
 Modelo SQLAlchemy para Perfil.
 """
-from sqlalchemy import Column, DateTime, String
+from sqlalchemy import Column, DateTime, ForeignKey, String, Table
+from sqlalchemy.dialects.postgresql import UUID as PgUUID
 from sqlalchemy.orm import relationship
 
 from ..base import Base
 from .perfil_permissao import perfil_permissao
 
+# Tabela de associação entre usuários e perfis
+usuario_perfil = Table(
+    "usuario_perfil",
+    Base.metadata,
+    Column(
+        "usuario_id", PgUUID(as_uuid=True), ForeignKey("usuarios.id"), primary_key=True
+    ),
+    Column("perfil_id", String(36), ForeignKey("perfis.id"), primary_key=True),
+)
+
 
 class PerfilModel(Base):
     """Modelo SQLAlchemy para Perfil."""
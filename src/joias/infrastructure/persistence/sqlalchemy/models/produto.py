@@ -6,7 +6,16 @@ Este módulo define o modelo de dados para produtos usando SQLAlchemy ORM.
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, Numeric, String
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+)
 from sqlalchemy.orm import relationship
 
 from ..base import Base
@@ -28,6 +37,9 @@ class ProdutoModel(Base):
     data_criacao = Column(DateTime, nullable=False, default=datetime.now)
     ativo = Column(Boolean, nullable=False, default=True)
 
+    # Listagens e buscas por faixa de preço filtram por ativo e preço
+    __table_args__ = (Index("ix_produtos_ativo_preco_valor", "ativo", "preco_valor"),)
+
     # Relacionamentos
     variacoes = relationship("VariacaoModel", back_populates="produto")
     detalhes = relationship("DetalheModel", back_populates="produto")
@@ -39,7 +51,7 @@ class VariacaoModel(Base):
     __tablename__ = "variacoes"
 
     id = Column(Integer, primary_key=True)
-    produto_id = Column(Integer, ForeignKey("produtos.id"), nullable=False)
+    produto_id = Column(Integer, ForeignKey("produtos.id"), nullable=False, index=True)
     nome = Column(String(100), nullable=False)
     descricao = Column(String(500))
     codigo = Column(String(50), nullable=False)
@@ -57,7 +69,7 @@ class DetalheModel(Base):
     __tablename__ = "detalhes"
 
     id = Column(Integer, primary_key=True)
-    produto_id = Column(Integer, ForeignKey("produtos.id"), nullable=False)
+    produto_id = Column(Integer, ForeignKey("produtos.id"), nullable=False, index=True)
     nome = Column(String(100), nullable=False)
     valor = Column(String(200), nullable=False)
     tipo = Column(String(50), nullable=False)
@@ -74,7 +86,9 @@ class DetalheVariacaoModel(Base):
     __tablename__ = "detalhes_variacoes"
 
     id = Column(Integer, primary_key=True)
-    variacao_id = Column(Integer, ForeignKey("variacoes.id"), nullable=False)
+    variacao_id = Column(
+        Integer, ForeignKey("variacoes.id"), nullable=False, index=True
+    )
     nome = Column(String(100), nullable=False)
     valor = Column(String(200), nullable=False)
     tipo = Column(String(50), nullable=False)
@@ -7,7 +7,7 @@ SQLAlchemy como ORM.
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import Column, DateTime, ForeignKey, String
+from sqlalchemy import CHAR, Column, DateTime, ForeignKey, String
 from sqlalchemy.dialects.postgresql import UUID as PgUUID
 from sqlalchemy.orm import relationship
 
@@ -20,12 +20,18 @@ class Token(Base):
     __tablename__ = "token"
 
     id = Column(PgUUID(as_uuid=True), primary_key=True)
-    usuario_id = Column(PgUUID(as_uuid=True), ForeignKey("usuario.id"), nullable=False)
-    token = Column(String(255), nullable=False, unique=True)
-    expiracao = Column(DateTime, nullable=False)
+    usuario_id = Column(
+        PgUUID(as_uuid=True), ForeignKey("usuarios.id"), nullable=False, index=True
+    )
+    token = Column(String(255), nullable=False)
+    # SHA-256 do token, em hexadecimal: buscar_por_token usa este índice
+    # de tamanho fixo em vez de comparar o texto do JWT
+    token_hash = Column(CHAR(64), nullable=False, unique=True, index=True)
+    # Índice usado pela purga dos tokens expirados
+    expiracao = Column(DateTime, nullable=False, index=True)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     deleted_at = Column(DateTime, nullable=True)
 
     # Relacionamento com usuário
-    usuario = relationship("Usuario", back_populates="tokens") 
\ No newline at end of file
+    usuario = relationship("UsuarioModel", back_populates="tokens") 
\ No newline at end of file
@@ -7,12 +7,13 @@ SQLAlchemy como ORM.
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import Boolean, Column, DateTime, String
+from sqlalchemy import Boolean, Column, DateTime, Index, String, func
 from sqlalchemy.dialects.postgresql import UUID as PgUUID
 from sqlalchemy.orm import relationship
 
 from src.joias.infrastructure.persistence.sqlalchemy.base import Base
 from src.joias.infrastructure.persistence.sqlalchemy.models.perfil import usuario_perfil
+from src.joias.infrastructure.persistence.sqlalchemy.models.token import Token
 
 
 class UsuarioModel(Base):
@@ -29,15 +30,17 @@ class UsuarioModel(Base):
     ativo = Column(Boolean, nullable=False, default=True)
     data_criacao = Column(DateTime, nullable=False, default=datetime.utcnow)
 
+    # Busca por email sem diferenciar maiúsculas (buscar_por_email compara
+    # lower(email)); a busca por substring
+    # (ilike '%...%') usa os índices de trigramas criados na migração,
+    # disponíveis apenas no PostgreSQL
+    __table_args__ = (Index("ix_usuarios_email_lower", func.lower(email)),)
+
     # Relacionamento many-to-many com perfis
-    perfis = relationship(
-        "Perfil",
-        secondary=usuario_perfil,
-        back_populates="usuarios",
-    )
+    perfis = relationship("PerfilModel", secondary=usuario_perfil)
 
     # Relacionamento one-to-many com tokens
-    tokens = relationship("Token", back_populates="usuario", cascade="all, delete-orphan")
+    tokens = relationship(Token, back_populates="usuario", cascade="all, delete-orphan")
 
     def __repr__(self) -> str:
         """Retorna uma representação legível do modelo."""
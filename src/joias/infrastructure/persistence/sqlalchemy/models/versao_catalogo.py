@@ -0,0 +1,21 @@
+"""
+Modelo SQLAlchemy para as versões dos catálogos em cache.
+"""
+from sqlalchemy import Column, Integer, String
+
+from ..base import Base
+
+
+class VersaoCatalogoModel(Base):
+    """
+    Modelo SQLAlchemy para a versão de um catálogo mantido em cache.
+
+    Cada escrita em um catálogo (ex.: permissões) incrementa a versão na
+    mesma transação, permitindo que cada processo detecte que seu cache
+    ficou desatualizado com uma consulta de uma linha.
+    """
+
+    __tablename__ = "versoes_catalogo"
+
+    nome = Column(String(50), primary_key=True)
+    versao = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,44 @@
+"""
+Purga periódica dos tokens expirados.
+
+Executada em segundo plano pela API, para que a tabela de tokens não
+cresça indefinidamente com tokens que já não podem ser usados.
+"""
+import asyncio
+import logging
+from typing import Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .repositories.async_token_repository import AsyncTokenRepository
+from .repositories.token_repository import TAMANHO_LOTE_PURGA
+
+logger = logging.getLogger("joias")
+
+
+async def purgar_tokens_periodicamente(
+    session_factory: Callable[[], AsyncSession],
+    intervalo: float,
+    lote: int = TAMANHO_LOTE_PURGA,
+) -> None:
+    """
+    Exclui os tokens expirados a cada `intervalo` segundos, até ser cancelada.
+
+    Uma falha é registrada e a purga é tentada novamente no próximo ciclo.
+
+    Args:
+        session_factory: Fábrica de sessões assíncronas
+        intervalo: Segundos entre execuções
+        lote: Quantidade máxima de tokens excluídos por lote
+    """
+    while True:
+        try:
+            async with session_factory() as session:
+                excluidos = await AsyncTokenRepository(session).purgar_expirados(
+                    lote=lote
+                )
+            if excluidos:
+                logger.info("Tokens expirados excluídos: %d", excluidos)
+        except Exception:
+            logger.exception("Falha ao purgar tokens expirados")
+        await asyncio.sleep(intervalo)
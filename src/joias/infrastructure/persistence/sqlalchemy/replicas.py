@@ -0,0 +1,223 @@
+"""
+Roteamento de leituras para réplicas do banco.
+
+As sessões criadas com SessaoRoteada enviam as consultas de leitura
+(SELECT) dos repositórios para uma réplica, escolhida em rodízio a cada
+sessão, e todo o resto (flush, INSERT/UPDATE/DELETE, SELECT ... FOR
+UPDATE, SQL textual) para o primário. Depois da primeira escrita, a
+sessão passa a ler apenas do primário até ser fechada, para que cada
+requisição enxergue as próprias escritas mesmo com atraso de replicação.
+Sessões de uma unidade de trabalho e carregamentos para atualização
+(`fixar_no_primario`) leem sempre do primário.
+"""
+import threading
+import time
+from itertools import count
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from sqlalchemy import Select, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from .unit_of_work import CHAVE_UNIDADE_DE_TRABALHO
+
+# Chave usada em Session.info para marcar a sessão que já escreveu
+CHAVE_ESCREVEU = "escreveu_no_primario"
+
+# Segundos até uma réplica indisponível voltar a receber leituras
+INTERVALO_RETORNO = 30.0
+
+
+class RoteadorReplicas:
+    """
+    Escolhe o engine de cada leitura entre as réplicas disponíveis.
+
+    As réplicas são usadas em rodízio. Uma réplica que falha ao conectar
+    ou perde a conexão é retirada do rodízio por `intervalo_retorno`
+    segundos; sem réplicas disponíveis, as leituras vão para o primário.
+    """
+
+    def __init__(
+        self,
+        primario: Engine,
+        replicas: Sequence[Engine],
+        intervalo_retorno: float = INTERVALO_RETORNO,
+        relogio: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Inicializa o roteador.
+
+        Args:
+            primario: Engine do banco primário
+            replicas: Engines das réplicas de leitura
+            intervalo_retorno: Segundos até uma réplica indisponível voltar
+            relogio: Função que retorna o instante atual em segundos
+        """
+        self.primario = primario
+        self.replicas: List[Engine] = list(replicas)
+        self._intervalo_retorno = intervalo_retorno
+        self._relogio = relogio
+        self._lock = threading.Lock()
+        self._rodizio = count()
+        # Instante até o qual cada réplica fica fora do rodízio
+        self._indisponivel_ate: Dict[Engine, float] = {}
+        for replica in self.replicas:
+            event.listen(replica, "handle_error", self._ao_falhar(replica))
+
+    def _ao_falhar(self, replica: Engine) -> Callable[[Any], None]:
+        """
+        Cria o ouvinte de erros de uma réplica.
+
+        Args:
+            replica: Engine da réplica
+
+        Returns:
+            Função para o evento handle_error do engine
+        """
+
+        def ao_falhar(contexto) -> None:
+            # Sem conexão, o erro aconteceu ao conectar
+            if contexto.is_disconnect or contexto.connection is None:
+                self.marcar_indisponivel(replica)
+
+        return ao_falhar
+
+    def disponivel(self, replica: Engine) -> bool:
+        """
+        Verifica se uma réplica está no rodízio.
+
+        Args:
+            replica: Engine da réplica
+
+        Returns:
+            True se a réplica pode receber leituras
+        """
+        with self._lock:
+            return self._indisponivel_ate.get(replica, 0.0) <= self._relogio()
+
+    def marcar_indisponivel(self, replica: Engine) -> None:
+        """
+        Retira uma réplica do rodízio por `intervalo_retorno` segundos.
+
+        Args:
+            replica: Engine da réplica
+        """
+        with self._lock:
+            retorno = self._relogio() + self._intervalo_retorno
+            self._indisponivel_ate[replica] = retorno
+
+    def engine_leitura(self) -> Engine:
+        """
+        Escolhe o engine da próxima leitura.
+
+        Returns:
+            Próxima réplica disponível no rodízio, ou o primário se
+            nenhuma estiver disponível
+        """
+        total = len(self.replicas)
+        for _ in range(total):
+            replica = self.replicas[next(self._rodizio) % total]
+            if self.disponivel(replica):
+                return replica
+        return self.primario
+
+    def verificar(self) -> Dict[str, bool]:
+        """
+        Executa um SELECT 1 em cada réplica, atualizando o rodízio.
+
+        Réplicas que respondem voltam ao rodízio imediatamente. Usa
+        conexões síncronas, então vale apenas para engines síncronos.
+
+        Returns:
+            Disponibilidade de cada réplica, indexada pela URL sem senha
+        """
+        estado = {}
+        for replica in self.replicas:
+            try:
+                with replica.connect() as conexao:
+                    conexao.execute(text("SELECT 1"))
+            except Exception:
+                self.marcar_indisponivel(replica)
+            else:
+                with self._lock:
+                    self._indisponivel_ate.pop(replica, None)
+            estado[replica.url.render_as_string()] = self.disponivel(replica)
+        return estado
+
+
+def fixar_no_primario(session: Union[Session, AsyncSession]) -> bool:
+    """
+    Faz a sessão ler do primário antes de carregar modelos para alteração.
+
+    O flush grava apenas as colunas que diferem do estado carregado. Com o
+    modelo lido de uma réplica atrasada, uma alteração igual ao valor
+    antigo da réplica não seria gravada e o valor do primário prevaleceria
+    (atualização perdida). Os repositórios chamam esta função antes de
+    carregar o modelo que vão alterar.
+
+    Args:
+        session: Sessão (síncrona ou assíncrona) do repositório
+
+    Returns:
+        True se a sessão já leu de uma réplica: os modelos do identity map
+        podem estar atrasados e devem ser recarregados (populate_existing)
+    """
+    sessao = getattr(session, "sync_session", session)
+    sessao.info[CHAVE_ESCREVEU] = True
+    return getattr(sessao, "_replica", None) is not None
+
+
+class SessaoRoteada(Session):
+    """
+    Sessão que envia as leituras às réplicas de um RoteadorReplicas.
+
+    Sem roteador, comporta-se como uma Session comum.
+    """
+
+    def __init__(
+        self, *args: Any, roteador: Optional[RoteadorReplicas] = None, **kw: Any
+    ):
+        """
+        Inicializa a sessão.
+
+        Args:
+            roteador: Roteador de leituras (None desativa o roteamento)
+        """
+        super().__init__(*args, **kw)
+        self.roteador = roteador
+        # Réplica das leituras desta sessão, para que todas vejam o mesmo
+        # estado de replicação
+        self._replica: Optional[Engine] = None
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        """
+        Escolhe o engine de cada comando.
+
+        Returns:
+            Réplica para leituras de uma sessão que ainda não escreveu e
+            não pertence a uma unidade de trabalho; primário para todo o
+            resto
+        """
+        if self.roteador is None:
+            return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+        leitura = (
+            isinstance(clause, Select)
+            and clause._for_update_arg is None
+            and not self._flushing
+        )
+        if not leitura:
+            self.info[CHAVE_ESCREVEU] = True
+            return self.roteador.primario
+        if self.info.get(CHAVE_ESCREVEU) or CHAVE_UNIDADE_DE_TRABALHO in self.info:
+            return self.roteador.primario
+        if self._replica is None or not self.roteador.disponivel(self._replica):
+            self._replica = self.roteador.engine_leitura()
+        return self._replica
+
+    def close(self) -> None:
+        """Fecha a sessão; o próximo uso volta a ler das réplicas."""
+        self.info.pop(CHAVE_ESCREVEU, None)
+        self._replica = None
+        super().close()
@@ -0,0 +1,196 @@
+"""
+Implementação SQLAlchemy assíncrona do repositório de fornecedores.
+
+Este módulo contém a versão assíncrona do SQLAlchemyFornecedorRepository,
+usada pelos endpoints da API. Os documentos são sempre carregados junto
+com o fornecedor, já que sessões assíncronas não permitem carregamento
+sob demanda.
+"""
+from typing import List, Optional
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .....domain.catalogo.entities.fornecedor import Documento as DocumentoEntity
+from .....domain.catalogo.entities.fornecedor import Fornecedor as FornecedorEntity
+from .....domain.catalogo.repositories.fornecedor_repository import ResumoFornecedor
+from ..mappers.fornecedor_mapper import to_entity, to_model, update_model
+from ..models.fornecedor import Documento as DocumentoModel
+from ..models.fornecedor import Fornecedor as FornecedorModel
+from ..replicas import fixar_no_primario
+from .fornecedor_repository import OPCOES_CARREGAMENTO, select_resumos
+
+
+class AsyncSQLAlchemyFornecedorRepository:
+    """
+    Implementação SQLAlchemy assíncrona do repositório de fornecedores.
+
+    Oferece os mesmos métodos do SQLAlchemyFornecedorRepository, como
+    corrotinas.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Inicializa o repositório com uma sessão assíncrona do SQLAlchemy.
+
+        Args:
+            session: Sessão assíncrona do SQLAlchemy
+        """
+        self._session = session
+
+    def _select(self) -> Select:
+        """
+        Cria uma consulta de fornecedores com os documentos carregados.
+
+        Returns:
+            Select: Consulta configurada
+        """
+        return select(FornecedorModel).options(*OPCOES_CARREGAMENTO)
+
+    async def salvar(self, fornecedor: FornecedorEntity) -> FornecedorEntity:
+        """
+        Salva um fornecedor no banco de dados.
+
+        Args:
+            fornecedor: O fornecedor a ser salvo
+
+        Returns:
+            FornecedorEntity: O fornecedor salvo com ID atualizado
+        """
+        model = to_model(fornecedor)
+        self._session.add(model)
+        await self._session.flush()  # Para gerar o ID
+        return to_entity(model)
+
+    async def buscar_por_id(self, fornecedor_id: int) -> Optional[FornecedorEntity]:
+        """
+        Busca um fornecedor pelo ID.
+
+        Args:
+            fornecedor_id: ID do fornecedor
+
+        Returns:
+            Optional[FornecedorEntity]: O fornecedor encontrado ou None
+        """
+        model = await self._session.get(
+            FornecedorModel, fornecedor_id, options=OPCOES_CARREGAMENTO
+        )
+        if not model:
+            return None
+        return to_entity(model)
+
+    async def buscar_por_documento(
+        self, documento: DocumentoEntity
+    ) -> Optional[FornecedorEntity]:
+        """
+        Busca um fornecedor pelo documento.
+
+        Args:
+            documento: Documento do fornecedor
+
+        Returns:
+            Optional[FornecedorEntity]: O fornecedor encontrado ou None
+        """
+        model = await self._session.scalar(
+            self._select()
+            .join(FornecedorModel.documentos)
+            .where(
+                DocumentoModel.numero == documento.numero,
+                DocumentoModel.tipo == documento.tipo,
+            )
+            .limit(1)
+        )
+        if not model:
+            return None
+        return to_entity(model)
+
+    async def listar(self, apenas_ativos: bool = True) -> List[FornecedorEntity]:
+        """
+        Lista todos os fornecedores.
+
+        Args:
+            apenas_ativos: Se True, retorna apenas fornecedores ativos
+
+        Returns:
+            List[FornecedorEntity]: Lista de fornecedores
+        """
+        stmt = self._select()
+        if apenas_ativos:
+            stmt = stmt.where(FornecedorModel.ativo == True)
+        models = await self._session.scalars(stmt)
+        return [to_entity(model) for model in models]
+
+    async def listar_resumos(
+        self, apenas_ativos: bool = True
+    ) -> List[ResumoFornecedor]:
+        """
+        Lista os resumos dos fornecedores, sem carregar as entidades.
+
+        Args:
+            apenas_ativos: Se True, retorna apenas fornecedores ativos
+
+        Returns:
+            List[ResumoFornecedor]: Resumos dos fornecedores
+        """
+        linhas = await self._session.execute(select_resumos(apenas_ativos))
+        return [ResumoFornecedor._make(linha) for linha in linhas]
+
+    async def buscar_por_nome(self, nome: str) -> List[FornecedorEntity]:
+        """
+        Busca fornecedores por nome.
+
+        Args:
+            nome: Nome ou parte do nome do fornecedor
+
+        Returns:
+            List[FornecedorEntity]: Lista de fornecedores encontrados
+        """
+        models = await self._session.scalars(
+            self._select().where(FornecedorModel.nome.ilike(f"%{nome}%"))
+        )
+        return [to_entity(model) for model in models]
+
+    async def atualizar(
+        self, fornecedor: FornecedorEntity
+    ) -> Optional[FornecedorEntity]:
+        """
+        Atualiza um fornecedor existente.
+
+        Args:
+            fornecedor: O fornecedor com dados atualizados
+
+        Returns:
+            Optional[FornecedorEntity]: O fornecedor atualizado ou None
+            se não encontrado
+        """
+        model = await self._session.get(
+            FornecedorModel,
+            fornecedor.id,
+            options=OPCOES_CARREGAMENTO,
+            populate_existing=fixar_no_primario(self._session),
+        )
+        if not model:
+            return None
+
+        update_model(model, fornecedor)
+        await self._session.flush()
+        return to_entity(model)
+
+    async def excluir(self, fornecedor_id: int) -> bool:
+        """
+        Remove um fornecedor.
+
+        Args:
+            fornecedor_id: ID do fornecedor
+
+        Returns:
+            bool: True se removido com sucesso, False caso contrário
+        """
+        model = await self._session.get(
+            FornecedorModel, fornecedor_id, options=OPCOES_CARREGAMENTO
+        )
+        if not model:
+            return False
+
+        await self._session.delete(model)
+        return True
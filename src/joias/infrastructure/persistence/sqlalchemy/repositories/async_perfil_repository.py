@@ -0,0 +1,175 @@
+"""
+Repositório SQLAlchemy assíncrono para Perfil.
+"""
+import uuid
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .....domain.entities.perfil import Perfil
+from ..models.perfil import PerfilModel
+from ..models.perfil_permissao import perfil_permissao
+from ..replicas import fixar_no_primario
+from ..unit_of_work import confirmar_async
+from .perfil_repository import (
+    CARREGAR_PERMISSOES,
+    hidratar_perfis,
+    linhas_perfil_permissao,
+    permissoes_do_perfil,
+    permissoes_existentes,
+    remover_permissoes,
+    verificar_permissoes,
+)
+from .permissoes_efetivas_repository import invalidar_permissoes_efetivas
+
+
+class AsyncSQLPerfilRepository:
+    """Implementação SQLAlchemy assíncrona do repositório de Perfil."""
+
+    def __init__(self, session: AsyncSession):
+        """
+        Inicializa o repositório.
+
+        Args:
+            session: Sessão assíncrona do SQLAlchemy
+        """
+        self._session = session
+
+    async def criar(self, perfil: Perfil) -> Perfil:
+        """
+        Cria um novo perfil.
+
+        Args:
+            perfil: Perfil a ser criado
+
+        Returns:
+            Perfil criado com ID
+        """
+        model = PerfilModel(
+            id=str(uuid.uuid4()),
+            nome=perfil.nome,
+            descricao=perfil.descricao,
+            data_criacao=datetime.now(),
+        )
+
+        self._session.add(model)
+        await confirmar_async(self._session, perfil)
+
+        perfil._id = model.id  # pylint: disable=protected-access
+
+        return perfil
+
+    async def buscar_por_id(self, id: str) -> Optional[Perfil]:
+        """
+        Busca um perfil pelo ID.
+
+        Args:
+            id: ID do perfil
+
+        Returns:
+            Perfil encontrado ou None
+        """
+        model = await self._session.get(PerfilModel, id, options=CARREGAR_PERMISSOES)
+
+        if not model:
+            return None
+
+        return hidratar_perfis([model])[0]
+
+    async def buscar_por_nome(self, nome: str) -> Optional[Perfil]:
+        """
+        Busca um perfil pelo nome.
+
+        Args:
+            nome: Nome do perfil
+
+        Returns:
+            Perfil encontrado ou None
+        """
+        model = await self._session.scalar(
+            select(PerfilModel)
+            .options(*CARREGAR_PERMISSOES)
+            .where(PerfilModel.nome == nome)
+            .limit(1)
+        )
+
+        if not model:
+            return None
+
+        return hidratar_perfis([model])[0]
+
+    async def listar(self) -> List[Perfil]:
+        """
+        Lista todos os perfis.
+
+        Returns:
+            Lista de perfis
+        """
+        models = await self._session.scalars(
+            select(PerfilModel).options(*CARREGAR_PERMISSOES)
+        )
+
+        return hidratar_perfis(models)
+
+    async def atualizar(self, perfil: Perfil) -> Perfil:
+        """
+        Atualiza um perfil existente.
+
+        Args:
+            perfil: Perfil com as alterações
+
+        Returns:
+            Perfil atualizado
+        """
+        model = await self._session.get(
+            PerfilModel, perfil.id, populate_existing=fixar_no_primario(self._session)
+        )
+
+        if not model:
+            raise ValueError("Perfil não encontrado")
+
+        # Atualiza os dados básicos
+        model.nome = perfil.nome
+        model.descricao = perfil.descricao
+
+        # Sincroniza as permissões gravando apenas a diferença
+        atuais = set(await self._session.scalars(permissoes_do_perfil(model.id)))
+        desejadas = {str(permissao.id) for permissao in perfil.permissoes}
+        adicionadas = desejadas - atuais
+        removidas = atuais - desejadas
+
+        if adicionadas:
+            encontradas = set(
+                await self._session.scalars(permissoes_existentes(adicionadas))
+            )
+            verificar_permissoes(adicionadas, encontradas)
+            await self._session.execute(
+                insert(perfil_permissao),
+                linhas_perfil_permissao(model.id, adicionadas),
+            )
+        if removidas:
+            await self._session.execute(remover_permissoes(model.id, removidas))
+        if adicionadas or removidas:
+            self._session.expire(model, ["permissoes"])
+
+        await confirmar_async(self._session, perfil)
+        if adicionadas or removidas:
+            invalidar_permissoes_efetivas(self._session.sync_session)
+
+        return perfil
+
+    async def deletar(self, perfil: Perfil) -> None:
+        """
+        Remove um perfil.
+
+        Args:
+            perfil: Perfil a ser removido
+        """
+        model = await self._session.get(PerfilModel, perfil.id)
+
+        if model:
+            await self._session.delete(model)
+            await confirmar_async(self._session, perfil)
+            invalidar_permissoes_efetivas(self._session.sync_session)
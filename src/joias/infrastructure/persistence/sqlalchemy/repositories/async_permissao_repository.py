@@ -0,0 +1,197 @@
+"""
+Repositório SQLAlchemy assíncrono para Permissão.
+"""
+import uuid
+from typing import List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .....domain.entities.permissao import Permissao
+from ..models.perfil_permissao import perfil_permissao
+from ..models.permissao import PermissaoModel
+from ..replicas import fixar_no_primario
+from ..unit_of_work import confirmar_async
+from .permissao_repository import CATALOGO_PERMISSOES, incrementar_versao
+
+
+class AsyncSQLPermissaoRepository:
+    """Implementação SQLAlchemy assíncrona do repositório de Permissão."""
+
+    def __init__(self, session: AsyncSession):
+        """
+        Inicializa o repositório.
+
+        Args:
+            session: Sessão assíncrona do SQLAlchemy
+        """
+        self._session = session
+
+    async def criar(self, permissao: Permissao) -> Permissao:
+        """
+        Cria uma nova permissão.
+
+        Args:
+            permissao: Permissão a ser criada
+
+        Returns:
+            Permissão criada com ID
+        """
+        model = PermissaoModel(
+            id=str(uuid.uuid4()),
+            nome=permissao.nome,
+            chave=permissao.chave,
+            descricao=permissao.descricao,
+        )
+
+        self._session.add(model)
+        await self._confirmar_escrita(permissao)
+
+        permissao._id = model.id  # pylint: disable=protected-access
+
+        return permissao
+
+    async def buscar_por_id(self, id: str) -> Optional[Permissao]:
+        """
+        Busca uma permissão pelo ID.
+
+        Args:
+            id: ID da permissão
+
+        Returns:
+            Permissão encontrada ou None
+        """
+        model = await self._session.get(PermissaoModel, id)
+
+        if not model:
+            return None
+
+        return self._to_entity(model)
+
+    async def buscar_por_chave(self, chave: str) -> Optional[Permissao]:
+        """
+        Busca uma permissão pela chave.
+
+        Args:
+            chave: Chave da permissão
+
+        Returns:
+            Permissão encontrada ou None
+        """
+        model = await self._session.scalar(
+            select(PermissaoModel)
+            .where(PermissaoModel.chave == chave.upper())
+            .limit(1)
+        )
+
+        if not model:
+            return None
+
+        return self._to_entity(model)
+
+    async def listar(self) -> List[Permissao]:
+        """
+        Lista todas as permissões.
+
+        Returns:
+            Lista de permissões
+        """
+        models = await self._session.scalars(select(PermissaoModel))
+
+        return [self._to_entity(model) for model in models]
+
+    async def atualizar(self, permissao: Permissao) -> Permissao:
+        """
+        Atualiza uma permissão.
+
+        Args:
+            permissao: Permissão a ser atualizada
+
+        Returns:
+            Permissão atualizada
+        """
+        model = await self._session.get(
+            PermissaoModel,
+            permissao.id,
+            populate_existing=fixar_no_primario(self._session),
+        )
+
+        if model:
+            model.nome = permissao.nome
+            model.chave = permissao.chave
+            model.descricao = permissao.descricao
+            await self._confirmar_escrita(permissao)
+
+        return permissao
+
+    async def deletar(self, permissao: Permissao) -> None:
+        """
+        Remove uma permissão.
+
+        Args:
+            permissao: Permissão a ser removida
+        """
+        model = await self._session.get(PermissaoModel, permissao.id)
+
+        if model:
+            await self._session.delete(model)
+            await self._confirmar_escrita(permissao)
+
+    async def excluir(self, permissao: Permissao) -> None:
+        """
+        Exclui uma permissão.
+
+        Args:
+            permissao: Permissão a ser excluída
+        """
+        await self.deletar(permissao)
+
+    async def tem_perfis_associados(self, id: str) -> bool:
+        """
+        Verifica se uma permissão está associada a algum perfil.
+
+        Args:
+            id: ID da permissão
+
+        Returns:
+            True se a permissão estiver associada a algum perfil
+        """
+        perfil_id = await self._session.scalar(
+            select(perfil_permissao.c.perfil_id)
+            .where(perfil_permissao.c.permissao_id == str(id))
+            .limit(1)
+        )
+        return perfil_id is not None
+
+    async def _confirmar_escrita(self, permissao: Permissao) -> None:
+        """
+        Confirma a escrita de uma permissão no catálogo de permissões.
+
+        Incrementa a versão do catálogo e invalida o catálogo do processo
+        usado pelo SQLPermissaoRepository.
+
+        Args:
+            permissao: Permissão gravada
+        """
+        await self._session.flush()
+        await self._session.run_sync(incrementar_versao)
+        await confirmar_async(self._session, permissao)
+        CATALOGO_PERMISSOES.invalidar()
+
+    def _to_entity(self, model: PermissaoModel) -> Permissao:
+        """
+        Converte um modelo em entidade.
+
+        Args:
+            model: Modelo da permissão
+
+        Returns:
+            Permissão correspondente
+        """
+        permissao = Permissao(
+            nome=model.nome,
+            chave=model.chave,
+            descricao=model.descricao,
+        )
+        permissao._id = model.id  # pylint: disable=protected-access
+        return permissao
@@ -0,0 +1,312 @@
+"""
+Implementação assíncrona do repositório de produtos usando SQLAlchemy.
+
+Este módulo contém a versão assíncrona do SQLAlchemyProdutoRepository,
+usada pelos endpoints da API. Os perfis de carregamento são os mesmos
+da versão síncrona; como sessões assíncronas não permitem carregamento
+sob demanda, todos os relacionamentos lidos pelo mapeador são carregados
+antecipadamente. A gravação em lote continua apenas na versão síncrona.
+"""
+from decimal import Decimal
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from sqlalchemy import Select, and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .....domain.catalogo.entities.produto import Produto
+from .....domain.catalogo.repositories.produto_repository import ResumoProduto
+from ..mappers.produto_mapper import ProdutoMapper
+from ..models.produto import ProdutoModel
+from ..replicas import fixar_no_primario
+from ..unit_of_work import confirmar_async
+from .produto_repository import (
+    PERFIS_CARREGAMENTO,
+    PERFIS_POR_METODO,
+    pagina_de_resumos,
+    select_resumos,
+    validar_limite,
+)
+
+
+class AsyncSQLAlchemyProdutoRepository:
+    """
+    Implementação assíncrona do repositório de produtos usando SQLAlchemy.
+
+    Oferece os mesmos métodos do SQLAlchemyProdutoRepository, como
+    corrotinas.
+    """
+
+    def __init__(
+        self, session: AsyncSession, perfis: Optional[Dict[str, str]] = None
+    ):
+        """
+        Inicializa o repositório com uma sessão assíncrona do SQLAlchemy.
+
+        Args:
+            session: Sessão assíncrona do SQLAlchemy
+            perfis: Perfil de carregamento por método, sobrepondo
+                PERFIS_POR_METODO (ex.: {"listar": "listagem"})
+        """
+        self._session = session
+        self._mapper = ProdutoMapper()
+        self._perfis = {**PERFIS_POR_METODO, **(perfis or {})}
+
+    def _opcoes(self, metodo: str) -> tuple:
+        """
+        Retorna as opções de carregamento configuradas para um método.
+
+        Args:
+            metodo: Nome do método de leitura
+
+        Returns:
+            tuple: Opções de carregamento do SQLAlchemy
+        """
+        return PERFIS_CARREGAMENTO[self._perfis[metodo]]
+
+    def _select(self, metodo: str) -> Select:
+        """
+        Cria uma consulta de produtos com o perfil de carregamento do método.
+
+        Args:
+            metodo: Nome do método de leitura
+
+        Returns:
+            Select: Consulta configurada
+        """
+        return select(ProdutoModel).options(*self._opcoes(metodo))
+
+    async def salvar(self, produto: Produto) -> Produto:
+        """
+        Salva um produto no banco de dados.
+
+        Args:
+            produto: O produto a ser salvo
+
+        Returns:
+            Produto: O produto salvo com ID atualizado
+        """
+        model = self._mapper.to_model(produto)
+        self._session.add(model)
+        await confirmar_async(self._session)
+        return self._mapper.to_entity(model)
+
+    async def buscar_por_id(self, produto_id: int) -> Optional[Produto]:
+        """
+        Busca um produto pelo ID.
+
+        Args:
+            produto_id: ID do produto
+
+        Returns:
+            Optional[Produto]: O produto encontrado ou None
+        """
+        model = await self._session.get(
+            ProdutoModel, produto_id, options=self._opcoes("buscar_por_id")
+        )
+        if not model:
+            return None
+        return self._mapper.to_entity(model)
+
+    async def buscar_por_sku(self, sku: str) -> Optional[Produto]:
+        """
+        Busca um produto pelo SKU.
+
+        Args:
+            sku: SKU do produto
+
+        Returns:
+            Optional[Produto]: O produto encontrado ou None
+        """
+        model = await self._session.scalar(
+            self._select("buscar_por_sku").where(ProdutoModel.sku == sku).limit(1)
+        )
+        if not model:
+            return None
+        return self._mapper.to_entity(model)
+
+    async def listar(self, apenas_ativos: bool = True) -> List[Produto]:
+        """
+        Lista todos os produtos.
+
+        Args:
+            apenas_ativos: Se True, retorna apenas produtos ativos
+
+        Returns:
+            List[Produto]: Lista de produtos
+        """
+        stmt = self._select("listar")
+        if apenas_ativos:
+            stmt = stmt.where(ProdutoModel.ativo == True)
+        models = await self._session.scalars(stmt)
+        return [self._mapper.to_entity(model) for model in models]
+
+    async def listar_pagina(
+        self,
+        apos_id: Optional[int] = None,
+        limite: int = 50,
+        apenas_ativos: bool = True,
+    ) -> Tuple[List[Produto], Optional[int]]:
+        """
+        Lista uma página de produtos ordenados por ID (paginação por cursor).
+
+        Args:
+            apos_id: Cursor; retorna apenas produtos com ID maior que ele
+            limite: Quantidade máxima de produtos na página
+            apenas_ativos: Se True, retorna apenas produtos ativos
+
+        Returns:
+            Tuple[List[Produto], Optional[int]]: Produtos da página e o
+            cursor da próxima página (None se esta for a última)
+
+        Raises:
+            ValueError: Se limite for menor que 1
+        """
+        validar_limite(limite)
+        stmt = self._select("listar_pagina")
+        if apenas_ativos:
+            stmt = stmt.where(ProdutoModel.ativo == True)
+        if apos_id is not None:
+            stmt = stmt.where(ProdutoModel.id > apos_id)
+
+        # Busca um registro a mais apenas para saber se há próxima página
+        models = (
+            await self._session.scalars(
+                stmt.order_by(ProdutoModel.id).limit(limite + 1)
+            )
+        ).all()
+        proximo = models[limite - 1].id if len(models) > limite else None
+        return [self._mapper.to_entity(model) for model in models[:limite]], proximo
+
+    async def listar_resumos(self, apenas_ativos: bool = True) -> List[ResumoProduto]:
+        """
+        Lista os resumos dos produtos, sem carregar as entidades.
+
+        Args:
+            apenas_ativos: Se True, retorna apenas produtos ativos
+
+        Returns:
+            List[ResumoProduto]: Resumos dos produtos
+        """
+        linhas = await self._session.execute(select_resumos(apenas_ativos))
+        return [ResumoProduto._make(linha) for linha in linhas]
+
+    async def listar_pagina_resumos(
+        self,
+        apos_id: Optional[int] = None,
+        limite: int = 50,
+        apenas_ativos: bool = True,
+    ) -> Tuple[List[ResumoProduto], Optional[int]]:
+        """
+        Lista uma página de resumos de produtos ordenados por ID.
+
+        Args:
+            apos_id: Cursor; retorna apenas produtos com ID maior que ele
+            limite: Quantidade máxima de produtos na página
+            apenas_ativos: Se True, retorna apenas produtos ativos
+
+        Returns:
+            Tuple[List[ResumoProduto], Optional[int]]: Resumos da página e o
+            cursor da próxima página (None se esta for a última)
+
+        Raises:
+            ValueError: Se limite for menor que 1
+        """
+        validar_limite(limite)
+        linhas = (
+            await self._session.execute(
+                select_resumos(apenas_ativos, apos_id).limit(limite + 1)
+            )
+        ).all()
+        return pagina_de_resumos(linhas, limite)
+
+    async def iterar(
+        self, apenas_ativos: bool = True, lote: int = 1000
+    ) -> AsyncIterator[Produto]:
+        """
+        Percorre todos os produtos sem carregá-los todos em memória.
+
+        Args:
+            apenas_ativos: Se True, percorre apenas produtos ativos
+            lote: Quantidade de produtos carregados por vez
+
+        Yields:
+            Produto: Cada produto, em ordem de ID
+        """
+        stmt = self._select("iterar")
+        if apenas_ativos:
+            stmt = stmt.where(ProdutoModel.ativo == True)
+        stmt = stmt.order_by(ProdutoModel.id).execution_options(yield_per=lote)
+        async for model in await self._session.stream_scalars(stmt):
+            yield self._mapper.to_entity(model)
+
+    async def buscar_por_faixa_de_preco(
+        self, preco_minimo: Decimal, preco_maximo: Decimal
+    ) -> List[Produto]:
+        """
+        Busca produtos por faixa de preço.
+
+        Args:
+            preco_minimo: Preço mínimo
+            preco_maximo: Preço máximo
+
+        Returns:
+            List[Produto]: Lista de produtos na faixa de preço
+        """
+        models = await self._session.scalars(
+            self._select("buscar_por_faixa_de_preco").where(
+                and_(
+                    ProdutoModel.preco_valor >= preco_minimo,
+                    ProdutoModel.preco_valor <= preco_maximo,
+                    ProdutoModel.ativo == True,
+                )
+            )
+        )
+        return [self._mapper.to_entity(model) for model in models]
+
+    async def atualizar(self, produto: Produto) -> Optional[Produto]:
+        """
+        Atualiza um produto existente.
+
+        Args:
+            produto: O produto com dados atualizados
+
+        Returns:
+            Optional[Produto]: O produto atualizado ou None se não encontrado
+        """
+        # As coleções são comparadas com as da entidade, então precisam
+        # estar carregadas
+        model = await self._session.get(
+            ProdutoModel,
+            produto.id,
+            options=PERFIS_CARREGAMENTO["completo"],
+            populate_existing=fixar_no_primario(self._session),
+        )
+        if not model:
+            return None
+
+        # Grava apenas as colunas e os filhos alterados
+        novos, removidos = self._mapper.atualizar_model(produto, model)
+        self._session.add_all(novos)
+        for removido in removidos:
+            await self._session.delete(removido)
+
+        await confirmar_async(self._session)
+        return produto
+
+    async def excluir(self, produto_id: int) -> bool:
+        """
+        Remove um produto.
+
+        Args:
+            produto_id: ID do produto
+
+        Returns:
+            bool: True se removido com sucesso, False caso contrário
+        """
+        model = await self._session.get(ProdutoModel, produto_id)
+        if not model:
+            return False
+
+        await self._session.delete(model)
+        await confirmar_async(self._session)
+        return True
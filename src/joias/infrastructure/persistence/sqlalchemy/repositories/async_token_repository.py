@@ -0,0 +1,194 @@
+"""
+Repositório SQLAlchemy assíncrono para tokens.
+
+Este módulo implementa a versão assíncrona do repositório de tokens,
+usada pelos endpoints da API. A versão síncrona continua em
+`token_repository` para scripts.
+"""
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.joias.domain.entities.autorizacao import Token
+from src.joias.infrastructure.persistence.sqlalchemy.models import Token as TokenModel
+from src.joias.infrastructure.persistence.sqlalchemy.replicas import fixar_no_primario
+from src.joias.infrastructure.persistence.sqlalchemy.repositories.token_repository import (
+    BUSCAR_TOKEN_POR_HASH,
+    BUSCAR_TOKEN_POR_ID,
+    BUSCAR_TOKEN_POR_USUARIO,
+    PURGAR_EXPIRADOS,
+    TAMANHO_LOTE_PURGA,
+    hash_token,
+    row_to_token,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.unit_of_work import (
+    confirmar_async,
+    desfazer_async,
+)
+
+
+class AsyncTokenRepository:
+    """Repositório SQLAlchemy assíncrono para tokens."""
+
+    def __init__(self, session: AsyncSession):
+        """
+        Inicializa o repositório.
+
+        Args:
+            session: Sessão assíncrona do SQLAlchemy
+        """
+        self._session = session
+
+    async def criar(self, token: Token) -> Token:
+        """
+        Cria um novo token.
+
+        Args:
+            token: Token a ser criado
+
+        Returns:
+            O token criado
+
+        Raises:
+            IntegrityError: Se houver erro de integridade
+        """
+        try:
+            token_model = TokenModel(
+                id=token.id,
+                usuario_id=token.usuario_id,
+                token=token.token,
+                token_hash=hash_token(token.token),
+                expiracao=token.expiracao,
+                created_at=token.created_at,
+                updated_at=token.updated_at,
+                deleted_at=token.deleted_at,
+            )
+            self._session.add(token_model)
+            await confirmar_async(self._session, token)
+            return token
+        except IntegrityError:
+            await desfazer_async(self._session)
+            raise
+
+    async def buscar_por_id(self, id: UUID) -> Optional[Token]:
+        """
+        Busca um token pelo ID.
+
+        Args:
+            id: ID do token
+
+        Returns:
+            O token encontrado ou None se não existir
+        """
+        row = (await self._session.execute(BUSCAR_TOKEN_POR_ID, {"id": id})).first()
+        return row_to_token(row) if row else None
+
+    async def buscar_por_token(self, token: str) -> Optional[Token]:
+        """
+        Busca um token pelo valor do token.
+
+        Args:
+            token: Valor do token
+
+        Returns:
+            O token encontrado ou None se não existir
+        """
+        row = (
+            await self._session.execute(
+                BUSCAR_TOKEN_POR_HASH, {"token_hash": hash_token(token)}
+            )
+        ).first()
+        return row_to_token(row) if row else None
+
+    async def buscar_por_usuario_id(self, usuario_id: UUID) -> Optional[Token]:
+        """
+        Busca um token pelo ID do usuário.
+
+        Args:
+            usuario_id: ID do usuário
+
+        Returns:
+            O token encontrado ou None se não existir
+        """
+        row = (
+            await self._session.execute(
+                BUSCAR_TOKEN_POR_USUARIO, {"usuario_id": usuario_id}
+            )
+        ).first()
+        return row_to_token(row) if row else None
+
+    async def atualizar(self, token: Token) -> Token:
+        """
+        Atualiza um token existente.
+
+        Args:
+            token: Token a ser atualizado
+
+        Returns:
+            O token atualizado
+
+        Raises:
+            IntegrityError: Se houver erro de integridade
+            ValueError: Se o token não for encontrado
+        """
+        try:
+            token_model = await self._session.get(
+                TokenModel,
+                token.id,
+                populate_existing=fixar_no_primario(self._session),
+            )
+            if not token_model:
+                raise ValueError(f"Token com ID {token.id} não encontrado")
+
+            token_model.usuario_id = token.usuario_id
+            token_model.token = token.token
+            token_model.token_hash = hash_token(token.token)
+            token_model.expiracao = token.expiracao
+            token_model.updated_at = token.updated_at
+            token_model.deleted_at = token.deleted_at
+
+            await confirmar_async(self._session, token)
+            return token
+        except IntegrityError:
+            await desfazer_async(self._session)
+            raise
+
+    async def excluir(self, id: UUID) -> None:
+        """
+        Exclui um token.
+
+        Args:
+            id: ID do token a ser excluído
+        """
+        token_model = await self._session.get(TokenModel, id)
+        if token_model:
+            await self._session.delete(token_model)
+            await confirmar_async(self._session)
+
+    async def purgar_expirados(
+        self, agora: Optional[datetime] = None, lote: int = TAMANHO_LOTE_PURGA
+    ) -> int:
+        """
+        Exclui os tokens expirados, em lotes.
+
+        Fora de uma unidade de trabalho, cada lote é confirmado em sua
+        própria transação, para não manter bloqueios sobre a tabela inteira.
+
+        Args:
+            agora: Instante de referência (por padrão, o atual)
+            lote: Quantidade máxima de tokens excluídos por lote
+
+        Returns:
+            Quantidade de tokens excluídos
+        """
+        parametros = {"agora": agora or datetime.now(), "lote": lote}
+        total = 0
+        while True:
+            resultado = await self._session.execute(PURGAR_EXPIRADOS, parametros)
+            await confirmar_async(self._session)
+            total += resultado.rowcount
+            if resultado.rowcount < lote:
+                return total
@@ -0,0 +1,317 @@
+"""
+Repositório SQLAlchemy assíncrono para usuários.
+
+Este módulo implementa a versão assíncrona do repositório de usuários,
+usada pelos endpoints da API. A versão síncrona continua em
+`usuario_repository` para scripts.
+"""
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from src.joias.domain.entities.autorizacao import Usuario, Perfil
+from src.joias.domain.repositories.usuario_repository import ResumoUsuario
+from src.joias.infrastructure.persistence.sqlalchemy.models import (
+    Usuario as UsuarioModel,
+    Perfil as PerfilModel,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.replicas import fixar_no_primario
+from src.joias.infrastructure.persistence.sqlalchemy.repositories.permissoes_efetivas_repository import (
+    invalidar_permissoes_efetivas,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.repositories.usuario_repository import (
+    BUSCAR_USUARIO_POR_EMAIL,
+    BUSCAR_USUARIO_POR_ID,
+    model_to_perfil,
+    row_to_usuario,
+    select_resumos,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.unit_of_work import (
+    confirmar_async,
+    desfazer_async,
+)
+
+
+class AsyncUsuarioRepository:
+    """Repositório SQLAlchemy assíncrono para usuários."""
+
+    def __init__(self, session: AsyncSession):
+        """
+        Inicializa o repositório.
+
+        Args:
+            session: Sessão assíncrona do SQLAlchemy
+        """
+        self._session = session
+
+    async def criar(self, usuario: Usuario) -> Usuario:
+        """
+        Cria um novo usuário.
+
+        Args:
+            usuario: Usuário a ser criado
+
+        Returns:
+            O usuário criado
+
+        Raises:
+            IntegrityError: Se o email já estiver em uso
+        """
+        try:
+            usuario_model = UsuarioModel(
+                id=usuario.id,
+                nome=usuario.nome,
+                email=usuario.email,
+                senha_hash=usuario.senha_hash,
+                ativo=usuario.ativo,
+                data_criacao=usuario.created_at,
+            )
+            self._session.add(usuario_model)
+            await confirmar_async(self._session, usuario)
+            return usuario
+        except IntegrityError:
+            await desfazer_async(self._session)
+            raise
+
+    async def buscar_por_id(self, id: UUID) -> Optional[Usuario]:
+        """
+        Busca um usuário pelo ID.
+
+        Args:
+            id: ID do usuário
+
+        Returns:
+            O usuário encontrado ou None se não existir
+        """
+        row = (await self._session.execute(BUSCAR_USUARIO_POR_ID, {"id": id})).first()
+        return row_to_usuario(row) if row else None
+
+    async def buscar_por_email(self, email: str) -> Optional[Usuario]:
+        """
+        Busca um usuário pelo email.
+
+        Args:
+            email: Email do usuário
+
+        Returns:
+            O usuário encontrado ou None se não existir
+        """
+        row = (
+            await self._session.execute(BUSCAR_USUARIO_POR_EMAIL, {"email": email})
+        ).first()
+        return row_to_usuario(row) if row else None
+
+    async def listar(
+        self,
+        pagina: int = 1,
+        tamanho: int = 10,
+        email: Optional[str] = None,
+        nome: Optional[str] = None,
+    ) -> List[Usuario]:
+        """
+        Lista usuários com paginação e filtros opcionais.
+
+        Args:
+            pagina: Número da página (1-based)
+            tamanho: Tamanho da página
+            email: Filtro por email
+            nome: Filtro por nome
+
+        Returns:
+            Lista de usuários
+        """
+        stmt = select(UsuarioModel)
+
+        # Aplica filtros
+        if email or nome:
+            stmt = stmt.where(
+                or_(
+                    UsuarioModel.email.ilike(f"%{email}%") if email else False,
+                    UsuarioModel.nome.ilike(f"%{nome}%") if nome else False,
+                )
+            )
+
+        # Aplica paginação
+        offset = (pagina - 1) * tamanho
+        stmt = stmt.offset(offset).limit(tamanho)
+
+        # Converte para entidades
+        models = await self._session.scalars(stmt)
+        return [self._to_entity(model) for model in models]
+
+    async def listar_resumos(
+        self,
+        pagina: int = 1,
+        tamanho: int = 10,
+        email: Optional[str] = None,
+        nome: Optional[str] = None,
+    ) -> List[ResumoUsuario]:
+        """
+        Lista os resumos dos usuários, sem carregar as entidades.
+
+        Args:
+            pagina: Número da página (1-based)
+            tamanho: Tamanho da página
+            email: Filtro por email
+            nome: Filtro por nome
+
+        Returns:
+            Lista de resumos de usuários
+        """
+        linhas = await self._session.execute(
+            select_resumos(pagina, tamanho, email, nome)
+        )
+        return [ResumoUsuario._make(linha) for linha in linhas]
+
+    async def atualizar(self, usuario: Usuario) -> Usuario:
+        """
+        Atualiza um usuário existente.
+
+        Args:
+            usuario: Usuário a ser atualizado
+
+        Returns:
+            O usuário atualizado
+
+        Raises:
+            IntegrityError: Se o email já estiver em uso
+            ValueError: Se o usuário não for encontrado
+        """
+        try:
+            usuario_model = await self._session.get(
+                UsuarioModel,
+                usuario.id,
+                populate_existing=fixar_no_primario(self._session),
+            )
+            if not usuario_model:
+                raise ValueError(f"Usuário com ID {usuario.id} não encontrado")
+
+            usuario_model.nome = usuario.nome
+            usuario_model.email = usuario.email
+            usuario_model.senha_hash = usuario.senha_hash
+            usuario_model.ativo = usuario.ativo
+
+            await confirmar_async(self._session, usuario)
+            return usuario
+        except IntegrityError:
+            await desfazer_async(self._session)
+            raise
+
+    async def excluir(self, id: UUID) -> None:
+        """
+        Exclui um usuário.
+
+        Args:
+            id: ID do usuário a ser excluído
+        """
+        usuario_model = await self._session.get(UsuarioModel, id)
+        if usuario_model:
+            await self._session.delete(usuario_model)
+            await confirmar_async(self._session)
+
+    async def associar_perfil(self, usuario_id: UUID, perfil_id: UUID) -> None:
+        """
+        Associa um perfil a um usuário.
+
+        Args:
+            usuario_id: ID do usuário
+            perfil_id: ID do perfil
+
+        Raises:
+            ValueError: Se o usuário ou perfil não forem encontrados
+            IntegrityError: Se houver erro de integridade
+        """
+        try:
+            usuario_model, perfil_model = await self._buscar_usuario_e_perfil(
+                usuario_id, perfil_id
+            )
+            usuario_model.perfis.append(perfil_model)
+            await confirmar_async(self._session)
+            invalidar_permissoes_efetivas(self._session.sync_session, usuario_id)
+        except IntegrityError:
+            await desfazer_async(self._session)
+            raise
+
+    async def desassociar_perfil(self, usuario_id: UUID, perfil_id: UUID) -> None:
+        """
+        Desassocia um perfil de um usuário.
+
+        Args:
+            usuario_id: ID do usuário
+            perfil_id: ID do perfil
+
+        Raises:
+            ValueError: Se o usuário ou perfil não forem encontrados
+        """
+        usuario_model, perfil_model = await self._buscar_usuario_e_perfil(
+            usuario_id, perfil_id
+        )
+        usuario_model.perfis.remove(perfil_model)
+        await confirmar_async(self._session)
+        invalidar_permissoes_efetivas(self._session.sync_session, usuario_id)
+
+    async def listar_perfis(self, usuario_id: UUID) -> List[Perfil]:
+        """
+        Lista os perfis de um usuário.
+
+        Args:
+            usuario_id: ID do usuário
+
+        Returns:
+            Lista de perfis do usuário
+
+        Raises:
+            ValueError: Se o usuário não for encontrado
+        """
+        usuario_model = await self._session.get(
+            UsuarioModel, usuario_id, options=[selectinload(UsuarioModel.perfis)]
+        )
+        if not usuario_model:
+            raise ValueError(f"Usuário com ID {usuario_id} não encontrado")
+
+        return [model_to_perfil(perfil) for perfil in usuario_model.perfis]
+
+    async def _buscar_usuario_e_perfil(self, usuario_id: UUID, perfil_id: UUID):
+        """
+        Busca o usuário, com os perfis carregados, e o perfil a associar.
+
+        Em sessões assíncronas a coleção `perfis` não pode ser carregada
+        sob demanda, então ela é carregada junto com o usuário.
+
+        Args:
+            usuario_id: ID do usuário
+            perfil_id: ID do perfil
+
+        Returns:
+            Tupla (modelo do usuário, modelo do perfil)
+
+        Raises:
+            ValueError: Se o usuário ou perfil não forem encontrados
+        """
+        usuario_model = await self._session.get(
+            UsuarioModel, usuario_id, options=[selectinload(UsuarioModel.perfis)]
+        )
+        if not usuario_model:
+            raise ValueError(f"Usuário com ID {usuario_id} não encontrado")
+
+        perfil_model = await self._session.get(PerfilModel, perfil_id)
+        if not perfil_model:
+            raise ValueError(f"Perfil com ID {perfil_id} não encontrado")
+
+        return usuario_model, perfil_model
+
+    def _to_entity(self, model: UsuarioModel) -> Usuario:
+        """
+        Converte um modelo SQLAlchemy para uma entidade de domínio.
+
+        Args:
+            model: O modelo SQLAlchemy
+
+        Returns:
+            A entidade de domínio
+        """
+        return row_to_usuario(model)
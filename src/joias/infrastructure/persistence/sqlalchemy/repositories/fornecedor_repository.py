@@ -4,17 +4,80 @@ Implementação SQLAlchemy do repositório de fornecedores.
 Este módulo contém a implementação concreta do repositório de fornecedores
 usando SQLAlchemy como ORM.
 """
-from typing import List, Optional
+from functools import partial
+from typing import List, Optional, Set, Tuple
 
-from sqlalchemy import or_
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, and_, delete, func, insert, select, tuple_
+from sqlalchemy.orm import Session, selectinload
 
 from .....domain.catalogo.entities.fornecedor import Documento as DocumentoEntity
 from .....domain.catalogo.entities.fornecedor import Fornecedor as FornecedorEntity
-from .....domain.catalogo.repositories.fornecedor_repository import FornecedorRepository
-from ..mappers.fornecedor_mapper import to_entity, to_model, update_model
+from .....domain.catalogo.entities.fornecedor import ProdutosFornecedor
+from .....domain.catalogo.entities.produto import Produto
+from .....domain.catalogo.repositories.fornecedor_repository import (
+    FornecedorRepository,
+    ResumoFornecedor,
+)
+from ..mappers.fornecedor_mapper import (
+    documento_to_row,
+    to_entity,
+    to_model,
+    to_row,
+    update_model,
+)
 from ..models.fornecedor import Documento as DocumentoModel
+from ..mappers.produto_mapper import ProdutoMapper
 from ..models.fornecedor import Fornecedor as FornecedorModel
+from ..models.fornecedor import fornecedores_produtos
+from ..models.produto import ProdutoModel
+from ..replicas import fixar_no_primario
+from ..unit_of_work import confirmar
+from .produto_repository import PERFIS_CARREGAMENTO, validar_limite
+
+# Relacionamentos lidos pelo mapeador: os documentos de todos os
+# fornecedores de uma consulta são carregados com uma única consulta IN
+OPCOES_CARREGAMENTO = (selectinload(FornecedorModel.documentos),)
+
+# Pares (tipo, numero) por consulta na verificação de documentos em lote,
+# abaixo do limite de parâmetros por comando dos bancos suportados
+PARES_POR_CONSULTA = 500
+
+
+# Documento principal de cada fornecedor: o primeiro cadastrado, o mesmo
+# que aparece primeiro na lista de documentos da entidade
+DOCUMENTO_PRINCIPAL = (
+    select(func.min(DocumentoModel.id))
+    .where(DocumentoModel.fornecedor_id == FornecedorModel.id)
+    .correlate(FornecedorModel)
+    .scalar_subquery()
+)
+
+
+def select_resumos(apenas_ativos: bool) -> Select:
+    """
+    Cria a consulta dos resumos de fornecedores, ordenados por ID.
+
+    Seleciona apenas as colunas da listagem, sem instanciar modelos,
+    documentos ou endereços.
+
+    Args:
+        apenas_ativos: Se True, seleciona apenas fornecedores ativos
+
+    Returns:
+        Select: Consulta com as colunas de ResumoFornecedor
+    """
+    stmt = select(
+        FornecedorModel.id,
+        FornecedorModel.nome,
+        DocumentoModel.numero,
+        DocumentoModel.tipo,
+        FornecedorModel.cidade,
+        FornecedorModel.estado,
+        FornecedorModel.ativo,
+    ).join(DocumentoModel, DocumentoModel.id == DOCUMENTO_PRINCIPAL)
+    if apenas_ativos:
+        stmt = stmt.where(FornecedorModel.ativo == True)
+    return stmt.order_by(FornecedorModel.id)
 
 
 class SQLAlchemyFornecedorRepository(FornecedorRepository):
@@ -33,6 +96,152 @@ class SQLAlchemyFornecedorRepository(FornecedorRepository):
             session: Sessão SQLAlchemy
         """
         self._session = session
+        self._produto_mapper = ProdutoMapper()
+
+    def _to_entity(self, model: FornecedorModel) -> FornecedorEntity:
+        """
+        Converte um modelo para entidade, com os produtos sob demanda.
+
+        Os produtos do fornecedor só são consultados se a coleção de
+        produtos da entidade for percorrida; a verificação de um produto
+        consulta apenas a associação dele.
+
+        Args:
+            model: O modelo SQLAlchemy
+
+        Returns:
+            FornecedorEntity: A entidade correspondente
+        """
+        fornecedor = to_entity(model)
+        fornecedor.produtos = ProdutosFornecedor(
+            carregar=partial(self._carregar_produtos, model.id),
+            contem=partial(self._contem_produto, model.id),
+        )
+        return fornecedor
+
+    def _carregar_produtos(self, fornecedor_id: int) -> List[Produto]:
+        """
+        Carrega todos os produtos de um fornecedor, sem variações e detalhes.
+
+        Args:
+            fornecedor_id: ID do fornecedor
+
+        Returns:
+            List[Produto]: Produtos do fornecedor
+        """
+        models = self._session.scalars(self._select_produtos(fornecedor_id))
+        return [self._produto_mapper.to_entity(model) for model in models]
+
+    def _contem_produto(self, fornecedor_id: int, produto: Produto) -> bool:
+        """
+        Verifica se um fornecedor fornece um produto, pelo SKU.
+
+        Args:
+            fornecedor_id: ID do fornecedor
+            produto: O produto a ser verificado
+
+        Returns:
+            bool: True se o produto está associado ao fornecedor
+        """
+        existente = self._session.execute(
+            select(fornecedores_produtos.c.produto_id)
+            .join(ProdutoModel, ProdutoModel.id == fornecedores_produtos.c.produto_id)
+            .where(
+                fornecedores_produtos.c.fornecedor_id == fornecedor_id,
+                ProdutoModel.sku == getattr(produto, "sku", None),
+            )
+        ).first()
+        return existente is not None
+
+    def _gravar_produtos(
+        self, fornecedor_id: int, fornecedor: FornecedorEntity
+    ) -> None:
+        """
+        Grava os produtos adicionados e removidos da coleção do fornecedor.
+
+        Os IDs dos produtos e as associações existentes são lidos com uma
+        única consulta pelos SKUs; as associações são gravadas com um
+        INSERT e um DELETE em lote, na transação de quem chamou.
+
+        Args:
+            fornecedor_id: ID do fornecedor
+            fornecedor: O fornecedor com as alterações pendentes
+
+        Raises:
+            ValueError: Se um produto adicionado não estiver cadastrado
+        """
+        adicionados, removidos = fornecedor.produtos.extrair_alteracoes()
+        if not adicionados and not removidos:
+            return
+
+        linhas = self._session.execute(
+            select(
+                ProdutoModel.sku,
+                ProdutoModel.id,
+                fornecedores_produtos.c.produto_id,
+            )
+            .outerjoin(
+                fornecedores_produtos,
+                and_(
+                    fornecedores_produtos.c.produto_id == ProdutoModel.id,
+                    fornecedores_produtos.c.fornecedor_id == fornecedor_id,
+                ),
+            )
+            .where(ProdutoModel.sku.in_([p.sku for p in adicionados + removidos]))
+        )
+        # SKU -> (ID do produto, se já está associado ao fornecedor)
+        produtos = {
+            sku: (produto_id, associado is not None)
+            for sku, produto_id, associado in linhas
+        }
+
+        novos = []
+        for produto in adicionados:
+            if produto.sku not in produtos:
+                raise ValueError(f"Produto não encontrado: {produto.sku}")
+            produto_id, associado = produtos[produto.sku]
+            if not associado:
+                novos.append({"fornecedor_id": fornecedor_id, "produto_id": produto_id})
+        if novos:
+            self._session.execute(insert(fornecedores_produtos), novos)
+
+        excluidos = [
+            produtos[p.sku][0]
+            for p in removidos
+            if p.sku in produtos and produtos[p.sku][1]
+        ]
+        if excluidos:
+            self._session.execute(
+                delete(fornecedores_produtos).where(
+                    fornecedores_produtos.c.fornecedor_id == fornecedor_id,
+                    fornecedores_produtos.c.produto_id.in_(excluidos),
+                )
+            )
+
+    def _select_produtos(self, fornecedor_id: int, perfil: str = "listagem") -> Select:
+        """
+        Cria a consulta dos produtos de um fornecedor.
+
+        A consulta filtra e ordena pelas colunas da tabela de associação,
+        atendidas pela chave primária (fornecedor_id, produto_id).
+
+        Args:
+            fornecedor_id: ID do fornecedor
+            perfil: Perfil de carregamento dos produtos
+
+        Returns:
+            Select: Consulta configurada
+        """
+        return (
+            select(ProdutoModel)
+            .join(
+                fornecedores_produtos,
+                fornecedores_produtos.c.produto_id == ProdutoModel.id,
+            )
+            .where(fornecedores_produtos.c.fornecedor_id == fornecedor_id)
+            .order_by(fornecedores_produtos.c.produto_id)
+            .options(*PERFIS_CARREGAMENTO[perfil])
+        )
 
     def salvar(self, fornecedor: FornecedorEntity) -> FornecedorEntity:
         """
@@ -47,7 +256,57 @@ class SQLAlchemyFornecedorRepository(FornecedorRepository):
         model = to_model(fornecedor)
         self._session.add(model)
         self._session.flush()  # Para gerar o ID
-        return to_entity(model)
+        self._gravar_produtos(model.id, fornecedor)
+        return self._to_entity(model)
+
+    def salvar_em_lote(
+        self, fornecedores: List[FornecedorEntity], tamanho_lote: int = 1000
+    ) -> int:
+        """
+        Insere muitos fornecedores novos, com seus documentos.
+
+        Cada lote usa um INSERT de várias linhas para os fornecedores, que
+        devolve os IDs na ordem das linhas, um INSERT de várias linhas para
+        os documentos e termina com um único commit. Documentos já
+        cadastrados violam o índice único de (tipo, numero); use
+        buscar_documentos_existentes antes para descartá-los.
+
+        Args:
+            fornecedores: Fornecedores a serem inseridos
+            tamanho_lote: Quantidade de fornecedores por transação
+
+        Returns:
+            int: Quantidade de fornecedores inseridos
+        """
+        total = 0
+        for inicio in range(0, len(fornecedores), tamanho_lote):
+            lote = fornecedores[inicio : inicio + tamanho_lote]
+            self._inserir_lote(lote)
+            confirmar(self._session)
+            total += len(lote)
+        return total
+
+    def _inserir_lote(self, fornecedores: List[FornecedorEntity]) -> None:
+        """
+        Insere um lote de fornecedores sem fazer commit.
+
+        Args:
+            fornecedores: Fornecedores do lote
+        """
+        ids = self._session.scalars(
+            insert(FornecedorModel).returning(
+                FornecedorModel.id, sort_by_parameter_order=True
+            ),
+            [to_row(fornecedor) for fornecedor in fornecedores],
+        ).all()
+
+        documentos = [
+            documento_to_row(documento, fornecedor_id)
+            for fornecedor, fornecedor_id in zip(fornecedores, ids)
+            for documento in fornecedor.documentos
+        ]
+        if documentos:
+            self._session.execute(insert(DocumentoModel), documentos)
 
     def buscar_por_id(self, fornecedor_id: int) -> Optional[FornecedorEntity]:
         """
@@ -62,7 +321,7 @@ class SQLAlchemyFornecedorRepository(FornecedorRepository):
         model = self._session.query(FornecedorModel).get(fornecedor_id)
         if not model:
             return None
-        return to_entity(model)
+        return self._to_entity(model)
 
     def buscar_por_documento(
         self, documento: DocumentoEntity
@@ -87,7 +346,36 @@ class SQLAlchemyFornecedorRepository(FornecedorRepository):
         )
         if not model:
             return None
-        return to_entity(model)
+        return self._to_entity(model)
+
+    def buscar_documentos_existentes(
+        self, documentos: List[DocumentoEntity]
+    ) -> Set[Tuple[str, str]]:
+        """
+        Verifica quais documentos já estão cadastrados.
+
+        Usa uma consulta por (tipo, numero) IN (...) a cada
+        PARES_POR_CONSULTA documentos, atendida pelo índice único de
+        documentos, em vez de uma consulta por documento.
+
+        Args:
+            documentos: Documentos a serem verificados
+
+        Returns:
+            Set[Tuple[str, str]]: Pares (numero, tipo) já cadastrados
+        """
+        pares = list(dict.fromkeys((d.tipo, d.numero) for d in documentos))
+        existentes: Set[Tuple[str, str]] = set()
+        for inicio in range(0, len(pares), PARES_POR_CONSULTA):
+            linhas = self._session.execute(
+                select(DocumentoModel.numero, DocumentoModel.tipo).where(
+                    tuple_(DocumentoModel.tipo, DocumentoModel.numero).in_(
+                        pares[inicio : inicio + PARES_POR_CONSULTA]
+                    )
+                )
+            )
+            existentes.update((numero, tipo) for numero, tipo in linhas)
+        return existentes
 
     def listar(self, apenas_ativos: bool = True) -> List[FornecedorEntity]:
         """
@@ -99,10 +387,23 @@ class SQLAlchemyFornecedorRepository(FornecedorRepository):
         Returns:
             List[FornecedorEntity]: Lista de fornecedores
         """
-        query = self._session.query(FornecedorModel)
+        query = self._session.query(FornecedorModel).options(*OPCOES_CARREGAMENTO)
         if apenas_ativos:
             query = query.filter(FornecedorModel.ativo == True)
-        return [to_entity(model) for model in query.all()]
+        return [self._to_entity(model) for model in query.all()]
+
+    def listar_resumos(self, apenas_ativos: bool = True) -> List[ResumoFornecedor]:
+        """
+        Lista os resumos dos fornecedores, sem carregar as entidades.
+
+        Args:
+            apenas_ativos: Se True, retorna apenas fornecedores ativos
+
+        Returns:
+            List[ResumoFornecedor]: Resumos dos fornecedores
+        """
+        linhas = self._session.execute(select_resumos(apenas_ativos))
+        return [ResumoFornecedor._make(linha) for linha in linhas]
 
     def buscar_por_nome(self, nome: str) -> List[FornecedorEntity]:
         """
@@ -116,10 +417,120 @@ class SQLAlchemyFornecedorRepository(FornecedorRepository):
         """
         models = (
             self._session.query(FornecedorModel)
+            .options(*OPCOES_CARREGAMENTO)
             .filter(FornecedorModel.nome.ilike(f"%{nome}%"))
             .all()
         )
-        return [to_entity(model) for model in models]
+        return [self._to_entity(model) for model in models]
+
+    def listar_produtos_do_fornecedor(
+        self, fornecedor_id: int, apos_id: Optional[int] = None, limite: int = 50
+    ) -> Tuple[List[Produto], Optional[int]]:
+        """
+        Lista uma página dos produtos de um fornecedor (paginação por cursor).
+
+        Args:
+            fornecedor_id: ID do fornecedor
+            apos_id: Cursor; retorna apenas produtos com ID maior que ele
+            limite: Quantidade máxima de produtos na página
+
+        Returns:
+            Tuple[List[Produto], Optional[int]]: Produtos da página e o
+            cursor da próxima página (None se esta for a última)
+
+        Raises:
+            ValueError: Se limite for menor que 1
+        """
+        validar_limite(limite)
+        stmt = self._select_produtos(fornecedor_id, "completo")
+        if apos_id is not None:
+            stmt = stmt.where(fornecedores_produtos.c.produto_id > apos_id)
+
+        # Busca um registro a mais apenas para saber se há próxima página
+        models = self._session.scalars(stmt.limit(limite + 1)).all()
+        proximo = models[limite - 1].id if len(models) > limite else None
+        return [self._produto_mapper.to_entity(m) for m in models[:limite]], proximo
+
+    def listar_fornecedores_do_produto(
+        self, produto_id: int, apos_id: Optional[int] = None, limite: int = 50
+    ) -> Tuple[List[FornecedorEntity], Optional[int]]:
+        """
+        Lista uma página dos fornecedores de um produto (paginação por cursor).
+
+        A consulta filtra e ordena pelo índice (produto_id, fornecedor_id)
+        da tabela de associação.
+
+        Args:
+            produto_id: ID do produto
+            apos_id: Cursor; retorna apenas fornecedores com ID maior que ele
+            limite: Quantidade máxima de fornecedores na página
+
+        Returns:
+            Tuple[List[FornecedorEntity], Optional[int]]: Fornecedores da
+            página e o cursor da próxima página (None se esta for a última)
+
+        Raises:
+            ValueError: Se limite for menor que 1
+        """
+        validar_limite(limite)
+        stmt = (
+            select(FornecedorModel)
+            .join(
+                fornecedores_produtos,
+                fornecedores_produtos.c.fornecedor_id == FornecedorModel.id,
+            )
+            .where(fornecedores_produtos.c.produto_id == produto_id)
+            .options(*OPCOES_CARREGAMENTO)
+        )
+        if apos_id is not None:
+            stmt = stmt.where(fornecedores_produtos.c.fornecedor_id > apos_id)
+        stmt = stmt.order_by(fornecedores_produtos.c.fornecedor_id).limit(limite + 1)
+
+        models = self._session.scalars(stmt).all()
+        proximo = models[limite - 1].id if len(models) > limite else None
+        return [self._to_entity(model) for model in models[:limite]], proximo
+
+    def associar_produto(self, fornecedor_id: int, produto_id: int) -> None:
+        """
+        Registra que um fornecedor fornece um produto.
+
+        Args:
+            fornecedor_id: ID do fornecedor
+            produto_id: ID do produto
+        """
+        existente = self._session.execute(
+            select(fornecedores_produtos.c.produto_id).where(
+                fornecedores_produtos.c.fornecedor_id == fornecedor_id,
+                fornecedores_produtos.c.produto_id == produto_id,
+            )
+        ).first()
+        if existente is None:
+            self._session.execute(
+                insert(fornecedores_produtos).values(
+                    fornecedor_id=fornecedor_id, produto_id=produto_id
+                )
+            )
+            confirmar(self._session)
+
+    def desassociar_produto(self, fornecedor_id: int, produto_id: int) -> bool:
+        """
+        Remove o registro de que um fornecedor fornece um produto.
+
+        Args:
+            fornecedor_id: ID do fornecedor
+            produto_id: ID do produto
+
+        Returns:
+            bool: True se a associação existia, False caso contrário
+        """
+        resultado = self._session.execute(
+            delete(fornecedores_produtos).where(
+                fornecedores_produtos.c.fornecedor_id == fornecedor_id,
+                fornecedores_produtos.c.produto_id == produto_id,
+            )
+        )
+        confirmar(self._session)
+        return resultado.rowcount > 0
 
     def atualizar(self, fornecedor: FornecedorEntity) -> Optional[FornecedorEntity]:
         """
@@ -132,13 +543,18 @@ class SQLAlchemyFornecedorRepository(FornecedorRepository):
             Optional[FornecedorEntity]: O fornecedor atualizado ou None
             se não encontrado
         """
-        model = self._session.query(FornecedorModel).get(fornecedor.id)
+        model = self._session.get(
+            FornecedorModel,
+            fornecedor.id,
+            populate_existing=fixar_no_primario(self._session),
+        )
         if not model:
             return None
 
         update_model(model, fornecedor)
         self._session.flush()
-        return to_entity(model)
+        self._gravar_produtos(model.id, fornecedor)
+        return self._to_entity(model)
 
     def excluir(self, fornecedor_id: int) -> bool:
         """
@@ -3,15 +3,138 @@ Repositório SQLAlchemy para Perfil.
 """
 import uuid
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Set
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Delete, Select, delete, insert, select
+from sqlalchemy.orm import Session, selectinload
 
 from .....domain.entities.perfil import Perfil
 from .....domain.entities.permissao import Permissao
 from .....domain.repositories.perfil_repository import IPerfilRepository
 from ..models.perfil import PerfilModel
+from ..models.perfil_permissao import perfil_permissao
 from ..models.permissao import PermissaoModel
+from ..replicas import fixar_no_primario
+from ..unit_of_work import confirmar
+from .permissoes_efetivas_repository import invalidar_permissoes_efetivas
+
+# Carrega as permissões de todos os perfis consultados com um único IN
+CARREGAR_PERMISSOES = (selectinload(PerfilModel.permissoes),)
+
+
+def hidratar_perfis(models: Iterable[PerfilModel]) -> List[Perfil]:
+    """
+    Converte modelos de perfil, com as permissões carregadas, em entidades.
+
+    Cada permissão é convertida uma única vez: perfis que compartilham
+    uma permissão recebem a mesma instância de Permissao.
+
+    Args:
+        models: Modelos dos perfis
+
+    Returns:
+        Perfis com suas permissões
+    """
+    permissoes: Dict[str, Permissao] = {}
+    perfis = []
+    for model in models:
+        perfil = Perfil(
+            nome=model.nome,
+            descricao=model.descricao,
+            data_criacao=model.data_criacao,
+        )
+
+        for permissao_model in model.permissoes:
+            permissao = permissoes.get(permissao_model.id)
+            if permissao is None:
+                permissao = Permissao(
+                    nome=permissao_model.nome,
+                    chave=permissao_model.chave,
+                    descricao=permissao_model.descricao,
+                )
+                permissao._id = permissao_model.id  # pylint: disable=protected-access
+                permissoes[permissao_model.id] = permissao
+            perfil.adicionar_permissao(permissao)
+
+        perfil._id = model.id  # pylint: disable=protected-access
+        perfis.append(perfil)
+
+    return perfis
+
+
+def permissoes_do_perfil(perfil_id: str) -> Select:
+    """
+    Consulta os IDs das permissões associadas a um perfil.
+
+    Args:
+        perfil_id: ID do perfil
+
+    Returns:
+        Consulta que retorna os IDs das permissões
+    """
+    return select(perfil_permissao.c.permissao_id).where(
+        perfil_permissao.c.perfil_id == perfil_id
+    )
+
+
+def permissoes_existentes(ids: Set[str]) -> Select:
+    """
+    Consulta, com um único IN, quais dos IDs de permissão existem.
+
+    Args:
+        ids: IDs das permissões
+
+    Returns:
+        Consulta que retorna os IDs existentes
+    """
+    return select(PermissaoModel.id).where(PermissaoModel.id.in_(ids))
+
+
+def remover_permissoes(perfil_id: str, ids: Set[str]) -> Delete:
+    """
+    Remove, com um único DELETE, as associações do perfil às permissões.
+
+    Args:
+        perfil_id: ID do perfil
+        ids: IDs das permissões a desassociar
+
+    Returns:
+        Comando DELETE
+    """
+    return delete(perfil_permissao).where(
+        perfil_permissao.c.perfil_id == perfil_id,
+        perfil_permissao.c.permissao_id.in_(ids),
+    )
+
+
+def linhas_perfil_permissao(perfil_id: str, ids: Set[str]) -> List[dict]:
+    """
+    Monta as linhas de perfil_permissao para uma inserção em lote.
+
+    Args:
+        perfil_id: ID do perfil
+        ids: IDs das permissões a associar
+
+    Returns:
+        Linhas da tabela de associação
+    """
+    return [{"perfil_id": perfil_id, "permissao_id": i} for i in sorted(ids)]
+
+
+def verificar_permissoes(solicitadas: Set[str], encontradas: Set[str]) -> None:
+    """
+    Verifica se todas as permissões solicitadas existem.
+
+    Args:
+        solicitadas: IDs das permissões a associar
+        encontradas: IDs dentre os solicitados que existem no banco
+
+    Raises:
+        ValueError: Se alguma permissão não existir
+    """
+    faltantes = solicitadas - encontradas
+    if faltantes:
+        raise ValueError(f"Permissão não encontrada: {min(faltantes)}")
 
 
 class SQLPerfilRepository(IPerfilRepository):
@@ -46,7 +169,7 @@ class SQLPerfilRepository(IPerfilRepository):
 
         # Persiste
         self._session.add(model)
-        self._session.commit()
+        confirmar(self._session, perfil)
 
         # Atualiza o ID da entidade
         perfil._id = model.id  # pylint: disable=protected-access
@@ -63,32 +186,12 @@ class SQLPerfilRepository(IPerfilRepository):
         Returns:
             Perfil encontrado ou None
         """
-        model = self._session.query(PerfilModel).get(id)
+        model = self._session.get(PerfilModel, id, options=CARREGAR_PERMISSOES)
 
         if not model:
             return None
 
-        # Cria a entidade
-        perfil = Perfil(
-            nome=model.nome,
-            descricao=model.descricao,
-            data_criacao=model.data_criacao,
-        )
-
-        # Adiciona as permissões
-        for permissao_model in model.permissoes:
-            permissao = Permissao(
-                nome=permissao_model.nome,
-                chave=permissao_model.chave,
-                descricao=permissao_model.descricao,
-            )
-            permissao._id = permissao_model.id  # pylint: disable=protected-access
-            perfil.adicionar_permissao(permissao)
-
-        # Atualiza o ID
-        perfil._id = model.id  # pylint: disable=protected-access
-
-        return perfil
+        return hidratar_perfis([model])[0]
 
     def buscar_por_nome(self, nome: str) -> Optional[Perfil]:
         """
@@ -100,71 +203,33 @@ class SQLPerfilRepository(IPerfilRepository):
         Returns:
             Perfil encontrado ou None
         """
-        model = (
-            self._session.query(PerfilModel)
-            .filter(PerfilModel.nome == nome)
-            .first()
+        model = self._session.scalar(
+            select(PerfilModel)
+            .options(*CARREGAR_PERMISSOES)
+            .where(PerfilModel.nome == nome)
+            .limit(1)
         )
 
         if not model:
             return None
 
-        # Cria a entidade
-        perfil = Perfil(
-            nome=model.nome,
-            descricao=model.descricao,
-            data_criacao=model.data_criacao,
-        )
-
-        # Adiciona as permissões
-        for permissao_model in model.permissoes:
-            permissao = Permissao(
-                nome=permissao_model.nome,
-                chave=permissao_model.chave,
-                descricao=permissao_model.descricao,
-            )
-            permissao._id = permissao_model.id  # pylint: disable=protected-access
-            perfil.adicionar_permissao(permissao)
-
-        # Atualiza o ID
-        perfil._id = model.id  # pylint: disable=protected-access
-
-        return perfil
+        return hidratar_perfis([model])[0]
 
     def listar(self) -> List[Perfil]:
         """
         Lista todos os perfis.
 
+        Os perfis e as permissões de todos eles são carregados em duas
+        consultas, qualquer que seja o número de perfis.
+
         Returns:
             Lista de perfis
         """
-        models = self._session.query(PerfilModel).all()
-
-        perfis = []
-        for model in models:
-            # Cria a entidade
-            perfil = Perfil(
-                nome=model.nome,
-                descricao=model.descricao,
-                data_criacao=model.data_criacao,
-            )
-
-            # Adiciona as permissões
-            for permissao_model in model.permissoes:
-                permissao = Permissao(
-                    nome=permissao_model.nome,
-                    chave=permissao_model.chave,
-                    descricao=permissao_model.descricao,
-                )
-                permissao._id = permissao_model.id  # pylint: disable=protected-access
-                perfil.adicionar_permissao(permissao)
-
-            # Atualiza o ID
-            perfil._id = model.id  # pylint: disable=protected-access
-
-            perfis.append(perfil)
+        models = self._session.scalars(
+            select(PerfilModel).options(*CARREGAR_PERMISSOES)
+        )
 
-        return perfis
+        return hidratar_perfis(models)
 
     def atualizar(self, perfil: Perfil) -> Perfil:
         """
@@ -177,7 +242,9 @@ class SQLPerfilRepository(IPerfilRepository):
             Perfil atualizado
         """
         # Busca o modelo
-        model = self._session.query(PerfilModel).get(perfil.id)
+        model = self._session.get(
+            PerfilModel, perfil.id, populate_existing=fixar_no_primario(self._session)
+        )
 
         if not model:
             raise ValueError("Perfil não encontrado")
@@ -186,19 +253,31 @@ class SQLPerfilRepository(IPerfilRepository):
         model.nome = perfil.nome
         model.descricao = perfil.descricao
 
-        # Atualiza as permissões
-        model.permissoes = []
-        for permissao in perfil.permissoes:
-            permissao_model = (
-                self._session.query(PermissaoModel)
-                .get(permissao.id)
+        # Sincroniza as permissões gravando apenas a diferença
+        atuais = set(self._session.scalars(permissoes_do_perfil(model.id)))
+        desejadas = {str(permissao.id) for permissao in perfil.permissoes}
+        adicionadas = desejadas - atuais
+        removidas = atuais - desejadas
+
+        if adicionadas:
+            encontradas = set(
+                self._session.scalars(permissoes_existentes(adicionadas))
+            )
+            verificar_permissoes(adicionadas, encontradas)
+            self._session.execute(
+                insert(perfil_permissao),
+                linhas_perfil_permissao(model.id, adicionadas),
             )
-            if not permissao_model:
-                raise ValueError(f"Permissão não encontrada: {permissao.id}")
-            model.permissoes.append(permissao_model)
+        if removidas:
+            self._session.execute(remover_permissoes(model.id, removidas))
+        if adicionadas or removidas:
+            # A coleção do modelo, se carregada, não reflete mais a tabela
+            self._session.expire(model, ["permissoes"])
 
         # Persiste
-        self._session.commit()
+        confirmar(self._session, perfil)
+        if adicionadas or removidas:
+            invalidar_permissoes_efetivas(self._session)
 
         return perfil
 
@@ -213,4 +292,5 @@ class SQLPerfilRepository(IPerfilRepository):
 
         if model:
             self._session.delete(model)
-            self._session.commit() 
\ No newline at end of file
+            confirmar(self._session, perfil)
+            invalidar_permissoes_efetivas(self._session) 
\ No newline at end of file
@@ -1,27 +1,206 @@
 """
 Repositório SQLAlchemy para Permissão.
+
+As leituras são atendidas por um catálogo de permissões mantido em memória
+pelo processo: as permissões são poucas, quase estáticas e lidas a cada
+verificação de autorização.
 """
+import threading
+import time
 import uuid
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
+from sqlalchemy import bindparam, insert, select, update
 from sqlalchemy.orm import Session
 
 from .....domain.entities.permissao import Permissao
 from .....domain.repositories.permissao_repository import IPermissaoRepository
+from ..models.perfil_permissao import perfil_permissao
 from ..models.permissao import PermissaoModel
+from ..models.versao_catalogo import VersaoCatalogoModel
+from ..replicas import fixar_no_primario
+from ..unit_of_work import confirmar, invalidar_cache
+
+# Nome do catálogo de permissões na tabela de versões
+CATALOGO = "permissoes"
+
+# Intervalo mínimo, em segundos, entre verificações da versão no banco
+INTERVALO_VERIFICACAO = 5.0
+
+LER_VERSAO = select(VersaoCatalogoModel.versao).where(
+    VersaoCatalogoModel.nome == bindparam("catalogo")
+)
+INCREMENTAR_VERSAO = (
+    update(VersaoCatalogoModel)
+    .where(VersaoCatalogoModel.nome == bindparam("catalogo"))
+    .values(versao=VersaoCatalogoModel.versao + 1)
+)
+LISTAR_PERMISSOES = select(
+    PermissaoModel.id,
+    PermissaoModel.nome,
+    PermissaoModel.chave,
+    PermissaoModel.descricao,
+).order_by(PermissaoModel.nome)
+
+# (id, nome, chave, descricao)
+LinhaPermissao = Tuple[str, str, str, Optional[str]]
+
+
+def incrementar_versao(session: Session, nome: str = CATALOGO) -> None:
+    """
+    Incrementa a versão de um catálogo, na transação da sessão.
+
+    Args:
+        session: Sessão da escrita no catálogo
+        nome: Nome do catálogo
+    """
+    if session.execute(INCREMENTAR_VERSAO, {"catalogo": nome}).rowcount == 0:
+        session.execute(insert(VersaoCatalogoModel).values(nome=nome, versao=1))
+
+
+def linha_to_permissao(linha: LinhaPermissao) -> Permissao:
+    """
+    Cria a entidade de uma permissão do catálogo.
+
+    Cada chamada cria uma nova entidade, para que alterações feitas por
+    quem a recebe não modifiquem o catálogo compartilhado.
+
+    Args:
+        linha: Linha (id, nome, chave, descricao) da permissão
+
+    Returns:
+        Permissão correspondente
+    """
+    permissao = Permissao(nome=linha[1], chave=linha[2], descricao=linha[3])
+    permissao._id = linha[0]  # pylint: disable=protected-access
+    return permissao
+
+
+class CatalogoPermissoes:
+    """
+    Catálogo de permissões em memória, compartilhado pelo processo.
+
+    É carregado com uma consulta na primeira leitura e indexado por ID e
+    por chave. Escritas feitas pelo processo o invalidam; escritas de
+    outros processos são detectadas comparando a versão do catálogo no
+    banco, consultada no máximo uma vez a cada `intervalo_verificacao`
+    segundos. Entre verificações, as leituras não acessam o banco.
+    """
+
+    def __init__(
+        self,
+        intervalo_verificacao: float = INTERVALO_VERIFICACAO,
+        relogio: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Inicializa o catálogo, ainda vazio.
+
+        Args:
+            intervalo_verificacao: Segundos entre verificações da versão
+            relogio: Função que retorna o instante atual em segundos
+        """
+        self._intervalo = intervalo_verificacao
+        self._relogio = relogio
+        self._lock = threading.Lock()
+        self._por_id: Dict[str, LinhaPermissao] = {}
+        self._por_chave: Dict[str, LinhaPermissao] = {}
+        self._versao: Optional[int] = None
+        self._verificado_em = 0.0
+        self.carregamentos = 0
+
+    def invalidar(self) -> None:
+        """Descarta o catálogo; a próxima leitura o carrega novamente."""
+        with self._lock:
+            self._versao = None
+
+    def por_id(self, session: Session, id: str) -> Optional[LinhaPermissao]:
+        """
+        Busca uma permissão pelo ID.
+
+        Args:
+            session: Sessão usada se o catálogo precisar ser carregado
+            id: ID da permissão
+
+        Returns:
+            Linha da permissão ou None
+        """
+        return self._indices(session)[0].get(str(id))
+
+    def por_chave(self, session: Session, chave: str) -> Optional[LinhaPermissao]:
+        """
+        Busca uma permissão pela chave.
+
+        Args:
+            session: Sessão usada se o catálogo precisar ser carregado
+            chave: Chave da permissão
+
+        Returns:
+            Linha da permissão ou None
+        """
+        return self._indices(session)[1].get(chave.upper())
+
+    def todas(self, session: Session) -> List[LinhaPermissao]:
+        """
+        Lista todas as permissões, ordenadas por nome.
+
+        Args:
+            session: Sessão usada se o catálogo precisar ser carregado
+
+        Returns:
+            Linhas das permissões
+        """
+        return list(self._indices(session)[0].values())
+
+    def _indices(
+        self, session: Session
+    ) -> Tuple[Dict[str, LinhaPermissao], Dict[str, LinhaPermissao]]:
+        """
+        Retorna os índices do catálogo, carregando-o se necessário.
+
+        Args:
+            session: Sessão usada para verificar a versão e carregar
+
+        Returns:
+            Índices por ID e por chave
+        """
+        with self._lock:
+            agora = self._relogio()
+            recente = agora - self._verificado_em < self._intervalo
+            if self._versao is not None and recente:
+                return self._por_id, self._por_chave
+
+            versao = session.execute(LER_VERSAO, {"catalogo": CATALOGO}).scalar() or 0
+            if versao != self._versao:
+                # A versão é lida antes das linhas: uma escrita entre as duas
+                # consultas apenas faz a próxima verificação recarregar
+                linhas = [tuple(row) for row in session.execute(LISTAR_PERMISSOES)]
+                self._por_id = {linha[0]: linha for linha in linhas}
+                self._por_chave = {linha[2]: linha for linha in linhas}
+                self._versao = versao
+                self.carregamentos += 1
+            self._verificado_em = agora
+            return self._por_id, self._por_chave
+
+
+# Catálogo compartilhado por todos os repositórios do processo
+CATALOGO_PERMISSOES = CatalogoPermissoes()
 
 
 class SQLPermissaoRepository(IPermissaoRepository):
     """Implementação SQLAlchemy do repositório de Permissão."""
 
-    def __init__(self, session: Session):
+    def __init__(
+        self, session: Session, catalogo: Optional[CatalogoPermissoes] = None
+    ):
         """
         Inicializa o repositório.
 
         Args:
             session: Sessão do SQLAlchemy
+            catalogo: Catálogo de permissões (por padrão, o do processo)
         """
         self._session = session
+        self._catalogo = catalogo if catalogo is not None else CATALOGO_PERMISSOES
 
     def criar(self, permissao: Permissao) -> Permissao:
         """
@@ -43,7 +222,7 @@ class SQLPermissaoRepository(IPermissaoRepository):
 
         # Persiste
         self._session.add(model)
-        self._session.commit()
+        self._confirmar_escrita(permissao)
 
         # Atualiza o ID da entidade
         permissao._id = model.id  # pylint: disable=protected-access
@@ -60,16 +239,8 @@ class SQLPermissaoRepository(IPermissaoRepository):
         Returns:
             Permissão encontrada ou None
         """
-        model = self._session.query(PermissaoModel).get(id)
-
-        if not model:
-            return None
-
-        return Permissao(
-            nome=model.nome,
-            chave=model.chave,
-            descricao=model.descricao,
-        )
+        linha = self._catalogo.por_id(self._session, id)
+        return linha_to_permissao(linha) if linha else None
 
     def buscar_por_chave(self, chave: str) -> Optional[Permissao]:
         """
@@ -81,20 +252,8 @@ class SQLPermissaoRepository(IPermissaoRepository):
         Returns:
             Permissão encontrada ou None
         """
-        model = (
-            self._session.query(PermissaoModel)
-            .filter(PermissaoModel.chave == chave.upper())
-            .first()
-        )
-
-        if not model:
-            return None
-
-        return Permissao(
-            nome=model.nome,
-            chave=model.chave,
-            descricao=model.descricao,
-        )
+        linha = self._catalogo.por_chave(self._session, chave)
+        return linha_to_permissao(linha) if linha else None
 
     def listar(self) -> List[Permissao]:
         """
@@ -103,16 +262,32 @@ class SQLPermissaoRepository(IPermissaoRepository):
         Returns:
             Lista de permissões
         """
-        models = self._session.query(PermissaoModel).all()
+        linhas = self._catalogo.todas(self._session)
+        return [linha_to_permissao(linha) for linha in linhas]
 
-        return [
-            Permissao(
-                nome=model.nome,
-                chave=model.chave,
-                descricao=model.descricao,
-            )
-            for model in models
-        ]
+    def atualizar(self, permissao: Permissao) -> Permissao:
+        """
+        Atualiza uma permissão.
+
+        Args:
+            permissao: Permissão a ser atualizada
+
+        Returns:
+            Permissão atualizada
+        """
+        model = self._session.get(
+            PermissaoModel,
+            permissao.id,
+            populate_existing=fixar_no_primario(self._session),
+        )
+
+        if model:
+            model.nome = permissao.nome
+            model.chave = permissao.chave
+            model.descricao = permissao.descricao
+            self._confirmar_escrita(permissao)
+
+        return permissao
 
     def deletar(self, permissao: Permissao) -> None:
         """
@@ -121,8 +296,43 @@ class SQLPermissaoRepository(IPermissaoRepository):
         Args:
             permissao: Permissão a ser removida
         """
-        model = self._session.query(PermissaoModel).get(permissao.id)
+        model = self._session.get(PermissaoModel, permissao.id)
 
         if model:
             self._session.delete(model)
-            self._session.commit() 
\ No newline at end of file
+            self._confirmar_escrita(permissao)
+
+    def excluir(self, permissao: Permissao) -> None:
+        """
+        Exclui uma permissão.
+
+        Args:
+            permissao: Permissão a ser excluída
+        """
+        self.deletar(permissao)
+
+    def tem_perfis_associados(self, id: str) -> bool:
+        """
+        Verifica se uma permissão está associada a algum perfil.
+
+        Args:
+            id: ID da permissão
+
+        Returns:
+            True se a permissão estiver associada a algum perfil
+        """
+        return (
+            self._session.execute(
+                select(perfil_permissao.c.perfil_id)
+                .where(perfil_permissao.c.permissao_id == str(id))
+                .limit(1)
+            ).first()
+            is not None
+        )
+
+    def _confirmar_escrita(self, permissao: Permissao) -> None:
+        """Confirma a escrita de uma permissão e incrementa a versão do catálogo."""
+        self._session.flush()
+        incrementar_versao(self._session)
+        confirmar(self._session, permissao)
+        invalidar_cache(self._session, self._catalogo.invalidar)
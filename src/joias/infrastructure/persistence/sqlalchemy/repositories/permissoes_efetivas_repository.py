@@ -0,0 +1,163 @@
+"""
+Repositório SQLAlchemy para permissões efetivas.
+
+Resolve as chaves de permissão de um usuário com uma única consulta
+(usuario_perfil -> perfil_permissao -> permissoes) e mantém o resultado
+em um cache por usuário, compartilhado pelo processo.
+"""
+import threading
+import time
+from typing import Callable, Dict, FrozenSet, Hashable, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import Session
+
+from .....domain.repositories.permissoes_efetivas_repository import (
+    IPermissoesEfetivasRepository,
+)
+from ..models.perfil import usuario_perfil
+from ..models.perfil_permissao import perfil_permissao
+from ..models.permissao import PermissaoModel
+from ..unit_of_work import invalidar_cache
+
+# Tempo de vida, em segundos, das permissões em cache de cada usuário
+TTL_PERMISSOES = 60.0
+
+CHAVES_DO_USUARIO = (
+    select(PermissaoModel.chave)
+    .join(perfil_permissao, perfil_permissao.c.permissao_id == PermissaoModel.id)
+    .join(usuario_perfil, usuario_perfil.c.perfil_id == perfil_permissao.c.perfil_id)
+    .where(usuario_perfil.c.usuario_id == bindparam("usuario_id"))
+    .distinct()
+)
+
+
+class CachePermissoesEfetivas:
+    """
+    Cache das permissões efetivas por usuário, com TTL.
+
+    Invalidações incrementam uma geração: um carregamento iniciado antes
+    de uma invalidação não é armazenado, para não guardar permissões que
+    já mudaram.
+    """
+
+    def __init__(
+        self,
+        ttl: float = TTL_PERMISSOES,
+        relogio: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Inicializa o cache.
+
+        Args:
+            ttl: Tempo de vida de cada entrada, em segundos
+            relogio: Função que retorna o instante atual em segundos
+        """
+        self._ttl = ttl
+        self._relogio = relogio
+        self._lock = threading.Lock()
+        self._entradas: Dict[Hashable, Tuple[float, FrozenSet[str]]] = {}
+        self.geracao = 0
+
+    def obter(self, usuario_id: UUID) -> Optional[FrozenSet[str]]:
+        """
+        Busca as permissões de um usuário no cache.
+
+        Args:
+            usuario_id: ID do usuário
+
+        Returns:
+            Chaves das permissões ou None se ausentes ou expiradas
+        """
+        with self._lock:
+            entrada = self._entradas.get(usuario_id)
+            if entrada is None:
+                return None
+            expira_em, chaves = entrada
+            if expira_em <= self._relogio():
+                del self._entradas[usuario_id]
+                return None
+            return chaves
+
+    def definir(self, usuario_id: UUID, chaves: FrozenSet[str], geracao: int) -> None:
+        """
+        Armazena as permissões de um usuário.
+
+        Args:
+            usuario_id: ID do usuário
+            chaves: Chaves das permissões
+            geracao: Geração do cache quando o carregamento começou
+        """
+        with self._lock:
+            if geracao == self.geracao:
+                self._entradas[usuario_id] = (self._relogio() + self._ttl, chaves)
+
+    def invalidar(self, usuario_id: Optional[UUID] = None) -> None:
+        """
+        Descarta as permissões de um usuário, ou de todos.
+
+        Args:
+            usuario_id: ID do usuário (None descarta todos)
+        """
+        with self._lock:
+            self.geracao += 1
+            if usuario_id is None:
+                self._entradas.clear()
+            else:
+                self._entradas.pop(usuario_id, None)
+
+
+# Cache compartilhado por todos os repositórios do processo
+PERMISSOES_EFETIVAS = CachePermissoesEfetivas()
+
+
+def invalidar_permissoes_efetivas(
+    session: Session, usuario_id: Optional[UUID] = None
+) -> None:
+    """
+    Invalida as permissões em cache após uma escrita que altera o grafo
+    usuário -> perfis -> permissões.
+
+    Args:
+        session: Sessão síncrona da escrita
+        usuario_id: Usuário afetado (None quando a escrita afeta todos os
+            usuários de um perfil)
+    """
+    invalidar_cache(session, lambda: PERMISSOES_EFETIVAS.invalidar(usuario_id))
+
+
+class SQLPermissoesEfetivasRepository(IPermissoesEfetivasRepository):
+    """Implementação SQLAlchemy do repositório de permissões efetivas."""
+
+    def __init__(
+        self, session: Session, cache: Optional[CachePermissoesEfetivas] = None
+    ):
+        """
+        Inicializa o repositório.
+
+        Args:
+            session: Sessão do SQLAlchemy
+            cache: Cache de permissões (por padrão, o do processo)
+        """
+        self._session = session
+        self._cache = cache if cache is not None else PERMISSOES_EFETIVAS
+
+    def buscar_chaves(self, usuario_id: UUID) -> FrozenSet[str]:
+        """
+        Busca as chaves das permissões efetivas de um usuário.
+
+        Args:
+            usuario_id: ID do usuário
+
+        Returns:
+            Chaves das permissões do usuário, em maiúsculas
+        """
+        chaves = self._cache.obter(usuario_id)
+        if chaves is None:
+            geracao = self._cache.geracao
+            chaves = frozenset(
+                self._session.scalars(CHAVES_DO_USUARIO, {"usuario_id": usuario_id})
+            )
+            self._cache.definir(usuario_id, chaves, geracao)
+        return chaves
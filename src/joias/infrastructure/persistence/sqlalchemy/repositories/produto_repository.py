@@ -5,15 +5,110 @@ Este módulo implementa a interface ProdutoRepository usando SQLAlchemy
 como tecnologia de persistência.
 """
 from decimal import Decimal
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from sqlalchemy import and_
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, and_, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Query, Session, noload, selectinload
 
 from .....domain.catalogo.entities.produto import Produto
-from .....domain.catalogo.repositories.produto_repository import ProdutoRepository
+from .....domain.catalogo.repositories.produto_repository import (
+    ProdutoRepository,
+    ResumoProduto,
+)
 from ..mappers.produto_mapper import ProdutoMapper
-from ..models.produto import ProdutoModel
+from ..models.produto import ProdutoModel, VariacaoModel
+from ..replicas import fixar_no_primario
+from ..unit_of_work import confirmar
+
+# Perfis de carregamento dos relacionamentos do produto:
+# - "listagem": não carrega variações nem detalhes (nenhuma consulta extra)
+# - "completo": carrega variações, detalhes das variações e detalhes do
+#   produto com uma consulta IN por relacionamento, qualquer que seja o
+#   número de produtos
+PERFIS_CARREGAMENTO = {
+    "listagem": (
+        noload(ProdutoModel.variacoes),
+        noload(ProdutoModel.detalhes),
+    ),
+    "completo": (
+        selectinload(ProdutoModel.variacoes).selectinload(VariacaoModel.detalhes),
+        selectinload(ProdutoModel.detalhes),
+    ),
+}
+
+# Perfil usado por padrão em cada método de leitura
+PERFIS_POR_METODO = {
+    "buscar_por_id": "completo",
+    "buscar_por_sku": "completo",
+    "listar": "completo",
+    "listar_pagina": "completo",
+    "iterar": "completo",
+    "buscar_por_faixa_de_preco": "completo",
+}
+
+
+# Colunas lidas pelas listagens: os resumos são montados direto das
+# linhas, sem instanciar modelos nem entidades (preço, moeda, variações)
+COLUNAS_RESUMO = (
+    ProdutoModel.id,
+    ProdutoModel.sku,
+    ProdutoModel.nome,
+    ProdutoModel.preco_valor,
+    ProdutoModel.preco_moeda,
+    ProdutoModel.ativo,
+)
+
+
+def select_resumos(apenas_ativos: bool, apos_id: Optional[int] = None) -> Select:
+    """
+    Cria a consulta dos resumos de produtos, ordenados por ID.
+
+    Args:
+        apenas_ativos: Se True, seleciona apenas produtos ativos
+        apos_id: Cursor; seleciona apenas produtos com ID maior que ele
+
+    Returns:
+        Select: Consulta das colunas de COLUNAS_RESUMO
+    """
+    stmt = select(*COLUNAS_RESUMO)
+    if apenas_ativos:
+        stmt = stmt.where(ProdutoModel.ativo == True)
+    if apos_id is not None:
+        stmt = stmt.where(ProdutoModel.id > apos_id)
+    return stmt.order_by(ProdutoModel.id)
+
+
+def validar_limite(limite: int) -> None:
+    """
+    Valida o tamanho de uma página da paginação por cursor.
+
+    Args:
+        limite: Quantidade máxima de itens na página
+
+    Raises:
+        ValueError: Se limite for menor que 1
+    """
+    if limite < 1:
+        raise ValueError("O limite da página deve ser maior que zero")
+
+
+def pagina_de_resumos(
+    linhas: List[Any], limite: int
+) -> Tuple[List[ResumoProduto], Optional[int]]:
+    """
+    Monta uma página de resumos a partir de até limite + 1 linhas.
+
+    Args:
+        linhas: Linhas de select_resumos, com um registro a mais
+        limite: Quantidade máxima de produtos na página
+
+    Returns:
+        Tuple[List[ResumoProduto], Optional[int]]: Resumos da página e o
+        cursor da próxima página (None se esta for a última)
+    """
+    proximo = linhas[limite - 1].id if len(linhas) > limite else None
+    return [ResumoProduto._make(linha) for linha in linhas[:limite]], proximo
 
 
 class SQLAlchemyProdutoRepository(ProdutoRepository):
@@ -24,15 +119,42 @@ class SQLAlchemyProdutoRepository(ProdutoRepository):
     como tecnologia de persistência.
     """
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, perfis: Optional[Dict[str, str]] = None):
         """
         Inicializa o repositório com uma sessão do SQLAlchemy.
 
         Args:
             session: Sessão do SQLAlchemy
+            perfis: Perfil de carregamento por método, sobrepondo
+                PERFIS_POR_METODO (ex.: {"listar": "listagem"})
         """
         self._session = session
         self._mapper = ProdutoMapper()
+        self._perfis = {**PERFIS_POR_METODO, **(perfis or {})}
+
+    def _opcoes(self, metodo: str) -> tuple:
+        """
+        Retorna as opções de carregamento configuradas para um método.
+
+        Args:
+            metodo: Nome do método de leitura
+
+        Returns:
+            tuple: Opções de carregamento do SQLAlchemy
+        """
+        return PERFIS_CARREGAMENTO[self._perfis[metodo]]
+
+    def _query(self, metodo: str) -> Query:
+        """
+        Cria uma consulta de produtos com o perfil de carregamento do método.
+
+        Args:
+            metodo: Nome do método de leitura
+
+        Returns:
+            Query: Consulta configurada
+        """
+        return self._session.query(ProdutoModel).options(*self._opcoes(metodo))
 
     def salvar(self, produto: Produto) -> Produto:
         """
@@ -46,9 +168,105 @@ class SQLAlchemyProdutoRepository(ProdutoRepository):
         """
         model = self._mapper.to_model(produto)
         self._session.add(model)
-        self._session.commit()
+        confirmar(self._session)
         return self._mapper.to_entity(model)
 
+    def salvar_em_lote(self, produtos: List[Produto], tamanho_lote: int = 1000) -> int:
+        """
+        Insere ou atualiza muitos produtos, com variações e detalhes.
+
+        Os produtos são identificados pelo SKU. Cada lote usa um INSERT ...
+        ON CONFLICT de várias linhas para os produtos e uma consulta por
+        relacionamento para carregar os filhos do lote, que são atualizados
+        pelas mesmas chaves de atualizar (variações pelo código, detalhes
+        pelo par (nome, tipo)), e termina com um único commit.
+
+        Args:
+            produtos: Produtos a serem salvos
+            tamanho_lote: Quantidade de produtos por transação
+
+        Returns:
+            int: Quantidade de produtos processados
+        """
+        total = 0
+        for inicio in range(0, len(produtos), tamanho_lote):
+            lote = produtos[inicio : inicio + tamanho_lote]
+            self._salvar_lote(lote)
+            confirmar(self._session)
+            total += len(lote)
+        return total
+
+    def _salvar_lote(self, produtos: List[Produto]) -> None:
+        """
+        Grava um lote de produtos sem fazer commit.
+
+        Args:
+            produtos: Produtos do lote
+        """
+        # Se o mesmo SKU aparecer mais de uma vez, vale a última ocorrência
+        por_sku = {produto.sku: produto for produto in produtos}
+        self._upsert_produtos([self._mapper.to_row(p) for p in por_sku.values()])
+
+        # Os filhos são sincronizados como em atualizar: variações pelo
+        # código e detalhes pelo par (nome, tipo), mantendo os IDs dos que
+        # continuam na entidade
+        models = self._session.scalars(
+            select(ProdutoModel)
+            .where(ProdutoModel.sku.in_(list(por_sku)))
+            .options(*PERFIS_CARREGAMENTO["completo"])
+            .execution_options(populate_existing=True)
+        )
+        for model in models:
+            novos, removidos = self._mapper.sincronizar_filhos(
+                por_sku[model.sku], model
+            )
+            self._session.add_all(novos)
+            for removido in removidos:
+                self._session.delete(removido)
+
+    def _upsert_produtos(self, linhas: List[Dict[str, Any]]) -> None:
+        """
+        Insere ou atualiza as linhas de produtos pelo SKU.
+
+        Args:
+            linhas: Valores das colunas de cada produto
+        """
+        dialetos = {"postgresql": postgresql, "sqlite": sqlite}
+        dialeto = dialetos.get(self._session.get_bind().dialect.name)
+        if dialeto is not None:
+            stmt = dialeto.insert(ProdutoModel)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[ProdutoModel.sku],
+                set_={
+                    coluna: stmt.excluded[coluna]
+                    for coluna in linhas[0]
+                    if coluna not in ("sku", "data_criacao")
+                },
+            )
+            self._session.execute(stmt, linhas)
+            return
+
+        # Demais bancos: separa novos e existentes e usa executemany
+        existentes = dict(
+            self._session.execute(
+                select(ProdutoModel.sku, ProdutoModel.id).where(
+                    ProdutoModel.sku.in_([linha["sku"] for linha in linhas])
+                )
+            ).all()
+        )
+        novos = [linha for linha in linhas if linha["sku"] not in existentes]
+        alterados = [
+            {**linha, "id": existentes[linha["sku"]]}
+            for linha in linhas
+            if linha["sku"] in existentes
+        ]
+        for linha in alterados:
+            del linha["data_criacao"]
+        if novos:
+            self._session.execute(insert(ProdutoModel), novos)
+        if alterados:
+            self._session.execute(update(ProdutoModel), alterados)
+
     def buscar_por_id(self, produto_id: int) -> Optional[Produto]:
         """
         Busca um produto pelo ID.
@@ -59,7 +277,9 @@ class SQLAlchemyProdutoRepository(ProdutoRepository):
         Returns:
             Optional[Produto]: O produto encontrado ou None
         """
-        model = self._session.query(ProdutoModel).get(produto_id)
+        model = self._session.get(
+            ProdutoModel, produto_id, options=self._opcoes("buscar_por_id")
+        )
         if not model:
             return None
         return self._mapper.to_entity(model)
@@ -74,9 +294,7 @@ class SQLAlchemyProdutoRepository(ProdutoRepository):
         Returns:
             Optional[Produto]: O produto encontrado ou None
         """
-        model = (
-            self._session.query(ProdutoModel).filter(ProdutoModel.sku == sku).first()
-        )
+        model = self._query("buscar_por_sku").filter(ProdutoModel.sku == sku).first()
         if not model:
             return None
         return self._mapper.to_entity(model)
@@ -91,11 +309,105 @@ class SQLAlchemyProdutoRepository(ProdutoRepository):
         Returns:
             List[Produto]: Lista de produtos
         """
-        query = self._session.query(ProdutoModel)
+        query = self._query("listar")
         if apenas_ativos:
             query = query.filter(ProdutoModel.ativo == True)
         return [self._mapper.to_entity(model) for model in query.all()]
 
+    def listar_pagina(
+        self,
+        apos_id: Optional[int] = None,
+        limite: int = 50,
+        apenas_ativos: bool = True,
+    ) -> Tuple[List[Produto], Optional[int]]:
+        """
+        Lista uma página de produtos ordenados por ID (paginação por cursor).
+
+        Em vez de OFFSET, filtra por ID maior que o cursor, então o custo
+        de cada página não cresce com a posição dela.
+
+        Args:
+            apos_id: Cursor; retorna apenas produtos com ID maior que ele
+            limite: Quantidade máxima de produtos na página
+            apenas_ativos: Se True, retorna apenas produtos ativos
+
+        Returns:
+            Tuple[List[Produto], Optional[int]]: Produtos da página e o
+            cursor da próxima página (None se esta for a última)
+
+        Raises:
+            ValueError: Se limite for menor que 1
+        """
+        validar_limite(limite)
+        query = self._query("listar_pagina")
+        if apenas_ativos:
+            query = query.filter(ProdutoModel.ativo == True)
+        if apos_id is not None:
+            query = query.filter(ProdutoModel.id > apos_id)
+
+        # Busca um registro a mais apenas para saber se há próxima página
+        models = query.order_by(ProdutoModel.id).limit(limite + 1).all()
+        proximo = models[limite - 1].id if len(models) > limite else None
+        return [self._mapper.to_entity(model) for model in models[:limite]], proximo
+
+    def listar_resumos(self, apenas_ativos: bool = True) -> List[ResumoProduto]:
+        """
+        Lista os resumos dos produtos, sem carregar as entidades.
+
+        Args:
+            apenas_ativos: Se True, retorna apenas produtos ativos
+
+        Returns:
+            List[ResumoProduto]: Resumos dos produtos
+        """
+        linhas = self._session.execute(select_resumos(apenas_ativos))
+        return [ResumoProduto._make(linha) for linha in linhas]
+
+    def listar_pagina_resumos(
+        self,
+        apos_id: Optional[int] = None,
+        limite: int = 50,
+        apenas_ativos: bool = True,
+    ) -> Tuple[List[ResumoProduto], Optional[int]]:
+        """
+        Lista uma página de resumos de produtos ordenados por ID.
+
+        Args:
+            apos_id: Cursor; retorna apenas produtos com ID maior que ele
+            limite: Quantidade máxima de produtos na página
+            apenas_ativos: Se True, retorna apenas produtos ativos
+
+        Returns:
+            Tuple[List[ResumoProduto], Optional[int]]: Resumos da página e o
+            cursor da próxima página (None se esta for a última)
+
+        Raises:
+            ValueError: Se limite for menor que 1
+        """
+        validar_limite(limite)
+        linhas = self._session.execute(
+            select_resumos(apenas_ativos, apos_id).limit(limite + 1)
+        ).all()
+        return pagina_de_resumos(linhas, limite)
+
+    def iterar(self, apenas_ativos: bool = True, lote: int = 1000) -> Iterator[Produto]:
+        """
+        Percorre todos os produtos sem carregá-los todos em memória.
+
+        Args:
+            apenas_ativos: Se True, percorre apenas produtos ativos
+            lote: Quantidade de produtos carregados por vez
+
+        Yields:
+            Produto: Cada produto, em ordem de ID
+        """
+        stmt = select(ProdutoModel).options(*self._opcoes("iterar"))
+        if apenas_ativos:
+            stmt = stmt.where(ProdutoModel.ativo == True)
+        stmt = stmt.order_by(ProdutoModel.id).execution_options(yield_per=lote)
+        for model in self._session.scalars(stmt):
+            yield self._mapper.to_entity(model)
+
     def buscar_por_faixa_de_preco(
         self, preco_minimo: Decimal, preco_maximo: Decimal
     ) -> List[Produto]:
@@ -110,7 +422,7 @@ class SQLAlchemyProdutoRepository(ProdutoRepository):
             List[Produto]: Lista de produtos na faixa de preço
         """
         models = (
-            self._session.query(ProdutoModel)
+            self._query("buscar_por_faixa_de_preco")
             .filter(
                 and_(
                     ProdutoModel.preco_valor >= preco_minimo,
@@ -132,17 +444,25 @@ class SQLAlchemyProdutoRepository(ProdutoRepository):
         Returns:
             Optional[Produto]: O produto atualizado ou None se não encontrado
         """
-        model = self._session.query(ProdutoModel).get(produto.id)
+        # As coleções são comparadas com as da entidade, então precisam
+        # estar carregadas
+        model = self._session.get(
+            ProdutoModel,
+            produto.id,
+            options=PERFIS_CARREGAMENTO["completo"],
+            populate_existing=fixar_no_primario(self._session),
+        )
         if not model:
             return None
 
-        updated_model = self._mapper.to_model(produto)
-        for key, value in updated_model.__dict__.items():
-            if not key.startswith("_"):
-                setattr(model, key, value)
+        # Grava apenas as colunas e os filhos alterados
+        novos, removidos = self._mapper.atualizar_model(produto, model)
+        self._session.add_all(novos)
+        for removido in removidos:
+            self._session.delete(removido)
 
-        self._session.commit()
-        return self._mapper.to_entity(model)
+        confirmar(self._session)
+        return produto
 
     def excluir(self, produto_id: int) -> bool:
         """
@@ -159,5 +479,5 @@ class SQLAlchemyProdutoRepository(ProdutoRepository):
             return False
 
         self._session.delete(model)
-        self._session.commit()
+        confirmar(self._session)
         return True
@@ -4,14 +4,93 @@ Repositório SQLAlchemy para tokens.
 Este módulo implementa o repositório de tokens usando
 SQLAlchemy como ORM.
 """
+import hashlib
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
+from sqlalchemy import Row, bindparam, delete, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from src.joias.domain.entities.autorizacao import Token
 from src.joias.infrastructure.persistence.sqlalchemy.models import Token as TokenModel
+from src.joias.infrastructure.persistence.sqlalchemy.replicas import fixar_no_primario
+from src.joias.infrastructure.persistence.sqlalchemy.unit_of_work import (
+    confirmar,
+    desfazer,
+)
+
+# Consultas das buscas mais frequentes (validação de token), construídas
+# uma única vez para aproveitar o cache de compilação do SQLAlchemy.
+# Selecionam colunas, não entidades, então não passam pelo identity map.
+COLUNAS_TOKEN = (
+    TokenModel.id,
+    TokenModel.usuario_id,
+    TokenModel.token,
+    TokenModel.expiracao,
+    TokenModel.created_at,
+    TokenModel.updated_at,
+    TokenModel.deleted_at,
+)
+BUSCAR_TOKEN_POR_ID = (
+    select(*COLUNAS_TOKEN).where(TokenModel.id == bindparam("id")).limit(1)
+)
+BUSCAR_TOKEN_POR_HASH = (
+    select(*COLUNAS_TOKEN)
+    .where(TokenModel.token_hash == bindparam("token_hash"))
+    .limit(1)
+)
+BUSCAR_TOKEN_POR_USUARIO = (
+    select(*COLUNAS_TOKEN)
+    .where(TokenModel.usuario_id == bindparam("usuario_id"))
+    .limit(1)
+)
+
+
+# Quantidade máxima de tokens removidos por comando na purga
+TAMANHO_LOTE_PURGA = 1000
+
+# Remove um lote dos tokens expirados, percorrendo o índice de expiracao.
+# synchronize_session=False: a purga não altera objetos da sessão
+PURGAR_EXPIRADOS = (
+    delete(TokenModel)
+    .where(
+        TokenModel.id.in_(
+            select(TokenModel.id)
+            .where(TokenModel.expiracao < bindparam("agora"))
+            .order_by(TokenModel.expiracao)
+            .limit(bindparam("lote"))
+        )
+    )
+    .execution_options(synchronize_session=False)
+)
+
+
+def hash_token(token: str) -> str:
+    """
+    Calcula o hash armazenado e indexado de um token.
+
+    Args:
+        token: Valor do token
+
+    Returns:
+        SHA-256 do token, com 64 dígitos hexadecimais
+    """
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def row_to_token(row: Row) -> Token:
+    """
+    Converte uma linha de COLUNAS_TOKEN em entidade.
+
+    Args:
+        row: Linha retornada por uma das consultas de token
+
+    Returns:
+        A entidade de domínio
+    """
+    return Token(**row._asdict())
 
 
 class TokenRepository:
@@ -44,16 +123,17 @@ class TokenRepository:
                 id=token.id,
                 usuario_id=token.usuario_id,
                 token=token.token,
+                token_hash=hash_token(token.token),
                 expiracao=token.expiracao,
                 created_at=token.created_at,
                 updated_at=token.updated_at,
                 deleted_at=token.deleted_at,
             )
             self._session.add(token_model)
-            self._session.commit()
+            confirmar(self._session, token)
             return token
         except IntegrityError:
-            self._session.rollback()
+            desfazer(self._session)
             raise
 
     def buscar_por_id(self, id: UUID) -> Optional[Token]:
@@ -66,18 +146,8 @@ class TokenRepository:
         Returns:
             O token encontrado ou None se não existir
         """
-        token_model = self._session.query(TokenModel).filter_by(id=id).first()
-        if not token_model:
-            return None
-        return Token(
-            id=token_model.id,
-            usuario_id=token_model.usuario_id,
-            token=token_model.token,
-            expiracao=token_model.expiracao,
-            created_at=token_model.created_at,
-            updated_at=token_model.updated_at,
-            deleted_at=token_model.deleted_at,
-        )
+        row = self._session.execute(BUSCAR_TOKEN_POR_ID, {"id": id}).first()
+        return row_to_token(row) if row else None
 
     def buscar_por_token(self, token: str) -> Optional[Token]:
         """
@@ -89,18 +159,10 @@ class TokenRepository:
         Returns:
             O token encontrado ou None se não existir
         """
-        token_model = self._session.query(TokenModel).filter_by(token=token).first()
-        if not token_model:
-            return None
-        return Token(
-            id=token_model.id,
-            usuario_id=token_model.usuario_id,
-            token=token_model.token,
-            expiracao=token_model.expiracao,
-            created_at=token_model.created_at,
-            updated_at=token_model.updated_at,
-            deleted_at=token_model.deleted_at,
-        )
+        row = self._session.execute(
+            BUSCAR_TOKEN_POR_HASH, {"token_hash": hash_token(token)}
+        ).first()
+        return row_to_token(row) if row else None
 
     def buscar_por_usuario_id(self, usuario_id: UUID) -> Optional[Token]:
         """
@@ -112,18 +174,10 @@ class TokenRepository:
         Returns:
             O token encontrado ou None se não existir
         """
-        token_model = self._session.query(TokenModel).filter_by(usuario_id=usuario_id).first()
-        if not token_model:
-            return None
-        return Token(
-            id=token_model.id,
-            usuario_id=token_model.usuario_id,
-            token=token_model.token,
-            expiracao=token_model.expiracao,
-            created_at=token_model.created_at,
-            updated_at=token_model.updated_at,
-            deleted_at=token_model.deleted_at,
-        )
+        row = self._session.execute(
+            BUSCAR_TOKEN_POR_USUARIO, {"usuario_id": usuario_id}
+        ).first()
+        return row_to_token(row) if row else None
 
     def atualizar(self, token: Token) -> Token:
         """
@@ -140,20 +194,25 @@ class TokenRepository:
             ValueError: Se o token não for encontrado
         """
         try:
-            token_model = self._session.query(TokenModel).filter_by(id=token.id).first()
+            token_model = self._session.get(
+                TokenModel,
+                token.id,
+                populate_existing=fixar_no_primario(self._session),
+            )
             if not token_model:
                 raise ValueError(f"Token com ID {token.id} não encontrado")
             
             token_model.usuario_id = token.usuario_id
             token_model.token = token.token
+            token_model.token_hash = hash_token(token.token)
             token_model.expiracao = token.expiracao
             token_model.updated_at = token.updated_at
             token_model.deleted_at = token.deleted_at
             
-            self._session.commit()
+            confirmar(self._session, token)
             return token
         except IntegrityError:
-            self._session.rollback()
+            desfazer(self._session)
             raise
 
     def excluir(self, id: UUID) -> None:
@@ -166,4 +225,29 @@ class TokenRepository:
         token_model = self._session.query(TokenModel).filter_by(id=id).first()
         if token_model:
             self._session.delete(token_model)
-            self._session.commit() 
\ No newline at end of file
+            confirmar(self._session)
+
+    def purgar_expirados(
+        self, agora: Optional[datetime] = None, lote: int = TAMANHO_LOTE_PURGA
+    ) -> int:
+        """
+        Exclui os tokens expirados, em lotes.
+
+        Fora de uma unidade de trabalho, cada lote é confirmado em sua
+        própria transação, para não manter bloqueios sobre a tabela inteira.
+
+        Args:
+            agora: Instante de referência (por padrão, o atual)
+            lote: Quantidade máxima de tokens excluídos por lote
+
+        Returns:
+            Quantidade de tokens excluídos
+        """
+        parametros = {"agora": agora or datetime.now(), "lote": lote}
+        total = 0
+        while True:
+            excluidos = self._session.execute(PURGAR_EXPIRADOS, parametros).rowcount
+            confirmar(self._session)
+            total += excluidos
+            if excluidos < lote:
+                return total
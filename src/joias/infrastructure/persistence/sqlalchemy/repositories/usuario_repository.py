@@ -4,18 +4,130 @@ Repositório SQLAlchemy para usuários.
 Este módulo implementa o repositório de usuários usando
 SQLAlchemy como ORM.
 """
-from typing import List, Optional
+from typing import List, Optional, Union
 from uuid import UUID
 
-from sqlalchemy import or_
+from sqlalchemy import Row, Select, bindparam, func, or_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from src.joias.domain.entities.autorizacao import Usuario, Perfil
+from src.joias.domain.repositories.usuario_repository import ResumoUsuario
 from src.joias.infrastructure.persistence.sqlalchemy.models import (
     Usuario as UsuarioModel,
     Perfil as PerfilModel,
 )
+from src.joias.infrastructure.persistence.sqlalchemy.replicas import fixar_no_primario
+from src.joias.infrastructure.persistence.sqlalchemy.repositories.permissoes_efetivas_repository import (
+    invalidar_permissoes_efetivas,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.unit_of_work import (
+    confirmar,
+    desfazer,
+)
+
+# Consultas das buscas mais frequentes (autenticação), construídas uma
+# única vez: o SQL compilado fica no cache do SQLAlchemy e só os
+# parâmetros mudam a cada chamada. Selecionam colunas, não entidades,
+# então não passam pelo identity map da sessão.
+COLUNAS_USUARIO = (
+    UsuarioModel.id,
+    UsuarioModel.nome,
+    UsuarioModel.email,
+    UsuarioModel.senha_hash,
+    UsuarioModel.ativo,
+    UsuarioModel.data_criacao,
+)
+BUSCAR_USUARIO_POR_ID = (
+    select(*COLUNAS_USUARIO).where(UsuarioModel.id == bindparam("id")).limit(1)
+)
+BUSCAR_USUARIO_POR_EMAIL = (
+    select(*COLUNAS_USUARIO)
+    # Compara lower(email), atendida pelo índice ix_usuarios_email_lower
+    .where(func.lower(UsuarioModel.email) == func.lower(bindparam("email")))
+    .limit(1)
+)
+
+# Colunas lidas pelas listagens de usuários
+COLUNAS_RESUMO_USUARIO = (
+    UsuarioModel.id,
+    UsuarioModel.nome,
+    UsuarioModel.email,
+    UsuarioModel.ativo,
+    UsuarioModel.data_criacao,
+)
+
+
+def select_resumos(
+    pagina: int = 1,
+    tamanho: int = 10,
+    email: Optional[str] = None,
+    nome: Optional[str] = None,
+) -> Select:
+    """
+    Cria a consulta dos resumos de usuários, com os filtros de `listar`.
+
+    Args:
+        pagina: Número da página (1-based)
+        tamanho: Tamanho da página
+        email: Filtro por email
+        nome: Filtro por nome
+
+    Returns:
+        Consulta com as colunas de ResumoUsuario
+    """
+    stmt = select(*COLUNAS_RESUMO_USUARIO)
+    if email or nome:
+        stmt = stmt.where(
+            or_(
+                UsuarioModel.email.ilike(f"%{email}%") if email else False,
+                UsuarioModel.nome.ilike(f"%{nome}%") if nome else False,
+            )
+        )
+    return stmt.offset((pagina - 1) * tamanho).limit(tamanho)
+
+
+def row_to_usuario(row: Union[Row, UsuarioModel]) -> Usuario:
+    """
+    Converte uma linha de COLUNAS_USUARIO, ou um modelo, em entidade.
+
+    A tabela não tem datas de atualização e exclusão: a entidade recebe a
+    data de criação como data de atualização.
+
+    Args:
+        row: Linha retornada por uma das consultas de usuário, ou modelo
+
+    Returns:
+        A entidade de domínio
+    """
+    return Usuario(
+        id=row.id,
+        email=row.email,
+        nome=row.nome,
+        senha_hash=row.senha_hash,
+        ativo=row.ativo,
+        created_at=row.data_criacao,
+        updated_at=row.data_criacao,
+    )
+
+
+def model_to_perfil(model: PerfilModel) -> Perfil:
+    """
+    Converte um modelo de perfil em entidade.
+
+    Args:
+        model: Modelo do perfil
+
+    Returns:
+        A entidade de domínio
+    """
+    return Perfil(
+        id=model.id,
+        nome=model.nome,
+        descricao=model.descricao,
+        created_at=model.data_criacao,
+        updated_at=model.data_criacao,
+    )
 
 
 class UsuarioRepository:
@@ -49,15 +161,14 @@ class UsuarioRepository:
                 nome=usuario.nome,
                 email=usuario.email,
                 senha_hash=usuario.senha_hash,
-                created_at=usuario.created_at,
-                updated_at=usuario.updated_at,
-                deleted_at=usuario.deleted_at,
+                ativo=usuario.ativo,
+                data_criacao=usuario.created_at,
             )
             self._session.add(usuario_model)
-            self._session.commit()
+            confirmar(self._session, usuario)
             return usuario
         except IntegrityError:
-            self._session.rollback()
+            desfazer(self._session)
             raise
 
     def buscar_por_id(self, id: UUID) -> Optional[Usuario]:
@@ -70,18 +181,8 @@ class UsuarioRepository:
         Returns:
             O usuário encontrado ou None se não existir
         """
-        usuario_model = self._session.query(UsuarioModel).filter_by(id=id).first()
-        if not usuario_model:
-            return None
-        return Usuario(
-            id=usuario_model.id,
-            nome=usuario_model.nome,
-            email=usuario_model.email,
-            senha_hash=usuario_model.senha_hash,
-            created_at=usuario_model.created_at,
-            updated_at=usuario_model.updated_at,
-            deleted_at=usuario_model.deleted_at,
-        )
+        row = self._session.execute(BUSCAR_USUARIO_POR_ID, {"id": id}).first()
+        return row_to_usuario(row) if row else None
 
     def buscar_por_email(self, email: str) -> Optional[Usuario]:
         """
@@ -93,18 +194,8 @@ class UsuarioRepository:
         Returns:
             O usuário encontrado ou None se não existir
         """
-        usuario_model = self._session.query(UsuarioModel).filter_by(email=email).first()
-        if not usuario_model:
-            return None
-        return Usuario(
-            id=usuario_model.id,
-            nome=usuario_model.nome,
-            email=usuario_model.email,
-            senha_hash=usuario_model.senha_hash,
-            created_at=usuario_model.created_at,
-            updated_at=usuario_model.updated_at,
-            deleted_at=usuario_model.deleted_at,
-        )
+        row = self._session.execute(BUSCAR_USUARIO_POR_EMAIL, {"email": email}).first()
+        return row_to_usuario(row) if row else None
 
     def listar(
         self,
@@ -143,6 +234,28 @@ class UsuarioRepository:
         # Converte para entidades
         return [self._to_entity(model) for model in query.all()]
 
+    def listar_resumos(
+        self,
+        pagina: int = 1,
+        tamanho: int = 10,
+        email: Optional[str] = None,
+        nome: Optional[str] = None,
+    ) -> List[ResumoUsuario]:
+        """
+        Lista os resumos dos usuários, sem carregar as entidades.
+
+        Args:
+            pagina: Número da página (1-based)
+            tamanho: Tamanho da página
+            email: Filtro por email
+            nome: Filtro por nome
+
+        Returns:
+            Lista de resumos de usuários
+        """
+        linhas = self._session.execute(select_resumos(pagina, tamanho, email, nome))
+        return [ResumoUsuario._make(linha) for linha in linhas]
+
     def atualizar(self, usuario: Usuario) -> Usuario:
         """
         Atualiza um usuário existente.
@@ -158,20 +271,23 @@ class UsuarioRepository:
             ValueError: Se o usuário não for encontrado
         """
         try:
-            usuario_model = self._session.query(UsuarioModel).filter_by(id=usuario.id).first()
+            usuario_model = self._session.get(
+                UsuarioModel,
+                usuario.id,
+                populate_existing=fixar_no_primario(self._session),
+            )
             if not usuario_model:
                 raise ValueError(f"Usuário com ID {usuario.id} não encontrado")
             
             usuario_model.nome = usuario.nome
             usuario_model.email = usuario.email
             usuario_model.senha_hash = usuario.senha_hash
-            usuario_model.updated_at = usuario.updated_at
-            usuario_model.deleted_at = usuario.deleted_at
+            usuario_model.ativo = usuario.ativo
             
-            self._session.commit()
+            confirmar(self._session, usuario)
             return usuario
         except IntegrityError:
-            self._session.rollback()
+            desfazer(self._session)
             raise
 
     def excluir(self, id: UUID) -> None:
@@ -184,7 +300,7 @@ class UsuarioRepository:
         usuario_model = self._session.query(UsuarioModel).filter_by(id=id).first()
         if usuario_model:
             self._session.delete(usuario_model)
-            self._session.commit()
+            confirmar(self._session)
 
     def associar_perfil(self, usuario_id: UUID, perfil_id: UUID) -> None:
         """
@@ -208,9 +324,10 @@ class UsuarioRepository:
                 raise ValueError(f"Perfil com ID {perfil_id} não encontrado")
 
             usuario_model.perfis.append(perfil_model)
-            self._session.commit()
+            confirmar(self._session)
+            invalidar_permissoes_efetivas(self._session, usuario_id)
         except IntegrityError:
-            self._session.rollback()
+            desfazer(self._session)
             raise
 
     def desassociar_perfil(self, usuario_id: UUID, perfil_id: UUID) -> None:
@@ -233,7 +350,8 @@ class UsuarioRepository:
             raise ValueError(f"Perfil com ID {perfil_id} não encontrado")
 
         usuario_model.perfis.remove(perfil_model)
-        self._session.commit()
+        confirmar(self._session)
+        invalidar_permissoes_efetivas(self._session, usuario_id)
 
     def listar_perfis(self, usuario_id: UUID) -> List[Perfil]:
         """
@@ -252,17 +370,7 @@ class UsuarioRepository:
         if not usuario_model:
             raise ValueError(f"Usuário com ID {usuario_id} não encontrado")
 
-        return [
-            Perfil(
-                id=perfil.id,
-                nome=perfil.nome,
-                descricao=perfil.descricao,
-                created_at=perfil.created_at,
-                updated_at=perfil.updated_at,
-                deleted_at=perfil.deleted_at,
-            )
-            for perfil in usuario_model.perfis
-        ]
+        return [model_to_perfil(perfil) for perfil in usuario_model.perfis]
 
     def _to_entity(self, model: UsuarioModel) -> Usuario:
         """
@@ -274,12 +382,4 @@ class UsuarioRepository:
         Returns:
             A entidade de domínio
         """
-        return Usuario(
-            id=model.id,
-            nome=model.nome,
-            email=model.email,
-            senha_hash=model.senha_hash,
-            created_at=model.created_at,
-            updated_at=model.updated_at,
-            deleted_at=model.deleted_at,
-        )
+        return row_to_usuario(model)
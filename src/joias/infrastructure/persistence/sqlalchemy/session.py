@@ -5,7 +5,9 @@ from typing import Generator
 
 from sqlalchemy.orm import Session
 
+from ...eventos import get_publicador
 from .base import SessionLocal
+from .unit_of_work import SQLAlchemyUnitOfWork
 
 
 def get_db_session() -> Generator[Session, None, None]:
@@ -20,3 +22,20 @@ def get_db_session() -> Generator[Session, None, None]:
         yield session
     finally:
         session.close()
+
+
+def get_unit_of_work() -> Generator[SQLAlchemyUnitOfWork, None, None]:
+    """
+    Retorna uma unidade de trabalho que dura a requisição inteira.
+
+    Os repositórios criados com `uow.session` não fazem commit; a
+    transação é confirmada uma única vez ao fim da requisição, ou
+    desfeita se ocorrer uma exceção. Os eventos dos agregados gravados
+    são entregues ao publicador da aplicação após o commit.
+
+    Yields:
+        Unidade de trabalho do SQLAlchemy
+    """
+    with SQLAlchemyUnitOfWork(SessionLocal, get_publicador()) as uow:
+        yield uow
+        uow.commit()
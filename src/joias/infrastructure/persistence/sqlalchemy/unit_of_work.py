@@ -0,0 +1,310 @@
+"""
+Unidade de trabalho do SQLAlchemy.
+
+Este módulo define a unidade de trabalho compartilhada pelos repositórios
+SQLAlchemy: dentro dela, os repositórios não fazem commit, e todas as
+escritas de uma requisição são confirmadas em uma única transação.
+"""
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ....domain.shared.events.domain_event import DomainEvent
+from ....domain.shared.events.publicador import PublicadorEventos
+
+# Chave usada em Session.info para marcar a sessão de uma unidade de trabalho
+CHAVE_UNIDADE_DE_TRABALHO = "unidade_de_trabalho"
+
+
+# Chave usada em Session.info para as invalidações pendentes da transação
+CHAVE_INVALIDACOES = "invalidacoes_pendentes"
+
+
+def confirmar(session: Session, *agregados) -> None:
+    """
+    Confirma as alterações feitas por um repositório.
+
+    Fora de uma unidade de trabalho, faz commit imediatamente. Dentro de
+    uma, apenas envia as alterações ao banco (flush): o commit acontece uma
+    única vez, no fim da unidade, mas erros de integridade surgem na
+    chamada do repositório que os causou. Os agregados gravados são
+    registrados na unidade, que publica os eventos deles após o commit.
+
+    Args:
+        session: Sessão usada pelo repositório
+        agregados: Agregados gravados pelo repositório
+    """
+    uow = session.info.get(CHAVE_UNIDADE_DE_TRABALHO)
+    if uow is not None:
+        for agregado in agregados:
+            uow.registrar(agregado)
+        session.flush()
+    else:
+        session.commit()
+
+
+async def confirmar_async(session: AsyncSession, *agregados) -> None:
+    """
+    Versão assíncrona de `confirmar`, usada pelos repositórios assíncronos.
+
+    Args:
+        session: Sessão assíncrona usada pelo repositório
+        agregados: Agregados gravados pelo repositório
+    """
+    uow = session.info.get(CHAVE_UNIDADE_DE_TRABALHO)
+    if uow is not None:
+        for agregado in agregados:
+            uow.registrar(agregado)
+        await session.flush()
+    else:
+        await session.commit()
+
+
+def desfazer(session: Session) -> None:
+    """
+    Desfaz uma escrita de repositório que falhou.
+
+    Fora de uma unidade de trabalho, faz rollback da sessão. Dentro de uma,
+    não faz nada: a sessão é compartilhada com outros repositórios, e a
+    unidade desfaz a transação inteira quando o erro chega ao fim do bloco.
+
+    Args:
+        session: Sessão usada pelo repositório
+    """
+    if CHAVE_UNIDADE_DE_TRABALHO not in session.info:
+        session.rollback()
+
+
+async def desfazer_async(session: AsyncSession) -> None:
+    """
+    Versão assíncrona de `desfazer`, usada pelos repositórios assíncronos.
+
+    Args:
+        session: Sessão assíncrona usada pelo repositório
+    """
+    if CHAVE_UNIDADE_DE_TRABALHO not in session.info:
+        await session.rollback()
+
+
+def _executar_invalidacoes(session: Session) -> None:
+    """Executa as invalidações pendentes ao fim da transação da sessão."""
+    for invalidar in session.info.pop(CHAVE_INVALIDACOES, []):
+        invalidar()
+
+
+def invalidar_cache(session: Session, invalidar: Callable[[], None]) -> None:
+    """
+    Invalida um cache em memória após uma escrita de repositório.
+
+    O cache é invalidado imediatamente. Dentro de uma unidade de trabalho,
+    é invalidado também ao fim da transação: leituras feitas antes do
+    commit podem tê-lo preenchido com dados ainda não confirmados. As
+    invalidações pendentes ficam em `session.info`, e um único listener
+    por sessão as executa no commit ou no rollback.
+
+    Args:
+        session: Sessão síncrona usada pelo repositório
+        invalidar: Função que invalida o cache
+    """
+    invalidar()
+    if CHAVE_UNIDADE_DE_TRABALHO not in session.info:
+        return
+
+    pendentes = session.info.setdefault(CHAVE_INVALIDACOES, [])
+    if invalidar not in pendentes:
+        pendentes.append(invalidar)
+    if not event.contains(session, "after_commit", _executar_invalidacoes):
+        event.listen(session, "after_commit", _executar_invalidacoes)
+        event.listen(session, "after_rollback", _executar_invalidacoes)
+
+
+class SQLAlchemyUnitOfWork:
+    """
+    Unidade de trabalho sobre uma sessão do SQLAlchemy.
+
+    Os repositórios devem ser criados com a sessão da unidade. Ao sair do
+    bloco `with` sem commit, as alterações são desfeitas. Os eventos de
+    domínio dos agregados gravados pelos repositórios (ou coletados com
+    `coletar`) são publicados somente após o commit.
+
+    Exemplo:
+        with SQLAlchemyUnitOfWork(SessionLocal) as uow:
+            usuarios = UsuarioRepository(uow.session)
+            tokens = TokenRepository(uow.session)
+            ...
+            uow.commit()
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        publicador: Optional[PublicadorEventos] = None,
+    ):
+        """
+        Inicializa a unidade de trabalho.
+
+        Args:
+            session_factory: Fábrica de sessões (ex.: SessionLocal)
+            publicador: Publicador dos eventos coletados (opcional)
+        """
+        self._session_factory = session_factory
+        self._publicador = publicador
+        self._eventos: List[DomainEvent] = []
+        self._agregados: Dict[int, object] = {}
+        self.session: Optional[Session] = None
+        self.commits = 0
+
+    def __enter__(self) -> "SQLAlchemyUnitOfWork":
+        self.session = self._session_factory()
+        self.session.info[CHAVE_UNIDADE_DE_TRABALHO] = self
+        # Sem commits intermediários, o autoflush garante que consultas
+        # feitas na mesma unidade enxerguem as escritas anteriores
+        self.session.autoflush = True
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            self.rollback()
+        finally:
+            self.session.info.pop(CHAVE_UNIDADE_DE_TRABALHO, None)
+            self.session.close()
+            self.session = None
+
+    def registrar(self, agregado) -> None:
+        """
+        Registra um agregado gravado na unidade.
+
+        Os eventos do agregado são coletados no commit, incluindo os
+        adicionados depois da gravação.
+
+        Args:
+            agregado: Objeto com `eventos` e `limpar_eventos()`
+        """
+        self._agregados[id(agregado)] = agregado
+
+    def coletar(self, agregado) -> None:
+        """
+        Coleta os eventos pendentes de um agregado para publicação pós-commit.
+
+        Args:
+            agregado: Objeto com `eventos` e `limpar_eventos()`
+        """
+        self._eventos.extend(agregado.eventos)
+        agregado.limpar_eventos()
+
+    def _eventos_pendentes(self) -> List[DomainEvent]:
+        """Coleta os eventos dos agregados registrados e esvazia a unidade."""
+        for agregado in self._agregados.values():
+            self.coletar(agregado)
+        self._agregados.clear()
+        eventos, self._eventos = self._eventos, []
+        return eventos
+
+    def commit(self) -> None:
+        """Confirma a transação e publica os eventos coletados."""
+        self.session.commit()
+        self.commits += 1
+
+        eventos = self._eventos_pendentes()
+        if self._publicador is not None:
+            self._publicador.publicar(eventos)
+
+    def rollback(self) -> None:
+        """Desfaz as alterações pendentes e descarta os eventos coletados."""
+        self.session.rollback()
+        self._eventos.clear()
+        self._agregados.clear()
+
+
+class AsyncSQLAlchemyUnitOfWork:
+    """
+    Unidade de trabalho sobre uma sessão assíncrona do SQLAlchemy.
+
+    Equivalente ao SQLAlchemyUnitOfWork para os repositórios assíncronos.
+
+    Exemplo:
+        async with AsyncSQLAlchemyUnitOfWork(AsyncSessionLocal) as uow:
+            usuarios = AsyncUsuarioRepository(uow.session)
+            ...
+            await uow.commit()
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        publicador: Optional[PublicadorEventos] = None,
+    ):
+        """
+        Inicializa a unidade de trabalho.
+
+        Args:
+            session_factory: Fábrica de sessões (ex.: AsyncSessionLocal)
+            publicador: Publicador dos eventos coletados (opcional)
+        """
+        self._session_factory = session_factory
+        self._publicador = publicador
+        self._eventos: List[DomainEvent] = []
+        self._agregados: Dict[int, object] = {}
+        self.session: Optional[AsyncSession] = None
+        self.commits = 0
+
+    async def __aenter__(self) -> "AsyncSQLAlchemyUnitOfWork":
+        self.session = self._session_factory()
+        self.session.info[CHAVE_UNIDADE_DE_TRABALHO] = self
+        self.session.sync_session.autoflush = True
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        try:
+            await self.rollback()
+        finally:
+            self.session.info.pop(CHAVE_UNIDADE_DE_TRABALHO, None)
+            await self.session.close()
+            self.session = None
+
+    def registrar(self, agregado) -> None:
+        """
+        Registra um agregado gravado na unidade.
+
+        Os eventos do agregado são coletados no commit, incluindo os
+        adicionados depois da gravação.
+
+        Args:
+            agregado: Objeto com `eventos` e `limpar_eventos()`
+        """
+        self._agregados[id(agregado)] = agregado
+
+    def coletar(self, agregado) -> None:
+        """
+        Coleta os eventos pendentes de um agregado para publicação pós-commit.
+
+        Args:
+            agregado: Objeto com `eventos` e `limpar_eventos()`
+        """
+        self._eventos.extend(agregado.eventos)
+        agregado.limpar_eventos()
+
+    def _eventos_pendentes(self) -> List[DomainEvent]:
+        """Coleta os eventos dos agregados registrados e esvazia a unidade."""
+        for agregado in self._agregados.values():
+            self.coletar(agregado)
+        self._agregados.clear()
+        eventos, self._eventos = self._eventos, []
+        return eventos
+
+    async def commit(self) -> None:
+        """Confirma a transação e publica os eventos coletados."""
+        await self.session.commit()
+        self.commits += 1
+
+        eventos = self._eventos_pendentes()
+        if self._publicador is not None:
+            self._publicador.publicar(eventos)
+
+    async def rollback(self) -> None:
+        """Desfaz as alterações pendentes e descarta os eventos coletados."""
+        await self.session.rollback()
+        self._eventos.clear()
+        self._agregados.clear()
@@ -0,0 +1,110 @@
+"""
+Cache base para repositórios.
+
+Este módulo contém um cache em memória com expiração por tempo (TTL)
+e descarte do item menos usado recentemente (LRU), usado pelos
+decoradores de repositório com cache.
+"""
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+
+class CacheLRU:
+    """
+    Cache em memória com TTL e descarte LRU.
+
+    Valores None também são armazenados, permitindo cache negativo
+    (buscas que não encontraram nada). Se `ao_descartar` for definido,
+    ele é chamado com a chave e o valor de cada entrada descartada pelo
+    LRU ou pelo TTL, fora do lock do cache.
+    """
+
+    def __init__(
+        self,
+        tamanho_maximo: int = 1024,
+        ttl: float = 300.0,
+        relogio: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Inicializa o cache.
+
+        Args:
+            tamanho_maximo: Número máximo de entradas mantidas
+            ttl: Tempo de vida de cada entrada, em segundos
+            relogio: Função que retorna o instante atual em segundos
+        """
+        self._tamanho_maximo = tamanho_maximo
+        self._ttl = ttl
+        self._relogio = relogio
+        self._entradas: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = Lock()
+        self.acertos = 0
+        self.falhas = 0
+        self.ao_descartar: Optional[Callable[[Hashable, Any], None]] = None
+
+    def obter(self, chave: Hashable) -> Tuple[bool, Any]:
+        """
+        Busca uma entrada no cache.
+
+        Args:
+            chave: Chave da entrada
+
+        Returns:
+            Tupla (encontrado, valor); valor é None quando não encontrado
+        """
+        with self._lock:
+            entrada = self._entradas.get(chave)
+            if entrada is not None:
+                expira_em, valor = entrada
+                if expira_em > self._relogio():
+                    self._entradas.move_to_end(chave)
+                    self.acertos += 1
+                    return True, valor
+                del self._entradas[chave]
+            self.falhas += 1
+        if entrada is not None:
+            self._descartados([(chave, valor)])
+        return False, None
+
+    def definir(self, chave: Hashable, valor: Any) -> None:
+        """
+        Armazena uma entrada no cache.
+
+        Args:
+            chave: Chave da entrada
+            valor: Valor a ser armazenado (pode ser None)
+        """
+        descartados = []
+        with self._lock:
+            self._entradas[chave] = (self._relogio() + self._ttl, valor)
+            self._entradas.move_to_end(chave)
+            while len(self._entradas) > self._tamanho_maximo:
+                chave_antiga, (_, valor_antigo) = self._entradas.popitem(last=False)
+                descartados.append((chave_antiga, valor_antigo))
+        self._descartados(descartados)
+
+    def invalidar(self, chave: Hashable) -> None:
+        """
+        Remove uma entrada do cache, se existir.
+
+        Args:
+            chave: Chave da entrada
+        """
+        with self._lock:
+            self._entradas.pop(chave, None)
+
+    def limpar(self) -> None:
+        """Remove todas as entradas do cache."""
+        with self._lock:
+            self._entradas.clear()
+
+    def _descartados(self, entradas: List[Tuple[Hashable, Any]]) -> None:
+        """Avisa `ao_descartar` das entradas descartadas pelo LRU ou pelo TTL."""
+        if self.ao_descartar is not None:
+            for chave, valor in entradas:
+                self.ao_descartar(chave, valor)
+
+    def __len__(self) -> int:
+        return len(self._entradas)
@@ -0,0 +1,465 @@
+"""
+Repositórios de produtos com cache.
+
+Este módulo contém decoradores que implementam as interfaces de
+repositório de produtos adicionando um cache de leitura (read-through)
+na frente de qualquer implementação: em memória ou SQLAlchemy.
+"""
+from decimal import Decimal
+from threading import RLock
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from ....domain.catalogo.entities.produto import Produto as ProdutoCatalogo
+from ....domain.catalogo.repositories.produto_repository import (
+    ProdutoRepository as CatalogoProdutoRepository,
+    ResumoProduto,
+)
+from ....domain.entities.produto import Produto
+from ....domain.repositories.produto import ProdutoRepository
+from .base import CacheLRU
+
+
+def _id_e_codigo(produto: Produto) -> Tuple[Any, str]:
+    """Retorna o ID e o código com que um produto é armazenado no cache."""
+    return produto.id, produto.codigo
+
+
+class _ProdutoCache:
+    """
+    Lógica comum de cache por ID e por código de produto.
+
+    Mantém o código associado a cada ID em cache para conseguir invalidar
+    a entrada por código mesmo quando o código do produto muda, e o ID
+    associado a cada código para produtos recebidos sem ID. As associações
+    são descartadas junto com as entradas do produto, então acompanham o
+    tamanho do cache.
+
+    Invalidações incrementam uma geração: uma leitura iniciada antes de
+    uma invalidação não armazena o que carregou, para não guardar um
+    produto que a escrita já alterou.
+    """
+
+    def __init__(self, cache: Optional[CacheLRU]):
+        self.cache = cache if cache is not None else CacheLRU()
+        self.cache.ao_descartar = self._descartado
+        self._codigos_por_id: Dict[Any, str] = {}
+        self._ids_por_codigo: Dict[str, Any] = {}
+        self._lock = RLock()
+        self.geracao = 0
+
+    @property
+    def acertos(self) -> int:
+        """Número de buscas atendidas pelo cache."""
+        return self.cache.acertos
+
+    @property
+    def falhas(self) -> int:
+        """Número de buscas que precisaram ir ao repositório."""
+        return self.cache.falhas
+
+    def _buscar(
+        self,
+        chave: Hashable,
+        carregar: Callable[[], Any],
+        identificar: Callable[[Any], Tuple[Any, str]],
+    ) -> Any:
+        encontrado, valor = self.cache.obter(chave)
+        if encontrado:
+            return valor
+        geracao = self.geracao
+        valor = carregar()
+        with self._lock:
+            if geracao == self.geracao:
+                self.cache.definir(chave, valor)
+                if valor is not None:
+                    self._armazenar(*identificar(valor), valor)
+        return valor
+
+    def _armazenar(self, produto_id: Any, codigo: str, produto: Any) -> None:
+        if produto_id is None:
+            return
+        self.cache.definir(("id", produto_id), produto)
+        self.cache.definir(("codigo", codigo), produto)
+        self._codigos_por_id[produto_id] = codigo
+        self._ids_por_codigo[codigo] = produto_id
+
+    def _remover(self, produto_id: Any, codigo: Optional[str]) -> None:
+        self.cache.invalidar(("id", produto_id))
+        codigo_anterior = self._codigos_por_id.pop(produto_id, None)
+        for c in {codigo, codigo_anterior} - {None}:
+            self.cache.invalidar(("codigo", c))
+            self._ids_por_codigo.pop(c, None)
+
+    def _descartado(self, chave: Hashable, valor: Any) -> None:
+        """Remove o par de uma entrada descartada pelo LRU ou pelo TTL."""
+        tipo, valor_chave = chave
+        with self._lock:
+            if tipo == "id":
+                self._remover(valor_chave, None)
+            else:
+                self._remover(self._ids_por_codigo.get(valor_chave), valor_chave)
+
+    def _invalidar(self, produto_id: Any, codigo: Optional[str] = None) -> None:
+        with self._lock:
+            self.geracao += 1
+            self._remover(produto_id, codigo)
+
+    def _limpar(self) -> None:
+        with self._lock:
+            self.geracao += 1
+            self.cache.limpar()
+            self._codigos_por_id.clear()
+            self._ids_por_codigo.clear()
+
+    def _escrever(
+        self, produto_id: Any, codigo: Optional[str], escrita: Callable[[], Any]
+    ) -> Any:
+        """
+        Executa uma escrita no repositório invalidando o produto antes e depois.
+
+        A invalidação posterior descarta o valor antigo que uma leitura
+        concorrente tenha recarregado enquanto a escrita não terminava.
+
+        Args:
+            produto_id: ID do produto escrito
+            codigo: Código do produto escrito
+            escrita: Função que executa a escrita
+
+        Returns:
+            O retorno da escrita
+        """
+        self._invalidar(produto_id, codigo)
+        try:
+            return escrita()
+        finally:
+            self._invalidar(produto_id, codigo)
+
+
+class CachedProdutoRepository(_ProdutoCache, ProdutoRepository):
+    """
+    Decorador com cache para o repositório de produtos.
+
+    As buscas por ID e por código são atendidas pelo cache, inclusive
+    buscas sem resultado (cache negativo). Escritas feitas através do
+    decorador invalidam as entradas do produto afetado.
+    """
+
+    def __init__(
+        self, repository: ProdutoRepository, cache: Optional[CacheLRU] = None
+    ):
+        """
+        Inicializa o decorador.
+
+        Args:
+            repository: Repositório decorado
+            cache: Cache a ser usado (um novo é criado se None)
+        """
+        super().__init__(cache)
+        self._repository = repository
+
+    def __getattr__(self, nome: str) -> Any:
+        # Métodos fora da interface (ex.: listar_todos) vão direto ao repositório
+        if nome == "_repository":
+            raise AttributeError(nome)
+        return getattr(self._repository, nome)
+
+    def buscar_por_id(self, id: int) -> Optional[Produto]:
+        """
+        Busca um produto pelo ID, consultando o cache primeiro.
+
+        Args:
+            id: ID do produto
+
+        Returns:
+            O produto encontrado ou None se não existir
+        """
+
+        return self._buscar(
+            ("id", id), lambda: self._repository.buscar_por_id(id), _id_e_codigo
+        )
+
+    def buscar_por_codigo(self, codigo: str) -> Optional[Produto]:
+        """
+        Busca um produto pelo código, consultando o cache primeiro.
+
+        Args:
+            codigo: Código do produto
+
+        Returns:
+            O produto encontrado ou None se não existir
+        """
+
+        return self._buscar(
+            ("codigo", codigo),
+            lambda: self._repository.buscar_por_codigo(codigo),
+            _id_e_codigo,
+        )
+
+    def buscar_por_ids(self, ids: List[int]) -> List[Produto]:
+        """
+        Busca vários produtos pelos IDs, indo ao repositório só pelos ausentes.
+
+        Args:
+            ids: IDs dos produtos
+
+        Returns:
+            Lista dos produtos encontrados (IDs inexistentes são ignorados)
+        """
+        encontrados: Dict[int, Optional[Produto]] = {}
+        pendentes = []
+        for produto_id in dict.fromkeys(ids):
+            encontrado, produto = self.cache.obter(("id", produto_id))
+            if encontrado:
+                encontrados[produto_id] = produto
+            else:
+                pendentes.append(produto_id)
+
+        if pendentes:
+            geracao = self.geracao
+            carregados = {p.id: p for p in self._repository.buscar_por_ids(pendentes)}
+            with self._lock:
+                armazenar = geracao == self.geracao
+                for produto_id in pendentes:
+                    produto = carregados.get(produto_id)
+                    if armazenar and produto is not None:
+                        self._armazenar(produto.id, produto.codigo, produto)
+                    elif armazenar:
+                        self.cache.definir(("id", produto_id), None)
+                    encontrados[produto_id] = produto
+
+        return [p for p in encontrados.values() if p is not None]
+
+    def criar(self, item: Produto) -> Produto:
+        """
+        Cria um produto e descarta buscas negativas em cache para ele.
+
+        Args:
+            item: Produto a ser criado
+
+        Returns:
+            Produto criado
+        """
+        produto = self._repository.criar(item)
+        self._invalidar(produto.id, produto.codigo)
+        return produto
+
+    def atualizar(self, item: Produto) -> Produto:
+        """
+        Atualiza um produto e invalida suas entradas no cache.
+
+        Args:
+            item: Produto a ser atualizado
+
+        Returns:
+            Produto atualizado
+        """
+        return self._escrever(
+            item.id, item.codigo, lambda: self._repository.atualizar(item)
+        )
+
+    def deletar(self, item: Produto) -> None:
+        """
+        Remove um produto e invalida suas entradas no cache.
+
+        Args:
+            item: Produto a ser removido
+        """
+        self._escrever(item.id, item.codigo, lambda: self._repository.deletar(item))
+
+    def buscar_por_nome(self, nome: str) -> List[Produto]:
+        return self._repository.buscar_por_nome(nome)
+
+    def buscar_por_variacao(self, variacao_id: int) -> Optional[Produto]:
+        return self._repository.buscar_por_variacao(variacao_id)
+
+    def buscar_por_detalhe(self, tipo: str, valor: str) -> List[Produto]:
+        return self._repository.buscar_por_detalhe(tipo, valor)
+
+    def save(self, entity: Produto) -> Produto:
+        return self._escrever(
+            entity.id, entity.codigo, lambda: self._repository.save(entity)
+        )
+
+    def get_by_id(self, entity_id: int) -> Optional[Produto]:
+        return self.buscar_por_id(entity_id)
+
+    def list(self, active_only: bool = True) -> List[Produto]:
+        return self._repository.list(active_only)
+
+    def delete(self, entity_id: int) -> bool:
+        return self._escrever(
+            entity_id, None, lambda: self._repository.delete(entity_id)
+        )
+
+    def update(self, entity: Produto) -> Optional[Produto]:
+        return self._escrever(
+            entity.id, entity.codigo, lambda: self._repository.update(entity)
+        )
+
+
+class CachedCatalogoProdutoRepository(_ProdutoCache, CatalogoProdutoRepository):
+    """
+    Decorador com cache para o repositório de produtos do catálogo.
+
+    Equivalente ao CachedProdutoRepository para a interface do catálogo,
+    implementada por SQLAlchemyProdutoRepository, usando o SKU como código.
+    """
+
+    def __init__(
+        self, repository: CatalogoProdutoRepository, cache: Optional[CacheLRU] = None
+    ):
+        """
+        Inicializa o decorador.
+
+        Args:
+            repository: Repositório decorado
+            cache: Cache a ser usado (um novo é criado se None)
+        """
+        super().__init__(cache)
+        self._repository = repository
+
+    def __getattr__(self, nome: str) -> Any:
+        if nome == "_repository":
+            raise AttributeError(nome)
+        return getattr(self._repository, nome)
+
+    def buscar_por_id(self, produto_id: int) -> Optional[ProdutoCatalogo]:
+        """
+        Busca um produto pelo ID, consultando o cache primeiro.
+
+        Args:
+            produto_id: ID do produto
+
+        Returns:
+            Optional[Produto]: O produto encontrado ou None
+        """
+
+        return self._buscar(
+            ("id", produto_id),
+            lambda: self._repository.buscar_por_id(produto_id),
+            lambda produto: (produto_id, produto.sku),
+        )
+
+    def buscar_por_sku(self, sku: str) -> Optional[ProdutoCatalogo]:
+        """
+        Busca um produto pelo SKU, consultando o cache primeiro.
+
+        Args:
+            sku: SKU do produto
+
+        Returns:
+            Optional[Produto]: O produto encontrado ou None
+        """
+
+        return self._buscar(
+            ("codigo", sku),
+            lambda: self._repository.buscar_por_sku(sku),
+            lambda produto: (getattr(produto, "id", None), sku),
+        )
+
+    def salvar(self, produto: ProdutoCatalogo) -> ProdutoCatalogo:
+        """
+        Salva um produto e descarta buscas negativas em cache para o SKU.
+
+        Args:
+            produto: O produto a ser salvo
+
+        Returns:
+            Produto: O produto salvo
+        """
+        self._invalidar(getattr(produto, "id", None), produto.sku)
+        salvo = self._repository.salvar(produto)
+        self._invalidar(getattr(salvo, "id", None), salvo.sku)
+        return salvo
+
+    def salvar_em_lote(
+        self, produtos: List[ProdutoCatalogo], tamanho_lote: int = 1000
+    ) -> int:
+        """
+        Salva produtos em lote e descarta todo o cache.
+
+        Args:
+            produtos: Produtos a serem salvos
+            tamanho_lote: Quantidade de produtos por transação
+
+        Returns:
+            int: Quantidade de produtos processados
+        """
+        total = self._repository.salvar_em_lote(produtos, tamanho_lote)
+        self._limpar()
+        return total
+
+    def atualizar(self, produto: ProdutoCatalogo) -> Optional[ProdutoCatalogo]:
+        """
+        Atualiza um produto e invalida suas entradas no cache.
+
+        A entidade do catálogo não declara ID: sem ele, o ID é o associado
+        ao SKU em cache ou, depois da escrita, o do produto retornado.
+
+        Args:
+            produto: O produto com dados atualizados
+
+        Returns:
+            Optional[Produto]: O produto atualizado ou None se não encontrado
+        """
+        produto_id = getattr(produto, "id", None)
+        if produto_id is None:
+            produto_id = self._ids_por_codigo.get(produto.sku)
+        atualizado = self._escrever(
+            produto_id, produto.sku, lambda: self._repository.atualizar(produto)
+        )
+        id_retornado = getattr(atualizado, "id", None)
+        if id_retornado is not None and id_retornado != produto_id:
+            self._invalidar(id_retornado, produto.sku)
+        return atualizado
+
+    def excluir(self, produto_id: int) -> bool:
+        """
+        Remove um produto e invalida suas entradas no cache.
+
+        Args:
+            produto_id: ID do produto
+
+        Returns:
+            bool: True se removido com sucesso, False caso contrário
+        """
+        sku = None
+        if produto_id not in self._codigos_por_id:
+            # O SKU só é conhecido se o produto passou pelo cache por ID
+            existente = self._repository.buscar_por_id(produto_id)
+            sku = existente.sku if existente is not None else None
+        return self._escrever(
+            produto_id, sku, lambda: self._repository.excluir(produto_id)
+        )
+
+    def listar(self, apenas_ativos: bool = True) -> List[ProdutoCatalogo]:
+        return self._repository.listar(apenas_ativos)
+
+    def listar_pagina(
+        self,
+        apos_id: Optional[int] = None,
+        limite: int = 50,
+        apenas_ativos: bool = True,
+    ) -> Tuple[List[ProdutoCatalogo], Optional[int]]:
+        return self._repository.listar_pagina(apos_id, limite, apenas_ativos)
+
+    def listar_resumos(self, apenas_ativos: bool = True) -> List[ResumoProduto]:
+        return self._repository.listar_resumos(apenas_ativos)
+
+    def listar_pagina_resumos(
+        self,
+        apos_id: Optional[int] = None,
+        limite: int = 50,
+        apenas_ativos: bool = True,
+    ) -> Tuple[List[ResumoProduto], Optional[int]]:
+        return self._repository.listar_pagina_resumos(apos_id, limite, apenas_ativos)
+
+    def iterar(
+        self, apenas_ativos: bool = True, lote: int = 1000
+    ) -> Iterator[ProdutoCatalogo]:
+        return self._repository.iterar(apenas_ativos, lote)
+
+    def buscar_por_faixa_de_preco(
+        self, preco_minimo: Decimal, preco_maximo: Decimal
+    ) -> List[ProdutoCatalogo]:
+        return self._repository.buscar_por_faixa_de_preco(preco_minimo, preco_maximo)
@@ -91,3 +91,71 @@ class MemoryRepository(Repository[T], Generic[T]):
             Lista com todos os itens
         """
         return list(self._items.values())
+
+    def save(self, entity: T) -> T:
+        """
+        Salva uma entidade, criando-a se ainda não estiver no repositório.
+
+        Args:
+            entity: Entidade a ser salva
+
+        Returns:
+            A entidade salva
+        """
+        if entity.id is None or entity.id not in self._items:
+            return self.criar(entity)
+        return self.atualizar(entity)
+
+    def get_by_id(self, entity_id: int) -> Optional[T]:
+        """
+        Busca uma entidade pelo ID.
+
+        Args:
+            entity_id: ID da entidade
+
+        Returns:
+            A entidade encontrada ou None
+        """
+        return self.buscar_por_id(entity_id)
+
+    def list(self, active_only: bool = True) -> List[T]:
+        """
+        Lista todas as entidades.
+
+        Args:
+            active_only: Se True, retorna apenas entidades ativas
+
+        Returns:
+            Lista de entidades
+        """
+        return [i for i in self._items.values() if i.ativo or not active_only]
+
+    def delete(self, entity_id: int) -> bool:
+        """
+        Remove uma entidade.
+
+        Args:
+            entity_id: ID da entidade
+
+        Returns:
+            True se removida com sucesso, False caso contrário
+        """
+        item = self._items.get(entity_id)
+        if item is None:
+            return False
+        self.deletar(item)
+        return True
+
+    def update(self, entity: T) -> Optional[T]:
+        """
+        Atualiza uma entidade.
+
+        Args:
+            entity: Entidade com dados atualizados
+
+        Returns:
+            A entidade atualizada ou None se não encontrada
+        """
+        if entity.id not in self._items:
+            return None
+        return self.atualizar(entity)
@@ -4,7 +4,7 @@ Repositório de produtos em memória.
 Este módulo contém a implementação dos repositórios de produtos,
 variações e detalhes em memória para testes.
 """
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from ....domain.entities.produto import Detalhe, Produto, Variacao
 from ....domain.repositories.produto import (
@@ -13,6 +13,7 @@ from ....domain.repositories.produto import (
     VariacaoRepository,
 )
 from .base import MemoryRepository
+from .trigramas import IndiceTrigramas
 
 
 class MemoryProdutoRepository(MemoryRepository[Produto], ProdutoRepository):
@@ -22,6 +23,71 @@ class MemoryProdutoRepository(MemoryRepository[Produto], ProdutoRepository):
     Esta implementação é útil para testes e desenvolvimento.
     """
 
+    def __init__(self):
+        super().__init__()
+        self._produto_por_variacao: Dict[int, int] = {}
+        self._indice_nomes = IndiceTrigramas()
+
+    def criar(self, item: Produto) -> Produto:
+        """
+        Cria um novo produto no repositório.
+
+        Args:
+            item: Produto a ser criado
+
+        Returns:
+            Produto criado com ID atribuído
+        """
+        produto = super().criar(item)
+        self._indexar_variacoes(produto)
+        self._indice_nomes.indexar(produto.id, produto.nome)
+        return produto
+
+    def atualizar(self, item: Produto) -> Produto:
+        """
+        Atualiza um produto existente no repositório.
+
+        Args:
+            item: Produto a ser atualizado
+
+        Returns:
+            Produto atualizado
+
+        Raises:
+            ValueError: Se o produto não existir
+        """
+        produto = super().atualizar(item)
+        self._indexar_variacoes(produto)
+        self._indice_nomes.indexar(produto.id, produto.nome)
+        return produto
+
+    def deletar(self, item: Produto) -> None:
+        """
+        Remove um produto do repositório.
+
+        Args:
+            item: Produto a ser removido
+
+        Raises:
+            ValueError: Se o produto não existir
+        """
+        super().deletar(item)
+        self._indice_nomes.remover(item.id)
+        for variacao in item.variacoes:
+            if self._produto_por_variacao.get(variacao.id) == item.id:
+                del self._produto_por_variacao[variacao.id]
+
+    def _indexar_variacoes(self, produto: Produto) -> None:
+        """
+        Registra as variações do produto no índice por ID de variação.
+
+        Args:
+            produto: Produto cujas variações serão indexadas
+        """
+        for variacao in produto.variacoes:
+            if variacao.id is not None:
+                self._produto_por_variacao[variacao.id] = produto.id
+
     def buscar_por_codigo(self, codigo: str) -> Optional[Produto]:
         """
         Busca um produto pelo código.
@@ -34,18 +100,30 @@ class MemoryProdutoRepository(MemoryRepository[Produto], ProdutoRepository):
         """
         return next((p for p in self._items.values() if p.codigo == codigo), None)
 
+    def buscar_por_ids(self, ids: List[int]) -> List[Produto]:
+        """
+        Busca vários produtos pelos IDs em uma única chamada.
+
+        Args:
+            ids: IDs dos produtos
+
+        Returns:
+            Lista dos produtos encontrados (IDs inexistentes são ignorados)
+        """
+        return [self._items[i] for i in dict.fromkeys(ids) if i in self._items]
+
     def buscar_por_nome(self, nome: str) -> List[Produto]:
         """
-        Busca produtos pelo nome.
+        Busca produtos pelo nome, ignorando acentos e caixa.
 
         Args:
             nome: Nome ou parte do nome do produto
 
         Returns:
-            Lista de produtos encontrados
+            Lista de produtos encontrados, em ordem crescente de ID (a
+            mesma ordem de criação, independente do caminho da busca)
         """
-        nome = nome.lower()
-        return [p for p in self._items.values() if nome in p.nome.lower()]
+        return [self._items[i] for i in self._indice_nomes.buscar(nome)]
 
     def buscar_por_variacao(self, variacao_id: int) -> Optional[Produto]:
         """
@@ -57,15 +135,17 @@ class MemoryProdutoRepository(MemoryRepository[Produto], ProdutoRepository):
         Returns:
             O produto encontrado ou None se não existir
         """
-        return next(
-            (
-                p
-                for p in self._items.values()
-                for v in p.variacoes
-                if v.id == variacao_id
-            ),
-            None,
-        )
+        produto_id = self._produto_por_variacao.get(variacao_id)
+        if produto_id is None:
+            return None
+
+        # Entradas antigas ficam no índice quando a variação é removida do
+        # produto, então confirmamos no índice do próprio produto
+        produto = self._items.get(produto_id)
+        if produto is None or produto.buscar_variacao(variacao_id) is None:
+            del self._produto_por_variacao[variacao_id]
+            return None
+        return produto
 
     def buscar_por_detalhe(self, tipo: str, valor: str) -> List[Produto]:
         """
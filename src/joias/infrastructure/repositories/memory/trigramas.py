@@ -0,0 +1,110 @@
+"""
+Índice de trigramas em memória.
+
+Este módulo contém um índice invertido de trigramas usado pelos
+repositórios em memória para buscas por substring sem varrer
+todos os itens a cada consulta.
+"""
+import unicodedata
+from typing import Dict, Iterable, List, Set
+
+
+def normalizar(texto: str) -> str:
+    """
+    Normaliza um texto para busca, removendo acentos e caixa.
+
+    Args:
+        texto: Texto a ser normalizado
+
+    Returns:
+        Texto sem acentos e em caixa baixa
+    """
+    decomposto = unicodedata.normalize("NFKD", texto)
+    return "".join(c for c in decomposto if not unicodedata.combining(c)).casefold()
+
+
+def trigramas(texto: str) -> Set[str]:
+    """
+    Extrai os trigramas de um texto já normalizado.
+
+    Args:
+        texto: Texto normalizado
+
+    Returns:
+        Conjunto de trigramas do texto
+    """
+    return {texto[i : i + 3] for i in range(len(texto) - 2)}
+
+
+class IndiceTrigramas:
+    """
+    Índice invertido de trigramas sobre textos identificados por ID.
+
+    Cada texto é normalizado uma única vez na indexação. As consultas
+    intersectam as listas de ocorrência dos trigramas do termo e depois
+    confirmam a substring apenas nos candidatos restantes.
+    """
+
+    def __init__(self):
+        self._textos: Dict[int, str] = {}
+        self._ocorrencias: Dict[str, Set[int]] = {}
+
+    def indexar(self, item_id: int, texto: str) -> None:
+        """
+        Indexa (ou reindexa) o texto de um item.
+
+        Args:
+            item_id: ID do item
+            texto: Texto original do item
+        """
+        normalizado = normalizar(texto)
+        if self._textos.get(item_id) == normalizado:
+            return
+        self.remover(item_id)
+        self._textos[item_id] = normalizado
+        for trigrama in trigramas(normalizado):
+            self._ocorrencias.setdefault(trigrama, set()).add(item_id)
+
+    def remover(self, item_id: int) -> None:
+        """
+        Remove um item do índice.
+
+        Args:
+            item_id: ID do item
+        """
+        normalizado = self._textos.pop(item_id, None)
+        if normalizado is None:
+            return
+        for trigrama in trigramas(normalizado):
+            ids = self._ocorrencias.get(trigrama)
+            if ids is not None:
+                ids.discard(item_id)
+                if not ids:
+                    del self._ocorrencias[trigrama]
+
+    def buscar(self, termo: str) -> List[int]:
+        """
+        Busca os itens cujo texto contém o termo.
+
+        Args:
+            termo: Termo a ser buscado
+
+        Returns:
+            IDs dos itens encontrados, em ordem crescente
+        """
+        termo = normalizar(termo)
+        chaves = trigramas(termo)
+        if not chaves:
+            # Termos com menos de três caracteres não geram trigramas
+            candidatos: Iterable[int] = self._textos.keys()
+        else:
+            listas = []
+            for chave in chaves:
+                ids = self._ocorrencias.get(chave)
+                if not ids:
+                    return []
+                listas.append(ids)
+            listas.sort(key=len)
+            candidatos = set(listas[0]).intersection(*listas[1:])
+
+        return sorted(i for i in candidatos if termo in self._textos[i])
@@ -1,11 +1,28 @@
 """
 Configuração do FastAPI.
 """
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from ...infrastructure.config.moedas import registrar_moedas
+from ...infrastructure.config.settings import get_settings
+from ...infrastructure.eventos import get_publicador
+from ...infrastructure.persistence.sqlalchemy.async_session import (
+    AsyncSessionLocal,
+    async_engine,
+)
+from ...infrastructure.persistence.sqlalchemy.base import engine
+from ...infrastructure.persistence.sqlalchemy.purga_tokens import (
+    purgar_tokens_periodicamente,
+)
+from .dependencies import get_resumo_pedidos_read_model
 from .routers import api_router
 
+# Moedas configuradas, disponíveis antes do primeiro mapeamento de produto
+registrar_moedas()
+
 app = FastAPI(
     title="Joias API",
     description="API para gerenciamento de joias",
@@ -20,4 +37,40 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-app.include_router(api_router) 
\ No newline at end of file
+app.include_router(api_router)
+
+# Tarefas executadas em segundo plano enquanto a aplicação está no ar
+tarefas = set()
+
+
+@app.on_event("startup")
+async def inscrever_projecoes() -> None:
+    """Inscreve as projeções de leitura no publicador de eventos da aplicação."""
+    get_resumo_pedidos_read_model().inscrever_em(get_publicador())
+
+
+@app.on_event("startup")
+async def iniciar_purga_tokens() -> None:
+    """Inicia a purga periódica dos tokens expirados."""
+    settings = get_settings()
+    if settings.token_purga_intervalo > 0:
+        tarefas.add(
+            asyncio.create_task(
+                purgar_tokens_periodicamente(
+                    AsyncSessionLocal,
+                    settings.token_purga_intervalo,
+                    settings.token_purga_lote,
+                )
+            )
+        )
+
+
+@app.on_event("shutdown")
+async def fechar_pools() -> None:
+    """Encerra as tarefas e fecha as conexões dos pools ao encerrar."""
+    for tarefa in tarefas:
+        tarefa.cancel()
+    await asyncio.gather(*tarefas, return_exceptions=True)
+    tarefas.clear()
+    await async_engine.dispose()
+    engine.dispose() 
\ No newline at end of file
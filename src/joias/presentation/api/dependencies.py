@@ -5,36 +5,114 @@ Este módulo contém as funções de injeção de dependência
 utilizadas pelos endpoints da API.
 """
 import os
+from functools import lru_cache
+from typing import Callable
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from ...application.identity.async_auth_service import AsyncAuthService
+from ...application.identity.async_perfil_service import AsyncPerfilService
+from ...application.identity.async_permissao_service import AsyncPermissaoService
+from ...application.identity.async_usuario_service import AsyncUsuarioService
 from ...application.identity.auth_service import AuthService
+from ...application.identity.autorizacao_service import AutorizacaoService
 from ...application.identity.permissao_service import PermissaoService
 from ...application.identity.usuario_service import UsuarioService
-from ...application.shared.exceptions import AutenticacaoError
-from ...domain.entities.usuario import Usuario
+from ...application.read_models.pedido import ResumoPedidosReadModel
+from ...application.shared.exceptions import AutenticacaoError, AutorizacaoError
+from ...application.use_cases.pedido import (
+    ListarResumoPedidosAtivosUseCase,
+    ListarResumoPedidosClienteUseCase,
+)
+from ...domain.entities.autorizacao import Usuario
 from ...domain.repositories.perfil_repository import IPerfilRepository
 from ...domain.repositories.permissao_repository import IPermissaoRepository
+from ...domain.repositories.permissoes_efetivas_repository import (
+    IPermissoesEfetivasRepository,
+)
 from ...domain.repositories.usuario_repository import IUsuarioRepository
 from ...infrastructure.config.settings import get_settings
+from ...infrastructure.persistence.sqlalchemy.async_session import (
+    get_async_unit_of_work,
+)
+from ...infrastructure.persistence.sqlalchemy.repositories.async_fornecedor_repository import (
+    AsyncSQLAlchemyFornecedorRepository,
+)
+from ...infrastructure.persistence.sqlalchemy.repositories.async_perfil_repository import (
+    AsyncSQLPerfilRepository,
+)
+from ...infrastructure.persistence.sqlalchemy.repositories.async_permissao_repository import (
+    AsyncSQLPermissaoRepository,
+)
+from ...infrastructure.persistence.sqlalchemy.repositories.async_produto_repository import (
+    AsyncSQLAlchemyProdutoRepository,
+)
+from ...infrastructure.persistence.sqlalchemy.repositories.async_token_repository import (
+    AsyncTokenRepository,
+)
+from ...infrastructure.persistence.sqlalchemy.repositories.async_usuario_repository import (
+    AsyncUsuarioRepository,
+)
 from ...infrastructure.persistence.sqlalchemy.repositories.perfil_repository import (
     SQLPerfilRepository,
 )
 from ...infrastructure.persistence.sqlalchemy.repositories.permissao_repository import (
     SQLPermissaoRepository,
 )
+from ...infrastructure.persistence.sqlalchemy.repositories.permissoes_efetivas_repository import (
+    SQLPermissoesEfetivasRepository,
+)
 from ...infrastructure.persistence.sqlalchemy.repositories.usuario_repository import (
     SQLUsuarioRepository,
 )
-from ...infrastructure.persistence.sqlalchemy.session import get_db_session
+from ...infrastructure.persistence.sqlalchemy.session import get_unit_of_work
+from ...infrastructure.persistence.sqlalchemy.unit_of_work import (
+    AsyncSQLAlchemyUnitOfWork,
+    SQLAlchemyUnitOfWork,
+)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
 
+def get_session(
+    uow: SQLAlchemyUnitOfWork = Depends(get_unit_of_work),
+) -> Session:
+    """
+    Retorna a sessão da unidade de trabalho da requisição.
+
+    O FastAPI resolve cada dependência uma vez por requisição, então todos
+    os repositórios da requisição compartilham esta sessão, e as escritas
+    deles são confirmadas em um único commit ao fim da requisição.
+
+    Args:
+        uow: Unidade de trabalho da requisição
+
+    Returns:
+        Sessão do banco de dados
+    """
+    return uow.session
+
+
+def get_async_session(
+    uow: AsyncSQLAlchemyUnitOfWork = Depends(get_async_unit_of_work),
+) -> AsyncSession:
+    """
+    Retorna a sessão da unidade de trabalho assíncrona da requisição.
+
+    Args:
+        uow: Unidade de trabalho assíncrona da requisição
+
+    Returns:
+        Sessão assíncrona do banco de dados
+    """
+    return uow.session
+
+
 def get_permissao_repository(
-    session: Session = Depends(get_db_session),
+    session: Session = Depends(get_session),
 ) -> IPermissaoRepository:
     """
     Retorna uma instância do repositório de permissões.
@@ -63,8 +141,40 @@ def get_permissao_service(
     return PermissaoService(permissao_repository)
 
 
+def get_permissoes_efetivas_repository(
+    session: Session = Depends(get_session),
+) -> IPermissoesEfetivasRepository:
+    """
+    Retorna uma instância do repositório de permissões efetivas.
+
+    Args:
+        session: Sessão do banco de dados
+
+    Returns:
+        Repositório de permissões efetivas
+    """
+    return SQLPermissoesEfetivasRepository(session)
+
+
+def get_autorizacao_service(
+    permissoes_repository: IPermissoesEfetivasRepository = Depends(
+        get_permissoes_efetivas_repository
+    ),
+) -> AutorizacaoService:
+    """
+    Retorna uma instância do serviço de autorização.
+
+    Args:
+        permissoes_repository: Repositório de permissões efetivas
+
+    Returns:
+        Serviço de autorização
+    """
+    return AutorizacaoService(permissoes_repository)
+
+
 def get_perfil_repository(
-    session: Session = Depends(get_db_session),
+    session: Session = Depends(get_session),
 ) -> IPerfilRepository:
     """
     Retorna uma instância do repositório de perfis.
@@ -79,7 +189,7 @@ def get_perfil_repository(
 
 
 def get_usuario_repository(
-    session: Session = Depends(get_db_session),
+    session: Session = Depends(get_session),
 ) -> IUsuarioRepository:
     """
     Retorna uma instância do repositório de usuários.
@@ -93,6 +203,96 @@ def get_usuario_repository(
     return SQLUsuarioRepository(session)
 
 
+def get_async_permissao_repository(
+    session: AsyncSession = Depends(get_async_session),
+) -> AsyncSQLPermissaoRepository:
+    """
+    Retorna uma instância assíncrona do repositório de permissões.
+
+    Args:
+        session: Sessão assíncrona do banco de dados
+
+    Returns:
+        Repositório assíncrono de permissões
+    """
+    return AsyncSQLPermissaoRepository(session)
+
+
+def get_async_perfil_repository(
+    session: AsyncSession = Depends(get_async_session),
+) -> AsyncSQLPerfilRepository:
+    """
+    Retorna uma instância assíncrona do repositório de perfis.
+
+    Args:
+        session: Sessão assíncrona do banco de dados
+
+    Returns:
+        Repositório assíncrono de perfis
+    """
+    return AsyncSQLPerfilRepository(session)
+
+
+def get_async_usuario_repository(
+    session: AsyncSession = Depends(get_async_session),
+) -> AsyncUsuarioRepository:
+    """
+    Retorna uma instância assíncrona do repositório de usuários.
+
+    Args:
+        session: Sessão assíncrona do banco de dados
+
+    Returns:
+        Repositório assíncrono de usuários
+    """
+    return AsyncUsuarioRepository(session)
+
+
+def get_async_token_repository(
+    session: AsyncSession = Depends(get_async_session),
+) -> AsyncTokenRepository:
+    """
+    Retorna uma instância assíncrona do repositório de tokens.
+
+    Args:
+        session: Sessão assíncrona do banco de dados
+
+    Returns:
+        Repositório assíncrono de tokens
+    """
+    return AsyncTokenRepository(session)
+
+
+def get_async_produto_repository(
+    session: AsyncSession = Depends(get_async_session),
+) -> AsyncSQLAlchemyProdutoRepository:
+    """
+    Retorna uma instância assíncrona do repositório de produtos.
+
+    Args:
+        session: Sessão assíncrona do banco de dados
+
+    Returns:
+        Repositório assíncrono de produtos
+    """
+    return AsyncSQLAlchemyProdutoRepository(session)
+
+
+def get_async_fornecedor_repository(
+    session: AsyncSession = Depends(get_async_session),
+) -> AsyncSQLAlchemyFornecedorRepository:
+    """
+    Retorna uma instância assíncrona do repositório de fornecedores.
+
+    Args:
+        session: Sessão assíncrona do banco de dados
+
+    Returns:
+        Repositório assíncrono de fornecedores
+    """
+    return AsyncSQLAlchemyFornecedorRepository(session)
+
+
 def get_auth_service(
     usuario_repository: IUsuarioRepository = Depends(get_usuario_repository),
 ) -> AuthService:
@@ -113,6 +313,82 @@ def get_auth_service(
     )
 
 
+def get_async_auth_service(
+    usuario_repository: AsyncUsuarioRepository = Depends(get_async_usuario_repository),
+) -> AsyncAuthService:
+    """
+    Retorna uma instância assíncrona do serviço de autenticação.
+
+    Args:
+        usuario_repository: Repositório assíncrono de usuários
+
+    Returns:
+        Serviço assíncrono de autenticação
+    """
+    settings = get_settings()
+    return AsyncAuthService(
+        usuario_repository=usuario_repository,
+        secret_key=settings.secret_key,
+        token_expiration=settings.token_expiration,
+    )
+
+
+def get_async_usuario_service(
+    usuario_repository: AsyncUsuarioRepository = Depends(get_async_usuario_repository),
+    auth_service: AsyncAuthService = Depends(get_async_auth_service),
+) -> AsyncUsuarioService:
+    """
+    Retorna uma instância assíncrona do serviço de usuários.
+
+    Args:
+        usuario_repository: Repositório assíncrono de usuários
+        auth_service: Serviço assíncrono de autenticação
+
+    Returns:
+        Serviço assíncrono de usuários
+    """
+    return AsyncUsuarioService(
+        usuario_repository=usuario_repository,
+        auth_service=auth_service,
+    )
+
+
+def get_async_perfil_service(
+    perfil_repository: AsyncSQLPerfilRepository = Depends(get_async_perfil_repository),
+    permissao_repository: AsyncSQLPermissaoRepository = Depends(
+        get_async_permissao_repository
+    ),
+) -> AsyncPerfilService:
+    """
+    Retorna uma instância assíncrona do serviço de perfis.
+
+    Args:
+        perfil_repository: Repositório assíncrono de perfis
+        permissao_repository: Repositório assíncrono de permissões
+
+    Returns:
+        Serviço assíncrono de perfis
+    """
+    return AsyncPerfilService(perfil_repository, permissao_repository)
+
+
+def get_async_permissao_service(
+    permissao_repository: AsyncSQLPermissaoRepository = Depends(
+        get_async_permissao_repository
+    ),
+) -> AsyncPermissaoService:
+    """
+    Retorna uma instância assíncrona do serviço de permissões.
+
+    Args:
+        permissao_repository: Repositório assíncrono de permissões
+
+    Returns:
+        Serviço assíncrono de permissões
+    """
+    return AsyncPermissaoService(permissao_repository)
+
+
 def get_usuario_service(
     usuario_repository: IUsuarioRepository = Depends(get_usuario_repository),
     auth_service: AuthService = Depends(get_auth_service),
@@ -133,16 +409,60 @@ def get_usuario_service(
     )
 
 
+@lru_cache
+def get_resumo_pedidos_read_model() -> ResumoPedidosReadModel:
+    """
+    Retorna a projeção de resumos de pedidos do processo.
+
+    A projeção é inscrita no publicador de eventos da aplicação na
+    inicialização da API.
+
+    Returns:
+        Projeção de resumos de pedidos
+    """
+    return ResumoPedidosReadModel()
+
+
+def get_listar_resumo_pedidos_cliente_use_case(
+    read_model: ResumoPedidosReadModel = Depends(get_resumo_pedidos_read_model),
+) -> ListarResumoPedidosClienteUseCase:
+    """
+    Retorna o caso de uso de listagem dos pedidos de um cliente.
+
+    Args:
+        read_model: Projeção de resumos de pedidos
+
+    Returns:
+        Caso de uso de listagem dos pedidos de um cliente
+    """
+    return ListarResumoPedidosClienteUseCase(read_model)
+
+
+def get_listar_resumo_pedidos_ativos_use_case(
+    read_model: ResumoPedidosReadModel = Depends(get_resumo_pedidos_read_model),
+) -> ListarResumoPedidosAtivosUseCase:
+    """
+    Retorna o caso de uso de listagem dos pedidos ativos.
+
+    Args:
+        read_model: Projeção de resumos de pedidos
+
+    Returns:
+        Caso de uso de listagem dos pedidos ativos
+    """
+    return ListarResumoPedidosAtivosUseCase(read_model)
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    auth_service: AuthService = Depends(get_auth_service),
+    auth_service: AsyncAuthService = Depends(get_async_auth_service),
 ) -> Usuario:
     """
     Retorna o usuário autenticado.
 
     Args:
         token: Token JWT
-        auth_service: Serviço de autenticação
+        auth_service: Serviço assíncrono de autenticação
 
     Returns:
         Usuário autenticado
@@ -151,10 +471,46 @@ async def get_current_user(
         HTTPException: Se o token for inválido
     """
     try:
-        return auth_service.validar_token(token)
+        return await auth_service.validar_token(token)
     except AutenticacaoError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=str(e),
             headers={"WWW-Authenticate": "Bearer"},
-        ) 
\ No newline at end of file
+        ) 
+
+
+def require(chave: str) -> Callable[..., Usuario]:
+    """
+    Cria uma dependência que exige uma permissão do usuário autenticado.
+
+    Uso:
+        @router.put("/{id}", dependencies=[Depends(require("produto:editar"))])
+
+    Args:
+        chave: Chave da permissão exigida
+
+    Returns:
+        Dependência que retorna o usuário autenticado
+    """
+
+    def verificar_permissao(
+        usuario: Usuario = Depends(get_current_user),
+        autorizacao_service: AutorizacaoService = Depends(get_autorizacao_service),
+    ) -> Usuario:
+        """
+        Verifica a permissão do usuário autenticado.
+
+        Raises:
+            HTTPException: Se o usuário não tiver a permissão
+        """
+        try:
+            autorizacao_service.exigir_permissao(usuario.id, chave)
+        except AutorizacaoError as e:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=str(e),
+            )
+        return usuario
+
+    return verificar_permissao
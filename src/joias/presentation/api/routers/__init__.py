@@ -12,12 +12,14 @@ from .suppliers import router as suppliers_router
 from .users import router as users_router
 from fastapi import APIRouter
 
+from .pedido_router import router as pedido_router
 from .permissao_router import router as permissao_router
 from .usuario_router import router as usuario_router
 
 api_router = APIRouter()
 
 api_router.include_router(auth_router)
+api_router.include_router(pedido_router)
 api_router.include_router(permissao_router)
 api_router.include_router(usuario_router)
 
@@ -28,4 +30,5 @@ __all__ = [
     "orders_router",
     "suppliers_router",
     "perfil_router",
+    "pedido_router",
 ]
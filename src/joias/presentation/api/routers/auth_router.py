@@ -7,10 +7,10 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from pydantic import BaseModel
 
-from ....application.identity.auth_service import AuthService
+from ....application.identity.async_auth_service import AsyncAuthService
 from ....application.shared.exceptions import AutenticacaoError, ValidacaoError
-from ....domain.entities.usuario import Usuario
-from ..dependencies import get_auth_service, get_current_user
+from ....domain.entities.autorizacao import Usuario
+from ..dependencies import get_async_auth_service, get_current_user
 
 
 class Token(BaseModel):
@@ -52,7 +52,7 @@ router = APIRouter(
 )
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    auth_service: AuthService = Depends(get_auth_service),
+    auth_service: AsyncAuthService = Depends(get_async_auth_service),
 ) -> Token:
     """
     Autentica um usuário.
@@ -68,7 +68,7 @@ async def login(
         HTTPException: Se as credenciais forem inválidas
     """
     try:
-        token = auth_service.autenticar(
+        token = await auth_service.autenticar(
             email=form_data.username,
             senha=form_data.password,
         )
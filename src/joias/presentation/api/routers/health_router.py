@@ -2,8 +2,15 @@
 Router para health check.
 
 Este módulo define os endpoints para verificar a saúde da aplicação.
+Apenas `/health` é público; as métricas do pool e o estado das réplicas
+exigem um usuário autenticado.
 """
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+
+from ....infrastructure.persistence.sqlalchemy.async_session import async_engine
+from ....infrastructure.persistence.sqlalchemy.base import engine, roteador
+from ....infrastructure.persistence.sqlalchemy.engine import metricas_pool
+from ..dependencies import get_current_user
 
 router = APIRouter()
 
@@ -16,4 +23,32 @@ async def health_check():
     Returns:
         dict: Status da aplicação
     """
-    return {"status": "ok"} 
\ No newline at end of file
+    return {"status": "ok"}
+
+
+@router.get("/health/pool", dependencies=[Depends(get_current_user)])
+async def pool_metrics():
+    """
+    Retorna as métricas do pool de conexões com o banco.
+
+    Returns:
+        dict: Conexões em uso, overflow e histograma de espera por conexão
+        dos engines síncrono e assíncrono
+    """
+    return {
+        "sincrono": metricas_pool(engine),
+        "assincrono": metricas_pool(async_engine),
+    }
+
+
+@router.get("/health/replicas", dependencies=[Depends(get_current_user)])
+def replicas_status():
+    """
+    Verifica as réplicas de leitura com um SELECT 1 em cada uma.
+
+    Réplicas que respondem voltam a receber leituras imediatamente.
+
+    Returns:
+        dict: Disponibilidade de cada réplica (vazio sem réplicas)
+    """
+    return roteador.verificar() if roteador is not None else {}
@@ -0,0 +1,75 @@
+"""
+Router para endpoints de pedido.
+
+Este módulo contém as rotas da API que listam pedidos a partir
+da projeção de resumos mantida pelos eventos de pedido.
+"""
+from typing import List
+from uuid import UUID
+
+from fastapi import APIRouter, Depends
+
+from ....application.read_models.pedido import ResumoPedido
+from ....application.use_cases.pedido import (
+    ListarResumoPedidosAtivosUseCase,
+    ListarResumoPedidosClienteUseCase,
+)
+from ....domain.entities.autorizacao import Usuario
+from ..dependencies import (
+    get_current_user,
+    get_listar_resumo_pedidos_ativos_use_case,
+    get_listar_resumo_pedidos_cliente_use_case,
+)
+
+router = APIRouter(
+    prefix="/pedidos",
+    tags=["Pedidos"],
+)
+
+
+@router.get(
+    "/ativos",
+    response_model=List[ResumoPedido],
+)
+async def listar_pedidos_ativos(
+    use_case: ListarResumoPedidosAtivosUseCase = Depends(
+        get_listar_resumo_pedidos_ativos_use_case
+    ),
+    current_user: Usuario = Depends(get_current_user),
+) -> List[ResumoPedido]:
+    """
+    Lista os resumos dos pedidos ativos.
+
+    Args:
+        use_case: Caso de uso de listagem dos pedidos ativos
+        current_user: Usuário autenticado
+
+    Returns:
+        Lista de resumos dos pedidos ativos
+    """
+    return use_case.execute()
+
+
+@router.get(
+    "/clientes/{cliente_id}",
+    response_model=List[ResumoPedido],
+)
+async def listar_pedidos_do_cliente(
+    cliente_id: UUID,
+    use_case: ListarResumoPedidosClienteUseCase = Depends(
+        get_listar_resumo_pedidos_cliente_use_case
+    ),
+    current_user: Usuario = Depends(get_current_user),
+) -> List[ResumoPedido]:
+    """
+    Lista os resumos dos pedidos de um cliente.
+
+    Args:
+        cliente_id: ID do cliente
+        use_case: Caso de uso de listagem dos pedidos de um cliente
+        current_user: Usuário autenticado
+
+    Returns:
+        Lista de resumos dos pedidos do cliente
+    """
+    return use_case.execute(cliente_id)
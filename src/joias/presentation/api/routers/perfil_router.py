@@ -5,10 +5,8 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from typing import List
 
 from ....application.dtos.perfil import CriarPerfilDTO, PerfilDTO, AtualizarPerfilDTO
-from ....application.identity.perfil_service import PerfilService
-from ....domain.repositories.perfil_repository import IPerfilRepository
-from ....domain.repositories.permissao_repository import IPermissaoRepository
-from ...dependencies import get_perfil_repository, get_permissao_repository
+from ....application.identity.async_perfil_service import AsyncPerfilService
+from ...dependencies import get_async_perfil_service
 
 router = APIRouter(prefix="/perfis", tags=["Perfis"])
 
@@ -19,18 +17,16 @@ router = APIRouter(prefix="/perfis", tags=["Perfis"])
     status_code=201,
     description="Cria um novo perfil",
 )
-def criar_perfil(
+async def criar_perfil(
     dados: CriarPerfilDTO,
-    perfil_repository: IPerfilRepository = Depends(get_perfil_repository),
-    permissao_repository: IPermissaoRepository = Depends(get_permissao_repository),
+    service: AsyncPerfilService = Depends(get_async_perfil_service),
 ) -> PerfilDTO:
     """
     Cria um novo perfil.
 
     Args:
         dados: Dados do perfil
-        perfil_repository: Repositório de perfis (injetado)
-        permissao_repository: Repositório de permissões (injetado)
+        service: Serviço assíncrono de perfis (injetado)
 
     Returns:
         Dados do perfil criado
@@ -39,8 +35,7 @@ def criar_perfil(
         HTTPException: Se houver erro de validação
     """
     try:
-        service = PerfilService(perfil_repository, permissao_repository)
-        return service.criar_perfil(dados)
+        return await service.criar_perfil(dados)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -50,18 +45,16 @@ def criar_perfil(
     response_model=PerfilDTO,
     description="Retorna os dados de um perfil específico",
 )
-def buscar_perfil(
+async def buscar_perfil(
     id: str,
-    perfil_repository: IPerfilRepository = Depends(get_perfil_repository),
-    permissao_repository: IPermissaoRepository = Depends(get_permissao_repository),
+    service: AsyncPerfilService = Depends(get_async_perfil_service),
 ) -> PerfilDTO:
     """
     Busca um perfil pelo ID.
 
     Args:
         id: ID do perfil
-        perfil_repository: Repositório de perfis (injetado)
-        permissao_repository: Repositório de permissões (injetado)
+        service: Serviço assíncrono de perfis (injetado)
 
     Returns:
         Dados do perfil
@@ -69,8 +62,7 @@ def buscar_perfil(
     Raises:
         HTTPException: Se o perfil não for encontrado
     """
-    service = PerfilService(perfil_repository, permissao_repository)
-    perfil = service.buscar_perfil(id)
+    perfil = await service.buscar_perfil(id)
 
     if not perfil:
         raise HTTPException(status_code=404, detail="Perfil não encontrado")
@@ -83,22 +75,19 @@ def buscar_perfil(
     response_model=List[PerfilDTO],
     description="Lista todos os perfis",
 )
-def listar_perfis(
-    perfil_repository: IPerfilRepository = Depends(get_perfil_repository),
-    permissao_repository: IPermissaoRepository = Depends(get_permissao_repository),
+async def listar_perfis(
+    service: AsyncPerfilService = Depends(get_async_perfil_service),
 ) -> List[PerfilDTO]:
     """
     Lista todos os perfis.
 
     Args:
-        perfil_repository: Repositório de perfis (injetado)
-        permissao_repository: Repositório de permissões (injetado)
+        service: Serviço assíncrono de perfis (injetado)
 
     Returns:
         Lista de perfis
     """
-    service = PerfilService(perfil_repository, permissao_repository)
-    return service.listar_perfis()
+    return await service.listar_perfis()
 
 
 @router.post(
@@ -106,11 +95,10 @@ def listar_perfis(
     response_model=PerfilDTO,
     description="Adiciona uma permissão a um perfil",
 )
-def adicionar_permissao(
+async def adicionar_permissao(
     perfil_id: str,
     permissao_id: str,
-    perfil_repository: IPerfilRepository = Depends(get_perfil_repository),
-    permissao_repository: IPermissaoRepository = Depends(get_permissao_repository),
+    service: AsyncPerfilService = Depends(get_async_perfil_service),
 ) -> PerfilDTO:
     """
     Adiciona uma permissão a um perfil.
@@ -118,8 +106,7 @@ def adicionar_permissao(
     Args:
         perfil_id: ID do perfil
         permissao_id: ID da permissão
-        perfil_repository: Repositório de perfis (injetado)
-        permissao_repository: Repositório de permissões (injetado)
+        service: Serviço assíncrono de perfis (injetado)
 
     Returns:
         Dados do perfil atualizado
@@ -128,8 +115,7 @@ def adicionar_permissao(
         HTTPException: Se o perfil ou a permissão não forem encontrados
     """
     try:
-        service = PerfilService(perfil_repository, permissao_repository)
-        return service.adicionar_permissao(perfil_id, permissao_id)
+        return await service.adicionar_permissao(perfil_id, permissao_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -139,11 +125,10 @@ def adicionar_permissao(
     response_model=PerfilDTO,
     description="Remove uma permissão de um perfil",
 )
-def remover_permissao(
+async def remover_permissao(
     perfil_id: str,
     permissao_id: str,
-    perfil_repository: IPerfilRepository = Depends(get_perfil_repository),
-    permissao_repository: IPermissaoRepository = Depends(get_permissao_repository),
+    service: AsyncPerfilService = Depends(get_async_perfil_service),
 ) -> PerfilDTO:
     """
     Remove uma permissão de um perfil.
@@ -151,8 +136,7 @@ def remover_permissao(
     Args:
         perfil_id: ID do perfil
         permissao_id: ID da permissão
-        perfil_repository: Repositório de perfis (injetado)
-        permissao_repository: Repositório de permissões (injetado)
+        service: Serviço assíncrono de perfis (injetado)
 
     Returns:
         Dados do perfil atualizado
@@ -161,8 +145,7 @@ def remover_permissao(
         HTTPException: Se o perfil ou a permissão não forem encontrados
     """
     try:
-        service = PerfilService(perfil_repository, permissao_repository)
-        return service.remover_permissao(perfil_id, permissao_id)
+        return await service.remover_permissao(perfil_id, permissao_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -172,11 +155,10 @@ def remover_permissao(
     response_model=PerfilDTO,
     description="Atualiza um perfil existente",
 )
-def atualizar_perfil(
+async def atualizar_perfil(
     id: str,
     dados: AtualizarPerfilDTO,
-    perfil_repository: IPerfilRepository = Depends(get_perfil_repository),
-    permissao_repository: IPermissaoRepository = Depends(get_permissao_repository),
+    service: AsyncPerfilService = Depends(get_async_perfil_service),
 ) -> PerfilDTO:
     """
     Atualiza um perfil existente.
@@ -184,8 +166,7 @@ def atualizar_perfil(
     Args:
         id: ID do perfil
         dados: Dados do perfil a serem atualizados
-        perfil_repository: Repositório de perfis (injetado)
-        permissao_repository: Repositório de permissões (injetado)
+        service: Serviço assíncrono de perfis (injetado)
 
     Returns:
         Dados do perfil atualizado
@@ -194,8 +175,7 @@ def atualizar_perfil(
         HTTPException: Se o perfil não for encontrado ou houver erro de validação
     """
     try:
-        service = PerfilService(perfil_repository, permissao_repository)
-        return service.atualizar_perfil(id, dados)
+        return await service.atualizar_perfil(id, dados)
     except ValueError as e:
         raise HTTPException(status_code=404 if "não encontrado" in str(e) else 400, detail=str(e))
 
@@ -205,25 +185,22 @@ def atualizar_perfil(
     status_code=status.HTTP_204_NO_CONTENT,
     description="Exclui um perfil",
 )
-def excluir_perfil(
+async def excluir_perfil(
     id: str,
-    perfil_repository: IPerfilRepository = Depends(get_perfil_repository),
-    permissao_repository: IPermissaoRepository = Depends(get_permissao_repository),
+    service: AsyncPerfilService = Depends(get_async_perfil_service),
 ) -> None:
     """
     Exclui um perfil do sistema.
 
     Args:
         id: ID do perfil
-        perfil_repository: Repositório de perfis (injetado)
-        permissao_repository: Repositório de permissões (injetado)
+        service: Serviço assíncrono de perfis (injetado)
 
     Raises:
         HTTPException: Se o perfil não for encontrado ou não puder ser excluído
     """
     try:
-        service = PerfilService(perfil_repository, permissao_repository)
-        service.excluir_perfil(id)
+        await service.excluir_perfil(id)
     except ValueError as e:
         if "não encontrado" in str(e):
             raise HTTPException(status_code=404, detail=str(e))
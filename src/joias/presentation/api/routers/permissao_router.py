@@ -5,9 +5,8 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from typing import List
 
 from ....application.dtos.permissao import CriarPermissaoDTO, PermissaoDTO, AtualizarPermissaoDTO
-from ....application.identity.permissao_service import PermissaoService
-from ....domain.repositories.permissao_repository import IPermissaoRepository
-from ...dependencies import get_permissao_repository
+from ....application.identity.async_permissao_service import AsyncPermissaoService
+from ...dependencies import get_async_permissao_service
 
 router = APIRouter(prefix="/permissoes", tags=["Permissões"])
 
@@ -18,16 +17,16 @@ router = APIRouter(prefix="/permissoes", tags=["Permissões"])
     status_code=status.HTTP_201_CREATED,
     description="Cria uma nova permissão",
 )
-def criar_permissao(
+async def criar_permissao(
     dados: CriarPermissaoDTO,
-    permissao_repository: IPermissaoRepository = Depends(get_permissao_repository),
+    service: AsyncPermissaoService = Depends(get_async_permissao_service),
 ) -> PermissaoDTO:
     """
     Cria uma nova permissão.
 
     Args:
         dados: Dados da permissão
-        permissao_repository: Repositório de permissões (injetado)
+        service: Serviço assíncrono de permissões (injetado)
 
     Returns:
         Dados da permissão criada
@@ -36,8 +35,7 @@ def criar_permissao(
         HTTPException: Se houver erro de validação
     """
     try:
-        service = PermissaoService(permissao_repository)
-        return service.criar_permissao(dados)
+        return await service.criar_permissao(dados)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -47,16 +45,16 @@ def criar_permissao(
     response_model=PermissaoDTO,
     description="Retorna os dados de uma permissão específica",
 )
-def buscar_permissao(
+async def buscar_permissao(
     id: str,
-    permissao_repository: IPermissaoRepository = Depends(get_permissao_repository),
+    service: AsyncPermissaoService = Depends(get_async_permissao_service),
 ) -> PermissaoDTO:
     """
     Busca uma permissão pelo ID.
 
     Args:
         id: ID da permissão
-        permissao_repository: Repositório de permissões (injetado)
+        service: Serviço assíncrono de permissões (injetado)
 
     Returns:
         Dados da permissão
@@ -64,8 +62,7 @@ def buscar_permissao(
     Raises:
         HTTPException: Se a permissão não for encontrada
     """
-    service = PermissaoService(permissao_repository)
-    permissao = service.buscar_permissao(id)
+    permissao = await service.buscar_permissao(id)
 
     if not permissao:
         raise HTTPException(status_code=404, detail="Permissão não encontrada")
@@ -78,20 +75,19 @@ def buscar_permissao(
     response_model=List[PermissaoDTO],
     description="Lista todas as permissões",
 )
-def listar_permissoes(
-    permissao_repository: IPermissaoRepository = Depends(get_permissao_repository),
+async def listar_permissoes(
+    service: AsyncPermissaoService = Depends(get_async_permissao_service),
 ) -> List[PermissaoDTO]:
     """
     Lista todas as permissões.
 
     Args:
-        permissao_repository: Repositório de permissões (injetado)
+        service: Serviço assíncrono de permissões (injetado)
 
     Returns:
         Lista de permissões
     """
-    service = PermissaoService(permissao_repository)
-    return service.listar_permissoes()
+    return await service.listar_permissoes()
 
 
 @router.put(
@@ -99,10 +95,10 @@ def listar_permissoes(
     response_model=PermissaoDTO,
     description="Atualiza uma permissão existente",
 )
-def atualizar_permissao(
+async def atualizar_permissao(
     id: str,
     dados: AtualizarPermissaoDTO,
-    permissao_repository: IPermissaoRepository = Depends(get_permissao_repository),
+    service: AsyncPermissaoService = Depends(get_async_permissao_service),
 ) -> PermissaoDTO:
     """
     Atualiza uma permissão existente.
@@ -110,7 +106,7 @@ def atualizar_permissao(
     Args:
         id: ID da permissão
         dados: Dados da permissão a serem atualizados
-        permissao_repository: Repositório de permissões (injetado)
+        service: Serviço assíncrono de permissões (injetado)
 
     Returns:
         Dados da permissão atualizada
@@ -119,8 +115,7 @@ def atualizar_permissao(
         HTTPException: Se a permissão não for encontrada ou houver erro de validação
     """
     try:
-        service = PermissaoService(permissao_repository)
-        return service.atualizar_permissao(id, dados)
+        return await service.atualizar_permissao(id, dados)
     except ValueError as e:
         raise HTTPException(status_code=404 if "não encontrada" in str(e) else 400, detail=str(e))
 
@@ -130,23 +125,22 @@ def atualizar_permissao(
     status_code=status.HTTP_204_NO_CONTENT,
     description="Exclui uma permissão",
 )
-def excluir_permissao(
+async def excluir_permissao(
     id: str,
-    permissao_repository: IPermissaoRepository = Depends(get_permissao_repository),
+    service: AsyncPermissaoService = Depends(get_async_permissao_service),
 ) -> None:
     """
     Exclui uma permissão do sistema.
 
     Args:
         id: ID da permissão
-        permissao_repository: Repositório de permissões (injetado)
+        service: Serviço assíncrono de permissões (injetado)
 
     Raises:
         HTTPException: Se a permissão não for encontrada ou não puder ser excluída
     """
     try:
-        service = PermissaoService(permissao_repository)
-        service.excluir_permissao(id)
+        await service.excluir_permissao(id)
     except ValueError as e:
         if "não encontrada" in str(e):
             raise HTTPException(status_code=404, detail=str(e))
@@ -9,14 +9,15 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, EmailStr
 
-from ....application.identity.usuario_service import UsuarioService
+from ....application.identity.async_usuario_service import AsyncUsuarioService
 from ....application.shared.exceptions import (
     EntidadeJaExisteError,
     EntidadeNaoEncontradaError,
     ValidacaoError,
 )
-from ....domain.entities.usuario import Usuario
-from ..dependencies import get_current_user, get_usuario_service
+from ....domain.entities.autorizacao import Usuario
+from ....domain.repositories.usuario_repository import ResumoUsuario
+from ..dependencies import get_async_usuario_service, get_current_user
 
 
 class UsuarioBase(BaseModel):
@@ -85,10 +86,29 @@ def _usuario_to_response(usuario: Usuario) -> UsuarioResponse:
         nome=usuario.nome,
         email=str(usuario.email),
         ativo=usuario.ativo,
-        data_criacao=usuario.data_criacao.isoformat(),
+        data_criacao=usuario.created_at.isoformat(),
     )
 
 
+
+def _resumo_to_response(resumo: ResumoUsuario) -> UsuarioResponse:
+    """
+    Converte o resumo de um usuário para o modelo de resposta.
+
+    Args:
+        resumo: Resumo lido pelo repositório
+
+    Returns:
+        Modelo de resposta do usuário
+    """
+    return UsuarioResponse(
+        id=str(resumo.id),
+        nome=resumo.nome,
+        email=resumo.email,
+        ativo=resumo.ativo,
+        data_criacao=resumo.data_criacao.isoformat(),
+    )
+
 @router.post(
     "",
     response_model=UsuarioResponse,
@@ -96,7 +116,7 @@ def _usuario_to_response(usuario: Usuario) -> UsuarioResponse:
 )
 async def criar_usuario(
     usuario: UsuarioCreate,
-    usuario_service: UsuarioService = Depends(get_usuario_service),
+    usuario_service: AsyncUsuarioService = Depends(get_async_usuario_service),
 ) -> UsuarioResponse:
     """
     Cria um novo usuário.
@@ -112,7 +132,7 @@ async def criar_usuario(
         HTTPException: Se houver erro na criação do usuário
     """
     try:
-        usuario_criado = usuario_service.criar_usuario(
+        usuario_criado = await usuario_service.criar_usuario(
             nome=usuario.nome,
             email=usuario.email,
             senha=usuario.senha,
@@ -136,7 +156,7 @@ async def criar_usuario(
 )
 async def buscar_usuario_por_id(
     id: str,
-    usuario_service: UsuarioService = Depends(get_usuario_service),
+    usuario_service: AsyncUsuarioService = Depends(get_async_usuario_service),
     current_user: Usuario = Depends(get_current_user),
 ) -> UsuarioResponse:
     """
@@ -154,7 +174,7 @@ async def buscar_usuario_por_id(
         HTTPException: Se o usuário não for encontrado
     """
     try:
-        usuario = usuario_service.buscar_usuario_por_id(id)
+        usuario = await usuario_service.buscar_usuario_por_id(id)
         return _usuario_to_response(usuario)
     except EntidadeNaoEncontradaError as e:
         raise HTTPException(
@@ -168,7 +188,7 @@ async def buscar_usuario_por_id(
     response_model=List[UsuarioResponse],
 )
 async def listar_usuarios(
-    usuario_service: UsuarioService = Depends(get_usuario_service),
+    usuario_service: AsyncUsuarioService = Depends(get_async_usuario_service),
     current_user: Usuario = Depends(get_current_user),
 ) -> List[UsuarioResponse]:
     """
@@ -181,8 +201,8 @@ async def listar_usuarios(
     Returns:
         Lista de usuários
     """
-    usuarios = usuario_service.listar_usuarios()
-    return [_usuario_to_response(usuario) for usuario in usuarios]
+    resumos = await usuario_service.listar_resumos()
+    return [_resumo_to_response(resumo) for resumo in resumos]
 
 
 @router.put(
@@ -192,7 +212,7 @@ async def listar_usuarios(
 async def atualizar_usuario(
     id: str,
     usuario: UsuarioUpdate,
-    usuario_service: UsuarioService = Depends(get_usuario_service),
+    usuario_service: AsyncUsuarioService = Depends(get_async_usuario_service),
     current_user: Usuario = Depends(get_current_user),
 ) -> UsuarioResponse:
     """
@@ -211,7 +231,7 @@ async def atualizar_usuario(
         HTTPException: Se houver erro na atualização do usuário
     """
     try:
-        usuario_atualizado = usuario_service.atualizar_usuario(
+        usuario_atualizado = await usuario_service.atualizar_usuario(
             id=id,
             nome=usuario.nome,
             email=usuario.email,
@@ -242,7 +262,7 @@ async def atualizar_usuario(
 )
 async def excluir_usuario(
     id: str,
-    usuario_service: UsuarioService = Depends(get_usuario_service),
+    usuario_service: AsyncUsuarioService = Depends(get_async_usuario_service),
     current_user: Usuario = Depends(get_current_user),
 ) -> None:
     """
@@ -257,7 +277,7 @@ async def excluir_usuario(
         HTTPException: Se o usuário não for encontrado
     """
     try:
-        usuario_service.excluir_usuario(id)
+        await usuario_service.excluir_usuario(id)
     except EntidadeNaoEncontradaError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -0,0 +1,127 @@
+"""
+Microbenchmark do caminho de autenticação.
+
+Compara a busca de usuário por email e de token por valor feitas pelos
+repositórios (consultas `select()` de módulo, linhas mapeadas direto para
+entidades) com a forma anterior, que montava um `Query` do ORM a cada
+chamada e carregava o modelo no identity map.
+
+Uso:
+    python -m tests.benchmarks.bench_auth_lookup [repeticoes]
+"""
+import sys
+import timeit
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.joias.domain.entities.autorizacao import Token, Usuario
+from src.joias.infrastructure.persistence.sqlalchemy.base import Base
+from src.joias.infrastructure.persistence.sqlalchemy.models import (
+    Token as TokenModel,
+    Usuario as UsuarioModel,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.repositories.token_repository import (
+    TokenRepository,
+    hash_token,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.repositories.usuario_repository import (
+    UsuarioRepository,
+)
+
+QUANTIDADE_USUARIOS = 1000
+
+
+def popular(session: Session) -> None:
+    """Cria usuários com um token cada."""
+    agora = datetime.utcnow()
+    for i in range(QUANTIDADE_USUARIOS):
+        usuario_id = uuid4()
+        session.add(
+            UsuarioModel(
+                id=usuario_id,
+                nome=f"Usuário {i}",
+                email=f"usuario{i}@joias.com",
+                senha_hash="hash",
+                ativo=True,
+                data_criacao=agora,
+            )
+        )
+        session.add(
+            TokenModel(
+                id=uuid4(),
+                usuario_id=usuario_id,
+                token=f"token-{i}",
+                token_hash=hash_token(f"token-{i}"),
+                expiracao=agora + timedelta(hours=1),
+                created_at=agora,
+                updated_at=agora,
+            )
+        )
+    session.commit()
+    session.expunge_all()
+
+
+def autenticar_com_query(session: Session, email: str, token: str):
+    """Caminho anterior: Query do ORM montado a cada chamada."""
+    usuario_model = session.query(UsuarioModel).filter_by(email=email).first()
+    token_model = (
+        session.query(TokenModel).filter_by(token_hash=hash_token(token)).first()
+    )
+    return (
+        Usuario(
+            id=usuario_model.id,
+            nome=usuario_model.nome,
+            email=usuario_model.email,
+            senha_hash=usuario_model.senha_hash,
+            ativo=usuario_model.ativo,
+            created_at=usuario_model.data_criacao,
+            updated_at=usuario_model.data_criacao,
+        ),
+        Token(
+            id=token_model.id,
+            usuario_id=token_model.usuario_id,
+            token=token_model.token,
+            expiracao=token_model.expiracao,
+            created_at=token_model.created_at,
+            updated_at=token_model.updated_at,
+            deleted_at=token_model.deleted_at,
+        ),
+    )
+
+
+def autenticar_com_repositorios(session: Session, email: str, token: str):
+    """Caminho atual: consultas de módulo dos repositórios."""
+    return (
+        UsuarioRepository(session).buscar_por_email(email),
+        TokenRepository(session).buscar_por_token(token),
+    )
+
+
+def main(repeticoes: int = 5000) -> None:
+    """Executa o benchmark e imprime o tempo médio por autenticação."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(
+        engine, tables=[UsuarioModel.__table__, TokenModel.__table__]
+    )
+
+    with Session(engine) as session:
+        popular(session)
+        indice = QUANTIDADE_USUARIOS // 2
+        email, token = f"usuario{indice}@joias.com", f"token-{indice}"
+
+        for nome, funcao in (
+            ("query ORM", autenticar_com_query),
+            ("select() de módulo", autenticar_com_repositorios),
+        ):
+            funcao(session, email, token)  # aquece o cache de compilação
+            segundos = timeit.timeit(
+                lambda: funcao(session, email, token), number=repeticoes
+            )
+            print(f"{nome:>20}: {segundos / repeticoes * 1e6:8.1f} µs/autenticação")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
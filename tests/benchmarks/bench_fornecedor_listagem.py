@@ -0,0 +1,111 @@
+"""
+Benchmark da listagem de fornecedores.
+
+Compara a listagem feita pelo repositório (documentos carregados com uma
+consulta IN e documentos/endereços recriados sem revalidação) com a forma
+anterior, que carregava os documentos de cada fornecedor sob demanda e
+validava novamente cada Documento e Endereco lido do banco.
+
+Uso:
+    python -m tests.benchmarks.bench_fornecedor_listagem [quantidade]
+"""
+import sys
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.joias.domain.catalogo.entities.fornecedor import Documento, Fornecedor
+from src.joias.domain.shared.value_objects.endereco import Endereco
+from src.joias.infrastructure.persistence.sqlalchemy.base import Base
+from src.joias.infrastructure.persistence.sqlalchemy.models.fornecedor import (
+    Documento as DocumentoModel,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.models.fornecedor import (
+    Fornecedor as FornecedorModel,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.repositories.fornecedor_repository import (
+    SQLAlchemyFornecedorRepository,
+)
+
+
+def popular(session: Session, quantidade: int) -> None:
+    """Cria fornecedores com um CNPJ cada."""
+    repository = SQLAlchemyFornecedorRepository(session)
+    endereco = Endereco(
+        logradouro="Rua das Joias",
+        numero="100",
+        bairro="Centro",
+        cidade="São Paulo",
+        estado="SP",
+        cep="01001-000",
+    )
+    repository.salvar_em_lote(
+        [
+            Fornecedor(
+                nome=f"Fornecedor {i}",
+                documentos=[Documento(numero=f"{i:014d}", tipo="CNPJ")],
+                endereco=endereco,
+            )
+            for i in range(quantidade)
+        ]
+    )
+    session.commit()
+
+
+def listar_sob_demanda(session: Session):
+    """Caminho anterior: documentos sob demanda e objetos revalidados."""
+    fornecedores = []
+    for model in session.query(FornecedorModel).filter(FornecedorModel.ativo == True):
+        fornecedor = Fornecedor(
+            nome=model.nome,
+            documentos=[
+                Documento(numero=d.numero, tipo=d.tipo) for d in model.documentos
+            ],
+            endereco=Endereco(
+                logradouro=model.logradouro,
+                numero=model.numero,
+                bairro=model.bairro,
+                cidade=model.cidade,
+                estado=model.estado,
+                cep=model.cep,
+                complemento=model.complemento,
+                pais=model.pais,
+            ),
+        )
+        fornecedor.ativo = model.ativo
+        fornecedores.append(fornecedor)
+    return fornecedores
+
+
+def listar_com_repositorio(session: Session):
+    """Caminho atual: listagem do repositório."""
+    return SQLAlchemyFornecedorRepository(session).listar()
+
+
+def main(quantidade: int = 50_000) -> None:
+    """Executa o benchmark e imprime o tempo de cada listagem."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(
+        engine, tables=[FornecedorModel.__table__, DocumentoModel.__table__]
+    )
+
+    with Session(engine) as session:
+        popular(session, quantidade)
+
+        for nome, funcao in (
+            ("documentos sob demanda", listar_sob_demanda),
+            ("selectinload + reconstruir", listar_com_repositorio),
+        ):
+            session.expunge_all()
+            inicio = time.perf_counter()
+            fornecedores = funcao(session)
+            segundos = time.perf_counter() - inicio
+            assert len(fornecedores) == quantidade
+            print(f"{nome:>28}: {segundos:6.2f} s para {quantidade} fornecedores")
+
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,51 @@
+"""
+Testes de integração para o mapeador de produtos.
+
+Este módulo contém os testes que validam a conversão de linhas
+de produtos lidas do banco em entidades do catálogo.
+"""
+from decimal import Decimal
+
+from sqlalchemy import insert, select
+
+from src.joias.domain.shared.value_objects.moeda import Moeda
+from src.joias.infrastructure.persistence.sqlalchemy.mappers.produto_mapper import (
+    ProdutoMapper,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.models.produto import (
+    ProdutoModel,
+)
+
+
+def test_to_entity_usa_moedas_do_registro(session, monkeypatch):
+    """Deve converter o preço para centavos sem criar instâncias de Moeda."""
+    # Arrange
+    session.execute(
+        insert(ProdutoModel),
+        [
+            {
+                "sku": f"SKU-{i}",
+                "nome": f"Produto {i}",
+                "preco_valor": Decimal("10.90") + i,
+                "preco_moeda": "BRL" if i % 2 else "usd",
+                "ativo": True,
+            }
+            for i in range(10)
+        ],
+    )
+    models = session.scalars(select(ProdutoModel).order_by(ProdutoModel.id)).all()
+    criadas = []
+    validar = Moeda.__post_init__
+    monkeypatch.setattr(
+        Moeda, "__post_init__", lambda moeda: criadas.append(validar(moeda))
+    )
+
+    # Act
+    produtos = [ProdutoMapper().to_entity(model) for model in models]
+
+    # Assert
+    assert criadas == []
+    assert produtos[0].preco.valor_em_centavos == 1090
+    assert produtos[0].preco.moeda is Moeda.USD
+    assert produtos[1].preco.valor == Decimal("11.90")
+    assert produtos[1].preco.moeda is Moeda.BRL
@@ -0,0 +1,326 @@
+"""
+Testes de integração para os repositórios assíncronos.
+
+Este módulo contém os testes que validam os repositórios assíncronos
+com um banco SQLite acessado via aiosqlite.
+"""
+import asyncio
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.joias.application.dtos.perfil import CriarPerfilDTO
+from src.joias.application.dtos.permissao import CriarPermissaoDTO
+from src.joias.application.identity.async_auth_service import AsyncAuthService
+from src.joias.application.identity.async_perfil_service import AsyncPerfilService
+from src.joias.application.identity.async_permissao_service import (
+    AsyncPermissaoService,
+)
+from src.joias.application.identity.async_usuario_service import AsyncUsuarioService
+from src.joias.application.shared.exceptions import (
+    AutenticacaoError,
+    EntidadeJaExisteError,
+)
+from src.joias.domain.entities.autorizacao import Token, Usuario
+from src.joias.domain.entities.perfil import Perfil
+from src.joias.domain.entities.permissao import Permissao
+from src.joias.infrastructure.persistence.sqlalchemy.base import Base
+from src.joias.infrastructure.persistence.sqlalchemy.models.perfil import (
+    PerfilModel,
+    usuario_perfil,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.models.permissao import (
+    PermissaoModel,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.models.perfil_permissao import (
+    perfil_permissao,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.models.produto import (
+    DetalheModel,
+    DetalheVariacaoModel,
+    ProdutoModel,
+    VariacaoModel,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.models.token import (
+    Token as TokenModel,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.models.usuario import (
+    UsuarioModel,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.models.versao_catalogo import (
+    VersaoCatalogoModel,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.repositories.async_perfil_repository import (
+    AsyncSQLPerfilRepository,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.repositories.async_permissao_repository import (
+    AsyncSQLPermissaoRepository,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.repositories.async_produto_repository import (
+    AsyncSQLAlchemyProdutoRepository,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.repositories.async_token_repository import (
+    AsyncTokenRepository,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.repositories.async_usuario_repository import (
+    AsyncUsuarioRepository,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.unit_of_work import (
+    AsyncSQLAlchemyUnitOfWork,
+)
+
+TABELAS = [
+    PerfilModel.__table__,
+    PermissaoModel.__table__,
+    perfil_permissao,
+    ProdutoModel.__table__,
+    VariacaoModel.__table__,
+    DetalheModel.__table__,
+    DetalheVariacaoModel.__table__,
+    VersaoCatalogoModel.__table__,
+    UsuarioModel.__table__,
+    usuario_perfil,
+    TokenModel.__table__,
+]
+
+
+def grafo(produto):
+    """Retorna os nomes dos detalhes das variações e do produto."""
+    return (
+        [[d.nome for d in v.detalhes] for v in produto.variacoes],
+        [d.nome for d in produto.detalhes],
+    )
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    """Fixture que cria um banco SQLite assíncrono temporário."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'teste.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=TABELAS)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def criar_produtos(session, quantidade: int) -> None:
+    """Cria produtos com uma variação e detalhes cada."""
+    for i in range(quantidade):
+        produto = ProdutoModel(
+            sku=f"SKU-{i}",
+            nome=f"Produto {i}",
+            preco_valor=Decimal("10.00"),
+            preco_moeda="BRL",
+            ativo=True,
+        )
+        variacao = VariacaoModel(nome="Aro 18", codigo=f"V-{i}", produto=produto)
+        DetalheVariacaoModel(
+            nome="Tamanho", valor="18", tipo="medida", variacao=variacao
+        )
+        DetalheModel(nome="Material", valor="Ouro", tipo="material", produto=produto)
+        session.add(produto)
+    await session.commit()
+    session.expunge_all()
+
+
+@pytest.mark.asyncio
+async def test_perfis_e_permissoes(session_factory):
+    """Deve gravar e ler perfis e permissões pela sessão assíncrona."""
+    # Arrange
+    async with session_factory() as session:
+        permissao = await AsyncSQLPermissaoRepository(session).criar(
+            Permissao(nome="Editar produto", chave="produto:editar")
+        )
+        perfil = await AsyncSQLPerfilRepository(session).criar(Perfil(nome="Vendedor"))
+
+    # Act
+    async with session_factory() as session:
+        perfil_encontrado = await AsyncSQLPerfilRepository(session).buscar_por_nome(
+            "Vendedor"
+        )
+        permissao_encontrada = await AsyncSQLPermissaoRepository(
+            session
+        ).buscar_por_chave("produto:editar")
+
+    # Assert
+    assert perfil_encontrado.id == perfil.id
+    assert perfil_encontrado.permissoes == []
+    assert permissao_encontrada.id == permissao.id
+
+
+@pytest.mark.asyncio
+async def test_produtos_carregados_com_relacionamentos(session_factory):
+    """Deve listar, paginar e percorrer produtos com o grafo completo."""
+    # Arrange
+    async with session_factory() as session:
+        await criar_produtos(session, 5)
+
+    async with session_factory() as session:
+        repository = AsyncSQLAlchemyProdutoRepository(session)
+
+        # Act
+        listados = await repository.listar()
+        pagina, proximo = await repository.listar_pagina(limite=3)
+        percorridos = [p async for p in repository.iterar(lote=2)]
+
+    # Assert
+    assert len(listados) == 5
+    assert grafo(listados[0]) == ([["Tamanho"]], ["Material"])
+    assert [p.sku for p in pagina] == ["SKU-0", "SKU-1", "SKU-2"]
+    assert proximo == pagina[-1].id
+    assert [p.sku for p in percorridos] == [f"SKU-{i}" for i in range(5)]
+    assert all(grafo(p) == ([["Tamanho"]], ["Material"]) for p in percorridos)
+
+
+@pytest.mark.asyncio
+async def test_consultas_concorrentes(session_factory):
+    """Deve atender várias consultas simultâneas no mesmo event loop."""
+    # Arrange
+    async with session_factory() as session:
+        await criar_produtos(session, 3)
+
+    async def buscar(sku: str):
+        async with session_factory() as session:
+            repository = AsyncSQLAlchemyProdutoRepository(session)
+            return await repository.buscar_por_sku(sku)
+
+    # Act
+    resultados = await asyncio.gather(*(buscar(f"SKU-{i % 3}") for i in range(20)))
+
+    # Assert
+    assert [r.sku for r in resultados] == [f"SKU-{i % 3}" for i in range(20)]
+
+
+@pytest.mark.asyncio
+async def test_unidade_de_trabalho_assincrona(session_factory):
+    """Deve agrupar as escritas em um commit e desfazer sem commit."""
+    # Act
+    async with AsyncSQLAlchemyUnitOfWork(session_factory) as uow:
+        repository = AsyncSQLPerfilRepository(uow.session)
+        await repository.criar(Perfil(nome="Gerente"))
+        await repository.criar(Perfil(nome="Vendedor"))
+        await uow.commit()
+
+    async with AsyncSQLAlchemyUnitOfWork(session_factory) as uow:
+        await AsyncSQLPerfilRepository(uow.session).criar(Perfil(nome="Caixa"))
+
+    # Assert
+    assert uow.commits == 0
+    async with session_factory() as session:
+        nomes = [p.nome for p in await AsyncSQLPerfilRepository(session).listar()]
+    assert sorted(nomes) == ["Gerente", "Vendedor"]
+
+
+@pytest.mark.asyncio
+async def test_usuarios(session_factory):
+    """Deve gravar, buscar, atualizar e resumir usuários."""
+    # Arrange
+    async with session_factory() as session:
+        usuario = await AsyncUsuarioRepository(session).criar(
+            Usuario.criar("ana@joias.com", "Ana", "hash")
+        )
+
+    # Act
+    async with session_factory() as session:
+        repository = AsyncUsuarioRepository(session)
+        por_email = await repository.buscar_por_email("ana@joias.com")
+        por_email.excluir()
+        await repository.atualizar(por_email)
+        por_id = await repository.buscar_por_id(usuario.id)
+        resumos = await repository.listar_resumos()
+
+    # Assert
+    assert por_email.id == usuario.id
+    assert por_id.nome == "Ana"
+    assert por_id.ativo is False
+    assert [(r.email, r.ativo) for r in resumos] == [("ana@joias.com", False)]
+
+
+@pytest.mark.asyncio
+async def test_usuario_com_email_repetido(session_factory):
+    """Deve propagar o erro de integridade e manter a sessão utilizável."""
+    async with session_factory() as session:
+        repository = AsyncUsuarioRepository(session)
+        await repository.criar(Usuario.criar("ana@joias.com", "Ana", "hash"))
+
+        with pytest.raises(IntegrityError):
+            await repository.criar(Usuario.criar("ana@joias.com", "Outra", "hash"))
+
+        assert (await repository.buscar_por_email("ana@joias.com")).nome == "Ana"
+
+
+@pytest.mark.asyncio
+async def test_tokens(session_factory):
+    """Deve buscar tokens pelo valor e purgar apenas os expirados."""
+    # Arrange
+    agora = datetime(2024, 1, 1, 12)
+    async with session_factory() as session:
+        usuario = await AsyncUsuarioRepository(session).criar(
+            Usuario.criar("ana@joias.com", "Ana", "hash")
+        )
+        repository = AsyncTokenRepository(session)
+        valido = await repository.criar(
+            Token.criar(usuario.id, "valido", agora + timedelta(hours=1))
+        )
+        for i in range(3):
+            await repository.criar(
+                Token.criar(usuario.id, f"expirado-{i}", agora - timedelta(hours=1))
+            )
+
+    # Act
+    async with session_factory() as session:
+        repository = AsyncTokenRepository(session)
+        encontrado = await repository.buscar_por_token("valido")
+        purgados = await repository.purgar_expirados(agora, lote=2)
+        restante = await repository.buscar_por_usuario_id(usuario.id)
+
+    # Assert
+    assert encontrado.id == valido.id
+    assert purgados == 3
+    assert restante.token == "valido"
+
+
+@pytest.mark.asyncio
+async def test_servicos_de_perfis_e_permissoes(session_factory):
+    """Deve executar os casos de uso dos routers sobre os repositórios."""
+    async with session_factory() as session:
+        perfis = AsyncPerfilService(
+            AsyncSQLPerfilRepository(session), AsyncSQLPermissaoRepository(session)
+        )
+        permissoes = AsyncPermissaoService(AsyncSQLPermissaoRepository(session))
+
+        permissao = await permissoes.criar_permissao(
+            CriarPermissaoDTO(nome="Editar produto", chave="produto:editar")
+        )
+        perfil = await perfis.criar_perfil(CriarPerfilDTO(nome="Vendedor"))
+        perfil = await perfis.adicionar_permissao(perfil.id, permissao.id)
+
+        assert [p.chave for p in perfil.permissoes] == ["PRODUTO:EDITAR"]
+        with pytest.raises(ValueError):
+            await permissoes.excluir_permissao(permissao.id)
+        with pytest.raises(ValueError):
+            await perfis.criar_perfil(CriarPerfilDTO(nome="Vendedor"))
+
+
+@pytest.mark.asyncio
+async def test_servicos_de_usuarios_e_autenticacao(session_factory):
+    """Deve cadastrar, autenticar e atualizar usuários pelos serviços."""
+    async with session_factory() as session:
+        repository = AsyncUsuarioRepository(session)
+        auth = AsyncAuthService(repository, secret_key="segredo")
+        usuarios = AsyncUsuarioService(repository, auth)
+
+        usuario = await usuarios.criar_usuario("Ana", "ana@joias.com", "senha123")
+        token = await auth.autenticar("ana@joias.com", "senha123")
+        autenticado = await auth.validar_token(token)
+
+        assert autenticado.id == usuario.id
+        with pytest.raises(EntidadeJaExisteError):
+            await usuarios.criar_usuario("Outra", "ana@joias.com", "senha123")
+
+        await usuarios.atualizar_usuario(str(usuario.id), ativo=False)
+        with pytest.raises(AutenticacaoError):
+            await auth.autenticar("ana@joias.com", "senha123")
@@ -0,0 +1,347 @@
+"""
+Testes de integração para o repositório de fornecedores.
+
+Este módulo contém os testes que validam a integração
+do repositório de fornecedores com o banco de dados.
+"""
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from src.joias.domain.catalogo.entities.fornecedor import Documento, Fornecedor
+from src.joias.domain.catalogo.entities.produto import Produto
+from src.joias.domain.catalogo.services.fornecedor_service import FornecedorService
+from src.joias.domain.shared.value_objects.endereco import Endereco
+from src.joias.domain.shared.value_objects.moeda import Moeda
+from src.joias.domain.shared.value_objects.preco import Preco
+from src.joias.infrastructure.persistence.sqlalchemy.models.fornecedor import (
+    Documento as DocumentoModel,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.models.fornecedor import (
+    Fornecedor as FornecedorModel,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.models.fornecedor import (
+    fornecedores_produtos,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.models.produto import (
+    ProdutoModel,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.repositories.fornecedor_repository import (
+    SQLAlchemyFornecedorRepository,
+)
+
+
+def cnpj(i: int) -> str:
+    """Gera um número de CNPJ (14 dígitos) a partir de um inteiro."""
+    return f"{i:014d}"
+
+
+def novo_fornecedor(i: int) -> Fornecedor:
+    """Cria um fornecedor com um CNPJ derivado de i."""
+    return Fornecedor(
+        nome=f"Fornecedor {i}",
+        documentos=[Documento(numero=cnpj(i), tipo="CNPJ")],
+        endereco=Endereco(
+            logradouro="Rua das Joias",
+            numero="100",
+            bairro="Centro",
+            cidade="São Paulo",
+            estado="SP",
+            cep="01001-000",
+        ),
+    )
+
+
+def produto(sku: str) -> Produto:
+    """Cria um produto de catálogo, sem ID, identificado pelo SKU."""
+    return Produto(
+        sku=sku,
+        nome=f"Produto {sku}",
+        descricao="",
+        preco=Preco(valor_em_centavos=1000, moeda=Moeda.BRL),
+    )
+
+
+@pytest.fixture
+def repository(session, tables):
+    """Fixture que cria o repositório de fornecedores."""
+    return SQLAlchemyFornecedorRepository(session)
+
+
+@pytest.fixture
+def consultas(session):
+    """Fixture que registra os SELECTs executados na sessão."""
+    registradas = []
+
+    def registrar(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            registradas.append(statement)
+
+    conexao = session.connection()
+    event.listen(conexao, "before_cursor_execute", registrar)
+    yield registradas
+    event.remove(conexao, "before_cursor_execute", registrar)
+
+
+def test_salvar_em_lote_insere_fornecedores_e_documentos(session, repository):
+    """Testa a inserção em lote de fornecedores com seus documentos."""
+    fornecedores = [novo_fornecedor(i) for i in range(25)]
+
+    total = repository.salvar_em_lote(fornecedores, tamanho_lote=10)
+
+    assert total == 25
+    assert session.scalar(select(func.count()).select_from(FornecedorModel)) == 25
+    documentos = dict(
+        session.execute(
+            select(DocumentoModel.numero, FornecedorModel.nome).join(
+                FornecedorModel, DocumentoModel.fornecedor_id == FornecedorModel.id
+            )
+        ).all()
+    )
+    # Cada documento pertence ao fornecedor correspondente
+    assert documentos == {cnpj(i): f"Fornecedor {i}" for i in range(25)}
+
+
+def test_buscar_documentos_existentes(repository, consultas):
+    """Testa a verificação de documentos em lote com poucas consultas."""
+    repository.salvar_em_lote([novo_fornecedor(i) for i in range(0, 1200, 2)])
+    consultas.clear()
+
+    documentos = [Documento(numero=cnpj(i), tipo="CNPJ") for i in range(1200)]
+    existentes = repository.buscar_documentos_existentes(documentos)
+
+    assert existentes == {(cnpj(i), "CNPJ") for i in range(0, 1200, 2)}
+    # Uma consulta a cada 500 documentos, e não uma por documento
+    assert len(consultas) == 3
+
+
+def test_documento_duplicado_viola_indice_unico(session, repository):
+    """Testa que o mesmo documento não pode ser cadastrado duas vezes."""
+    repository.salvar_em_lote([novo_fornecedor(1)])
+
+    with pytest.raises(IntegrityError):
+        repository.salvar_em_lote([novo_fornecedor(1)])
+
+
+def test_criar_fornecedores_em_lote_ignora_documentos_repetidos(
+    session, repository, consultas
+):
+    """Testa que o serviço ignora documentos cadastrados e repetidos no lote."""
+    repository.salvar_em_lote([novo_fornecedor(i) for i in range(5)])
+    consultas.clear()
+    service = FornecedorService(repository)
+
+    lote = [novo_fornecedor(i) for i in range(3, 10)] + [novo_fornecedor(8)]
+    criados = service.criar_fornecedores_em_lote(lote)
+
+    # Uma única consulta resolve todos os documentos já cadastrados
+    assert len(consultas) == 1
+    assert [f.nome for f in criados] == [f"Fornecedor {i}" for i in range(5, 10)]
+    assert session.scalar(select(func.count()).select_from(FornecedorModel)) == 10
+
+
+def test_listar_carrega_documentos_com_uma_consulta(session, repository, consultas):
+    """Testa que a listagem não faz uma consulta de documentos por fornecedor."""
+    repository.salvar_em_lote([novo_fornecedor(i) for i in range(30)])
+    session.expunge_all()
+    consultas.clear()
+
+    fornecedores = repository.listar()
+
+    assert len(fornecedores) == 30
+    # Uma consulta para os fornecedores e uma (IN) para os documentos
+    assert len(consultas) == 2
+    assert fornecedores[0].documentos == [Documento(numero=cnpj(0), tipo="CNPJ")]
+    assert fornecedores[0].endereco == novo_fornecedor(0).endereco
+
+
+def test_buscar_por_nome_carrega_documentos_com_uma_consulta(
+    session, repository, consultas
+):
+    """Testa que a busca por nome carrega os documentos com uma consulta IN."""
+    repository.salvar_em_lote([novo_fornecedor(i) for i in range(30)])
+    session.expunge_all()
+    consultas.clear()
+
+    fornecedores = repository.buscar_por_nome("Fornecedor 1")
+
+    assert len(fornecedores) == 11
+    assert len(consultas) == 2
+    assert all(len(f.documentos) == 1 for f in fornecedores)
+
+
+def test_listar_resumos_com_documento_principal(session, repository, consultas):
+    """Testa que os resumos trazem o primeiro documento com uma consulta."""
+    fornecedor = novo_fornecedor(0)
+    fornecedor.documentos.append(Documento(numero="123456789", tipo="IE"))
+    repository.salvar_em_lote([fornecedor] + [novo_fornecedor(i) for i in range(1, 5)])
+    session.execute(
+        update(FornecedorModel)
+        .where(FornecedorModel.nome == "Fornecedor 4")
+        .values(ativo=False)
+    )
+    consultas.clear()
+
+    resumos = repository.listar_resumos()
+
+    assert len(consultas) == 1
+    assert [r.nome for r in resumos] == [f"Fornecedor {i}" for i in range(4)]
+    assert len(repository.listar_resumos(apenas_ativos=False)) == 5
+    assert (resumos[0].documento_numero, resumos[0].documento_tipo) == (
+        cnpj(0),
+        "CNPJ",
+    )
+    assert (resumos[0].cidade, resumos[0].estado) == ("São Paulo", "SP")
+
+def criar_catalogo(session, repository, fornecedores: int, produtos: int):
+    """Cria fornecedores e produtos, associando todos a todos."""
+    repository.salvar_em_lote([novo_fornecedor(i) for i in range(fornecedores)])
+    fornecedor_ids = session.scalars(
+        select(FornecedorModel.id).order_by(FornecedorModel.id)
+    ).all()
+    produto_ids = session.scalars(
+        insert(ProdutoModel).returning(ProdutoModel.id, sort_by_parameter_order=True),
+        [
+            {
+                "sku": f"SKU-{i:04d}",
+                "nome": f"Produto {i}",
+                "preco_valor": Decimal("10.00"),
+                "preco_moeda": "BRL",
+                "ativo": True,
+            }
+            for i in range(produtos)
+        ],
+    ).all()
+    session.execute(
+        insert(fornecedores_produtos),
+        [
+            {"fornecedor_id": f, "produto_id": p}
+            for f in fornecedor_ids
+            for p in produto_ids
+        ],
+    )
+    return fornecedor_ids, produto_ids
+
+
+def test_listar_produtos_do_fornecedor_paginado(session, repository):
+    """Testa a paginação por cursor dos produtos de um fornecedor."""
+    fornecedor_ids, produto_ids = criar_catalogo(session, repository, 2, 25)
+
+    skus = []
+    apos_id = None
+    for _ in range(3):
+        produtos, apos_id = repository.listar_produtos_do_fornecedor(
+            fornecedor_ids[0], apos_id=apos_id, limite=10
+        )
+        skus.extend(p.sku for p in produtos)
+
+    assert skus == [f"SKU-{i:04d}" for i in range(25)]
+    assert apos_id is None
+
+
+def test_listar_fornecedores_do_produto_paginado(session, repository):
+    """Testa a paginação por cursor dos fornecedores de um produto."""
+    fornecedor_ids, produto_ids = criar_catalogo(session, repository, 7, 2)
+    repository.desassociar_produto(fornecedor_ids[3], produto_ids[0])
+
+    pagina, proximo = repository.listar_fornecedores_do_produto(
+        produto_ids[0], limite=4
+    )
+    restante, fim = repository.listar_fornecedores_do_produto(
+        produto_ids[0], apos_id=proximo, limite=4
+    )
+
+    assert [f.id for f in pagina + restante] == [
+        i for i in fornecedor_ids if i != fornecedor_ids[3]
+    ]
+    assert proximo == fornecedor_ids[4]
+    assert fim is None
+
+
+def test_paginas_com_limite_invalido(session, repository):
+    """Testa que limites menores que 1 são rejeitados."""
+    fornecedor_ids, produto_ids = criar_catalogo(session, repository, 2, 2)
+
+    with pytest.raises(ValueError, match="limite"):
+        repository.listar_produtos_do_fornecedor(fornecedor_ids[0], limite=0)
+    with pytest.raises(ValueError, match="limite"):
+        repository.listar_fornecedores_do_produto(produto_ids[0], limite=-1)
+
+
+def test_buscar_por_id_carrega_produtos_sob_demanda(session, repository, consultas):
+    """Testa que os produtos só são consultados quando usados."""
+    fornecedor_ids, _ = criar_catalogo(session, repository, 1, 20)
+    session.expunge_all()
+    consultas.clear()
+
+    fornecedor = repository.buscar_por_id(fornecedor_ids[0])
+    consultas_busca = len(consultas)
+
+    assert not fornecedor.produtos.carregada
+    assert len(fornecedor.produtos) == 20
+    assert len(consultas) > consultas_busca
+    assert fornecedor.listar_produtos()[0] in fornecedor.produtos
+
+
+def test_alterar_produtos_sem_carregar(session, repository, consultas):
+    """Testa que adicionar, remover e verificar produtos não carregam a coleção."""
+    fornecedor_ids, _ = criar_catalogo(session, repository, 1, 3)
+    session.execute(
+        insert(ProdutoModel),
+        {
+            "sku": "SKU-NOVO",
+            "nome": "Produto novo",
+            "preco_valor": Decimal("10.00"),
+            "preco_moeda": "BRL",
+            "ativo": True,
+        },
+    )
+    novo, removido = produto("SKU-NOVO"), produto("SKU-0000")
+    session.expunge_all()
+
+    fornecedor = repository.buscar_por_id(fornecedor_ids[0])
+    consultas.clear()
+    fornecedor.adicionar_produto(novo)
+    fornecedor.remover_produto(removido)
+
+    assert novo in fornecedor.produtos
+    assert removido not in fornecedor.produtos
+    assert consultas == []
+    # Consulta apenas a associação do produto verificado
+    assert produto("SKU-0001") in fornecedor.produtos
+    assert len(consultas) == 1
+    assert not fornecedor.produtos.carregada
+
+    commits = []
+    event.listen(session, "after_commit", commits.append)
+    consultas.clear()
+    repository.atualizar(fornecedor)
+
+    # Uma consulta resolve os IDs pelos SKUs, sem commit no repositório
+    assert len([c for c in consultas if "FROM produtos" in c]) == 1
+    assert commits == []
+    produtos, _ = repository.listar_produtos_do_fornecedor(fornecedor_ids[0])
+    assert [p.sku for p in produtos] == ["SKU-0001", "SKU-0002", "SKU-NOVO"]
+
+
+def test_adicionar_produto_nao_cadastrado(session, repository):
+    """Testa que salvar um produto que não está cadastrado falha."""
+    fornecedor_ids, _ = criar_catalogo(session, repository, 1, 1)
+    fornecedor = repository.buscar_por_id(fornecedor_ids[0])
+    fornecedor.adicionar_produto(produto("SKU-INEXISTENTE"))
+
+    with pytest.raises(ValueError, match="SKU-INEXISTENTE"):
+        repository.atualizar(fornecedor)
+
+def test_associar_produto_nao_duplica(session, repository):
+    """Testa que associar o mesmo produto duas vezes não duplica a associação."""
+    fornecedor_ids, produto_ids = criar_catalogo(session, repository, 1, 1)
+    repository.desassociar_produto(fornecedor_ids[0], produto_ids[0])
+
+    repository.associar_produto(fornecedor_ids[0], produto_ids[0])
+    repository.associar_produto(fornecedor_ids[0], produto_ids[0])
+
+    produtos, _ = repository.listar_produtos_do_fornecedor(fornecedor_ids[0])
+    assert len(produtos) == 1
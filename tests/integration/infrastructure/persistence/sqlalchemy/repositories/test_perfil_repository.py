@@ -0,0 +1,166 @@
+"""
+Testes de integração para o repositório de perfis.
+
+Este módulo contém os testes que validam a integração
+do repositório de perfis com o banco de dados.
+"""
+import pytest
+from sqlalchemy import event, select
+
+from src.joias.domain.entities.perfil import Perfil
+from src.joias.domain.entities.permissao import Permissao
+from src.joias.infrastructure.persistence.sqlalchemy.models.perfil_permissao import (
+    perfil_permissao,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.models.permissao import (
+    PermissaoModel,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.repositories.perfil_repository import (
+    SQLPerfilRepository,
+)
+
+
+def criar_permissoes(session, quantidade: int):
+    """Cria permissões no banco e retorna as entidades correspondentes."""
+    permissoes = []
+    for i in range(quantidade):
+        model = PermissaoModel(
+            id=f"permissao-{i:04d}", nome=f"Permissão {i}", chave=f"recurso:{i}"
+        )
+        session.add(model)
+        permissao = Permissao(nome=model.nome, chave=model.chave)
+        permissao._id = model.id
+        permissoes.append(permissao)
+    session.flush()
+    return permissoes
+
+
+@pytest.fixture
+def comandos(session):
+    """Fixture que registra os comandos SQL executados na sessão."""
+    registrados = []
+
+    def registrar(conn, cursor, statement, parameters, context, executemany):
+        registrados.append(statement)
+
+    conexao = session.connection()
+    event.listen(conexao, "before_cursor_execute", registrar)
+    yield registrados
+    event.remove(conexao, "before_cursor_execute", registrar)
+
+
+def associadas(session, perfil_id: str):
+    """Retorna os IDs das permissões associadas ao perfil."""
+    return set(
+        session.scalars(
+            select(perfil_permissao.c.permissao_id).where(
+                perfil_permissao.c.perfil_id == perfil_id
+            )
+        )
+    )
+
+
+@pytest.mark.parametrize("quantidade", [10, 200])
+def test_atualizar_grava_apenas_a_diferenca(session, comandos, quantidade):
+    """Deve sincronizar as permissões com o mesmo número de comandos."""
+    # Arrange
+    permissoes = criar_permissoes(session, quantidade + 1)
+    repository = SQLPerfilRepository(session)
+    perfil = repository.criar(Perfil(nome="Administrador"))
+    for permissao in permissoes[:quantidade]:
+        perfil.adicionar_permissao(permissao)
+    repository.atualizar(perfil)
+
+    perfil.remover_permissao(permissoes[0])
+    perfil.adicionar_permissao(permissoes[quantidade])
+    comandos.clear()
+
+    # Act
+    repository.atualizar(perfil)
+
+    # Assert
+    esperadas = {p.id for p in permissoes[1:]}
+    assert associadas(session, perfil.id) == esperadas
+    inseridos = [c for c in comandos if c.startswith("INSERT INTO perfil_permissao")]
+    removidos = [c for c in comandos if c.startswith("DELETE FROM perfil_permissao")]
+    assert len(inseridos) == 1
+    assert len(removidos) == 1
+    assert len(comandos) <= 6
+
+
+def test_atualizar_sem_mudancas_nao_grava_associacoes(session, comandos):
+    """Não deve tocar em perfil_permissao quando as permissões não mudam."""
+    # Arrange
+    permissoes = criar_permissoes(session, 3)
+    repository = SQLPerfilRepository(session)
+    perfil = repository.criar(Perfil(nome="Vendedor"))
+    for permissao in permissoes:
+        perfil.adicionar_permissao(permissao)
+    repository.atualizar(perfil)
+    comandos.clear()
+
+    # Act
+    repository.atualizar(perfil)
+
+    # Assert
+    assert not [c for c in comandos if "perfil_permissao" in c and "SELECT" not in c]
+
+
+def test_atualizar_com_permissao_inexistente(session):
+    """Deve rejeitar permissões que não existem no banco."""
+    # Arrange
+    repository = SQLPerfilRepository(session)
+    perfil = repository.criar(Perfil(nome="Caixa"))
+    perfil.adicionar_permissao(Permissao(nome="Fantasma", chave="nada:existe"))
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="Permissão não encontrada"):
+        repository.atualizar(perfil)
+
+
+@pytest.mark.parametrize("quantidade", [5, 100])
+def test_listar_carrega_perfis_e_permissoes_em_duas_consultas(
+    session, comandos, quantidade
+):
+    """Deve listar perfis com permissões em duas consultas, compartilhando-as."""
+    # Arrange
+    permissoes = criar_permissoes(session, 3)
+    repository = SQLPerfilRepository(session)
+    for i in range(quantidade):
+        perfil = repository.criar(Perfil(nome=f"Perfil {i}"))
+        for permissao in permissoes:
+            perfil.adicionar_permissao(permissao)
+        repository.atualizar(perfil)
+    session.expunge_all()
+    comandos.clear()
+
+    # Act
+    perfis = repository.listar()
+
+    # Assert
+    assert len(comandos) == 2
+    assert len(perfis) == quantidade
+    instancias = {id(p) for perfil in perfis for p in perfil.permissoes}
+    assert len(instancias) == 3
+    assert all(perfil.tem_permissao("recurso:1") for perfil in perfis)
+
+
+def test_buscar_por_nome_com_permissoes(session, comandos):
+    """Deve buscar um perfil e suas permissões em duas consultas."""
+    # Arrange
+    permissoes = criar_permissoes(session, 2)
+    repository = SQLPerfilRepository(session)
+    perfil = repository.criar(Perfil(nome="Gerente"))
+    for permissao in permissoes:
+        perfil.adicionar_permissao(permissao)
+    repository.atualizar(perfil)
+    session.expunge_all()
+    comandos.clear()
+
+    # Act
+    encontrado = repository.buscar_por_nome("Gerente")
+
+    # Assert
+    assert len(comandos) == 2
+    assert encontrado.id == perfil.id
+    assert {p.id for p in encontrado.permissoes} == {p.id for p in permissoes}
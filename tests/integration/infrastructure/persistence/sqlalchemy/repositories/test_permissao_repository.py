@@ -0,0 +1,134 @@
+"""
+Testes de integração para o repositório de permissões.
+
+Este módulo contém os testes que validam o catálogo de permissões em
+memória usado pelo repositório de permissões.
+"""
+import pytest
+from sqlalchemy import event
+
+from src.joias.domain.entities.permissao import Permissao
+from src.joias.infrastructure.persistence.sqlalchemy.repositories.permissao_repository import (
+    CatalogoPermissoes,
+    SQLPermissaoRepository,
+)
+
+
+class Relogio:
+    """Relógio controlado pelo teste."""
+
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self) -> float:
+        return self.agora
+
+
+@pytest.fixture
+def relogio():
+    """Fixture que cria um relógio controlado."""
+    return Relogio()
+
+
+@pytest.fixture
+def catalogo(relogio):
+    """Fixture que cria um catálogo isolado do catálogo do processo."""
+    return CatalogoPermissoes(intervalo_verificacao=5.0, relogio=relogio)
+
+
+@pytest.fixture
+def repository(session, tables, catalogo):
+    """Fixture que cria o repositório de permissões."""
+    return SQLPermissaoRepository(session, catalogo)
+
+
+@pytest.fixture
+def consultas(session):
+    """Fixture que registra os comandos SQL executados na sessão."""
+    registradas = []
+
+    def registrar(conn, cursor, statement, parameters, context, executemany):
+        registradas.append(statement)
+
+    conexao = session.connection()
+    event.listen(conexao, "before_cursor_execute", registrar)
+    yield registradas
+    event.remove(conexao, "before_cursor_execute", registrar)
+
+
+def criar_permissoes(repository, quantidade: int):
+    """Cria permissões pelo repositório."""
+    return [
+        repository.criar(Permissao(nome=f"Permissão {i}", chave=f"recurso:{i}"))
+        for i in range(quantidade)
+    ]
+
+
+def test_leituras_nao_acessam_o_banco_apos_carregar(repository, catalogo, consultas):
+    """Testa que o catálogo atende as leituras sem consultas ao banco."""
+    permissoes = criar_permissoes(repository, 10)
+    repository.listar()
+    consultas.clear()
+
+    for permissao in permissoes:
+        assert repository.buscar_por_id(permissao.id).chave == permissao.chave
+        assert repository.buscar_por_chave(permissao.chave).id == permissao.id
+    assert repository.buscar_por_chave("inexistente") is None
+    assert len(repository.listar()) == 10
+
+    assert consultas == []
+    assert catalogo.carregamentos == 1
+
+
+def test_busca_por_chave_ignora_maiusculas(repository):
+    """Testa que a chave é buscada sem diferenciar maiúsculas."""
+    criar_permissoes(repository, 1)
+
+    assert repository.buscar_por_chave("recurso:0").chave == "RECURSO:0"
+
+
+def test_escritas_invalidam_o_catalogo(repository):
+    """Testa que criar e deletar refletem imediatamente nas leituras."""
+    assert repository.listar() == []
+
+    permissao = repository.criar(Permissao(nome="Editar", chave="produto:editar"))
+    assert repository.buscar_por_chave("produto:editar").id == permissao.id
+
+    repository.deletar(permissao)
+    assert repository.buscar_por_id(permissao.id) is None
+
+
+def test_entidades_retornadas_nao_alteram_o_catalogo(repository):
+    """Testa que cada leitura cria uma nova entidade."""
+    permissao = criar_permissoes(repository, 1)[0]
+
+    primeira = repository.buscar_por_id(permissao.id)
+    primeira._nome = "Alterada"  # pylint: disable=protected-access
+
+    assert repository.buscar_por_id(permissao.id).nome == "Permissão 0"
+
+
+def test_outro_processo_detecta_versao_nova(session, repository, relogio, consultas):
+    """Testa que outro processo recarrega o catálogo após uma escrita."""
+    outro_catalogo = CatalogoPermissoes(intervalo_verificacao=5.0, relogio=relogio)
+    outro_processo = SQLPermissaoRepository(session, outro_catalogo)
+    assert outro_processo.listar() == []
+
+    repository.criar(Permissao(nome="Editar", chave="produto:editar"))
+
+    # Dentro do intervalo, o outro processo não consulta o banco
+    consultas.clear()
+    assert outro_processo.buscar_por_chave("produto:editar") is None
+    assert consultas == []
+
+    # Após o intervalo, uma consulta de versão detecta a mudança
+    relogio.agora += 5.0
+    assert outro_processo.buscar_por_chave("produto:editar") is not None
+    assert outro_catalogo.carregamentos == 2
+
+    # Sem novas escritas, a verificação seguinte não recarrega
+    relogio.agora += 5.0
+    consultas.clear()
+    outro_processo.listar()
+    assert len(consultas) == 1
+    assert outro_catalogo.carregamentos == 2
@@ -0,0 +1,183 @@
+"""
+Testes de integração para o repositório de permissões efetivas.
+
+Este módulo contém os testes que validam a resolução das permissões
+de um usuário e o cache por usuário.
+"""
+import uuid
+
+import pytest
+from sqlalchemy import event, insert
+
+from src.joias.application.identity.autorizacao_service import AutorizacaoService
+from src.joias.application.shared.exceptions import AutorizacaoError
+from src.joias.domain.entities.perfil import Perfil
+from src.joias.domain.entities.permissao import Permissao
+from src.joias.infrastructure.persistence.sqlalchemy.models.perfil import (
+    usuario_perfil,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.models.usuario import (
+    UsuarioModel,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.repositories.perfil_repository import (
+    SQLPerfilRepository,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.repositories.permissao_repository import (
+    CatalogoPermissoes,
+    SQLPermissaoRepository,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.repositories.permissoes_efetivas_repository import (
+    PERMISSOES_EFETIVAS,
+    CachePermissoesEfetivas,
+    SQLPermissoesEfetivasRepository,
+)
+
+
+class Relogio:
+    """Relógio controlado pelo teste."""
+
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self) -> float:
+        return self.agora
+
+
+@pytest.fixture
+def relogio():
+    """Fixture que cria um relógio controlado."""
+    return Relogio()
+
+
+@pytest.fixture
+def cache(relogio):
+    """Fixture que cria um cache isolado do cache do processo."""
+    return CachePermissoesEfetivas(ttl=60.0, relogio=relogio)
+
+
+@pytest.fixture
+def repository(session, tables, cache):
+    """Fixture que cria o repositório de permissões efetivas."""
+    return SQLPermissoesEfetivasRepository(session, cache)
+
+
+@pytest.fixture
+def consultas(session):
+    """Fixture que registra os comandos SQL executados na sessão."""
+    registradas = []
+
+    def registrar(conn, cursor, statement, parameters, context, executemany):
+        registradas.append(statement)
+
+    conexao = session.connection()
+    event.listen(conexao, "before_cursor_execute", registrar)
+    yield registradas
+    event.remove(conexao, "before_cursor_execute", registrar)
+
+
+@pytest.fixture
+def cenario(session, tables):
+    """
+    Cria um usuário com dois perfis que compartilham uma permissão.
+
+    Returns:
+        ID do usuário e o perfil "Estoque"
+    """
+    permissoes = SQLPermissaoRepository(session, CatalogoPermissoes())
+    perfis = SQLPerfilRepository(session)
+    editar, listar, excluir = (
+        permissoes.criar(Permissao(nome=chave, chave=chave))
+        for chave in ("produto:editar", "produto:listar", "produto:excluir")
+    )
+    vendas = perfis.criar(Perfil(nome="Vendas"))
+    vendas.adicionar_permissao(listar)
+    perfis.atualizar(vendas)
+    estoque = perfis.criar(Perfil(nome="Estoque"))
+    estoque.adicionar_permissao(listar)
+    estoque.adicionar_permissao(editar)
+    perfis.atualizar(estoque)
+    # Perfil não associado ao usuário
+    administrador = perfis.criar(Perfil(nome="Administrador"))
+    administrador.adicionar_permissao(excluir)
+    perfis.atualizar(administrador)
+
+    usuario_id = uuid.uuid4()
+    session.execute(
+        insert(UsuarioModel).values(
+            id=usuario_id, nome="Ana", email="ana@joias.com", senha_hash="hash"
+        )
+    )
+    session.execute(
+        insert(usuario_perfil),
+        [
+            {"usuario_id": usuario_id, "perfil_id": vendas.id},
+            {"usuario_id": usuario_id, "perfil_id": estoque.id},
+        ],
+    )
+    return usuario_id, estoque
+
+
+def test_resolve_permissoes_com_uma_consulta(repository, cenario, consultas):
+    """Testa que as permissões de todos os perfis vêm de uma consulta."""
+    usuario_id, _ = cenario
+
+    chaves = repository.buscar_chaves(usuario_id)
+
+    assert chaves == frozenset({"PRODUTO:EDITAR", "PRODUTO:LISTAR"})
+    assert len(consultas) == 1
+
+
+def test_verificacoes_seguintes_usam_o_cache(repository, cenario, consultas):
+    """Testa que, dentro do TTL, as verificações não acessam o banco."""
+    usuario_id, _ = cenario
+    service = AutorizacaoService(repository)
+    repository.buscar_chaves(usuario_id)
+    consultas.clear()
+
+    assert service.tem_permissao(usuario_id, "produto:editar")
+    assert not service.tem_permissao(usuario_id, "produto:excluir")
+    with pytest.raises(AutorizacaoError):
+        service.exigir_permissao(usuario_id, "produto:excluir")
+    assert consultas == []
+
+
+def test_cache_expira_apos_o_ttl(repository, cenario, relogio, consultas):
+    """Testa que as permissões são consultadas novamente após o TTL."""
+    usuario_id, _ = cenario
+    repository.buscar_chaves(usuario_id)
+    consultas.clear()
+
+    relogio.agora += 60.0
+    repository.buscar_chaves(usuario_id)
+
+    assert len(consultas) == 1
+
+
+def test_usuario_sem_perfis_nao_tem_permissoes(repository, tables):
+    """Testa que um usuário sem perfis tem um conjunto vazio de permissões."""
+    assert repository.buscar_chaves(uuid.uuid4()) == frozenset()
+
+
+def test_atualizar_perfil_invalida_o_cache(session, cenario):
+    """Testa que alterar as permissões de um perfil reflete imediatamente."""
+    usuario_id, estoque = cenario
+    repository = SQLPermissoesEfetivasRepository(session)
+    assert "PRODUTO:EDITAR" in repository.buscar_chaves(usuario_id)
+
+    editar = next(p for p in estoque.permissoes if p.chave == "PRODUTO:EDITAR")
+    estoque.remover_permissao(editar)
+    SQLPerfilRepository(session).atualizar(estoque)
+
+    assert repository.buscar_chaves(usuario_id) == frozenset({"PRODUTO:LISTAR"})
+    PERMISSOES_EFETIVAS.invalidar()
+
+
+def test_carregamento_anterior_a_invalidacao_nao_e_armazenado(cache):
+    """Testa que uma invalidação descarta carregamentos em andamento."""
+    usuario_id = uuid.uuid4()
+    geracao = cache.geracao
+
+    cache.invalidar(usuario_id)
+    cache.definir(usuario_id, frozenset({"PRODUTO:EDITAR"}), geracao)
+
+    assert cache.obter(usuario_id) is None
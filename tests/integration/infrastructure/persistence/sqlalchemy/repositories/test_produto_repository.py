@@ -0,0 +1,366 @@
+"""
+Testes de integração para o repositório de produtos.
+
+Este módulo contém os testes que validam a integração
+do repositório de produtos com o banco de dados.
+"""
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event, func, select
+
+from src.joias.domain.catalogo.entities.produto import Detalhe, Produto, Variacao
+from src.joias.domain.shared.value_objects.moeda import Moeda
+from src.joias.domain.shared.value_objects.preco import Preco, centavos
+
+from src.joias.infrastructure.persistence.sqlalchemy.models.produto import (
+    DetalheModel,
+    DetalheVariacaoModel,
+    ProdutoModel,
+    VariacaoModel,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.repositories.produto_repository import (
+    SQLAlchemyProdutoRepository,
+)
+
+
+def grafo(produto: Produto):
+    """Retorna os nomes dos detalhes das variações e do produto."""
+    return (
+        [[d.nome for d in v.detalhes] for v in produto.variacoes],
+        [d.nome for d in produto.detalhes],
+    )
+
+
+def criar_produtos(session, quantidade: int) -> None:
+    """Cria produtos com uma variação e detalhes cada."""
+    for i in range(quantidade):
+        produto = ProdutoModel(
+            sku=f"SKU-{quantidade}-{i}",
+            nome=f"Produto {i}",
+            preco_valor=Decimal("10.00"),
+            preco_moeda="BRL",
+            ativo=True,
+        )
+        variacao = VariacaoModel(nome="Aro 18", codigo=f"V-{i}", produto=produto)
+        DetalheVariacaoModel(
+            nome="Tamanho", valor="18", tipo="medida", variacao=variacao
+        )
+        DetalheModel(nome="Material", valor="Ouro", tipo="material", produto=produto)
+        session.add(produto)
+    session.flush()
+    session.expunge_all()
+
+
+@pytest.fixture
+def contador_consultas(engine):
+    """Fixture que conta as consultas SQL executadas."""
+    consultas = []
+
+    def registrar(conn, cursor, statement, *args):
+        consultas.append(statement)
+
+    event.listen(engine, "before_cursor_execute", registrar)
+    yield consultas
+    event.remove(engine, "before_cursor_execute", registrar)
+
+
+@pytest.mark.parametrize("quantidade", [5, 50])
+def test_listar_completo_numero_constante_de_consultas(
+    session, contador_consultas, quantidade
+):
+    """Deve carregar o grafo completo com o mesmo número de consultas."""
+    # Arrange
+    criar_produtos(session, quantidade)
+    repository = SQLAlchemyProdutoRepository(session)
+    contador_consultas.clear()
+
+    # Act
+    produtos = repository.listar()
+
+    # Assert
+    assert len(produtos) == quantidade
+    assert grafo(produtos[0]) == ([["Tamanho"]], ["Material"])
+    assert produtos[0].preco.valor == Decimal("10.00")
+    # produtos + variações + detalhes das variações + detalhes do produto
+    assert len(contador_consultas) == 4
+
+
+def test_listar_perfil_listagem_nao_carrega_filhos(session, contador_consultas):
+    """Deve listar sem carregar variações e detalhes no perfil de listagem."""
+    # Arrange
+    criar_produtos(session, 20)
+    repository = SQLAlchemyProdutoRepository(session, perfis={"listar": "listagem"})
+    contador_consultas.clear()
+
+    # Act
+    produtos = repository.listar()
+
+    # Assert
+    assert len(produtos) == 20
+    assert grafo(produtos[0]) == ([], [])
+    assert produtos[0].sku == "SKU-20-0"
+    assert len(contador_consultas) == 1
+
+
+def test_listar_pagina_por_cursor(session):
+    """Deve percorrer todas as páginas seguindo o cursor."""
+    # Arrange
+    criar_produtos(session, 7)
+    repository = SQLAlchemyProdutoRepository(session)
+
+    # Act
+    pagina1, cursor1 = repository.listar_pagina(limite=3)
+    pagina2, cursor2 = repository.listar_pagina(apos_id=cursor1, limite=3)
+    pagina3, cursor3 = repository.listar_pagina(apos_id=cursor2, limite=3)
+
+    # Assert
+    assert [len(pagina1), len(pagina2), len(pagina3)] == [3, 3, 1]
+    assert [p.id for p in pagina1 + pagina2 + pagina3] == sorted(
+        p.id for p in pagina1 + pagina2 + pagina3
+    )
+    assert cursor1 == pagina1[-1].id
+    assert cursor1 < cursor2
+    assert grafo(pagina3[0]) == ([["Tamanho"]], ["Material"])
+    assert cursor3 is None
+
+
+def test_listar_resumos_com_uma_consulta(session, contador_consultas):
+    """Deve listar os resumos com uma consulta, sem carregar entidades."""
+    # Arrange
+    criar_produtos(session, 20)
+    repository = SQLAlchemyProdutoRepository(session)
+    contador_consultas.clear()
+
+    # Act
+    resumos = repository.listar_resumos()
+
+    # Assert
+    assert len(resumos) == 20
+    assert resumos[0].sku == "SKU-20-0"
+    assert resumos[0].preco_valor == Decimal("10.00")
+    assert resumos[0].preco_moeda == "BRL"
+    assert len(contador_consultas) == 1
+
+
+def test_listar_pagina_resumos_por_cursor(session):
+    """Deve percorrer as páginas de resumos seguindo o cursor."""
+    # Arrange
+    criar_produtos(session, 7)
+    repository = SQLAlchemyProdutoRepository(session)
+
+    # Act
+    pagina1, cursor1 = repository.listar_pagina_resumos(limite=4)
+    pagina2, cursor2 = repository.listar_pagina_resumos(apos_id=cursor1, limite=4)
+
+    # Assert
+    assert [r.sku for r in pagina1 + pagina2] == [f"SKU-7-{i}" for i in range(7)]
+    assert cursor1 == pagina1[-1].id
+    assert cursor2 is None
+
+
+@pytest.mark.parametrize("limite", [0, -1])
+def test_listar_pagina_limite_invalido(session, limite):
+    """Deve rejeitar páginas vazias ou negativas em vez de errar o cursor."""
+    # Arrange
+    criar_produtos(session, 3)
+    repository = SQLAlchemyProdutoRepository(session)
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="limite"):
+        repository.listar_pagina(limite=limite)
+    with pytest.raises(ValueError, match="limite"):
+        repository.listar_pagina_resumos(limite=limite)
+
+
+def test_iterar_percorre_todos_os_produtos(session):
+    """Deve percorrer todos os produtos carregando em lotes."""
+    # Arrange
+    criar_produtos(session, 25)
+    repository = SQLAlchemyProdutoRepository(session)
+
+    # Act
+    produtos = list(repository.iterar(lote=10))
+
+    # Assert
+    assert len(produtos) == 25
+    assert [p.sku for p in produtos] == [f"SKU-25-{i}" for i in range(25)]
+    assert all(grafo(p) == ([["Tamanho"]], ["Material"]) for p in produtos)
+
+
+def produto_para_importacao(sku: str, valor: str, variacoes: int) -> Produto:
+    """Cria um produto de catálogo como os recebidos na importação."""
+    return Produto(
+        sku=sku,
+        nome=f"Produto {sku}",
+        descricao="Importado do fornecedor",
+        preco=Preco(valor_em_centavos=centavos(Decimal(valor)), moeda=Moeda.BRL),
+        variacoes=[
+            Variacao(
+                nome=f"Aro {i}",
+                descricao="",
+                codigo=f"{sku}-{i}",
+                detalhes=[Detalhe(nome="Tamanho", valor=str(i), tipo="medida")],
+            )
+            for i in range(variacoes)
+        ],
+        detalhes=[Detalhe(nome="Material", valor="Ouro", tipo="material")],
+    )
+
+
+def contar(session, model) -> int:
+    """Conta as linhas de uma tabela."""
+    return session.scalar(select(func.count()).select_from(model))
+
+
+def test_salvar_em_lote_insere_e_atualiza(session):
+    """Deve inserir produtos novos e substituir os existentes pelo SKU."""
+    # Arrange
+    repository = SQLAlchemyProdutoRepository(session)
+    repository.salvar_em_lote(
+        [produto_para_importacao(f"SKU-{i}", "10.00", 2) for i in range(5)],
+        tamanho_lote=2,
+    )
+
+    # Act
+    total = repository.salvar_em_lote(
+        [produto_para_importacao("SKU-0", "12.50", 1)]
+        + [produto_para_importacao("SKU-9", "20.00", 3)]
+    )
+
+    # Assert
+    assert total == 2
+    assert contar(session, ProdutoModel) == 6
+    assert contar(session, VariacaoModel) == 4 * 2 + 1 + 3
+    assert contar(session, DetalheVariacaoModel) == 4 * 2 + 1 + 3
+    assert contar(session, DetalheModel) == 6
+    produto = repository.buscar_por_sku("SKU-0")
+    assert produto.preco == Preco(valor_em_centavos=1250, moeda=Moeda.BRL)
+    assert [v.codigo for v in produto.variacoes] == ["SKU-0-0"]
+    assert grafo(repository.buscar_por_sku("SKU-9")) == (
+        [["Tamanho"]] * 3,
+        ["Material"],
+    )
+
+
+def test_salvar_em_lote_mantem_filhos_existentes(session, escritas):
+    """Deve atualizar variações pelo código e detalhes por (nome, tipo)."""
+    # Arrange
+    repository = SQLAlchemyProdutoRepository(session)
+    repository.salvar_em_lote([produto_para_importacao("SKU-1", "10.00", 2)])
+    codigos_e_ids = select(VariacaoModel.codigo, VariacaoModel.id)
+    variacoes_antes = dict(session.execute(codigos_e_ids).all())
+    detalhe_antes = session.scalar(select(DetalheModel.id))
+    escritas.clear()
+
+    # Act
+    repository.salvar_em_lote([produto_para_importacao("SKU-1", "10.00", 3)])
+
+    # Assert
+    variacoes = dict(session.execute(codigos_e_ids).all())
+    assert {c: variacoes[c] for c in variacoes_antes} == variacoes_antes
+    assert set(variacoes) == {"SKU-1-0", "SKU-1-1", "SKU-1-2"}
+    assert session.scalar(select(DetalheModel.id)) == detalhe_antes
+    assert contar(session, DetalheVariacaoModel) == 3
+    assert not [c for c in escritas if c.startswith("DELETE")]
+
+
+@pytest.fixture
+def escritas(engine):
+    """Fixture que registra os comandos de escrita executados."""
+    comandos = []
+
+    def registrar(conn, cursor, statement, *args):
+        if not statement.startswith("SELECT"):
+            comandos.append(" ".join(statement.split()))
+
+    event.listen(engine, "before_cursor_execute", registrar)
+    yield comandos
+    event.remove(engine, "before_cursor_execute", registrar)
+
+
+def produto_salvo(session, sku: str, variacoes: int) -> Produto:
+    """Salva um produto de importação e o relê do banco, com o ID."""
+    repository = SQLAlchemyProdutoRepository(session)
+    repository.salvar_em_lote([produto_para_importacao(sku, "10.00", variacoes)])
+    session.expunge_all()
+    produto = repository.buscar_por_sku(sku)
+    session.expunge_all()
+    return produto
+
+
+def test_atualizar_apenas_preco_gera_um_update_de_uma_coluna(session, escritas):
+    """Deve gravar apenas a coluna do preço quando só o preço muda."""
+    # Arrange
+    produto = produto_salvo(session, "SKU-PRECO", 2)
+    repository = SQLAlchemyProdutoRepository(session)
+    assert produto.id is not None
+    produto.atualizar_preco(Preco(valor_em_centavos=1290, moeda=Moeda.BRL))
+    escritas.clear()
+
+    # Act
+    resultado = repository.atualizar(produto)
+
+    # Assert
+    assert resultado is produto
+    assert escritas == [
+        "UPDATE produtos SET preco_valor=? WHERE produtos.id = ?",
+    ]
+    preco = session.scalar(
+        select(ProdutoModel.preco_valor).where(ProdutoModel.id == produto.id)
+    )
+    assert preco == Decimal("12.90")
+
+
+def test_atualizar_sem_alteracoes_nao_grava(session, escritas):
+    """Não deve gravar nada quando o produto não mudou."""
+    # Arrange
+    produto = produto_salvo(session, "SKU-IGUAL", 2)
+    escritas.clear()
+
+    # Act
+    SQLAlchemyProdutoRepository(session).atualizar(produto)
+
+    # Assert
+    assert escritas == []
+
+
+def test_atualizar_grava_apenas_os_filhos_alterados(session, escritas):
+    """Deve atualizar, criar e excluir apenas os filhos que mudaram."""
+    # Arrange
+    produto = produto_salvo(session, "SKU-FILHOS", 3)
+    produto.variacoes[0].detalhes[0].valor = "20"
+    del produto.variacoes[2]
+    produto.adicionar_variacao(
+        Variacao(
+            nome="Aro 20",
+            descricao="",
+            codigo="SKU-FILHOS-20",
+            detalhes=[Detalhe(nome="Tamanho", valor="20", tipo="medida")],
+        )
+    )
+    produto.adicionar_detalhe(Detalhe(nome="Pedra", valor="Rubi", tipo="pedra"))
+    escritas.clear()
+
+    # Act
+    SQLAlchemyProdutoRepository(session).atualizar(produto)
+
+    # Assert
+    assert sorted(comando.split(" (")[0].split(" SET")[0] for comando in escritas) == [
+        "DELETE FROM detalhes_variacoes WHERE detalhes_variacoes.id = ?",
+        "DELETE FROM variacoes WHERE variacoes.id = ?",
+        "INSERT INTO detalhes",
+        "INSERT INTO detalhes_variacoes",
+        "INSERT INTO variacoes",
+        "UPDATE detalhes_variacoes",
+    ]
+    session.expunge_all()
+    model = session.get(ProdutoModel, produto.id)
+    assert [v.codigo for v in model.variacoes] == [
+        "SKU-FILHOS-0",
+        "SKU-FILHOS-1",
+        "SKU-FILHOS-20",
+    ]
+    assert [d.valor for d in model.variacoes[2].detalhes] == ["20"]
+    assert [d.valor for d in model.variacoes[0].detalhes] == ["20"]
+    assert sorted(d.nome for d in model.detalhes) == ["Material", "Pedra"]
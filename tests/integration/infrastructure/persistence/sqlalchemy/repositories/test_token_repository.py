@@ -0,0 +1,112 @@
+"""
+Testes de integração para o repositório de tokens.
+
+Este módulo contém os testes que validam a busca de tokens pelo hash
+e a purga dos tokens expirados.
+"""
+import hashlib
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, insert, select
+
+from src.joias.domain.entities.autorizacao import Token
+from src.joias.infrastructure.persistence.sqlalchemy.models.token import (
+    Token as TokenModel,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.models.usuario import (
+    UsuarioModel,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.repositories.token_repository import (
+    TokenRepository,
+)
+
+AGORA = datetime(2026, 10, 19, 12, 0)
+
+
+@pytest.fixture
+def repository(session, tables):
+    """Fixture que cria o repositório de tokens."""
+    return TokenRepository(session)
+
+
+@pytest.fixture
+def usuario_id(session, tables):
+    """Fixture que cria o usuário dono dos tokens."""
+    usuario_id = uuid4()
+    session.execute(
+        insert(UsuarioModel).values(
+            id=usuario_id, nome="Ana", email="ana@joias.com", senha_hash="hash"
+        )
+    )
+    return usuario_id
+
+
+@pytest.fixture
+def exclusoes(session):
+    """Fixture que registra os comandos DELETE executados na sessão."""
+    registradas = []
+
+    def registrar(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("DELETE"):
+            registradas.append(statement)
+
+    conexao = session.connection()
+    event.listen(conexao, "before_cursor_execute", registrar)
+    yield registradas
+    event.remove(conexao, "before_cursor_execute", registrar)
+
+
+def criar_tokens(repository, usuario_id, quantidade, expiracao):
+    """Cria tokens com a mesma expiração."""
+    return [
+        repository.criar(Token.criar(usuario_id, f"jwt-{uuid4()}", expiracao))
+        for _ in range(quantidade)
+    ]
+
+
+def test_buscar_por_token_usa_o_hash(session, repository, usuario_id):
+    """Testa que o token é armazenado com seu hash e buscado por ele."""
+    token = repository.criar(Token.criar(usuario_id, "header.payload.sig", AGORA))
+
+    token_hash = session.scalar(
+        select(TokenModel.token_hash).where(TokenModel.id == token.id)
+    )
+    encontrado = repository.buscar_por_token("header.payload.sig")
+
+    assert token_hash == hashlib.sha256(b"header.payload.sig").hexdigest()
+    assert encontrado.id == token.id
+    assert encontrado.token == "header.payload.sig"
+    assert repository.buscar_por_token("header.payload.outra") is None
+
+
+def test_atualizar_recalcula_o_hash(repository, usuario_id):
+    """Testa que o token atualizado é encontrado pelo novo valor."""
+    token = repository.criar(Token.criar(usuario_id, "antigo", AGORA))
+
+    token.atualizar(token="novo")
+    repository.atualizar(token)
+
+    assert repository.buscar_por_token("antigo") is None
+    assert repository.buscar_por_token("novo").id == token.id
+
+
+def test_purgar_expirados_em_lotes(repository, usuario_id, exclusoes):
+    """Testa que apenas os tokens expirados são excluídos, em lotes."""
+    expirados = criar_tokens(repository, usuario_id, 5, AGORA - timedelta(hours=1))
+    validos = criar_tokens(repository, usuario_id, 2, AGORA + timedelta(hours=1))
+
+    excluidos = repository.purgar_expirados(agora=AGORA, lote=2)
+
+    assert excluidos == 5
+    assert len(exclusoes) == 3
+    assert all(repository.buscar_por_id(t.id) is None for t in expirados)
+    assert all(repository.buscar_por_id(t.id) is not None for t in validos)
+
+
+def test_purgar_sem_tokens_expirados(repository, usuario_id):
+    """Testa que a purga sem tokens expirados não exclui nada."""
+    criar_tokens(repository, usuario_id, 2, AGORA + timedelta(hours=1))
+
+    assert repository.purgar_expirados(agora=AGORA) == 0
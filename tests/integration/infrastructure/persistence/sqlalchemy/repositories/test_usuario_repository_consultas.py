@@ -0,0 +1,80 @@
+"""
+Testes de integração para as consultas do repositório de usuários.
+
+Este módulo contém os testes que validam as buscas por colunas
+(autenticação) e a projeção das listagens de usuários.
+"""
+import pytest
+
+from src.joias.application.identity.usuario_service import UsuarioService
+from src.joias.domain.entities.autorizacao import Usuario
+from src.joias.domain.repositories.usuario_repository import ResumoUsuario
+from src.joias.infrastructure.persistence.sqlalchemy.repositories.usuario_repository import (
+    UsuarioRepository,
+)
+
+
+@pytest.fixture
+def repository(session, tables):
+    """Fixture que cria o repositório de usuários."""
+    return UsuarioRepository(session)
+
+
+@pytest.fixture
+def usuario(repository):
+    """Fixture que cria um usuário."""
+    return repository.criar(Usuario.criar("ana@joias.com", "Ana", "hash"))
+
+
+def test_buscar_por_email(repository, usuario):
+    """Testa que a busca por email retorna a entidade completa."""
+    encontrado = repository.buscar_por_email("ana@joias.com")
+
+    assert encontrado.id == usuario.id
+    assert encontrado.nome == "Ana"
+    assert encontrado.senha_hash == "hash"
+    assert encontrado.ativo is True
+    assert encontrado.created_at == usuario.created_at
+
+
+def test_buscar_por_email_inexistente(repository, tables):
+    """Testa que a busca por um email inexistente retorna None."""
+    assert repository.buscar_por_email("ninguem@joias.com") is None
+
+
+def test_buscar_por_id_reflete_atualizacao(repository, usuario):
+    """Testa que a busca por ID retorna os dados atualizados."""
+    usuario.excluir()
+    repository.atualizar(usuario)
+
+    encontrado = repository.buscar_por_id(usuario.id)
+
+    assert encontrado.ativo is False
+
+
+def test_listar_resumos(repository, usuario):
+    """Testa a projeção usada pelas listagens de usuários."""
+    repository.criar(Usuario.criar("bruno@joias.com", "Bruno", "hash"))
+
+    resumos = repository.listar_resumos(email="ana")
+
+    assert resumos == [
+        ResumoUsuario(
+            id=usuario.id,
+            nome="Ana",
+            email="ana@joias.com",
+            ativo=True,
+            data_criacao=usuario.created_at,
+        )
+    ]
+
+
+def test_servico_lista_resumos_do_repositorio(repository, usuario):
+    """Testa a projeção de ponta a ponta, do serviço ao banco."""
+    servico = UsuarioService(usuario_repository=repository, auth_service=None)
+
+    resumos = servico.listar_resumos()
+
+    assert [(r.id, r.email, r.ativo) for r in resumos] == [
+        (usuario.id, "ana@joias.com", True)
+    ]
@@ -0,0 +1,93 @@
+"""
+Testes de integração para a fábrica de engines.
+
+Este módulo contém os testes que validam a configuração do pool de
+conexões pelas Settings e as métricas expostas pelo pool.
+"""
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from src.joias.infrastructure.config.settings import Settings
+from src.joias.infrastructure.persistence.sqlalchemy.engine import (
+    MetricasPool,
+    QueuePoolMonitorado,
+    criar_engine,
+    metricas_pool,
+)
+
+
+@pytest.fixture
+def settings(tmp_path):
+    """Fixture com um pool de uma conexão e timeout curto."""
+    return Settings(
+        database_url=f"sqlite:///{tmp_path / 'pool.db'}",
+        database_pool_size=1,
+        database_max_overflow=0,
+        database_pool_timeout=0.05,
+        database_pool_recycle=60,
+    )
+
+
+def test_pool_configurado_pelas_settings(settings):
+    """Deve criar o pool com tamanho, overflow, timeout e recycle das Settings."""
+    engine = criar_engine(settings)
+
+    assert isinstance(engine.pool, QueuePoolMonitorado)
+    assert engine.pool.size() == 1
+    assert engine.pool._max_overflow == 0
+    assert engine.pool._timeout == 0.05
+    assert engine.pool._recycle == 60
+    assert engine.pool._pre_ping is True
+
+
+def test_metricas_de_uso_e_esgotamento(settings):
+    """Deve reportar conexões em uso e pedidos que esgotaram o timeout."""
+    engine = criar_engine(settings)
+
+    with engine.connect() as conexao:
+        conexao.execute(text("SELECT 1"))
+        em_uso = metricas_pool(engine)
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+
+    metricas = metricas_pool(engine)
+    assert em_uso["em_uso"] == 1
+    assert metricas["em_uso"] == 0
+    assert metricas["espera"]["total"] == 2
+    assert metricas["espera"]["esgotamentos"] == 1
+    assert sum(metricas["espera"]["histograma"].values()) == 2
+
+
+def test_metricas_sobrevivem_ao_dispose(settings):
+    """Deve manter as métricas quando o pool é recriado."""
+    engine = criar_engine(settings)
+    with engine.connect():
+        pass
+
+    engine.dispose()
+    with engine.connect():
+        pass
+
+    assert metricas_pool(engine)["espera"]["total"] == 2
+
+
+def test_sqlite_em_memoria_sem_configuracao_de_pool():
+    """Deve usar o pool padrão do SQLAlchemy para SQLite em memória."""
+    engine = criar_engine(Settings(database_url="sqlite://"))
+
+    assert not isinstance(engine.pool, QueuePoolMonitorado)
+    assert "espera" not in metricas_pool(engine)
+
+
+def test_histograma_por_faixa():
+    """Deve contar cada espera na faixa do seu limite superior."""
+    metricas = MetricasPool(faixas=(0.01, 0.1))
+
+    metricas.registrar_espera(0.005)
+    metricas.registrar_espera(0.05)
+    metricas.registrar_espera(0.05)
+    metricas.registrar_espera(2.0, esgotou=True)
+
+    assert metricas.histograma() == {"0.01": 1, "0.1": 2, "+Inf": 1}
+    assert metricas.esgotamentos == 1
@@ -0,0 +1,114 @@
+"""
+Testes de integração para os índices das tabelas.
+
+Este módulo verifica, pelo plano de execução do SQLite, que as consultas
+feitas pelos repositórios usam os índices declarados nos modelos.
+"""
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from src.joias.infrastructure.persistence.sqlalchemy.models.produto import (
+    DetalheModel,
+    ProdutoModel,
+    VariacaoModel,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.models.usuario import (
+    UsuarioModel,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.repositories.produto_repository import (
+    SQLAlchemyProdutoRepository,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.repositories.usuario_repository import (
+    UsuarioRepository,
+)
+
+
+@pytest.fixture
+def consultas(session):
+    """Fixture que registra as consultas SELECT executadas na sessão."""
+    registradas = []
+
+    def registrar(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            registradas.append((statement, parameters))
+
+    conexao = session.connection()
+    event.listen(conexao, "before_cursor_execute", registrar)
+    yield registradas
+    event.remove(conexao, "before_cursor_execute", registrar)
+
+
+def plano(session, statement: str, parameters) -> str:
+    """Retorna o plano de execução do SQLite para uma consulta."""
+    linhas = session.connection().exec_driver_sql(
+        f"EXPLAIN QUERY PLAN {statement}", tuple(parameters)
+    )
+    return "\n".join(linha[-1] for linha in linhas)
+
+
+@pytest.fixture
+def repository(session):
+    """Fixture que cria um repositório com alguns produtos."""
+    for i in range(3):
+        produto = ProdutoModel(
+            sku=f"SKU-{i}",
+            nome=f"Produto {i}",
+            preco_valor=Decimal("10.00") * (i + 1),
+            preco_moeda="BRL",
+            ativo=True,
+        )
+        VariacaoModel(nome="Aro 18", codigo=f"V-{i}", produto=produto)
+        DetalheModel(nome="Material", valor="Ouro", tipo="material", produto=produto)
+        session.add(produto)
+    session.flush()
+    session.expunge_all()
+
+    return SQLAlchemyProdutoRepository(session)
+
+
+def test_faixa_de_preco_usa_indice_composto(session, repository, consultas):
+    """Deve buscar por faixa de preço pelo índice (ativo, preco_valor)."""
+    repository.buscar_por_faixa_de_preco(Decimal("10.00"), Decimal("20.00"))
+
+    statement, parameters = consultas[0]
+    assert "USING INDEX ix_produtos_ativo_preco_valor" in plano(
+        session, statement, parameters
+    )
+
+
+def test_carregamento_de_relacionamentos_usa_indices_das_chaves(
+    session, repository, consultas
+):
+    """Deve carregar variações e detalhes pelos índices das chaves estrangeiras."""
+    repository.listar()
+
+    planos = "\n".join(plano(session, s, p) for s, p in consultas[1:])
+    assert "USING INDEX ix_variacoes_produto_id" in planos
+    assert "USING INDEX ix_detalhes_produto_id" in planos
+    assert "USING INDEX ix_detalhes_variacoes_variacao_id" in planos
+
+
+def test_buscar_usuario_por_email_usa_indice_de_lower(session, consultas):
+    """Deve buscar o email sem diferenciar maiúsculas pelo índice de lower(email)."""
+    session.add(
+        UsuarioModel(
+            id=uuid4(),
+            nome="Ana",
+            email="ana@example.com",
+            senha_hash="hash",
+            ativo=True,
+        )
+    )
+    session.flush()
+    consultas.clear()
+
+    usuario = UsuarioRepository(session).buscar_por_email("Ana@Example.com")
+
+    assert usuario.nome == "Ana"
+    statement, parameters = consultas[0]
+    assert "USING INDEX ix_usuarios_email_lower" in plano(
+        session, statement, parameters
+    )
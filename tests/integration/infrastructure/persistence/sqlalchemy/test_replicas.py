@@ -0,0 +1,245 @@
+"""
+Testes de integração para o roteamento de leituras às réplicas.
+
+Este módulo contém os testes que validam o roteamento com arquivos
+SQLite no lugar do primário e das réplicas.
+"""
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, select, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from src.joias.domain.catalogo.entities.produto import Produto
+from src.joias.domain.entities.perfil import Perfil
+from src.joias.domain.shared.value_objects.moeda import Moeda
+from src.joias.domain.shared.value_objects.preco import Preco, centavos
+from src.joias.infrastructure.persistence.sqlalchemy.base import Base
+from src.joias.infrastructure.persistence.sqlalchemy.models.perfil import PerfilModel
+from src.joias.infrastructure.persistence.sqlalchemy.models.perfil_permissao import (
+    perfil_permissao,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.models.permissao import (
+    PermissaoModel,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.models.produto import (
+    DetalheModel,
+    DetalheVariacaoModel,
+    ProdutoModel,
+    VariacaoModel,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.replicas import (
+    RoteadorReplicas,
+    SessaoRoteada,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.repositories.perfil_repository import (
+    SQLPerfilRepository,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.repositories.produto_repository import (
+    SQLAlchemyProdutoRepository,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.unit_of_work import (
+    SQLAlchemyUnitOfWork,
+)
+
+TABELAS = [
+    PerfilModel.__table__,
+    PermissaoModel.__table__,
+    perfil_permissao,
+    ProdutoModel.__table__,
+    VariacaoModel.__table__,
+    DetalheModel.__table__,
+    DetalheVariacaoModel.__table__,
+]
+
+
+class Relogio:
+    """Relógio controlado pelo teste."""
+
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self) -> float:
+        return self.agora
+
+
+def criar_banco(caminho, perfil: str):
+    """Cria um banco SQLite com um perfil identificando o banco."""
+    engine = create_engine(f"sqlite:///{caminho}")
+    Base.metadata.create_all(engine, tables=TABELAS)
+    with sessionmaker(bind=engine)() as session:
+        SQLPerfilRepository(session).criar(Perfil(nome=perfil))
+    return engine
+
+
+@pytest.fixture
+def relogio():
+    """Fixture que cria um relógio controlado."""
+    return Relogio()
+
+
+@pytest.fixture
+def bancos(tmp_path):
+    """Fixture que cria o primário e duas réplicas."""
+    engines = [
+        criar_banco(tmp_path / "primario.db", "Primário"),
+        criar_banco(tmp_path / "replica1.db", "Réplica 1"),
+        criar_banco(tmp_path / "replica2.db", "Réplica 2"),
+    ]
+    yield engines
+    for engine in engines:
+        engine.dispose()
+
+
+def fabrica(roteador: RoteadorReplicas):
+    """Cria uma fábrica de sessões roteadas."""
+    return sessionmaker(
+        class_=SessaoRoteada, roteador=roteador, bind=roteador.primario
+    )
+
+
+def banco_lido(session) -> str:
+    """Retorna o nome do perfil do banco que atendeu a leitura."""
+    return SQLPerfilRepository(session).listar()[0].nome
+
+
+def test_leituras_em_rodizio_entre_as_replicas(bancos):
+    """Testa que cada sessão lê de uma réplica, em rodízio."""
+    primario, replica1, replica2 = bancos
+    Session = fabrica(RoteadorReplicas(primario, [replica1, replica2]))
+
+    lidos = []
+    for _ in range(4):
+        with Session() as session:
+            lidos.append(banco_lido(session))
+            # A mesma sessão continua na mesma réplica
+            assert banco_lido(session) == lidos[-1]
+
+    assert lidos == ["Réplica 1", "Réplica 2", "Réplica 1", "Réplica 2"]
+
+
+def test_leituras_apos_escrita_vao_ao_primario(bancos):
+    """Testa que a sessão lê as próprias escritas até ser fechada."""
+    primario, replica1, _ = bancos
+    Session = fabrica(RoteadorReplicas(primario, [replica1]))
+
+    with Session() as session:
+        repository = SQLPerfilRepository(session)
+        assert banco_lido(session) == "Réplica 1"
+
+        repository.criar(Perfil(nome="Novo"))
+
+        assert repository.buscar_por_nome("Novo") is not None
+        assert banco_lido(session) == "Primário"
+
+    with Session() as session:
+        assert SQLPerfilRepository(session).buscar_por_nome("Novo") is None
+
+
+def test_unidade_de_trabalho_le_as_proprias_escritas(bancos):
+    """Testa que a unidade de trabalho lê do primário após escrever."""
+    primario, replica1, _ = bancos
+    Session = fabrica(RoteadorReplicas(primario, [replica1]))
+
+    with SQLAlchemyUnitOfWork(Session) as uow:
+        repository = SQLPerfilRepository(uow.session)
+        repository.criar(Perfil(nome="Novo"))
+
+        assert repository.buscar_por_nome("Novo") is not None
+        uow.commit()
+
+
+def test_unidade_de_trabalho_le_do_primario(bancos):
+    """Testa que a unidade de trabalho lê do primário desde o início."""
+    primario, replica1, _ = bancos
+    Session = fabrica(RoteadorReplicas(primario, [replica1]))
+
+    with SQLAlchemyUnitOfWork(Session) as uow:
+        assert banco_lido(uow.session) == "Primário"
+
+
+def produto_com_preco(valor: str) -> Produto:
+    """Cria um produto de catálogo sem variações."""
+    return Produto(
+        sku="SKU-1",
+        nome="Anel",
+        descricao="",
+        preco=Preco(valor_em_centavos=centavos(Decimal(valor)), moeda=Moeda.BRL),
+    )
+
+
+def preco_gravado(engine) -> Decimal:
+    """Retorna o preço do produto gravado no banco."""
+    with sessionmaker(bind=engine)() as session:
+        return session.scalar(select(ProdutoModel.preco_valor))
+
+
+def test_atualizar_com_replica_atrasada_grava_no_primario(bancos):
+    """Testa que a atualização não perde escritas por ler de uma réplica."""
+    primario, replica1, _ = bancos
+    for engine in (primario, replica1):
+        with sessionmaker(bind=engine)() as session:
+            SQLAlchemyProdutoRepository(session).salvar_em_lote(
+                [produto_com_preco("10.00")]
+            )
+    # Alteração no primário que a réplica ainda não recebeu
+    with primario.begin() as conexao:
+        conexao.execute(update(ProdutoModel).values(preco_valor=Decimal("20.00")))
+    Session = fabrica(RoteadorReplicas(primario, [replica1]))
+
+    with Session() as session:
+        # Leitura anterior, atendida pela réplica, deixa o modelo no
+        # identity map com o preço atrasado
+        assert session.get(ProdutoModel, 1).preco_valor == Decimal("10.00")
+        produto = produto_com_preco("10.00")
+        produto.id = 1
+
+        SQLAlchemyProdutoRepository(session).atualizar(produto)
+
+    assert preco_gravado(primario) == Decimal("10.00")
+
+
+def test_replica_indisponivel_sai_do_rodizio(bancos, relogio, tmp_path):
+    """Testa que uma réplica que falha deixa de receber leituras."""
+    primario, replica1, _ = bancos
+    inacessivel = create_engine(f"sqlite:///{tmp_path / 'inexistente' / 'r.db'}")
+    roteador = RoteadorReplicas(
+        primario, [inacessivel, replica1], intervalo_retorno=30.0, relogio=relogio
+    )
+    Session = fabrica(roteador)
+
+    with Session() as session, pytest.raises(OperationalError):
+        banco_lido(session)
+
+    assert not roteador.disponivel(inacessivel)
+    for _ in range(3):
+        with Session() as session:
+            assert banco_lido(session) == "Réplica 1"
+
+    # Passado o intervalo, a réplica volta ao rodízio
+    relogio.agora += 30.0
+    assert roteador.disponivel(inacessivel)
+
+
+def test_sem_replicas_disponiveis_le_do_primario(bancos, relogio):
+    """Testa que as leituras vão ao primário sem réplicas disponíveis."""
+    primario, replica1, _ = bancos
+    roteador = RoteadorReplicas(primario, [replica1], relogio=relogio)
+    roteador.marcar_indisponivel(replica1)
+
+    with fabrica(roteador)() as session:
+        assert banco_lido(session) == "Primário"
+
+
+def test_verificar_devolve_replicas_ao_rodizio(bancos, relogio, tmp_path):
+    """Testa a verificação ativa das réplicas."""
+    primario, replica1, _ = bancos
+    inacessivel = create_engine(f"sqlite:///{tmp_path / 'inexistente' / 'r.db'}")
+    roteador = RoteadorReplicas(primario, [inacessivel, replica1], relogio=relogio)
+    roteador.marcar_indisponivel(replica1)
+
+    estado = roteador.verificar()
+
+    assert list(estado.values()) == [False, True]
+    assert roteador.disponivel(replica1)
@@ -0,0 +1,176 @@
+"""
+Testes de integração para a unidade de trabalho.
+
+Este módulo contém os testes que validam que os repositórios
+compartilham uma única transação dentro da unidade de trabalho.
+"""
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError, PendingRollbackError
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.joias.domain.entities.autorizacao import Usuario
+from src.joias.domain.entities.perfil import Perfil
+from src.joias.domain.shared.events.publicador import PublicadorEventos
+from src.joias.infrastructure.persistence.sqlalchemy.models.perfil import PerfilModel
+from src.joias.infrastructure.persistence.sqlalchemy.models.usuario import (
+    UsuarioModel,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.repositories.perfil_repository import (
+    SQLPerfilRepository,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.repositories.usuario_repository import (
+    UsuarioRepository,
+)
+from src.joias.infrastructure.persistence.sqlalchemy.unit_of_work import (
+    SQLAlchemyUnitOfWork,
+    invalidar_cache,
+)
+
+
+@pytest.fixture
+def session_factory(engine, tables):
+    """Fixture que cria sessões reais e limpa as tabelas ao final."""
+    factory = sessionmaker(bind=engine, autoflush=False)
+    yield factory
+    with factory() as session:
+        session.query(PerfilModel).delete()
+        session.query(UsuarioModel).delete()
+        session.commit()
+
+
+@pytest.fixture
+def contador_commits():
+    """Fixture que conta os commits feitos por qualquer sessão."""
+    commits = []
+
+    def registrar(session):
+        commits.append(session)
+
+    event.listen(Session, "after_commit", registrar)
+    yield commits
+    event.remove(Session, "after_commit", registrar)
+
+
+def criar_perfis(session: Session) -> Perfil:
+    """Cria dois perfis e atualiza um deles: três escritas."""
+    repository = SQLPerfilRepository(session)
+    repository.criar(Perfil(nome="Gerente"))
+    perfil = repository.criar(Perfil(nome="Vendedor"))
+    repository.atualizar(perfil)
+    return perfil
+
+
+def test_sem_unidade_de_trabalho_cada_escrita_faz_commit(
+    session_factory, contador_commits
+):
+    """Deve fazer um commit por método de repositório fora da unidade."""
+    with session_factory() as session:
+        criar_perfis(session)
+
+    assert len(contador_commits) == 3
+
+
+def test_unidade_de_trabalho_faz_um_unico_commit(session_factory, contador_commits):
+    """Deve agrupar as escritas de vários repositórios em um commit."""
+    with SQLAlchemyUnitOfWork(session_factory) as uow:
+        criar_perfis(uow.session)
+        uow.commit()
+
+    assert len(contador_commits) == 1
+    with session_factory() as session:
+        assert session.query(PerfilModel).count() == 2
+
+
+def test_unidade_de_trabalho_sem_commit_desfaz_escritas(session_factory):
+    """Deve desfazer as escritas quando a unidade termina sem commit."""
+    with pytest.raises(RuntimeError):
+        with SQLAlchemyUnitOfWork(session_factory) as uow:
+            criar_perfis(uow.session)
+            raise RuntimeError("falha no meio da requisição")
+
+    with session_factory() as session:
+        assert session.query(PerfilModel).count() == 0
+
+
+def test_eventos_publicados_apos_commit(session_factory):
+    """Deve publicar os eventos coletados apenas depois do commit."""
+    publicados = []
+    publicador = PublicadorEventos()
+    publicador.inscrever(object, publicados.append)
+
+    with SQLAlchemyUnitOfWork(session_factory, publicador) as uow:
+        perfil = criar_perfis(uow.session)
+        perfil.adicionar_evento("perfil_criado")
+        uow.coletar(perfil)
+        assert publicados == []
+        uow.commit()
+
+    assert publicados == ["perfil_criado"]
+
+
+def test_eventos_dos_agregados_gravados_publicados_apos_commit(session_factory):
+    """Deve publicar os eventos dos agregados gravados sem coleta manual."""
+    publicados = []
+    publicador = PublicadorEventos()
+    publicador.inscrever(object, publicados.append)
+
+    with SQLAlchemyUnitOfWork(session_factory, publicador) as uow:
+        perfil = criar_perfis(uow.session)
+        # Eventos adicionados depois da gravação também são publicados
+        perfil.adicionar_evento("perfil_criado")
+        assert publicados == []
+        uow.commit()
+
+    assert publicados == ["perfil_criado"]
+    assert perfil.eventos == []
+
+
+def test_erro_de_integridade_surge_no_repositorio(session_factory):
+    """Deve enviar as escritas ao banco em cada chamada de repositório."""
+    with SQLAlchemyUnitOfWork(session_factory) as uow:
+        repository = UsuarioRepository(uow.session)
+        repository.criar(Usuario.criar("ana@joias.com", "Ana", "hash"))
+
+        with pytest.raises(IntegrityError):
+            repository.criar(Usuario.criar("ana@joias.com", "Outra", "hash"))
+
+
+def test_erro_de_integridade_nao_confirma_escritas_parciais(session_factory):
+    """Deve manter a transação compartilhada inválida após a falha."""
+    with SQLAlchemyUnitOfWork(session_factory) as uow:
+        SQLPerfilRepository(uow.session).criar(Perfil(nome="Gerente"))
+        usuarios = UsuarioRepository(uow.session)
+        usuarios.criar(Usuario.criar("ana@joias.com", "Ana", "hash"))
+        with pytest.raises(IntegrityError):
+            usuarios.criar(Usuario.criar("ana@joias.com", "Outra", "hash"))
+
+        # Sem rollback do repositório, a unidade não confirma metade do trabalho
+        with pytest.raises(PendingRollbackError):
+            SQLPerfilRepository(uow.session).criar(Perfil(nome="Vendedor"))
+            uow.commit()
+
+    with session_factory() as session:
+        assert session.query(PerfilModel).count() == 0
+        assert session.query(UsuarioModel).count() == 0
+
+
+def test_invalidacoes_usam_um_unico_listener(session_factory):
+    """Deve registrar um listener por sessão e invalidar uma vez no commit."""
+    invalidacoes = []
+
+    def invalidar():
+        invalidacoes.append(1)
+
+    with SQLAlchemyUnitOfWork(session_factory) as uow:
+        for _ in range(3):
+            invalidar_cache(uow.session, invalidar)
+        invalidar_cache(uow.session, lambda: invalidacoes.append(2))
+        invalidacoes.clear()
+        uow.commit()
+
+        assert invalidacoes == [1, 2]
+        invalidacoes.clear()
+        # As invalidações já executadas não se repetem na próxima transação
+        uow.session.rollback()
+        assert invalidacoes == []
@@ -0,0 +1,89 @@
+"""
+Testes de integração para os endpoints de pedido.
+
+Este módulo contém os testes que validam que as listagens de pedidos
+são servidas pela projeção inscrita na inicialização da API.
+"""
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.joias.domain.entities.pedido import Pedido, StatusPedido
+from src.joias.domain.entities.usuario import Usuario
+from src.joias.domain.shared.events.publicador import PublicadorEventos
+from src.joias.domain.shared.value_objects import Email
+from src.joias.presentation.api import app as modulo_app
+from src.joias.presentation.api.dependencies import (
+    get_current_user,
+    get_resumo_pedidos_read_model,
+)
+
+
+@pytest.fixture
+def publicador(monkeypatch):
+    """Fixture que inicializa a API com um publicador de eventos novo."""
+    publicador = PublicadorEventos()
+    monkeypatch.setattr(modulo_app, "get_publicador", lambda: publicador)
+    get_resumo_pedidos_read_model.cache_clear()
+    asyncio.run(modulo_app.inscrever_projecoes())
+    yield publicador
+    get_resumo_pedidos_read_model.cache_clear()
+
+
+@pytest.fixture
+def cliente():
+    """Fixture que cria um cliente."""
+    return Usuario(
+        nome="João Silva",
+        email=Email("joao.silva@example.com"),
+        senha_hash="senha123",
+    )
+
+
+@pytest.fixture
+def client(cliente):
+    """Fixture que cria um cliente HTTP autenticado."""
+    modulo_app.app.dependency_overrides[get_current_user] = lambda: cliente
+    yield TestClient(modulo_app.app)
+    modulo_app.app.dependency_overrides.clear()
+
+
+def publicar_pedido(publicador, cliente, pedido_id, status=StatusPedido.RASCUNHO):
+    """Cria um pedido e publica seus eventos, como faria a unidade de trabalho."""
+    pedido = Pedido(cliente=cliente)
+    pedido.id = pedido_id
+    pedido.registrar_criacao()
+    if status != StatusPedido.RASCUNHO:
+        pedido.atualizar_status(status)
+    publicador.publicar(pedido.eventos)
+    pedido.limpar_eventos()
+
+
+def test_listar_pedidos_do_cliente(client, publicador, cliente):
+    """Deve listar os pedidos do cliente a partir dos eventos publicados."""
+    # Arrange
+    publicar_pedido(publicador, cliente, 1)
+    publicar_pedido(publicador, cliente, 2)
+
+    # Act
+    response = client.get(f"/pedidos/clientes/{cliente.id}")
+
+    # Assert
+    assert response.status_code == 200
+    assert [r["pedido_id"] for r in response.json()] == [1, 2]
+    assert response.json()[0]["cliente_id"] == str(cliente.id)
+
+
+def test_listar_pedidos_ativos(client, publicador, cliente):
+    """Deve deixar os pedidos cancelados fora da listagem de ativos."""
+    # Arrange
+    publicar_pedido(publicador, cliente, 1)
+    publicar_pedido(publicador, cliente, 2, StatusPedido.CANCELADO)
+
+    # Act
+    response = client.get("/pedidos/ativos")
+
+    # Assert
+    assert response.status_code == 200
+    assert [r["pedido_id"] for r in response.json()] == [1]
@@ -0,0 +1,119 @@
+"""
+Testes de integração para a unidade de trabalho das requisições.
+
+Este módulo contém os testes que validam que os repositórios injetados
+nos endpoints compartilham a unidade de trabalho da requisição.
+"""
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.joias.domain.entities.perfil import Perfil
+from src.joias.domain.entities.permissao import Permissao
+from src.joias.domain.repositories.perfil_repository import IPerfilRepository
+from src.joias.domain.repositories.permissao_repository import IPermissaoRepository
+from src.joias.domain.shared.events.publicador import PublicadorEventos
+from src.joias.infrastructure.persistence.sqlalchemy import session as modulo_session
+from src.joias.infrastructure.persistence.sqlalchemy.models.perfil import PerfilModel
+from src.joias.infrastructure.persistence.sqlalchemy.models.permissao import (
+    PermissaoModel,
+)
+from src.joias.presentation.api.dependencies import (
+    get_perfil_repository,
+    get_permissao_repository,
+)
+
+app = FastAPI()
+
+
+@app.post("/perfis")
+def criar_perfil(
+    perfis: IPerfilRepository = Depends(get_perfil_repository),
+    permissoes: IPermissaoRepository = Depends(get_permissao_repository),
+) -> dict:
+    """Endpoint de teste que escreve com dois repositórios."""
+    permissoes.criar(Permissao(nome="Editar produto", chave="produto:editar"))
+    perfil = perfis.criar(Perfil(nome="Gerente"))
+    perfil.adicionar_evento("perfil_criado")
+    perfis.atualizar(perfil)
+    return {"id": str(perfil.id)}
+
+
+@app.post("/perfis/falha")
+def criar_perfil_com_falha(
+    perfis: IPerfilRepository = Depends(get_perfil_repository),
+) -> dict:
+    """Endpoint de teste que falha depois de escrever."""
+    perfil = perfis.criar(Perfil(nome="Gerente"))
+    perfil.adicionar_evento("perfil_criado")
+    raise HTTPException(status_code=400, detail="Dados inválidos")
+
+
+@pytest.fixture
+def session_factory(engine, tables):
+    """Fixture que cria sessões reais e limpa as tabelas ao final."""
+    factory = sessionmaker(bind=engine, autoflush=False)
+    yield factory
+    with factory() as session:
+        session.query(PerfilModel).delete()
+        session.query(PermissaoModel).delete()
+        session.commit()
+
+
+@pytest.fixture
+def publicados():
+    """Fixture que registra os eventos publicados pelo publicador da aplicação."""
+    return []
+
+
+@pytest.fixture
+def client(session_factory, publicados, monkeypatch):
+    """Fixture que liga a unidade de trabalho das requisições ao banco de teste."""
+    publicador = PublicadorEventos()
+    publicador.inscrever(object, publicados.append)
+    monkeypatch.setattr(modulo_session, "SessionLocal", session_factory)
+    monkeypatch.setattr(modulo_session, "get_publicador", lambda: publicador)
+    return TestClient(app)
+
+
+@pytest.fixture
+def contador_commits():
+    """Fixture que conta os commits feitos por qualquer sessão."""
+    commits = []
+
+    def registrar(session):
+        commits.append(session)
+
+    event.listen(Session, "after_commit", registrar)
+    yield commits
+    event.remove(Session, "after_commit", registrar)
+
+
+def test_requisicao_faz_um_unico_commit(
+    client, session_factory, contador_commits, publicados
+):
+    """Deve confirmar as escritas de todos os repositórios em um commit."""
+    response = client.post("/perfis")
+
+    assert response.status_code == 200
+    assert len(contador_commits) == 1
+    with session_factory() as session:
+        assert session.query(PerfilModel).count() == 1
+        assert session.query(PermissaoModel).count() == 1
+    # Os eventos dos agregados gravados chegam ao publicador sem coleta manual
+    assert publicados == ["perfil_criado"]
+
+
+def test_requisicao_com_erro_desfaz_escritas(
+    client, session_factory, contador_commits, publicados
+):
+    """Deve desfazer as escritas e descartar os eventos quando o endpoint falha."""
+    response = client.post("/perfis/falha")
+
+    assert response.status_code == 400
+    assert contador_commits == []
+    with session_factory() as session:
+        assert session.query(PerfilModel).count() == 0
+    assert publicados == []
@@ -15,6 +15,7 @@ from src.joias.application.shared.exceptions import (
     ValidacaoError,
 )
 from src.joias.domain.entities.usuario import Usuario
+from src.joias.domain.repositories.usuario_repository import ResumoUsuario
 from src.joias.domain.shared.value_objects import Email
 
 
@@ -245,6 +246,31 @@ def test_listar_usuarios(usuario_service, usuario_repository):
     usuario_repository.listar.assert_called_once()
 
 
+
+def test_listar_resumos(usuario_service, usuario_repository):
+    """
+    Testa a listagem de resumos de usuários.
+    """
+    # Arrange
+    resumos = [
+        ResumoUsuario(
+            id=uuid4(),
+            nome="John Doe",
+            email="john@doe.com",
+            ativo=True,
+            data_criacao=datetime.now(),
+        ),
+    ]
+    usuario_repository.listar_resumos.return_value = resumos
+
+    # Act
+    resultado = usuario_service.listar_resumos()
+
+    # Assert
+    assert resultado == resumos
+    usuario_repository.listar_resumos.assert_called_once()
+    usuario_repository.listar.assert_not_called()
+
 def test_atualizar_usuario_com_sucesso(usuario_service, usuario_repository, auth_service):
     """
     Testa a atualização de um usuário com sucesso.
@@ -0,0 +1,356 @@
+"""
+Testes para os casos de uso de pedidos.
+
+Este módulo contém os testes unitários para os casos de uso
+relacionados a pedidos.
+"""
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from src.joias.application.use_cases.pedido import (
+    AdicionarItemInput,
+    AdicionarItemUseCase,
+    AdicionarItensInput,
+    AdicionarItensUseCase,
+    AtualizarPedidoInput,
+    AtualizarPedidoUseCase,
+    AtualizarStatusInput,
+    AtualizarStatusUseCase,
+    CriarPedidoInput,
+    CriarPedidoUseCase,
+    ItemPedidoInput,
+    ListarPedidosAtivosUseCase,
+    ListarPedidosClienteUseCase,
+    ListarResumoPedidosAtivosUseCase,
+    ListarResumoPedidosClienteUseCase,
+)
+from src.joias.application.read_models.pedido import ResumoPedidosReadModel
+from src.joias.domain.entities.dados_pessoais import Endereco
+from src.joias.domain.entities.eventos_pedido import ItemAdicionadoAoPedido
+from src.joias.domain.entities.pedido import Pedido, StatusPedido
+from src.joias.domain.entities.produto import Preco, Produto
+from src.joias.domain.entities.usuario import Usuario
+from src.joias.domain.shared.events.publicador import PublicadorEventos
+from src.joias.domain.shared.value_objects import Email
+from src.joias.infrastructure.repositories.memory.pedido import MemoryPedidoRepository
+from src.joias.infrastructure.repositories.memory.produto import MemoryProdutoRepository
+
+
+@pytest.fixture
+def pedido_repository():
+    """Fixture que cria um repositório de pedidos em memória."""
+    return MemoryPedidoRepository()
+
+
+@pytest.fixture
+def produto_repository():
+    """Fixture que cria um repositório de produtos em memória."""
+    return MemoryProdutoRepository()
+
+
+@pytest.fixture
+def endereco():
+    """Fixture que cria um endereço."""
+    return Endereco(
+        logradouro="Rua Teste",
+        numero="123",
+        bairro="Centro",
+        cidade="São Paulo",
+        estado="SP",
+        cep="01234-567",
+    )
+
+
+@pytest.fixture
+def cliente():
+    """Fixture que cria um cliente."""
+    return Usuario(
+        nome="João Silva",
+        email=Email("joao.silva@example.com"),
+        senha_hash="senha123",
+    )
+
+
+@pytest.fixture
+def produto():
+    """Fixture que cria um produto."""
+    return Produto(
+        nome="Anel Solitário",
+        descricao="Anel solitário em ouro 18k",
+        codigo="ANL-001",
+        preco=Preco(valor=Decimal("1000.00")),
+    )
+
+
+def test_criar_pedido(pedido_repository, cliente, endereco):
+    """Testa a criação de um pedido."""
+    use_case = CriarPedidoUseCase(pedido_repository)
+    input_data = CriarPedidoInput(
+        cliente=cliente,
+        endereco_entrega=endereco,
+        observacoes="Entregar no período da tarde",
+    )
+
+    pedido = use_case.execute(input_data)
+
+    assert pedido.id is not None
+    assert pedido.cliente == cliente
+    assert pedido.endereco_entrega == endereco
+    assert pedido.status == StatusPedido.RASCUNHO
+
+
+def test_adicionar_item(pedido_repository, produto_repository, cliente, produto):
+    """Testa a adição de um item ao pedido."""
+    # Cria um pedido
+    criar_pedido_use_case = CriarPedidoUseCase(pedido_repository)
+    pedido = criar_pedido_use_case.execute(CriarPedidoInput(cliente=cliente))
+
+    # Adiciona o produto ao repositório
+    produto = produto_repository.criar(produto)
+
+    # Adiciona um item ao pedido
+    adicionar_item_use_case = AdicionarItemUseCase(
+        pedido_repository, produto_repository
+    )
+    pedido_atualizado = adicionar_item_use_case.execute(
+        AdicionarItemInput(pedido_id=pedido.id, produto_id=produto.id, quantidade=1)
+    )
+
+    assert len(pedido_atualizado.itens) == 1
+    assert pedido_atualizado.itens[0].produto == produto
+    assert pedido_atualizado.itens[0].quantidade == 1
+    assert pedido_atualizado.itens[0].preco_unitario == produto.preco.valor
+
+
+def test_adicionar_itens(pedido_repository, produto_repository, cliente, produto):
+    """Testa a adição de vários itens ao pedido de uma só vez."""
+    # Cria um pedido
+    criar_pedido_use_case = CriarPedidoUseCase(pedido_repository)
+    pedido = criar_pedido_use_case.execute(CriarPedidoInput(cliente=cliente))
+
+    # Adiciona o produto ao repositório
+    produto = produto_repository.criar(produto)
+
+    # Adiciona os itens ao pedido
+    adicionar_itens_use_case = AdicionarItensUseCase(
+        pedido_repository, produto_repository
+    )
+    pedido_atualizado = adicionar_itens_use_case.execute(
+        AdicionarItensInput(
+            pedido_id=pedido.id,
+            itens=[
+                ItemPedidoInput(produto_id=produto.id, quantidade=1),
+                ItemPedidoInput(
+                    produto_id=produto.id, quantidade=2, desconto=Decimal("50")
+                ),
+            ],
+        )
+    )
+
+    assert len(pedido_atualizado.itens) == 2
+    assert pedido_atualizado.subtotal == Decimal("2950.00")
+
+
+
+def test_adicionar_itens_emite_um_evento_por_item(
+    pedido_repository, produto_repository, cliente, produto
+):
+    """Testa que a adição em lote emite um evento para cada item."""
+    publicador = PublicadorEventos()
+    eventos = []
+    publicador.inscrever(ItemAdicionadoAoPedido, eventos.append)
+    pedido = CriarPedidoUseCase(pedido_repository).execute(
+        CriarPedidoInput(cliente=cliente)
+    )
+    produto = produto_repository.criar(produto)
+
+    AdicionarItensUseCase(pedido_repository, produto_repository, publicador).execute(
+        AdicionarItensInput(
+            pedido_id=pedido.id,
+            itens=[
+                ItemPedidoInput(produto_id=produto.id, quantidade=1),
+                ItemPedidoInput(produto_id=produto.id, quantidade=2),
+            ],
+        )
+    )
+
+    assert [e.quantidade_itens for e in eventos] == [1, 2]
+    assert [e.total for e in eventos] == [Decimal("1000.00"), Decimal("3000.00")]
+
+def test_adicionar_itens_produto_inexistente(
+    pedido_repository, produto_repository, cliente, produto
+):
+    """Testa que nenhum item é adicionado se algum produto não existir."""
+    criar_pedido_use_case = CriarPedidoUseCase(pedido_repository)
+    pedido = criar_pedido_use_case.execute(CriarPedidoInput(cliente=cliente))
+    produto = produto_repository.criar(produto)
+
+    adicionar_itens_use_case = AdicionarItensUseCase(
+        pedido_repository, produto_repository
+    )
+    with pytest.raises(ValueError, match="Produto não encontrado"):
+        adicionar_itens_use_case.execute(
+            AdicionarItensInput(
+                pedido_id=pedido.id,
+                itens=[
+                    ItemPedidoInput(produto_id=produto.id, quantidade=1),
+                    ItemPedidoInput(produto_id=999, quantidade=1),
+                ],
+            )
+        )
+
+    assert pedido_repository.buscar_por_id(pedido.id).itens == []
+
+
+def test_atualizar_pedido(pedido_repository, cliente, endereco):
+    """Testa a atualização de um pedido."""
+    # Cria um pedido
+    criar_use_case = CriarPedidoUseCase(pedido_repository)
+    pedido = criar_use_case.execute(CriarPedidoInput(cliente=cliente))
+
+    # Atualiza o pedido
+    atualizar_use_case = AtualizarPedidoUseCase(pedido_repository)
+    pedido_atualizado = atualizar_use_case.execute(
+        AtualizarPedidoInput(
+            id=pedido.id,
+            endereco_entrega=endereco,
+            observacoes="Entregar no período da tarde",
+        )
+    )
+
+    assert pedido_atualizado.endereco_entrega == endereco
+    assert pedido_atualizado.observacoes == "Entregar no período da tarde"
+
+
+def test_atualizar_status(pedido_repository, cliente):
+    """Testa a atualização do status de um pedido."""
+    # Cria um pedido
+    criar_use_case = CriarPedidoUseCase(pedido_repository)
+    pedido = criar_use_case.execute(CriarPedidoInput(cliente=cliente))
+
+    # Atualiza o status do pedido
+    atualizar_use_case = AtualizarStatusUseCase(pedido_repository)
+    pedido_atualizado = atualizar_use_case.execute(
+        AtualizarStatusInput(
+            pedido_id=pedido.id, novo_status=StatusPedido.AGUARDANDO_PAGAMENTO
+        )
+    )
+
+    assert pedido_atualizado.status == StatusPedido.AGUARDANDO_PAGAMENTO
+
+
+def test_listar_pedidos_cliente(pedido_repository, cliente):
+    """Testa a listagem de pedidos de um cliente."""
+    # Cria alguns pedidos
+    criar_use_case = CriarPedidoUseCase(pedido_repository)
+
+    # Pedido 1
+    criar_use_case.execute(CriarPedidoInput(cliente=cliente))
+
+    # Pedido 2
+    criar_use_case.execute(CriarPedidoInput(cliente=cliente))
+
+    # Lista os pedidos do cliente
+    listar_use_case = ListarPedidosClienteUseCase(pedido_repository)
+    pedidos = listar_use_case.execute(cliente.id)
+
+    assert len(pedidos) == 2
+    assert all(p.cliente.id == cliente.id for p in pedidos)
+
+
+def test_listar_pedidos_ativos(pedido_repository, cliente):
+    """Testa a listagem de pedidos ativos."""
+    # Cria alguns pedidos
+    criar_use_case = CriarPedidoUseCase(pedido_repository)
+    atualizar_status_use_case = AtualizarStatusUseCase(pedido_repository)
+
+    # Pedido 1 - Ativo (AGUARDANDO_PAGAMENTO)
+    pedido1 = criar_use_case.execute(CriarPedidoInput(cliente=cliente))
+    atualizar_status_use_case.execute(
+        AtualizarStatusInput(
+            pedido_id=pedido1.id, novo_status=StatusPedido.AGUARDANDO_PAGAMENTO
+        )
+    )
+
+    # Pedido 2 - Ativo (EM_PRODUCAO)
+    pedido2 = criar_use_case.execute(CriarPedidoInput(cliente=cliente))
+    atualizar_status_use_case.execute(
+        AtualizarStatusInput(pedido_id=pedido2.id, novo_status=StatusPedido.EM_PRODUCAO)
+    )
+
+    # Pedido 3 - Inativo (ENTREGUE)
+    pedido3 = criar_use_case.execute(CriarPedidoInput(cliente=cliente))
+    atualizar_status_use_case.execute(
+        AtualizarStatusInput(pedido_id=pedido3.id, novo_status=StatusPedido.ENTREGUE)
+    )
+
+    # Lista os pedidos ativos
+    listar_use_case = ListarPedidosAtivosUseCase(pedido_repository)
+    pedidos = listar_use_case.execute()
+
+    assert len(pedidos) == 2
+    assert all(
+        p.status not in {StatusPedido.CANCELADO, StatusPedido.ENTREGUE} for p in pedidos
+    )
+
+
+def test_listar_resumos_pedidos(
+    pedido_repository, produto_repository, cliente, produto
+):
+    """Testa as listagens de resumos mantidas pelos eventos de pedido."""
+    publicador = PublicadorEventos()
+    read_model = ResumoPedidosReadModel()
+    read_model.inscrever_em(publicador)
+
+    criar_use_case = CriarPedidoUseCase(pedido_repository, publicador)
+    adicionar_item_use_case = AdicionarItemUseCase(
+        pedido_repository, produto_repository, publicador
+    )
+    atualizar_status_use_case = AtualizarStatusUseCase(pedido_repository, publicador)
+    produto = produto_repository.criar(produto)
+
+    # Pedido 1 - Ativo com um item
+    pedido1 = criar_use_case.execute(CriarPedidoInput(cliente=cliente))
+    adicionar_item_use_case.execute(
+        AdicionarItemInput(pedido_id=pedido1.id, produto_id=produto.id, quantidade=2)
+    )
+
+    # Pedido 2 - Inativo (CANCELADO)
+    pedido2 = criar_use_case.execute(CriarPedidoInput(cliente=cliente))
+    atualizar_status_use_case.execute(
+        AtualizarStatusInput(pedido_id=pedido2.id, novo_status=StatusPedido.CANCELADO)
+    )
+
+    resumos_cliente = ListarResumoPedidosClienteUseCase(read_model).execute(cliente.id)
+    resumos_ativos = ListarResumoPedidosAtivosUseCase(read_model).execute()
+
+    assert [r.pedido_id for r in resumos_cliente] == [pedido1.id, pedido2.id]
+    assert resumos_cliente[0].quantidade_itens == 1
+    assert resumos_cliente[0].total == Decimal("2000.00")
+    assert [r.pedido_id for r in resumos_ativos] == [pedido1.id]
+    assert pedido1.eventos == []
+
+
+def test_alterar_itens_atualiza_data_modificacao(
+    pedido_repository, produto_repository, cliente, produto
+):
+    """Testa que adicionar e remover itens atualiza a data de modificação."""
+    pedido = CriarPedidoUseCase(pedido_repository).execute(
+        CriarPedidoInput(cliente=cliente)
+    )
+    produto = produto_repository.criar(produto)
+    pedido.data_modificacao = antes = datetime(2000, 1, 1)
+
+    pedido = AdicionarItemUseCase(pedido_repository, produto_repository).execute(
+        AdicionarItemInput(pedido_id=pedido.id, produto_id=produto.id, quantidade=1)
+    )
+
+    assert pedido.data_modificacao > antes
+    assert pedido.data_modificacao == pedido.data_atualizacao
+
+    pedido.data_modificacao = antes
+    pedido.remover_item(pedido.itens[0].id)
+
+    assert pedido.data_modificacao > antes
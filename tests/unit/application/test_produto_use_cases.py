@@ -4,11 +4,12 @@ Testes para os casos de uso de produtos.
 Este módulo contém os testes unitários para os casos de uso
 relacionados a produtos.
 """
+import copy
 from decimal import Decimal
 
 import pytest
 
-from ..application.use_cases.produto import (
+from src.joias.application.use_cases.produto import (
     AdicionarDetalheInput,
     AdicionarDetalheUseCase,
     AdicionarVariacaoInput,
@@ -20,8 +21,8 @@ from ..application.use_cases.produto import (
     CriarProdutoUseCase,
     DeletarProdutoUseCase,
 )
-from ..domain.entities.produto import Detalhe, Produto, Variacao
-from ..infrastructure.repositories.memory.produto import (
+from src.joias.domain.entities.produto import Detalhe, Preco, Produto, Variacao
+from src.joias.infrastructure.repositories.memory.produto import (
     MemoryDetalheRepository,
     MemoryProdutoRepository,
     MemoryVariacaoRepository,
@@ -233,3 +234,137 @@ def test_buscar_produtos(produto_repository):
 
     assert len(produtos) == 2
     assert all("Anel" in p.nome for p in produtos)
+
+
+
+def test_buscar_por_ids(produto_repository):
+    """Testa a busca de vários produtos pelos IDs em uma chamada."""
+    criar_use_case = CriarProdutoUseCase(produto_repository)
+    for i in range(3):
+        criar_use_case.execute(
+            CriarProdutoInput(
+                nome=f"Anel {i}",
+                descricao="Anel em ouro 18k",
+                codigo=f"ANL-00{i}",
+                preco=Decimal("1000.00"),
+            )
+        )
+
+    produtos = produto_repository.buscar_por_ids([3, 1, 999, 3])
+
+    # IDs repetidos aparecem uma vez e IDs inexistentes são ignorados
+    assert [p.id for p in produtos] == [3, 1]
+
+def test_buscar_por_variacao(produto_repository):
+    """Testa a busca de um produto pelo ID de uma de suas variações."""
+    # Cria um produto com uma variação já persistida
+    variacao = Variacao(nome="Aro 18", descricao="Anel aro 18", codigo="ANL-18")
+    variacao.id = 10
+    criar_use_case = CriarProdutoUseCase(produto_repository)
+    produto = criar_use_case.execute(
+        CriarProdutoInput(
+            nome="Anel Solitário",
+            descricao="Anel solitário em ouro 18k",
+            codigo="ANL-001",
+            preco=Decimal("1000.00"),
+            variacoes=[variacao],
+        )
+    )
+
+    assert produto_repository.buscar_por_variacao(10) == produto
+    assert produto.buscar_variacao(10).codigo == "ANL-18"
+
+    # Remove a variação e persiste o produto
+    produto.remover_variacao(10)
+    produto_repository.atualizar(produto)
+
+    assert produto_repository.buscar_por_variacao(10) is None
+    assert produto.buscar_variacao(10) is None
+
+
+def test_buscar_variacao_apos_alterar_a_lista(variacao):
+    """Testa que o índice de variações acompanha alterações diretas da lista."""
+    produto = Produto(
+        nome="Anel Solitário",
+        descricao="Anel solitário em ouro 18k",
+        codigo="ANL-001",
+        preco=Preco(valor=Decimal("1000.00")),
+    )
+    assert produto.buscar_variacao(1) is None
+
+    # Variação incluída sem passar por adicionar_variacao
+    produto.variacoes.append(variacao)
+    variacao.id = 1
+    assert produto.buscar_variacao(1) is variacao
+
+    produto.variacoes = []
+    assert produto.buscar_variacao(1) is None
+
+
+def test_buscar_variacao_apos_substituir_na_lista(variacao):
+    """Testa que o índice acompanha variações substituídas e removidas da lista."""
+    variacao.id = 1
+    outra = Variacao(nome="Aro 20", descricao="Anel tamanho aro 20", codigo="ANL-20")
+    outra.id = 2
+    produto = Produto(
+        nome="Anel Solitário",
+        descricao="Anel solitário em ouro 18k",
+        codigo="ANL-001",
+        preco=Preco(valor=Decimal("1000.00")),
+        variacoes=[variacao],
+    )
+
+    # Substituição no lugar, sem mudar o tamanho da lista
+    produto.variacoes[0] = outra
+    assert produto.buscar_variacao(1) is None
+    assert produto.buscar_variacao(2) is outra
+
+    del produto.variacoes[0]
+    assert produto.buscar_variacao(2) is None
+    assert copy.deepcopy(produto).buscar_variacao(2) is None
+
+    produto.variacoes += [variacao]
+    assert copy.deepcopy(produto).buscar_variacao(1).codigo == "ANL-18"
+
+
+def test_buscar_produtos_ignora_acentos(produto_repository):
+    """Testa que a busca por nome ignora acentos e caixa."""
+    criar_use_case = CriarProdutoUseCase(produto_repository)
+    criar_use_case.execute(
+        CriarProdutoInput(
+            nome="Anel Solitário",
+            descricao="Anel solitário em ouro 18k",
+            codigo="ANL-001",
+            preco=Decimal("1000.00"),
+        )
+    )
+
+    buscar_use_case = BuscarProdutosUseCase(produto_repository)
+
+    assert len(buscar_use_case.execute("SOLITARIO")) == 1
+    assert len(buscar_use_case.execute("solitário")) == 1
+    assert buscar_use_case.execute("veneziano") == []
+
+
+def test_buscar_produtos_ordena_por_id(produto_repository):
+    """Testa que a busca por nome retorna os produtos em ordem de ID."""
+    criar_use_case = CriarProdutoUseCase(produto_repository)
+    for i, nome in enumerate(["Anel Zircônia", "Anel Aparador", "Anel Meia Aliança"]):
+        criar_use_case.execute(
+            CriarProdutoInput(
+                nome=nome,
+                descricao="Anel em ouro 18k",
+                codigo=f"ANL-00{i}",
+                preco=Decimal("1000.00"),
+            )
+        )
+    # Renomear reindexa o primeiro produto depois dos demais
+    AtualizarProdutoUseCase(produto_repository).execute(
+        AtualizarProdutoInput(id=1, nome="Anel Solitário")
+    )
+
+    buscar_use_case = BuscarProdutosUseCase(produto_repository)
+
+    # Com trigramas e, para termos curtos, pela varredura dos nomes
+    assert [p.id for p in buscar_use_case.execute("anel")] == [1, 2, 3]
+    assert [p.id for p in buscar_use_case.execute("an")] == [1, 2, 3]
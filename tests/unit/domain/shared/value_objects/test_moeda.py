@@ -0,0 +1,66 @@
+"""
+Testes unitários para o objeto de valor Moeda.
+
+Este módulo contém os testes unitários que validam o
+registro compartilhado de moedas.
+"""
+import pytest
+
+from src.joias.domain.shared.value_objects.moeda import Moeda
+
+
+def test_de_codigo_retorna_a_moeda_registrada():
+    """Deve retornar a mesma instância para um código, sem diferenciar caixa."""
+    # Act & Assert
+    assert Moeda.de_codigo("BRL") is Moeda.BRL
+    assert Moeda.de_codigo("usd") is Moeda.USD
+    assert Moeda.de_codigo("Eur") is Moeda.EUR
+
+
+def test_de_codigo_nao_registrado():
+    """Deve lançar erro para um código não registrado."""
+    # Act & Assert
+    with pytest.raises(ValueError) as exc:
+        Moeda.de_codigo("XYZ")
+    assert "não registrada" in str(exc.value)
+
+
+def test_registrar_moeda():
+    """Deve registrar uma moeda nova e manter a existente ao repetir."""
+    # Act
+    moeda = Moeda.registrar("chf", "Franco Suíço", "CHF")
+    repetida = Moeda.registrar("CHF", "Outro nome", "Fr")
+
+    # Assert
+    assert moeda.codigo == "CHF"
+    assert repetida is moeda
+    assert Moeda.de_codigo("CHF") is moeda
+
+
+def test_registrar_moeda_invalida():
+    """Deve lançar erro ao registrar uma moeda sem nome."""
+    # Act & Assert
+    with pytest.raises(ValueError):
+        Moeda.registrar("ARS", "", "$")
+    with pytest.raises(ValueError):
+        Moeda.de_codigo("ARS")
+
+
+def test_de_codigo_nao_cria_moedas(monkeypatch):
+    """Deve buscar moedas sem criar novas instâncias."""
+    # Arrange
+    criadas = []
+    post_init = Moeda.__post_init__
+
+    def contar(self):
+        criadas.append(self)
+        post_init(self)
+
+    monkeypatch.setattr(Moeda, "__post_init__", contar)
+
+    # Act
+    moedas = {id(Moeda.de_codigo("BRL")) for _ in range(100_000)}
+
+    # Assert
+    assert criadas == []
+    assert moedas == {id(Moeda.BRL)}
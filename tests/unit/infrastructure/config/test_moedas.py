@@ -0,0 +1,39 @@
+"""
+Testes unitários para o registro das moedas configuradas.
+
+Este módulo contém os testes unitários que validam a leitura
+das moedas da variável MOEDAS.
+"""
+import pytest
+
+from src.joias.domain.shared.value_objects.moeda import Moeda
+from src.joias.infrastructure.config.moedas import registrar_moedas
+from src.joias.infrastructure.config.settings import Settings
+
+
+def test_registrar_moedas_configuradas():
+    """Deve registrar as moedas definidas nas configurações."""
+    # Arrange
+    settings = Settings(moedas="GBP:Libra Esterlina:£, JPY:Iene:¥")
+
+    # Act
+    moedas = registrar_moedas(settings)
+
+    # Assert
+    assert [m.codigo for m in moedas] == ["GBP", "JPY"]
+    assert Moeda.de_codigo("GBP").simbolo == "£"
+    assert Moeda.de_codigo("jpy") is moedas[1]
+
+
+def test_registrar_moedas_sem_configuracao():
+    """Deve manter apenas as moedas padrão sem MOEDAS definida."""
+    # Act & Assert
+    assert registrar_moedas(Settings(moedas="")) == []
+
+
+def test_registrar_moeda_mal_formatada():
+    """Deve lançar erro para uma moeda fora do formato CODIGO:Nome:Símbolo."""
+    # Act & Assert
+    with pytest.raises(ValueError) as exc:
+        registrar_moedas(Settings(moedas="AUD:Dólar Australiano"))
+    assert "AUD:Dólar Australiano" in str(exc.value)
@@ -0,0 +1,200 @@
+"""
+Testes unitários para o repositório de produtos com cache.
+
+Este módulo contém os testes unitários para o decorador
+de cache do repositório de produtos.
+"""
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from src.joias.infrastructure.repositories.cache.base import CacheLRU
+from src.joias.infrastructure.repositories.cache.produto import (
+    CachedCatalogoProdutoRepository,
+    CachedProdutoRepository,
+)
+
+
+@pytest.fixture
+def backend():
+    """Fixture que cria um mock do repositório decorado."""
+    return Mock()
+
+
+@pytest.fixture
+def repository(backend):
+    """Fixture que cria o repositório com cache."""
+    return CachedProdutoRepository(backend)
+
+
+def test_buscar_por_id_usa_cache(repository, backend):
+    """Deve ir ao repositório apenas na primeira busca."""
+    # Arrange
+    backend.buscar_por_id.return_value = SimpleNamespace(id=1, codigo="ANL-001")
+
+    # Act
+    primeiro = repository.buscar_por_id(1)
+    segundo = repository.buscar_por_id(1)
+
+    # Assert
+    assert primeiro is segundo
+    backend.buscar_por_id.assert_called_once_with(1)
+    assert repository.acertos == 1
+    assert repository.falhas == 1
+
+
+def test_busca_negativa_em_cache_descartada_ao_criar(repository, backend):
+    """Deve guardar buscas sem resultado até o produto ser criado."""
+    # Arrange
+    produto = SimpleNamespace(id=1, codigo="ANL-001")
+    backend.buscar_por_codigo.return_value = None
+    backend.criar.return_value = produto
+
+    # Act
+    assert repository.buscar_por_codigo("ANL-001") is None
+    assert repository.buscar_por_codigo("ANL-001") is None
+    repository.criar(produto)
+    backend.buscar_por_codigo.return_value = produto
+
+    # Assert
+    assert repository.buscar_por_codigo("ANL-001") is produto
+    assert backend.buscar_por_codigo.call_count == 2
+
+
+def test_atualizar_invalida_codigo_anterior(repository, backend):
+    """Deve invalidar a entrada pelo código antigo quando o código muda."""
+    # Arrange
+    backend.buscar_por_codigo.return_value = SimpleNamespace(id=1, codigo="ANL-001")
+    repository.buscar_por_codigo("ANL-001")
+
+    # Act
+    repository.atualizar(SimpleNamespace(id=1, codigo="ANL-002"))
+    backend.buscar_por_codigo.return_value = None
+
+    # Assert
+    assert repository.buscar_por_codigo("ANL-001") is None
+    assert backend.buscar_por_codigo.call_count == 2
+
+
+def test_atualizar_descarta_leitura_concorrente_a_escrita(repository, backend):
+    """Deve invalidar também depois da escrita, descartando valores antigos."""
+    # Arrange
+    antigo = SimpleNamespace(id=1, codigo="ANL-001", nome="Antigo")
+    novo = SimpleNamespace(id=1, codigo="ANL-001", nome="Novo")
+    backend.buscar_por_id.return_value = antigo
+
+    def escrever(item):
+        # Uma leitura durante a escrita recarrega o valor antigo
+        repository.buscar_por_id(1)
+        backend.buscar_por_id.return_value = novo
+        return novo
+
+    backend.atualizar.side_effect = escrever
+
+    # Act
+    repository.atualizar(novo)
+
+    # Assert
+    assert repository.buscar_por_id(1) is novo
+
+
+def test_leitura_anterior_a_escrita_nao_e_armazenada(repository, backend):
+    """Deve descartar o valor de uma leitura que termina depois de uma escrita."""
+    # Arrange
+    antigo = SimpleNamespace(id=1, codigo="ANL-001", nome="Antigo")
+    novo = SimpleNamespace(id=1, codigo="ANL-001", nome="Novo")
+
+    def ler(produto_id):
+        # A escrita termina antes de a leitura armazenar o valor antigo
+        repository.atualizar(novo)
+        return antigo
+
+    backend.buscar_por_id.side_effect = ler
+
+    # Act
+    lido = repository.buscar_por_id(1)
+    backend.buscar_por_id.side_effect = None
+    backend.buscar_por_id.return_value = novo
+
+    # Assert
+    assert lido is antigo
+    assert repository.buscar_por_id(1) is novo
+
+
+def test_associacoes_descartadas_com_as_entradas(backend):
+    """Deve descartar as associações entre ID e código junto com o LRU."""
+    # Arrange
+    repository = CachedProdutoRepository(backend, CacheLRU(tamanho_maximo=4))
+    backend.buscar_por_id.side_effect = lambda produto_id: SimpleNamespace(
+        id=produto_id, codigo=f"ANL-{produto_id:03}"
+    )
+
+    # Act
+    for produto_id in range(100):
+        repository.buscar_por_id(produto_id)
+
+    # Assert
+    assert len(repository.cache) <= 4
+    assert len(repository._codigos_por_id) <= 2
+    assert len(repository._ids_por_codigo) <= 2
+    assert repository.buscar_por_id(99).codigo == "ANL-099"
+    assert backend.buscar_por_id.call_count == 100
+
+
+@pytest.fixture
+def catalogo(backend):
+    """Fixture que cria o repositório do catálogo com cache."""
+    return CachedCatalogoProdutoRepository(backend)
+
+
+def test_catalogo_atualizar_sem_id_invalida_por_id(catalogo, backend):
+    """Deve resolver o ID pelo SKU em cache quando o produto não tem ID."""
+    # Arrange
+    backend.buscar_por_id.return_value = SimpleNamespace(sku="ANL-001", nome="A")
+    catalogo.buscar_por_id(1)
+    atualizado = SimpleNamespace(sku="ANL-001", nome="B")
+    backend.atualizar.return_value = atualizado
+
+    # Act
+    catalogo.atualizar(atualizado)
+    backend.buscar_por_id.return_value = atualizado
+
+    # Assert
+    assert catalogo.buscar_por_id(1) is atualizado
+    assert backend.buscar_por_id.call_count == 2
+
+
+def test_catalogo_atualizar_invalida_sku_anterior(catalogo, backend):
+    """Deve invalidar a entrada pelo SKU antigo quando o SKU muda."""
+    # Arrange
+    backend.buscar_por_sku.return_value = SimpleNamespace(id=1, sku="ANL-001")
+    catalogo.buscar_por_sku("ANL-001")
+    backend.atualizar.return_value = SimpleNamespace(id=1, sku="ANL-002")
+
+    # Act
+    catalogo.atualizar(SimpleNamespace(sku="ANL-002"))
+    backend.buscar_por_sku.return_value = None
+
+    # Assert
+    assert catalogo.buscar_por_sku("ANL-001") is None
+    assert backend.buscar_por_sku.call_count == 2
+
+
+def test_cache_descarta_entradas_expiradas_e_menos_usadas():
+    """Deve respeitar o TTL e o tamanho máximo do cache."""
+    # Arrange
+    agora = [0.0]
+    cache = CacheLRU(tamanho_maximo=2, ttl=10, relogio=lambda: agora[0])
+    cache.definir("a", 1)
+    cache.definir("b", 2)
+    cache.obter("a")
+
+    # Act
+    cache.definir("c", 3)
+
+    # Assert
+    assert cache.obter("b") == (False, None)
+    assert cache.obter("a") == (True, 1)
+    agora[0] = 11
+    assert cache.obter("a") == (False, None)